@@ -0,0 +1,84 @@
+import secrets
+from typing import Optional
+from fastapi import Request, Header, HTTPException, status
+from app.core.config import settings
+from app.services.event_loop_monitor import EventLoopLagMonitor
+from app.services.gemini_service import GeminiService
+from app.services.incremental_wbs import IncrementalWBSGenerator
+from app.services.job_queue import JobManager
+from app.services.wbs_generator import OfflineBatchStore
+from app.utils.flat_encoding import FlatEncoding, available_encodings, negotiate_flat_encoding
+
+
+def get_gemini_service(request: Request) -> GeminiService:
+    """
+    앱 수명주기 동안 공유되는 GeminiService 반환
+    
+    lifespan에서 생성한 인스턴스를 사용하고,
+    lifespan 없이 실행된 경우(테스트 클라이언트 등)에는 최초 요청 시 생성합니다.
+    """
+    gemini_service = getattr(request.app.state, "gemini_service", None)
+    if gemini_service is None:
+        gemini_service = GeminiService()
+        request.app.state.gemini_service = gemini_service
+    return gemini_service
+
+
+def get_job_manager(request: Request) -> JobManager:
+    """lifespan에서 시작한 비동기 작업 큐 반환"""
+    return request.app.state.job_manager
+
+
+def get_incremental_generator(request: Request) -> IncrementalWBSGenerator:
+    """lifespan에서 생성한 증분 WBS 재생성기 반환 (문서별 잠금/리비전 저장소 공유)"""
+    return request.app.state.incremental_generator
+
+
+def get_batch_store(request: Request) -> OfflineBatchStore:
+    """lifespan에서 생성한 오프라인 배치 요청 저장소 반환"""
+    return request.app.state.batch_store
+
+
+def get_loop_monitor(request: Request) -> EventLoopLagMonitor:
+    """lifespan에서 시작한 이벤트 루프 지연 측정기 반환"""
+    return request.app.state.loop_monitor
+
+
+def get_cache_bypass(
+    x_cache_bypass: bool = Header(
+        False,
+        description="true로 설정하면 응답 캐시를 건너뛰고 새로 생성합니다."
+    )
+) -> bool:
+    """요청 헤더(X-Cache-Bypass)로 응답 캐시 우회 여부 결정"""
+    return x_cache_bypass
+
+
+def get_flat_encoding(
+    accept: Optional[str] = Header(
+        None,
+        description="Flat 응답 형식: application/json(기본), application/vnd.flowplan.columnar+json, "
+                    "application/msgpack, application/vnd.flowplan.columnar+msgpack"
+    )
+) -> FlatEncoding:
+    """요청 헤더(Accept)로 Flat 작업 응답 형식 결정 (제공 가능한 형식이 없으면 406)"""
+    encoding = negotiate_flat_encoding(accept)
+    if encoding is None:
+        supported = ", ".join(e.value for e in available_encodings())
+        raise HTTPException(
+            status_code=status.HTTP_406_NOT_ACCEPTABLE,
+            detail=f"지원하지 않는 응답 형식입니다. (지원 형식: {supported})"
+        )
+    return encoding
+
+
+def verify_admin_token(
+    x_admin_token: str = Header("", description="관리자 토큰 (PROFILING_ADMIN_TOKEN)")
+) -> None:
+    """관리자 전용 엔드포인트 인증 (토큰이 설정되지 않았으면 항상 거부)"""
+    expected = settings.PROFILING_ADMIN_TOKEN
+    if not expected or not secrets.compare_digest(x_admin_token, expected):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 토큰이 올바르지 않습니다."
+        )
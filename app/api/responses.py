@@ -0,0 +1,34 @@
+from typing import Any
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+from pydantic_core import to_json
+from app.utils.flat_encoding import pack_msgpack
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    pydantic-core 직렬화기로 바로 JSON 바이트를 만드는 응답 클래스
+    
+    이미 검증된 모델을 이 응답으로 감싸 반환하면 FastAPI의 response_model 처리
+    (모델 → dict → 재검증 → 직렬화 → json.dumps)를 건너뛰고,
+    모델 클래스에 미리 컴파일된 직렬화기로 한 번에 직렬화합니다.
+    
+    Note:
+        응답 객체를 직접 반환하면 FastAPI는 response_model을 적용하지 않으므로
+        response_model은 OpenAPI 문서용으로만 쓰입니다.
+        출력 형식(ensure_ascii=False, 공백 없는 구분자)은 기본 JSONResponse와 같습니다.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        return to_json(content)
+
+
+class MsgpackResponse(Response):
+    """MessagePack 본문 응답 (Flat 작업 응답의 application/msgpack 형식)"""
+    
+    media_type = "application/msgpack"
+    
+    def render(self, content: Any) -> bytes:
+        return pack_msgpack(content)
@@ -0,0 +1,81 @@
+from typing import Any, Dict
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import JSONResponse, PlainTextResponse
+from app.core.config import settings
+from app.api.dependencies import verify_admin_token
+from app.services.profiler import ProfilerBusyError, ProfilingService, to_collapsed, to_speedscope
+
+# PROFILING_ENABLED일 때만 main.py에서 등록되는 관리자 전용 라우터
+router = APIRouter(
+    prefix="/admin/profile",
+    tags=["Admin"],
+    dependencies=[Depends(verify_admin_token)]
+)
+
+_profiling_service = ProfilingService()
+
+
+@router.post(
+    "/cpu",
+    summary="CPU 샘플링 프로파일",
+    description="""
+지정한 시간 동안 모든 스레드의 호출 스택을 샘플링합니다.
+
+- **format=collapsed**: flamegraph.pl / speedscope에서 열 수 있는 collapsed stack 텍스트
+- **format=speedscope**: https://www.speedscope.app 에서 바로 열 수 있는 JSON
+
+`X-Admin-Token` 헤더가 필요합니다.
+"""
+)
+async def profile_cpu(
+    seconds: float = Query(10.0, gt=0, description="샘플링 시간(초)"),
+    interval_ms: float = Query(10.0, ge=1, le=1000, description="샘플링 간격(ms)"),
+    format: str = Query("speedscope", pattern="^(collapsed|speedscope)$", description="출력 형식")
+):
+    """CPU 샘플링 프로파일 수집"""
+    _check_duration(seconds)
+    try:
+        profiler = await _profiling_service.profile_cpu(seconds, interval_ms / 1000)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    
+    if format == "collapsed":
+        return PlainTextResponse(
+            to_collapsed(profiler.stacks),
+            headers={"Content-Disposition": 'attachment; filename="flowplan-cpu.collapsed"'}
+        )
+    return JSONResponse(
+        to_speedscope(profiler.stacks, profiler.interval_seconds),
+        headers={"Content-Disposition": 'attachment; filename="flowplan-cpu.speedscope.json"'}
+    )
+
+
+@router.post(
+    "/memory",
+    summary="메모리 할당 비교",
+    description="""
+tracemalloc 스냅샷을 지정한 간격으로 두 번 찍어 그 사이 증가한 할당을 모듈별
+(app.services.gemini_service, app.utils.wbs_converter, pydantic 등)과 코드 위치별로 집계합니다.
+
+tracemalloc은 프로파일링 동안에만 켜집니다. `X-Admin-Token` 헤더가 필요합니다.
+"""
+)
+async def profile_memory(
+    seconds: float = Query(10.0, gt=0, description="스냅샷 간격(초)"),
+    top: int = Query(30, ge=1, le=500, description="반환할 상위 항목 수")
+) -> Dict[str, Any]:
+    """tracemalloc 스냅샷 비교"""
+    _check_duration(seconds)
+    try:
+        return await _profiling_service.profile_memory(seconds, top)
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+
+def _check_duration(seconds: float) -> None:
+    """프로파일링 시간 상한 검사"""
+    if seconds > settings.PROFILING_MAX_SECONDS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"프로파일링 시간은 최대 {settings.PROFILING_MAX_SECONDS}초입니다."
+        )
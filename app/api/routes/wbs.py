@@ -1,16 +1,65 @@
-from typing import Dict, Any
-from fastapi import APIRouter, HTTPException, status, Body
+import json
+import math
+from typing import AsyncIterator, Dict, Any, Optional
+from fastapi import APIRouter, HTTPException, status, Body, Depends, Query
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from app.models.request import WBSGenerateRequest, ProjectDuration
 from app.models.response import WBSGenerateResponse
-from app.models.markdown import MarkdownSpecResponse, WBSFromSpecRequest
-from app.services.wbs_generator import WBSGenerator
+from app.models.markdown import (
+    MarkdownSpecResponse, WBSFromSpecRequest, WBSIncrementalRequest, WBSIncrementalResponse
+)
+from app.models.batch import BatchMode, WBSBatchRequest, WBSBatchJobResponse
+from app.models.job import JobKind, JobStatus, JobSubmitRequest, JobResponse
+from app.models.schedule import WBSRescheduleRequest, WBSRescheduleResponse
+from app.core.config import settings
+from app.core.metrics import track_stage
+from app.api.responses import MsgpackResponse, PydanticJSONResponse
+from app.api.dependencies import (
+    get_gemini_service, get_job_manager, get_loop_monitor, get_cache_bypass, get_flat_encoding,
+    get_incremental_generator, get_batch_store
+)
+from app.services.event_loop_monitor import EventLoopLagMonitor
+from app.services.gemini_service import GeminiService
+from app.services.incremental_wbs import IncrementalWBSGenerator
+from app.services.job_queue import JobManager
+from app.services.rate_limiter import RateLimitExceeded
+from app.services.wbs_generator import OfflineBatchStore, WBSGenerator
 from app.services.markdown_generator import MarkdownSpecGenerator
 from app.services.wbs_from_markdown import WBSFromMarkdownGenerator
-from app.utils.wbs_converter import flatten_wbs_for_spring
+from app.utils.flat_encoding import FlatEncoding, encode_flat_body, rows_from_dicts
+from app.utils.scheduler import assignee_roles, schedule_wbs
+from app.utils.wbs_converter import iter_flat_tasks
 
 router = APIRouter(prefix="/wbs", tags=["WBS"])
 
 
+# Flat 응답의 Accept 협상 형식 (OpenAPI 문서용)
+_FLAT_RESPONSES = {
+    200: {
+        "description": "Accept 헤더에 따른 Flat 작업 응답",
+        "content": {encoding.value: {} for encoding in FlatEncoding}
+    },
+    406: {"description": "지원하지 않는 Accept 형식"}
+}
+
+
+def _flat_response(body: Dict[str, Any], encoding: FlatEncoding) -> Response:
+    """협상된 형식으로 Flat 응답 생성 (형식이 Accept에 따라 달라지므로 Vary: Accept)"""
+    headers = {"Vary": "Accept"}
+    if encoding.binary:
+        return MsgpackResponse(body, media_type=encoding.value, headers=headers)
+    return PydanticJSONResponse(body, media_type=encoding.value, headers=headers)
+
+
+def _rate_limit_error(e: RateLimitExceeded) -> HTTPException:
+    """Gemini 호출 한도 초과를 429 + Retry-After 응답으로 변환"""
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail=str(e),
+        headers={"Retry-After": str(math.ceil(e.retry_after))}
+    )
+
+
 @router.post(
     "/generate",
     response_model=WBSGenerateResponse,
@@ -66,16 +115,21 @@ async def generate_wbs(
                 }
             }
         }
-    )
+    ),
+    gemini_service: GeminiService = Depends(get_gemini_service),
+    bypass_cache: bool = Depends(get_cache_bypass)
 ) -> WBSGenerateResponse:
     """
     WBS 생성 엔드포인트
     """
     try:
-        wbs_generator = WBSGenerator()
-        result = await wbs_generator.generate_wbs(request)
-        return result
+        wbs_generator = WBSGenerator(gemini_service)
+        result = await wbs_generator.generate_wbs(request, bypass_cache=bypass_cache)
+        # 이미 검증된 모델이므로 response_model 재검증 없이 바로 직렬화
+        return PydanticJSONResponse(result)
         
+    except RateLimitExceeded as e:
+        raise _rate_limit_error(e)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -88,6 +142,81 @@ async def generate_wbs(
         )
 
 
+@router.post(
+    "/generate/batch",
+    status_code=status.HTTP_200_OK,
+    summary="WBS 일괄 생성",
+    description="""
+    여러 프로젝트의 WBS를 한 번에 생성합니다. 한 항목이 실패해도 나머지는 계속 처리됩니다.
+    
+    **mode=online** (기본): 항목을 병렬(BATCH_MAX_PARALLEL)로 생성하고,
+    완료되는 순서대로 NDJSON 행(`{"index", "project_name", "result", "error"}`)으로 전달합니다.
+    
+    **mode=offline**: Gemini 배치 예측 작업으로 제출하고 `202`와 함께 `batch_name`을 반환합니다.
+    지연 시간은 길지만 비용이 저렴하며, 결과는 `GET /generate/batch/{batch_name}`으로 조회합니다.
+    조회 시 항목별 기간/인원으로 날짜를 다시 배정합니다 (시작일이 없는 항목은 제출일 기준).
+    """
+)
+async def generate_wbs_batch(
+    request: WBSBatchRequest,
+    gemini_service: GeminiService = Depends(get_gemini_service),
+    batch_store: OfflineBatchStore = Depends(get_batch_store),
+    bypass_cache: bool = Depends(get_cache_bypass)
+):
+    """WBS 일괄 생성 엔드포인트"""
+    if len(request.items) > settings.BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"한 번에 최대 {settings.BATCH_MAX_ITEMS}개까지 요청할 수 있습니다."
+        )
+    
+    wbs_generator = WBSGenerator(gemini_service, batch_store)
+    
+    if request.mode == BatchMode.OFFLINE:
+        try:
+            batch_job = await wbs_generator.submit_offline_batch(request.items)
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"배치 작업 제출 중 오류 발생: {str(e)}"
+            )
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content=batch_job.model_dump(mode="json")
+        )
+    
+    async def result_stream() -> AsyncIterator[str]:
+        async for item_result in wbs_generator.generate_batch(request.items, bypass_cache=bypass_cache):
+            yield item_result.model_dump_json() + "\n"
+    
+    return StreamingResponse(result_stream(), media_type="application/x-ndjson")
+
+
+@router.get(
+    "/generate/batch/{batch_name:path}",
+    response_model=WBSBatchJobResponse,
+    summary="오프라인 WBS 일괄 생성 결과 조회",
+    description="""
+    mode=offline으로 제출한 배치 작업의 상태를 조회합니다. 완료되면 항목별 WBS가 포함됩니다.
+    날짜는 제출한 항목의 기간/인원으로 로컬에서 다시 배정합니다 (제출 기록이 없는 작업은 모델이 준 날짜 그대로).
+    """
+)
+async def get_wbs_batch(
+    batch_name: str,
+    gemini_service: GeminiService = Depends(get_gemini_service),
+    batch_store: OfflineBatchStore = Depends(get_batch_store)
+) -> WBSBatchJobResponse:
+    """오프라인 배치 작업 상태/결과 조회"""
+    try:
+        wbs_generator = WBSGenerator(gemini_service, batch_store)
+        return await wbs_generator.get_offline_batch(batch_name)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"배치 작업 조회 중 오류 발생: {str(e)}"
+        )
+
+
 @router.post(
     "/generate-spec",
     response_model=MarkdownSpecResponse,
@@ -118,18 +247,22 @@ async def generate_markdown_spec(
                 }
             }
         }
-    )
+    ),
+    gemini_service: GeminiService = Depends(get_gemini_service),
+    bypass_cache: bool = Depends(get_cache_bypass)
 ) -> MarkdownSpecResponse:
     """프로젝트 명세서 생성 (1단계)"""
     try:
-        spec_generator = MarkdownSpecGenerator()
-        markdown_spec = await spec_generator.generate_spec(request)
+        spec_generator = MarkdownSpecGenerator(gemini_service)
+        markdown_spec = await spec_generator.generate_spec(request, bypass_cache=bypass_cache)
         
         return MarkdownSpecResponse(
             project_name=request.project_name,
             markdown_spec=markdown_spec
         )
         
+    except RateLimitExceeded as e:
+        raise _rate_limit_error(e)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -137,6 +270,51 @@ async def generate_markdown_spec(
         )
 
 
+@router.post(
+    "/generate-spec/stream",
+    status_code=status.HTTP_200_OK,
+    summary="프로젝트 명세서 생성 (마크다운, SSE 스트리밍)",
+    description="""
+    `/generate-spec`의 스트리밍 버전입니다. 생성되는 명세서를 Server-Sent Events로 전달합니다.
+    
+    **이벤트 형식**:
+    - `chunk`: `{"text": "명세서 조각"}` (순서대로 이어 붙이면 전체 명세서)
+    - `done`: `{"project_name", "cached", "model", "usage", "timing"}` (토큰 사용량, 첫 조각/전체 소요 시간)
+    - `error`: `{"detail": "오류 메시지"}`
+    """
+)
+async def stream_markdown_spec(
+    request: WBSGenerateRequest,
+    gemini_service: GeminiService = Depends(get_gemini_service),
+    bypass_cache: bool = Depends(get_cache_bypass)
+) -> StreamingResponse:
+    """프로젝트 명세서 생성 (1단계, 스트리밍)"""
+    spec_generator = MarkdownSpecGenerator(gemini_service)
+    
+    async def event_stream() -> AsyncIterator[str]:
+        try:
+            async for event in spec_generator.stream_spec(request, bypass_cache=bypass_cache):
+                event_name = event.pop("event")
+                if event_name == "done":
+                    event["project_name"] = request.project_name
+                yield _format_sse(event_name, event)
+        except RateLimitExceeded as e:
+            yield _format_sse("error", {"detail": str(e), "retry_after": e.retry_after})
+        except Exception as e:
+            yield _format_sse("error", {"detail": f"명세서 생성 중 오류 발생: {str(e)}"})
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+def _format_sse(event: str, data: Dict[str, Any]) -> str:
+    """Server-Sent Events 메시지 포맷"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
 @router.post(
     "/generate-from-spec",
     response_model=WBSGenerateResponse,
@@ -179,14 +357,21 @@ async def generate_wbs_from_spec(
 - 작업 상태 관리
 """
         }
-    )
+    ),
+    gemini_service: GeminiService = Depends(get_gemini_service),
+    bypass_cache: bool = Depends(get_cache_bypass)
 ) -> WBSGenerateResponse:
     """마크다운 명세서로부터 WBS 생성 (2단계)"""
     try:
-        wbs_generator = WBSFromMarkdownGenerator()
-        result = await wbs_generator.generate_wbs(request.markdown_spec)
-        return result
+        wbs_generator = WBSFromMarkdownGenerator(gemini_service)
+        result = await wbs_generator.generate_wbs(
+            request.markdown_spec, bypass_cache=bypass_cache
+        )
+        # 이미 검증된 모델이므로 response_model 재검증 없이 바로 직렬화
+        return PydanticJSONResponse(result)
         
+    except RateLimitExceeded as e:
+        raise _rate_limit_error(e)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -199,9 +384,61 @@ async def generate_wbs_from_spec(
         )
 
 
+@router.post(
+    "/generate-from-spec/incremental",
+    response_model=WBSIncrementalResponse,
+    status_code=status.HTTP_200_OK,
+    summary="수정된 명세서로 WBS 증분 재생성",
+    description="""
+    명세서를 조금 수정할 때마다 WBS 전체를 다시 생성하지 않고, 변경된 부분만 다시 생성합니다.
+    
+    **사용 방법**:
+    1. `document_id` 없이 호출 → 전체 생성 후 `document_id`, `revision` 반환
+    2. 명세서를 수정한 뒤 같은 `document_id`로 호출 → 이전 명세서와 `##`/`###` 섹션 단위로 비교
+    
+    **처리 방식** (`incremental.mode`):
+    - `incremental`: 수정/추가/삭제된 섹션과 현재 WBS 개요만 AI에 보내 영향받는 주요 단계만 재생성하고,
+      나머지 단계는 그대로 병합 (기존 작업의 task_id 유지, 새 작업은 다음 번호)
+    - `full`: 이전 명세서가 없거나 `force_full`, 개요/제약사항/마일스톤 섹션 변경,
+      변경 분량이 `INCREMENTAL_MAX_CHANGED_RATIO` 초과 시 전체 재생성
+    - `unchanged`: 섹션 내용 변경이 없으면 AI 호출 없이 저장된 WBS 반환
+    
+    증분 재생성은 주요 단계를 삭제하지 않으므로, 기능 영역 자체를 없앤 경우 `force_full`을 사용하세요.
+    """
+)
+async def generate_wbs_incremental(
+    request: WBSIncrementalRequest,
+    incremental_generator: IncrementalWBSGenerator = Depends(get_incremental_generator),
+    bypass_cache: bool = Depends(get_cache_bypass)
+) -> WBSIncrementalResponse:
+    """수정된 마크다운 명세서로 WBS 증분 재생성"""
+    try:
+        result = await incremental_generator.regenerate_wbs(
+            request.markdown_spec,
+            document_id=request.document_id,
+            force_full=request.force_full,
+            bypass_cache=bypass_cache
+        )
+        return PydanticJSONResponse(result)
+        
+    except RateLimitExceeded as e:
+        raise _rate_limit_error(e)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"WBS 증분 재생성 중 데이터 검증 오류: {str(e)}"
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"WBS 증분 재생성 중 오류 발생: {str(e)}"
+        )
+
+
 @router.post(
     "/generate-from-spec/flat",
     status_code=status.HTTP_200_OK,
+    responses=_FLAT_RESPONSES,
     summary="마크다운으로부터 WBS 생성 (Flat 구조 - 스프링 DB용)",
     description="""
     마크다운 명세서로부터 WBS를 생성하고, **스프링 서버 DB 저장용 Flat 구조**로 변환합니다.
@@ -234,25 +471,44 @@ async def generate_wbs_from_spec(
     - start_date/end_date → Tasks.start_date/end_date
     - progress → Tasks.progress (항상 0)
     - status → Tasks.status (항상 "할일")
+    
+    **응답 형식** (`Accept` 헤더로 선택):
+    - `application/json` (기본): 작업마다 객체
+    - `application/vnd.flowplan.columnar+json`: `tasks`가 `{"count", "fields", "columns", "constants"}` 구조
+      (필드별 배열, 모든 작업에서 같은 값인 열은 `constants`에 한 번만)
+    - `application/msgpack`, `application/vnd.flowplan.columnar+msgpack`: 위 두 구조의 MessagePack 인코딩
     """
 )
-async def generate_wbs_from_spec_flat(request: WBSFromSpecRequest) -> Dict:
+async def generate_wbs_from_spec_flat(
+    request: WBSFromSpecRequest,
+    gemini_service: GeminiService = Depends(get_gemini_service),
+    bypass_cache: bool = Depends(get_cache_bypass),
+    encoding: FlatEncoding = Depends(get_flat_encoding)
+) -> Response:
     """마크다운 명세서로부터 WBS 생성 (Flat 구조)"""
     try:
         # 1. WBS 생성
-        wbs_generator = WBSFromMarkdownGenerator()
-        result = await wbs_generator.generate_wbs(request.markdown_spec)
+        wbs_generator = WBSFromMarkdownGenerator(gemini_service)
+        result = await wbs_generator.generate_wbs(
+            request.markdown_spec, bypass_cache=bypass_cache
+        )
         
         # 2. Flat 구조로 변환 (순서 보장, parent_task_id로 계층 표현)
-        flat_tasks = flatten_wbs_for_spring(result.wbs_structure)
+        with track_stage("flatten", gemini_service.response_model):
+            body = encode_flat_body(
+                {
+                    "project_name": result.project_name,
+                    "total_tasks": result.total_tasks,
+                    "total_duration_days": result.total_duration_days
+                },
+                list(iter_flat_tasks(result.wbs_structure)),  # Flat 구조 (순서대로, parent_task_id 포함)
+                encoding
+            )
         
-        return {
-            "project_name": result.project_name,
-            "total_tasks": result.total_tasks,
-            "total_duration_days": result.total_duration_days,
-            "tasks": flat_tasks  # Flat 구조 (순서대로, parent_task_id 포함)
-        }
+        return _flat_response(body, encoding)
         
+    except RateLimitExceeded as e:
+        raise _rate_limit_error(e)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -265,6 +521,203 @@ async def generate_wbs_from_spec_flat(request: WBSFromSpecRequest) -> Dict:
         )
 
 
+@router.post(
+    "/generate-from-spec/flat/stream",
+    status_code=status.HTTP_200_OK,
+    summary="마크다운으로부터 WBS 생성 (Flat 구조, NDJSON 스트리밍)",
+    description="""
+    `/generate-from-spec/flat`의 스트리밍 버전입니다.
+    AI가 주요 단계 하나를 완성할 때마다 해당 작업들을 NDJSON 행으로 즉시 전달하므로,
+    스프링 서버는 생성이 끝나기 전에 저장을 시작할 수 있습니다.
+    
+    **행 형식** (한 줄에 JSON 하나):
+    - `{"type": "task", "data": {...}}`: Flat 작업 (부모 → 자식 순서 보장, 필드는 `/flat`과 동일)
+    - `{"type": "schedule", "data": [{"task_id", "start_date", "end_date", "duration_days"}, ...]}`:
+      로컬 일정 계산 시 모든 작업의 확정 날짜. 일정은 전체 작업량을 알아야 기간에 맞출 수 있으므로
+      `task` 행의 날짜는 모델이 정한 잠정 값이며, 이 행의 날짜가 `/flat`의 날짜와 같습니다.
+    - `{"type": "summary", "data": {"project_name", "total_tasks", "total_duration_days", "usage", "timing"}}`: 마지막 행
+    - `{"type": "error", "detail": "..."}`: 생성 중 오류
+    """
+)
+async def stream_wbs_from_spec_flat(
+    request: WBSFromSpecRequest,
+    gemini_service: GeminiService = Depends(get_gemini_service),
+    bypass_cache: bool = Depends(get_cache_bypass)
+) -> StreamingResponse:
+    """마크다운 명세서로부터 WBS 생성 (Flat 구조, 스트리밍)"""
+    wbs_generator = WBSFromMarkdownGenerator(gemini_service)
+    
+    async def row_stream() -> AsyncIterator[str]:
+        try:
+            async for row in wbs_generator.stream_flat_tasks(
+                request.markdown_spec, bypass_cache=bypass_cache
+            ):
+                yield json.dumps(row, ensure_ascii=False) + "\n"
+        except RateLimitExceeded as e:
+            error = {"type": "error", "detail": str(e), "retry_after": e.retry_after}
+            yield json.dumps(error, ensure_ascii=False) + "\n"
+        except Exception as e:
+            error = {"type": "error", "detail": f"WBS 생성 중 오류 발생: {str(e)}"}
+            yield json.dumps(error, ensure_ascii=False) + "\n"
+    
+    return StreamingResponse(row_stream(), media_type="application/x-ndjson")
+
+
+@router.post(
+    "/reschedule",
+    response_model=WBSRescheduleResponse,
+    status_code=status.HTTP_200_OK,
+    summary="WBS 일정 재계산 (AI 호출 없음)",
+    description="""
+    기존 WBS의 작업 구조는 그대로 두고 날짜만 다시 배정합니다. AI를 호출하지 않으므로 수 ms 안에 응답합니다.
+    
+    - **이동**: `start_date`만 지정 → 같은 기간으로 시작일 이동
+    - **압축/연장**: `duration_days` 또는 `end_date` 지정 → 작업량 비율을 유지하며 기간에 맞춤
+    - **인원 변경**: `team_size` 지정 → 단계 안에서 동시에 진행하는 하위 작업 묶음 수 조정
+    
+    말단 작업의 `duration_days`를 상대 작업량으로 사용합니다. 주요 단계와 같은 상위 작업의 말단 작업은
+    순서대로 진행하고, 서로 다른 상위 작업의 하위 작업 묶음만 최대 `team_size`개까지 병행합니다
+    (상위 작업 날짜는 하위 작업 범위).
+    인원 대비 작업이 많아 기간 안에 넣을 수 없으면 `fits_window: false`와 함께 늘어난 일정을 반환합니다.
+    """
+)
+async def reschedule_wbs(request: WBSRescheduleRequest) -> WBSRescheduleResponse:
+    """기존 WBS 일정 재계산"""
+    phases = request.wbs_structure
+    current_start = min(phase.start_date for phase in phases)
+    current_days = (max(phase.end_date for phase in phases) - current_start).days + 1
+    start_date = request.start_date or current_start
+    if request.end_date is not None:
+        total_days = (request.end_date - start_date).days + 1
+    else:
+        total_days = request.duration_days or current_days
+    
+    # 인원을 지정하지 않으면 담당자 역할 수만큼 병행
+    team_size = request.team_size or len(assignee_roles(phases))
+    
+    try:
+        with track_stage("schedule"):
+            schedule = schedule_wbs(phases, start_date, total_days, team_size)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    
+    return PydanticJSONResponse(WBSRescheduleResponse.model_construct(
+        project_name=request.project_name,
+        total_tasks=sum(1 for _ in iter_flat_tasks(phases)),
+        total_duration_days=schedule.total_duration_days,
+        fits_window=schedule.fits_window,
+        wbs_structure=schedule.wbs_structure
+    ))
+
+
+@router.post(
+    "/jobs",
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="비동기 생성 작업 제출",
+    description="""
+    게이트웨이 타임아웃을 넘길 수 있는 긴 생성을 비동기 작업으로 제출합니다.
+    
+    **kind** 별 payload:
+    - `wbs`, `spec`: `/generate`, `/generate-spec` 요청 본문
+    - `wbs_from_spec`, `wbs_from_spec_flat`: `/generate-from-spec`, `/generate-from-spec/flat` 요청 본문
+    
+    같은 kind/payload의 작업이 진행 중이거나 `JOB_DEDUP_TTL_SECONDS` 안에 완료되었으면 새로 생성하지 않고
+    기존 작업을 반환합니다 (`deduplicated: true`).
+    `webhook_url`을 지정하면 완료 시 작업 상태(결과 포함)를 POST합니다. 기존 작업을 반환한 경우에도 알리며,
+    `JOB_WEBHOOK_ALLOWED_HOSTS`가 없으면 내부 주소(localhost, 사설/링크 로컬 IP)는 거부합니다.
+    """
+)
+async def submit_job(
+    request: JobSubmitRequest,
+    job_manager: JobManager = Depends(get_job_manager)
+) -> JobResponse:
+    """비동기 생성 작업 제출"""
+    try:
+        webhook_url = str(request.webhook_url) if request.webhook_url is not None else None
+        job = await job_manager.submit(request.kind, request.payload, webhook_url)
+        return job.model_copy(update={"result": None})
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"작업 요청 검증 오류: {str(e)}"
+        )
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=JobResponse,
+    summary="비동기 생성 작업 상태 조회",
+    description="작업 상태(queued/running/succeeded/failed)를 조회합니다. 결과는 `/jobs/{job_id}/result`로 조회합니다."
+)
+async def get_job(
+    job_id: str,
+    job_manager: JobManager = Depends(get_job_manager)
+) -> JobResponse:
+    """비동기 생성 작업 상태 조회"""
+    job = await job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="작업을 찾을 수 없습니다.")
+    return job.model_copy(update={"result": None})
+
+
+@router.get(
+    "/jobs/{job_id}/result",
+    summary="비동기 생성 작업 결과 조회",
+    responses=_FLAT_RESPONSES,
+    description="""
+    완료된 작업의 결과를 해당 생성 API와 같은 형식으로 반환합니다.
+    `wbs_from_spec_flat` 작업은 `/generate-from-spec/flat`과 같이 `Accept` 헤더로 응답 형식을 선택할 수 있습니다.
+    """
+)
+async def get_job_result(
+    job_id: str,
+    job_manager: JobManager = Depends(get_job_manager),
+    encoding: FlatEncoding = Depends(get_flat_encoding)
+) -> Any:
+    """비동기 생성 작업 결과 조회"""
+    job = await job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="작업을 찾을 수 없습니다.")
+    if job.status == JobStatus.FAILED:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"작업 실패: {job.error}"
+        )
+    if job.status != JobStatus.SUCCEEDED:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"작업이 아직 완료되지 않았습니다. (상태: {job.status.value})"
+        )
+    if job.kind == JobKind.WBS_FROM_SPEC_FLAT:
+        summary = {key: value for key, value in job.result.items() if key != "tasks"}
+        body = encode_flat_body(summary, rows_from_dicts(job.result["tasks"]), encoding)
+        return _flat_response(body, encoding)
+    return PydanticJSONResponse(job.result)
+
+
+@router.get(
+    "/stats",
+    summary="WBS 서비스 운영 지표",
+    description="""
+    응답 캐시 적중/미스, 작업 큐 깊이, 이벤트 루프 지연 등 운영 지표를 확인합니다.
+    
+    `loop_lag_since`에 이전 응답의 `event_loop.sequence`를 주면 그 이후의 이벤트 루프 지연만 집계합니다 (부하 테스트 단계별 측정).
+    """
+)
+async def get_stats(
+    loop_lag_since: Optional[int] = Query(None, ge=0, description="이 sequence 이후의 루프 지연만 집계"),
+    gemini_service: GeminiService = Depends(get_gemini_service),
+    job_manager: JobManager = Depends(get_job_manager),
+    loop_monitor: EventLoopLagMonitor = Depends(get_loop_monitor)
+) -> Dict[str, Any]:
+    """WBS 서비스 운영 지표 조회"""
+    stats = await gemini_service.get_stats()
+    stats["jobs"] = await job_manager.stats()
+    stats["event_loop"] = loop_monitor.stats(since=loop_lag_since)
+    return stats
+
+
 @router.get(
     "/health",
     summary="WBS 서비스 헬스체크",
@@ -0,0 +1,202 @@
+import time
+import zlib
+from typing import List, Optional, Tuple
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
+from app.core.metrics import COMPRESSION_BYTES, COMPRESSION_SECONDS, current_endpoint
+
+try:
+    import brotli
+except ImportError:  # brotli 미설치 시 gzip만 제공
+    brotli = None
+
+# 압축 대상 Content-Type (이미 압축된 이미지/아카이브 등은 제외)
+_COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/x-ndjson",
+    "application/msgpack",
+    "application/vnd.flowplan.",
+    "application/openmetrics-text"
+)
+
+
+class StreamEncoder:
+    """
+    gzip/brotli 압축기 (조각마다 flush하여 스트리밍 응답도 즉시 전달)
+    
+    Note:
+        gzip은 Z_SYNC_FLUSH, brotli는 flush()로 조각마다 지금까지의 입력을 모두 출력합니다.
+        한 번에 압축하는 일반 응답은 flush 없이 compress_all()을 사용합니다.
+    """
+    
+    def __init__(self, encoding: str):
+        """
+        Args:
+            encoding: gzip | br
+        """
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+        else:
+            # wbits 31 = gzip 헤더/트레일러 포함
+            self._compressor = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+    
+    def compress_all(self, data: bytes) -> bytes:
+        """본문 전체 압축"""
+        if self.encoding == "br":
+            return self._compressor.process(data) + self._compressor.finish()
+        return self._compressor.compress(data) + self._compressor.flush()
+    
+    def compress_chunk(self, data: bytes) -> bytes:
+        """스트리밍 조각 압축 후 flush"""
+        if self.encoding == "br":
+            return self._compressor.process(data) + self._compressor.flush()
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+    
+    def finish(self) -> bytes:
+        """스트림 종료 (남은 데이터와 트레일러)"""
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+
+def available_encodings() -> List[str]:
+    """서버가 제공하는 압축 방식 (선호 순)"""
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def select_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Accept-Encoding 헤더로 압축 방식 선택
+    
+    Returns:
+        br | gzip, 압축하지 않아야 하면 None
+    
+    Note:
+        q 값이 가장 높은 방식을 고르고, 같으면 brotli를 우선합니다.
+        "*"는 명시되지 않은 방식 모두에 적용됩니다.
+    """
+    qualities = dict(_parse_accept_encoding(accept_encoding))
+    wildcard = qualities.get("*", 0.0)
+    best: Optional[Tuple[float, int]] = None
+    chosen: Optional[str] = None
+    for rank, encoding in enumerate(reversed(available_encodings())):
+        quality = qualities.get(encoding, wildcard)
+        if quality > 0 and (best is None or (quality, rank) > best):
+            best, chosen = (quality, rank), encoding
+    return chosen
+
+
+class CompressionMiddleware:
+    """
+    응답 압축 (gzip/brotli, ASGI 미들웨어)
+    
+    - Accept-Encoding으로 brotli/gzip 협상, 압축 수준은 지연 시간 기준 설정값 사용
+    - 일반 응답은 COMPRESSION_MIN_SIZE 미만이면 압축하지 않음
+    - 스트리밍 응답(NDJSON 등)은 조각마다 flush하여 스트리밍을 유지
+    - 압축 전후 바이트와 압축 시간을 엔드포인트별 Prometheus 지표로 기록
+    """
+    
+    def __init__(self, app: ASGIApp, minimum_size: Optional[int] = None):
+        self.app = app
+        self.minimum_size = settings.COMPRESSION_MIN_SIZE if minimum_size is None else minimum_size
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        encoding = select_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        
+        start_message: Optional[Message] = None
+        encoder: Optional[StreamEncoder] = None
+        passthrough = False
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, encoder, passthrough
+            if message["type"] == "http.response.start":
+                # 첫 본문 조각을 보고 압축 여부를 정할 때까지 헤더 전송 보류
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+            
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            
+            if encoder is None:
+                headers = MutableHeaders(raw=start_message["headers"])
+                if not self._should_compress(headers, body, more_body):
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+                
+                encoder = StreamEncoder(encoding)
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                if not more_body:
+                    compressed = self._compress(encoder, encoder.compress_all, body)
+                    headers["Content-Length"] = str(len(compressed))
+                    await send(start_message)
+                    await send({"type": "http.response.body", "body": compressed})
+                    return
+                del headers["Content-Length"]
+                await send(start_message)
+            
+            chunk = self._compress(encoder, encoder.compress_chunk, body)
+            if not more_body:
+                chunk += self._compress(encoder, encoder.finish, None)
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+        
+        await self.app(scope, receive, send_wrapper)
+    
+    def _should_compress(self, headers: MutableHeaders, body: bytes, more_body: bool) -> bool:
+        """이미 인코딩되었거나 압축 대상이 아닌 형식, 작은 일반 응답은 제외"""
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "")
+        if not (content_type.startswith(_COMPRESSIBLE_TYPES) or "+json" in content_type):
+            return False
+        if not more_body and (not body or len(body) < self.minimum_size):
+            return False
+        return True
+    
+    @staticmethod
+    def _compress(encoder: StreamEncoder, compress, data: Optional[bytes]) -> bytes:
+        """압축 실행 및 바이트/시간 지표 기록"""
+        endpoint = current_endpoint.get()
+        started_at = time.perf_counter()
+        result = compress() if data is None else compress(data)
+        COMPRESSION_SECONDS.labels(encoding=encoder.encoding, endpoint=endpoint).inc(
+            time.perf_counter() - started_at
+        )
+        if data:
+            COMPRESSION_BYTES.labels(direction="in", encoding=encoder.encoding, endpoint=endpoint).inc(len(data))
+        COMPRESSION_BYTES.labels(direction="out", encoding=encoder.encoding, endpoint=endpoint).inc(len(result))
+        return result
+
+
+def _parse_accept_encoding(accept_encoding: str) -> List[Tuple[str, float]]:
+    """Accept-Encoding 헤더를 (방식, q) 목록으로 파싱 (잘못된 q는 0으로 취급)"""
+    parsed = []
+    for part in accept_encoding.split(","):
+        coding, *params = [token.strip() for token in part.split(";")]
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        parsed.append((coding.lower(), quality))
+    return parsed
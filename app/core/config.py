@@ -1,3 +1,4 @@
+from typing import Optional
 from pydantic_settings import BaseSettings
 
 
@@ -15,6 +16,126 @@ class Settings(BaseSettings):
     # Google Gemini
     GEMINI_API_KEY: str
     GEMINI_MODEL: str = "gemini-2.0-flash-exp"  # 최신 모델 (새로운 SDK 사용)
+    GEMINI_MAX_CONCURRENCY: int = 16  # 프로세스 전체 Gemini 동시 호출 상한
+    GEMINI_MAX_STREAMS: int = 64  # 프로세스 전체 동시 스트리밍 응답 상한 (느린 클라이언트 포함)
+    GEMINI_WARMUP_ON_STARTUP: bool = True  # 시작 시 커넥션 미리 열기
+    GEMINI_STRUCTURED_OUTPUT: bool = True  # WBS를 응답 스키마(JSON 모드)로 생성
+    GEMINI_PROVIDER: str = "gemini"  # gemini | fake (부하 테스트용 로컬 가짜 응답)
+    
+    # Gemini HTTP 커넥션 풀
+    GEMINI_HTTP_MAX_CONNECTIONS: int = 32
+    GEMINI_HTTP_MAX_KEEPALIVE: int = 16
+    GEMINI_HTTP_KEEPALIVE_EXPIRY: float = 120.0  # 유휴 커넥션 유지 시간(초)
+    
+    # Gemini 호출 한도 (클라이언트 측 RPM/TPM 제한)
+    RATE_LIMIT_ENABLED: bool = True
+    GEMINI_RPM: int = 60  # 분당 요청 수
+    GEMINI_TPM: int = 1_000_000  # 분당 토큰 수 (입력 + 출력)
+    GEMINI_ESTIMATED_OUTPUT_TOKENS: int = 4096  # 호출당 예상 출력 토큰 (할당용)
+    RATE_LIMIT_MAX_WAIT_SECONDS: float = 10.0  # 할당 대기 최대 시간, 초과 시 429
+    RATE_LIMIT_DEFAULT_RETRY_AFTER: float = 30.0  # 업스트림 429에 재시도 정보가 없을 때
+    
+    # Gemini 재시도/헤징
+    GEMINI_MAX_ATTEMPTS: int = 3  # 재시도 포함 최대 시도 횟수
+    GEMINI_RETRY_BASE_DELAY: float = 0.5  # 백오프 기준 대기(초), 시도마다 2배 (full jitter)
+    GEMINI_RETRY_MAX_DELAY: float = 8.0
+    GEMINI_DEADLINE_SECONDS: float = 120.0  # 재시도 포함 전체 제한 시간
+    GEMINI_ATTEMPT_TIMEOUT_SECONDS: float = 60.0  # 시도 1회 제한 시간
+    GEMINI_HEDGE_ENABLED: bool = False  # 느린 시도에 두 번째 요청 병행
+    GEMINI_HEDGE_QUANTILE: float = 0.95  # 헤징 기준 지연 분위수
+    GEMINI_HEDGE_MIN_SAMPLES: int = 20  # 헤징 기준 계산에 필요한 최소 표본 수
+    
+    # 입력 규모 기반 모델 라우팅 (작은 입력은 GEMINI_FAST_MODEL, 큰 입력은 GEMINI_MODEL)
+    MODEL_ROUTING_ENABLED: bool = False
+    GEMINI_FAST_MODEL: str = "gemini-2.0-flash-lite"
+    MODEL_ROUTING_FAST_MAX_TEAM_SIZE: int = 5  # 팀 규모, 기간, 명세서 길이가 모두 이하면 fast 모델
+    MODEL_ROUTING_FAST_MAX_DURATION_DAYS: int = 30
+    MODEL_ROUTING_FAST_MAX_SPEC_CHARS: int = 6000  # 명세서(증분 재생성은 프롬프트) 글자 수
+    MODEL_ROUTING_LATENCY_SLO_SECONDS: float = 20.0  # 최근 호출 p95가 넘으면 다른 모델로 전환
+    MODEL_ROUTING_ERROR_BUDGET: float = 0.1  # 최근 호출 오류율이 넘으면 다른 모델로 전환
+    MODEL_ROUTING_WINDOW: int = 50  # SLO/오류율 판단에 쓰는 모델별 최근 호출 수
+    MODEL_ROUTING_MIN_SAMPLES: int = 10  # 판단에 필요한 최소 호출 수
+    MODEL_ROUTING_COOLDOWN_SECONDS: float = 60.0  # 전환 후 원래 모델로 다시 보내기까지 대기 시간
+    
+    # 모델 경주 (같은 WBS 프롬프트를 두 모델에 동시에 보내 먼저 검증된 응답 사용, 토큰 2배)
+    GEMINI_RACE_ENDPOINTS: str = ""  # 경주를 사용할 라우트 경로 (쉼표 구분, 예: /api/v1/wbs/generate)
+    GEMINI_RACE_SECONDARY_MODEL: str = ""  # 두 번째 경주 모델 (비어 있으면 첫 번째 모델을 한 번 더 호출)
+    
+    # 모델별 100만 토큰당 가격 (USD, /stats 예상 비용 계산용)
+    GEMINI_INPUT_USD_PER_M: float = 0.10
+    GEMINI_OUTPUT_USD_PER_M: float = 0.40
+    GEMINI_FAST_INPUT_USD_PER_M: float = 0.075
+    GEMINI_FAST_OUTPUT_USD_PER_M: float = 0.30
+    
+    # 시스템 지시문 컨텍스트 캐시 (현재 지시문은 최소 토큰 수 미만이라 기본 비활성화)
+    GEMINI_CONTEXT_CACHE_ENABLED: bool = False  # 정적 지시문을 캐시로 등록해 재사용
+    GEMINI_CONTEXT_CACHE_TTL_SECONDS: int = 3600  # 캐시 TTL
+    GEMINI_CONTEXT_CACHE_REFRESH_MARGIN_SECONDS: int = 300  # 만료 이 시간 전에 TTL 연장
+    GEMINI_CONTEXT_CACHE_MIN_TOKENS: int = 1024  # 예상 토큰 수가 이보다 적은 지시문은 등록하지 않음 (Gemini 최소값)
+    
+    # 가짜 Gemini (GEMINI_PROVIDER=fake)
+    FAKE_GEMINI_LATENCY_MEDIAN_MS: float = 800.0  # 응답 지연 중앙값
+    FAKE_GEMINI_LATENCY_P95_MS: float = 2500.0  # 응답 지연 p95 (로그정규분포)
+    FAKE_GEMINI_ERROR_RATE: float = 0.0  # 503 오류 비율
+    FAKE_GEMINI_RATE_LIMIT_RATE: float = 0.0  # 429 오류 비율
+    FAKE_GEMINI_STREAM_CHUNK_CHARS: int = 200  # 스트리밍 조각당 글자 수
+    FAKE_GEMINI_SEED: Optional[int] = None  # 난수 시드
+    
+    # 응답 압축 (gzip/brotli)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024  # 이보다 작은 일반 응답은 압축하지 않음 (바이트)
+    COMPRESSION_GZIP_LEVEL: int = 5  # 1~9, 지연 시간 기준 (scripts/bench_compression.py)
+    COMPRESSION_BROTLI_QUALITY: int = 4  # 0~11, 5 이상은 압축 시간이 급격히 증가
+    
+    # 이벤트 루프 지연 측정
+    LOOP_LAG_MONITOR_ENABLED: bool = True
+    LOOP_LAG_INTERVAL_SECONDS: float = 0.05
+    
+    # 관리자 프로파일링 (/admin/profile, 비활성화 시 라우터 자체를 등록하지 않음)
+    PROFILING_ENABLED: bool = False
+    PROFILING_ADMIN_TOKEN: str = ""  # X-Admin-Token 헤더 값 (비어 있으면 모든 요청 거부)
+    PROFILING_MAX_SECONDS: int = 60  # 1회 프로파일링 최대 시간
+    
+    # 일괄 생성
+    BATCH_MAX_ITEMS: int = 100  # 요청당 최대 항목 수
+    BATCH_MAX_PARALLEL: int = 4  # 요청당 동시 생성 수
+    BATCH_DB_PATH: str = "flowplan_batches.db"  # 오프라인 배치 요청 저장 (결과 조회 시 항목별 일정 계산)
+    
+    # 비동기 작업 큐 (/wbs/jobs)
+    JOB_WORKERS: int = 2  # 동시에 처리할 작업 수
+    JOB_DB_PATH: str = "flowplan_jobs.db"
+    JOB_WEBHOOK_TIMEOUT_SECONDS: float = 10.0
+    JOB_WEBHOOK_ALLOWED_HOSTS: str = ""  # 쉼표 구분 허용 호스트 (비어 있으면 공인 주소만 허용, 내부 주소 차단)
+    JOB_DEDUP_TTL_SECONDS: int = 3600  # 완료된 작업을 같은 payload 제출에 재사용하는 기간 (진행 중 작업은 항상 재사용)
+    
+    # 스프링 서버 push 전송 (wbs_from_spec_flat 작업 완료 시 Flat 작업을 배치로 POST)
+    SPRING_PUSH_ENABLED: bool = False
+    SPRING_PUSH_URL: str = ""  # 배치를 받을 스프링 엔드포인트
+    SPRING_PUSH_AUTH_TOKEN: str = ""  # 설정 시 Authorization: Bearer 헤더
+    SPRING_PUSH_BATCH_SIZE: int = 200  # 배치당 작업 수
+    SPRING_PUSH_MAX_ATTEMPTS: int = 4  # 배치당 재시도 포함 최대 시도 횟수
+    SPRING_PUSH_RETRY_BASE_DELAY: float = 0.5  # 백오프 기준 대기(초), 시도마다 2배 (full jitter)
+    SPRING_PUSH_RETRY_MAX_DELAY: float = 8.0
+    SPRING_PUSH_TIMEOUT_SECONDS: float = 10.0  # 배치 요청 1회 제한 시간
+    SPRING_PUSH_MAX_CONNECTIONS: int = 8  # keep-alive 커넥션 풀 크기
+    SPRING_PUSH_KEEPALIVE_EXPIRY: float = 60.0  # 유휴 커넥션 유지 시간(초)
+    
+    # WBS 응답 검증/수정 (잘린 JSON 복구, 트리 불변식 수정, 복구 불가 시 재생성 1회)
+    WBS_REPAIR_MIN_PHASES: int = 3  # 잘린 응답에서 이만큼의 주요 단계를 살리지 못하면 재생성
+    
+    # 로컬 일정 계산 (모델이 준 날짜 대신 작업량 비율 + 인원 기반 자원 평준화로 날짜 배정)
+    LOCAL_SCHEDULING_ENABLED: bool = True
+    
+    # 증분 WBS 재생성 (/wbs/generate-from-spec/incremental)
+    INCREMENTAL_DB_PATH: str = "flowplan_specs.db"  # 문서별 마지막 명세서/WBS 저장
+    INCREMENTAL_MAX_CHANGED_RATIO: float = 0.5  # 변경 섹션 분량이 명세서의 이 비율을 넘으면 전체 재생성
+    
+    # 응답 캐시
+    CACHE_ENABLED: bool = True
+    CACHE_BACKEND: str = "memory"  # memory | sqlite
+    CACHE_MAX_ENTRIES: int = 512
+    CACHE_TTL_SECONDS: int = 3600
+    CACHE_SQLITE_PATH: str = "flowplan_cache.db"
     
     class Config:
         env_file = ".env"
@@ -0,0 +1,219 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+from prometheus_client import Counter, Gauge, Histogram
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
+
+# 현재 요청의 엔드포인트 (라우트 경로 템플릿, 작업 큐 등 요청 밖에서는 "background")
+current_endpoint: ContextVar[str] = ContextVar("current_endpoint", default="background")
+# 현재 요청이 사용한 Gemini 모델 목록 (미들웨어가 요청마다 새 목록을 넣고 서비스 코드가 추가, 요청 밖에서는 None)
+current_models: ContextVar[Optional[List[str]]] = ContextVar("current_models", default=None)
+
+# LLM 호출은 수 초~수십 초 걸리므로 기본 버킷보다 넓게 잡음
+_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120)
+
+HTTP_REQUESTS = Counter(
+    "flowplan_http_requests_total",
+    "HTTP 요청 수 (model: 요청이 마지막으로 사용한 모델, Gemini를 호출하지 않은 요청은 none)",
+    ["method", "endpoint", "status", "model"]
+)
+HTTP_LATENCY = Histogram(
+    "flowplan_http_request_duration_seconds",
+    "HTTP 요청 처리 시간 (스트리밍은 마지막 조각 전송까지)",
+    ["method", "endpoint", "model"],
+    buckets=_LATENCY_BUCKETS
+)
+STAGE_LATENCY = Histogram(
+    "flowplan_stage_duration_seconds",
+    "처리 단계별 소요 시간 (prompt_build, upstream, json_parse, validation, schedule, merge, flatten)",
+    ["stage", "endpoint", "model"],
+    buckets=_LATENCY_BUCKETS
+)
+GEMINI_TOKENS = Counter(
+    "flowplan_gemini_tokens_total",
+    "Gemini 사용 토큰 수 (SDK usage_metadata 기준, kind: input/cached/output)",
+    ["kind", "endpoint", "model"]
+)
+GEMINI_INFLIGHT = Gauge(
+    "flowplan_gemini_inflight_calls",
+    "진행 중인 Gemini 업스트림 호출 수",
+    ["endpoint", "model"]
+)
+GEMINI_COST = Counter(
+    "flowplan_gemini_cost_usd_total",
+    "토큰 사용량 기준 Gemini 예상 비용 (USD, 모델별 100만 토큰당 가격 설정 기준)",
+    ["endpoint", "model"]
+)
+JOB_QUEUE_DEPTH = Gauge(
+    "flowplan_job_queue_depth",
+    "작업 큐에서 워커를 기다리는 작업 수"
+)
+JOBS_RUNNING = Gauge(
+    "flowplan_jobs_running",
+    "워커가 처리 중인 작업 수"
+)
+RATE_LIMIT_REQUESTS_AVAILABLE = Gauge(
+    "flowplan_rate_limit_requests_available",
+    "RPM 버킷의 남은 요청 수 (조회 시점 기준, 실사용량 보정으로 음수 가능)"
+)
+RATE_LIMIT_TOKENS_AVAILABLE = Gauge(
+    "flowplan_rate_limit_tokens_available",
+    "TPM 버킷의 남은 토큰 수 (조회 시점 기준, 실사용량 보정으로 음수 가능)"
+)
+RATE_LIMIT_DECISIONS = Counter(
+    "flowplan_rate_limit_decisions_total",
+    "클라이언트 측 호출 한도 판정 (outcome: admitted=할당, rejected=대기 한도 초과로 429, upstream_rejected=업스트림 429)",
+    ["outcome"]
+)
+RATE_LIMIT_WAIT = Histogram(
+    "flowplan_rate_limit_wait_seconds",
+    "호출 한도 할당까지 대기한 시간 (할당된 호출 기준)",
+    buckets=_LATENCY_BUCKETS
+)
+MODEL_ROUTES = Counter(
+    "flowplan_model_routes_total",
+    "모델 라우팅 결과 (tier: fast/large, reason: default/size/slo/error_budget)",
+    ["tier", "model", "reason"]
+)
+RACE_WINS = Counter(
+    "flowplan_race_wins_total",
+    "모델 경주 결과 (racer: primary=라우팅된 모델, secondary=두 번째 경주자, none=모두 실패)",
+    ["endpoint", "racer", "model"]
+)
+RACE_LATENCY_SAVED = Histogram(
+    "flowplan_race_latency_saved_seconds",
+    "경주로 줄인 지연 시간 추정치 (첫 번째 모델의 최근 지연 중앙값 - 경주 지연, 첫 번째 모델이 이기면 0)",
+    ["endpoint"],
+    buckets=_LATENCY_BUCKETS
+)
+WBS_REPAIRS = Counter(
+    "flowplan_wbs_repairs_total",
+    "WBS 응답 검증 결과 (outcome: clean=수정 없음, repaired=로컬 수정, retried=재생성 후 성공, failed=재생성 후에도 실패)",
+    ["operation", "outcome"]
+)
+WBS_REPAIR_ISSUES = Counter(
+    "flowplan_wbs_repair_issues_total",
+    "로컬에서 수정한 WBS 응답 문제 수 (issue: truncated, syntax, parent_id, duration, parent_range, total_tasks 등)",
+    ["operation", "issue"]
+)
+WBS_RETRIES_AVOIDED = Counter(
+    "flowplan_wbs_retries_avoided_total",
+    "그대로였다면 실패했을 응답을 로컬 수정으로 살려 생략한 재생성 호출 수",
+    ["operation"]
+)
+COMPRESSION_BYTES = Counter(
+    "flowplan_compression_bytes_total",
+    "응답 압축 전후 바이트 수 (direction: in=원본, out=압축 결과)",
+    ["direction", "encoding", "endpoint"]
+)
+COMPRESSION_SECONDS = Counter(
+    "flowplan_compression_seconds_total",
+    "응답 압축에 쓴 CPU 시간 (이벤트 루프에서 실행)",
+    ["encoding", "endpoint"]
+)
+
+
+def record_request_model(model: str) -> None:
+    """
+    현재 요청이 사용한 모델 기록 (HTTP 지표의 model 라벨용)
+    
+    Note:
+        미들웨어가 넣은 목록을 직접 수정하므로, 하위 태스크나 스레드에서 기록해도 미들웨어가 읽을 수 있습니다.
+    """
+    models = current_models.get()
+    if models is not None:
+        models.append(model)
+
+
+@contextmanager
+def track_stage(stage: str, model: Optional[str] = None) -> Iterator[None]:
+    """
+    처리 단계 소요 시간 기록
+    
+    Args:
+        stage: 단계명 (prompt_build, upstream, json_parse, validation, schedule, merge, flatten)
+        model: 모델명 (없으면 설정의 기본 모델)
+    """
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_LATENCY.labels(
+            stage=stage,
+            endpoint=current_endpoint.get(),
+            model=model or settings.GEMINI_MODEL
+        ).observe(time.perf_counter() - started_at)
+
+
+@contextmanager
+def track_inflight(model: str) -> Iterator[None]:
+    """진행 중인 업스트림 호출 수 게이지 증감"""
+    gauge = GEMINI_INFLIGHT.labels(endpoint=current_endpoint.get(), model=model)
+    gauge.inc()
+    try:
+        yield
+    finally:
+        gauge.dec()
+
+
+def record_tokens(model: str, input_tokens: Optional[int], cached_tokens: Optional[int], output_tokens: Optional[int]) -> None:
+    """SDK 사용량 메타데이터의 토큰 수 누적"""
+    endpoint = current_endpoint.get()
+    for kind, count in (("input", input_tokens), ("cached", cached_tokens), ("output", output_tokens)):
+        if count:
+            GEMINI_TOKENS.labels(kind=kind, endpoint=endpoint, model=model).inc(count)
+
+
+class MetricsMiddleware:
+    """
+    요청 수/처리 시간 기록 및 현재 엔드포인트 설정 (ASGI 미들웨어)
+    
+    엔드포인트 라벨은 경로 템플릿(예: /api/v1/wbs/jobs/{job_id})을 사용해 카디널리티를 제한하고,
+    요청 처리 중 호출되는 서비스 코드가 같은 라벨을 쓰도록 ContextVar에 저장합니다.
+    model 라벨은 요청 처리 중 record_request_model로 기록된 마지막 모델(라우팅/경주 결과)입니다.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        endpoint = self._route_template(scope)
+        token = current_endpoint.set(endpoint)
+        models: List[str] = []
+        models_token = current_models.set(models)
+        status = "500"
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+        
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            method = scope["method"]
+            model = models[-1] if models else "none"
+            HTTP_LATENCY.labels(method=method, endpoint=endpoint, model=model).observe(
+                time.perf_counter() - started_at
+            )
+            HTTP_REQUESTS.labels(method=method, endpoint=endpoint, status=status, model=model).inc()
+            current_models.reset(models_token)
+            current_endpoint.reset(token)
+    
+    @staticmethod
+    def _route_template(scope: Scope) -> str:
+        """요청과 일치하는 라우트의 경로 템플릿 (없으면 unmatched)"""
+        for route in scope["app"].router.routes:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return getattr(route, "path", "unmatched")
+        return "unmatched"
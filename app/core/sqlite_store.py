@@ -0,0 +1,62 @@
+import asyncio
+import sqlite3
+import threading
+from typing import Callable, Iterable, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class SQLiteStore:
+    """
+    SQLite 기반 저장소 공통 기반 (연결 1개를 잠금으로 직렬화하고 쿼리는 스레드 풀에서 실행)
+    
+    하위 클래스는 생성자에서 스키마(CREATE 문)를 넘기고, 쿼리는 _read/_write/_transaction을 await합니다.
+    """
+    
+    def __init__(self, path: str, schema: Iterable[str] = ()):
+        """
+        Args:
+            path: SQLite 파일 경로
+            schema: 연결 직후 실행할 CREATE TABLE/INDEX 문
+        """
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        for statement in schema:
+            self._conn.execute(statement)
+        self._conn.commit()
+    
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+    
+    async def _read(self, sql: str, params: Tuple = ()) -> List[Tuple]:
+        """조회 쿼리 결과 행 목록"""
+        return await asyncio.to_thread(self._read_sync, sql, params)
+    
+    async def _write(self, sql: str, params: Tuple = ()) -> None:
+        """변경 쿼리 1개 실행 후 커밋"""
+        await asyncio.to_thread(self._write_sync, sql, params)
+    
+    async def _transaction(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """
+        여러 쿼리를 잠금 안에서 한 번에 실행 후 커밋
+        
+        Args:
+            fn: 연결을 받아 쿼리를 실행하는 함수 (스레드 풀에서 실행)
+        """
+        return await asyncio.to_thread(self._transaction_sync, fn)
+    
+    def _read_sync(self, sql: str, params: Tuple) -> List[Tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+    
+    def _write_sync(self, sql: str, params: Tuple) -> None:
+        with self._lock:
+            self._conn.execute(sql, params)
+            self._conn.commit()
+    
+    def _transaction_sync(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        with self._lock:
+            result = fn(self._conn)
+            self._conn.commit()
+            return result
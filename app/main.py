@@ -1,7 +1,58 @@
-from fastapi import FastAPI
+import logging
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from app.core.config import settings
+from app.core.compression import CompressionMiddleware
+from app.core.metrics import MetricsMiddleware
 from app.api.routes import wbs
+from app.services.event_loop_monitor import EventLoopLagMonitor
+from app.services.gemini_service import GeminiService
+from app.services.incremental_wbs import IncrementalWBSGenerator
+from app.services.job_queue import JobManager
+from app.services.wbs_generator import OfflineBatchStore
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 수명주기: Gemini 클라이언트/작업 큐/증분 재생성기를 한 번만 생성하고 종료 시 정리"""
+    loop_monitor = EventLoopLagMonitor(settings.LOOP_LAG_INTERVAL_SECONDS)
+    if settings.LOOP_LAG_MONITOR_ENABLED:
+        loop_monitor.start()
+    app.state.loop_monitor = loop_monitor
+    
+    gemini_service = GeminiService()
+    app.state.gemini_service = gemini_service
+    
+    if settings.GEMINI_WARMUP_ON_STARTUP:
+        try:
+            await gemini_service.warmup()
+        except Exception as e:
+            # 워밍업 실패는 치명적이지 않음 (첫 요청에서 커넥션 생성)
+            logger.warning(f"Gemini 커넥션 워밍업 실패: {str(e)}")
+    
+    job_manager = JobManager(gemini_service)
+    await job_manager.start()
+    app.state.job_manager = job_manager
+    
+    # 증분 재생성은 문서별 잠금과 리비전 저장소를 공유해야 하므로 한 번만 생성
+    incremental_generator = IncrementalWBSGenerator(gemini_service)
+    app.state.incremental_generator = incremental_generator
+    
+    batch_store = OfflineBatchStore(settings.BATCH_DB_PATH)
+    app.state.batch_store = batch_store
+    
+    yield
+    
+    batch_store.close()
+    incremental_generator.store.close()
+    await job_manager.stop()
+    await gemini_service.aclose()
+    await loop_monitor.stop()
+
 
 # FastAPI 애플리케이션 생성
 app = FastAPI(
@@ -9,7 +60,8 @@ app = FastAPI(
     version=settings.APP_VERSION,
     description="AI 기반 WBS(Work Breakdown Structure) 자동 생성 API",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -21,9 +73,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 응답 압축 (지표 미들웨어 안쪽에 두어 압축 시간도 요청 처리 시간과 엔드포인트 라벨에 포함)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+
+# 요청 수/처리 시간 지표 (엔드포인트 라벨을 요청 컨텍스트에 설정)
+app.add_middleware(MetricsMiddleware)
+
 # 라우터 등록
 app.include_router(wbs.router, prefix=settings.API_V1_PREFIX)
 
+# 관리자 프로파일링 (비활성화 시 모듈도 import하지 않음)
+if settings.PROFILING_ENABLED:
+    from app.api.routes import admin
+    app.include_router(admin.router)
+
 
 @app.get("/")
 async def root():
@@ -45,6 +109,12 @@ async def health_check():
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 지표 엔드포인트"""
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,36 @@
+from typing import List, Optional
+from enum import Enum
+from pydantic import BaseModel, Field
+from app.models.request import WBSGenerateRequest
+from app.models.response import WBSGenerateResponse
+
+
+class BatchMode(str, Enum):
+    """배치 처리 방식"""
+    ONLINE = "online"    # 즉시 병렬 처리, 완료 순서대로 스트리밍
+    OFFLINE = "offline"  # Gemini 배치 예측 (지연 시간↑, 비용↓)
+
+
+class WBSBatchRequest(BaseModel):
+    """WBS 일괄 생성 요청"""
+    
+    items: List[WBSGenerateRequest] = Field(..., min_length=1, description="WBS 생성 요청 목록")
+    mode: BatchMode = Field(BatchMode.ONLINE, description="처리 방식 (online/offline)")
+
+
+class WBSBatchItemResult(BaseModel):
+    """WBS 일괄 생성 항목별 결과 (성공 시 result, 실패 시 error)"""
+    
+    index: int = Field(..., description="요청 items 내 위치")
+    project_name: str = Field(..., description="프로젝트명")
+    result: Optional[WBSGenerateResponse] = Field(None, description="생성된 WBS")
+    error: Optional[str] = Field(None, description="오류 메시지")
+
+
+class WBSBatchJobResponse(BaseModel):
+    """오프라인 배치 작업 상태/결과"""
+    
+    batch_name: str = Field(..., description="Gemini 배치 작업 이름 (결과 조회용)")
+    state: str = Field(..., description="배치 작업 상태 (JOB_STATE_*)")
+    total_items: int = Field(..., description="요청 항목 수")
+    results: Optional[List[WBSBatchItemResult]] = Field(None, description="완료 시 항목별 결과")
@@ -0,0 +1,53 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+from enum import Enum
+from pydantic import BaseModel, Field, HttpUrl, field_validator
+from app.core.config import settings
+from app.utils.webhook_url import allowed_hosts_from_setting, check_webhook_url
+
+
+class JobKind(str, Enum):
+    """비동기 작업 종류 (기존 생성 API와 1:1 대응)"""
+    WBS = "wbs"                                  # /generate (payload: WBSGenerateRequest)
+    SPEC = "spec"                                # /generate-spec (payload: WBSGenerateRequest)
+    WBS_FROM_SPEC = "wbs_from_spec"              # /generate-from-spec (payload: WBSFromSpecRequest)
+    WBS_FROM_SPEC_FLAT = "wbs_from_spec_flat"    # /generate-from-spec/flat (payload: WBSFromSpecRequest)
+
+
+class JobStatus(str, Enum):
+    """비동기 작업 상태"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class JobSubmitRequest(BaseModel):
+    """비동기 생성 작업 제출 요청"""
+    
+    kind: JobKind = Field(..., description="작업 종류")
+    payload: Dict[str, Any] = Field(..., description="해당 생성 API의 요청 본문")
+    webhook_url: Optional[HttpUrl] = Field(
+        None,
+        description="[선택] 완료 시 결과를 POST할 URL (JOB_WEBHOOK_ALLOWED_HOSTS가 없으면 공인 주소만 허용)"
+    )
+    
+    @field_validator("webhook_url")
+    @classmethod
+    def check_webhook_host(cls, value: Optional[HttpUrl]) -> Optional[HttpUrl]:
+        if value is not None:
+            check_webhook_url(str(value), allowed_hosts_from_setting(settings.JOB_WEBHOOK_ALLOWED_HOSTS))
+        return value
+
+
+class JobResponse(BaseModel):
+    """비동기 생성 작업 상태"""
+    
+    job_id: str = Field(..., description="작업 ID")
+    kind: JobKind = Field(..., description="작업 종류")
+    status: JobStatus = Field(..., description="작업 상태")
+    deduplicated: bool = Field(False, description="동일한 요청의 기존 작업을 반환했는지 여부")
+    created_at: datetime = Field(..., description="제출 시각")
+    updated_at: datetime = Field(..., description="마지막 상태 변경 시각")
+    error: Optional[str] = Field(None, description="실패 시 오류 메시지")
+    result: Optional[Any] = Field(None, description="완료 시 생성 결과")
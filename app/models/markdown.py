@@ -1,4 +1,7 @@
+from enum import Enum
+from typing import List, Optional
 from pydantic import BaseModel, Field
+from app.models.response import WBSGenerateResponse
 
 
 class MarkdownSpecRequest(BaseModel):
@@ -43,3 +46,40 @@ class WBSFromSpecRequest(BaseModel):
 3. 칸반보드
 """
     )
+
+
+class WBSIncrementalRequest(WBSFromSpecRequest):
+    """수정된 마크다운 명세서 기반 증분 WBS 재생성 요청"""
+    
+    document_id: Optional[str] = Field(
+        None,
+        max_length=64,
+        description="이전 응답의 document_id (없으면 새 문서로 전체 생성)"
+    )
+    force_full: bool = Field(False, description="true면 변경 범위와 관계없이 전체 재생성")
+
+
+class IncrementalMode(str, Enum):
+    """증분 재생성 처리 방식"""
+    FULL = "full"  # 전체 생성
+    INCREMENTAL = "incremental"  # 영향받는 주요 단계만 재생성 후 병합
+    UNCHANGED = "unchanged"  # 섹션 변경 없음, 저장된 WBS 반환
+
+
+class IncrementalInfo(BaseModel):
+    """증분 재생성 결과 정보"""
+    
+    mode: IncrementalMode = Field(..., description="처리 방식")
+    reason: str = Field(..., description="처리 방식 선택 이유")
+    changed_sections: List[str] = Field(default=[], description="수정/추가/삭제된 섹션 제목 경로")
+    regenerated_phases: List[str] = Field(default=[], description="다시 생성된 기존 주요 단계 task_id")
+    added_phases: List[str] = Field(default=[], description="새로 추가된 주요 단계 task_id")
+    reused_task_ids: int = Field(0, description="재생성된 단계에서 기존 task_id를 유지한 작업 수")
+
+
+class WBSIncrementalResponse(WBSGenerateResponse):
+    """증분 WBS 재생성 응답 (WBS + 문서 리비전 정보)"""
+    
+    document_id: str = Field(..., description="다음 수정 요청에 전달할 문서 ID")
+    revision: int = Field(..., description="문서 리비전 (생성될 때마다 1 증가)")
+    incremental: IncrementalInfo = Field(..., description="증분 재생성 결과 정보")
@@ -0,0 +1,55 @@
+from datetime import date
+from typing import List, Optional
+from pydantic import BaseModel, Field, model_validator
+from app.models.response import WBSTask
+
+
+class WBSRescheduleRequest(BaseModel):
+    """기존 WBS 일정 재계산 요청 (AI 호출 없음)"""
+    
+    project_name: str = Field(..., description="프로젝트명")
+    wbs_structure: List[WBSTask] = Field(..., min_length=1, description="기존 WBS 구조 (duration_days를 작업량 비율로 사용)")
+    start_date: Optional[date] = Field(None, description="새 시작일 (없으면 기존 첫 작업 시작일)")
+    end_date: Optional[date] = Field(None, description="새 마감일 (duration_days와 함께 지정 불가)")
+    duration_days: Optional[int] = Field(None, gt=0, description="새 전체 기간(일) (없으면 기존 전체 기간)")
+    team_size: Optional[int] = Field(None, gt=0, description="참여 인원 (없으면 담당자 역할 수)")
+    
+    @model_validator(mode="after")
+    def check_window(self) -> "WBSRescheduleRequest":
+        if self.end_date is not None and self.duration_days is not None:
+            raise ValueError("end_date와 duration_days는 함께 지정할 수 없습니다.")
+        if self.end_date is not None and self.start_date is not None and self.end_date < self.start_date:
+            raise ValueError("end_date는 start_date 이후여야 합니다.")
+        return self
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "project_name": "FlowPlan 앱",
+                "wbs_structure": [
+                    {
+                        "task_id": "1.0",
+                        "parent_id": None,
+                        "name": "기획",
+                        "assignee": "PM",
+                        "start_date": "2024-01-01",
+                        "end_date": "2024-01-10",
+                        "duration_days": 10,
+                        "subtasks": []
+                    }
+                ],
+                "start_date": "2024-02-01",
+                "duration_days": 7,
+                "team_size": 3
+            }
+        }
+
+
+class WBSRescheduleResponse(BaseModel):
+    """일정 재계산 응답"""
+    
+    project_name: str = Field(..., description="프로젝트명")
+    total_tasks: int = Field(..., description="전체 작업 수")
+    total_duration_days: int = Field(..., description="전체 기간(일)")
+    fits_window: bool = Field(..., description="인원 제약 안에서 요청 기간에 맞췄는지 (False면 기간 초과)")
+    wbs_structure: List[WBSTask] = Field(..., description="날짜가 다시 배정된 WBS 구조")
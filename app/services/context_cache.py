@@ -0,0 +1,186 @@
+import asyncio
+import hashlib
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from google import genai
+from google.genai import types
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _CachedContext:
+    """등록된 컨텍스트 캐시 핸들"""
+    name: str
+    expires_at: float
+
+
+class ContextCacheManager:
+    """
+    시스템 지시문 컨텍스트 캐시 관리
+    
+    요청마다 동일한 시스템 지시문을 Gemini 컨텍스트 캐시로 한 번만 등록하고,
+    이후 요청은 캐시 이름(cached_content)만 참조하여 정적 텍스트를 다시 보내지 않습니다.
+    만료 직전에는 TTL을 연장하고, 등록에 실패하면(미지원 모델 등)
+    일정 시간 동안 일반 system_instruction 방식으로 동작합니다.
+    Gemini는 최소 토큰 수(모델별 1,024개 이상) 미만의 캐시를 만들 수 없으므로,
+    예상 토큰 수가 min_tokens 미만인 지시문은 등록을 시도하지 않습니다.
+    """
+    
+    def __init__(
+        self,
+        client: genai.Client,
+        enabled: bool = True,
+        ttl_seconds: int = 3600,
+        refresh_margin_seconds: int = 300,
+        min_tokens: int = 1024
+    ):
+        """
+        Args:
+            client: Gemini 클라이언트
+            enabled: False면 항상 일반 system_instruction 사용
+            ttl_seconds: 캐시 TTL (등록/연장 시 적용)
+            refresh_margin_seconds: 만료까지 남은 시간이 이보다 짧으면 TTL 연장
+            min_tokens: 등록을 시도할 최소 예상 토큰 수 (모델의 캐시 최소 토큰 수)
+        """
+        self.client = client
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self.refresh_margin_seconds = refresh_margin_seconds
+        self.min_tokens = min_tokens
+        self._entries: Dict[str, _CachedContext] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._disabled_until: Dict[str, float] = {}
+        self.hits = 0
+        self.creates = 0
+        self.refreshes = 0
+        self.failures = 0
+        self.too_small = 0
+    
+    @staticmethod
+    def estimate_tokens(system_instruction: str) -> int:
+        """
+        지시문의 예상 토큰 수
+        
+        한국어 위주 지시문 기준 약 2자당 1토큰으로 추정합니다 (호출 한도 제한기와 같은 기준).
+        """
+        return len(system_instruction) // 2
+    
+    @staticmethod
+    def make_key(model: str, system_instruction: str) -> str:
+        """모델 + 시스템 지시문 지문"""
+        return hashlib.sha256(f"{model}\n{system_instruction}".encode("utf-8")).hexdigest()
+    
+    async def resolve(self, model: str, system_instruction: str) -> Optional[str]:
+        """
+        시스템 지시문의 컨텍스트 캐시 이름 조회 (없으면 등록, 만료 직전이면 연장)
+        
+        Args:
+            model: 모델명
+            system_instruction: 시스템 지시문
+        
+        Returns:
+            캐시 이름 (사용할 수 없으면 None → 일반 system_instruction 사용)
+        """
+        if not self.enabled:
+            return None
+        if self.estimate_tokens(system_instruction) < self.min_tokens:
+            # 최소 토큰 수 미달: 등록해도 실패하므로 요청 경로에서 caches.create를 호출하지 않음
+            self.too_small += 1
+            return None
+        
+        key = self.make_key(model, system_instruction)
+        entry = self._fresh_entry(key)
+        if entry is not None:
+            self.hits += 1
+            return entry.name
+        if self._disabled_until.get(key, 0.0) > time.monotonic():
+            return None
+        
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = self._fresh_entry(key)
+            if entry is not None:
+                self.hits += 1
+                return entry.name
+            try:
+                return await self._create_or_refresh(key, model, system_instruction)
+            except Exception as e:
+                self.failures += 1
+                self._entries.pop(key, None)
+                self._disabled_until[key] = time.monotonic() + self.ttl_seconds
+                logger.warning(f"컨텍스트 캐시 등록 실패, 일반 시스템 지시문으로 대체: {str(e)}")
+                return None
+    
+    def invalidate(self, model: str, system_instruction: str) -> None:
+        """서버에서 캐시가 사라진 경우(만료/삭제) 핸들 폐기"""
+        self._entries.pop(self.make_key(model, system_instruction), None)
+    
+    async def aclose(self) -> None:
+        """등록한 캐시 삭제 (실패해도 TTL이 지나면 서버에서 정리됨)"""
+        entries = list(self._entries.values())
+        self._entries.clear()
+        for entry in entries:
+            try:
+                await self.client.aio.caches.delete(name=entry.name)
+            except Exception as e:
+                logger.warning(f"컨텍스트 캐시 삭제 실패 ({entry.name}): {str(e)}")
+    
+    def stats(self) -> Dict[str, Any]:
+        """컨텍스트 캐시 지표"""
+        return {
+            "enabled": self.enabled,
+            "min_tokens": self.min_tokens,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "creates": self.creates,
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "too_small": self.too_small
+        }
+    
+    def _fresh_entry(self, key: str) -> Optional[_CachedContext]:
+        """연장 없이 바로 쓸 수 있는 핸들"""
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at - time.monotonic() <= self.refresh_margin_seconds:
+            return None
+        return entry
+    
+    async def _create_or_refresh(self, key: str, model: str, system_instruction: str) -> str:
+        """만료 전이면 TTL 연장, 아니면 새로 등록"""
+        ttl = f"{self.ttl_seconds}s"
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at > time.monotonic():
+            await self.client.aio.caches.update(
+                name=entry.name,
+                config=types.UpdateCachedContentConfig(ttl=ttl)
+            )
+            self.refreshes += 1
+        else:
+            cached = await self.client.aio.caches.create(
+                model=model,
+                config=types.CreateCachedContentConfig(
+                    system_instruction=system_instruction,
+                    display_name=f"flowplan-{key[:12]}",
+                    ttl=ttl
+                )
+            )
+            entry = _CachedContext(name=cached.name, expires_at=0.0)
+            self.creates += 1
+        entry.expires_at = time.monotonic() + self.ttl_seconds
+        self._entries[key] = entry
+        return entry.name
+
+
+def create_context_cache(client: genai.Client) -> ContextCacheManager:
+    """설정값 기반 컨텍스트 캐시 관리자 생성"""
+    return ContextCacheManager(
+        client,
+        enabled=settings.GEMINI_CONTEXT_CACHE_ENABLED,
+        ttl_seconds=settings.GEMINI_CONTEXT_CACHE_TTL_SECONDS,
+        refresh_margin_seconds=settings.GEMINI_CONTEXT_CACHE_REFRESH_MARGIN_SECONDS,
+        min_tokens=settings.GEMINI_CONTEXT_CACHE_MIN_TOKENS
+    )
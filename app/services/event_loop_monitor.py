@@ -0,0 +1,79 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+
+class EventLoopLagMonitor:
+    """
+    이벤트 루프 지연(lag) 측정
+    
+    일정 간격으로 잠들었다 깨어나며 예정 시각보다 늦게 깨어난 시간을 기록합니다.
+    지연이 크면 동기 작업(JSON 파싱, 검증 등)이 루프를 막고 있다는 뜻입니다.
+    """
+    
+    def __init__(self, interval_seconds: float = 0.05, window: int = 1200):
+        """
+        Args:
+            interval_seconds: 측정 간격
+            window: 보관할 최근 측정값 수 (기본 1200개 ≈ 최근 1분)
+        """
+        self.interval_seconds = interval_seconds
+        self._samples: "deque[float]" = deque(maxlen=window)
+        self._sequence = 0
+        self._max_lag = 0.0
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self) -> None:
+        """측정 태스크 시작"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """측정 태스크 종료"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+    
+    def stats(self, since: Optional[int] = None) -> Dict[str, Any]:
+        """
+        최근 구간의 지연 분위수(ms)와 시작 이후 최대 지연
+        
+        Args:
+            since: 이전 조회의 sequence (주면 그 이후 측정값만 집계, 보관 개수 window 이내)
+        
+        Returns:
+            sequence(누적 측정 횟수)를 포함한 지표 (부하 테스트가 단계별 구간을 나누는 데 사용)
+        """
+        samples = list(self._samples)
+        if since is not None:
+            samples = samples[len(samples) - min(len(samples), max(0, self._sequence - since)):]
+        ordered = sorted(samples)
+        
+        def quantile(q: float) -> Optional[float]:
+            if not ordered:
+                return None
+            return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000, 2)
+        
+        return {
+            "sequence": self._sequence,
+            "samples": len(ordered),
+            "lag_p50_ms": quantile(0.50),
+            "lag_p99_ms": quantile(0.99),
+            "lag_max_recent_ms": round(ordered[-1] * 1000, 2) if ordered else None,
+            "lag_max_ms": round(self._max_lag * 1000, 2)
+        }
+    
+    async def _run(self) -> None:
+        while True:
+            expected = time.perf_counter() + self.interval_seconds
+            await asyncio.sleep(self.interval_seconds)
+            lag = max(0.0, time.perf_counter() - expected)
+            self._samples.append(lag)
+            self._sequence += 1
+            self._max_lag = max(self._max_lag, lag)
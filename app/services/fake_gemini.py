@@ -0,0 +1,421 @@
+import asyncio
+import json
+import math
+import random
+import re
+import uuid
+from datetime import date, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional
+from google.genai import errors, types
+from app.core.config import settings
+from app.services.prompt_templates import MARKDOWN_SPEC_INSTRUCTION, WBS_INCREMENTAL_INSTRUCTION
+from app.utils.spec_diff import normalize_title
+
+# p95 / median 비율을 로그정규분포 sigma로 바꾸는 계수 (표준정규 95% 분위수)
+_Z95 = 1.645
+
+
+class FakeGeminiClient:
+    """
+    부하 테스트용 로컬 Gemini 클라이언트
+    
+    GeminiService가 사용하는 SDK 인터페이스(aio.models / aio.caches / aio.batches)만
+    흉내 내며, 실제 호출 없이 현실적인 WBS JSON / 마크다운 명세서를 반환합니다.
+    지연 시간(로그정규분포), 오류율, 스트리밍 조각 크기는 설정으로 조절합니다.
+    """
+    
+    def __init__(
+        self,
+        latency_median_ms: float = 800.0,
+        latency_p95_ms: float = 2500.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        stream_chunk_chars: int = 200,
+        seed: Optional[int] = None
+    ):
+        """
+        Args:
+            latency_median_ms: 응답 지연 시간 중앙값
+            latency_p95_ms: 응답 지연 시간 p95 (중앙값과 같으면 고정 지연)
+            error_rate: 일시적 오류(503) 비율
+            rate_limit_rate: 호출 한도 초과(429) 비율
+            stream_chunk_chars: 스트리밍 조각당 글자 수
+            seed: 난수 시드 (재현 가능한 부하 테스트용)
+        """
+        self.latency_median_ms = latency_median_ms
+        self.latency_sigma = math.log(max(latency_p95_ms, latency_median_ms) / latency_median_ms) / _Z95
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.stream_chunk_chars = max(1, stream_chunk_chars)
+        self.random = random.Random(seed)
+        self.cached_instructions: Dict[str, str] = {}
+        self.aio = _FakeAsyncClient(self)
+    
+    def close(self) -> None:
+        """동기 클라이언트 정리 (정리할 자원 없음)"""
+    
+    def sample_latency(self) -> float:
+        """응답 1회의 지연 시간(초)"""
+        if self.latency_sigma == 0:
+            return self.latency_median_ms / 1000
+        return self.random.lognormvariate(math.log(self.latency_median_ms), self.latency_sigma) / 1000
+    
+    def maybe_fail(self) -> None:
+        """설정된 비율로 업스트림 오류 발생"""
+        roll = self.random.random()
+        if roll < self.rate_limit_rate:
+            raise errors.ClientError(429, {"error": {
+                "code": 429,
+                "status": "RESOURCE_EXHAUSTED",
+                "message": "fake quota exceeded",
+                "details": [{"@type": "type.googleapis.com/google.rpc.RetryInfo", "retryDelay": "1s"}]
+            }})
+        if roll < self.rate_limit_rate + self.error_rate:
+            raise errors.ServerError(503, {"error": {
+                "code": 503,
+                "status": "UNAVAILABLE",
+                "message": "fake upstream unavailable"
+            }})
+    
+    def render(self, contents: Any, config: Optional[types.GenerateContentConfig]) -> str:
+        """요청 종류(시스템 지시문 기준)에 맞는 응답 본문 생성"""
+        prompt = _contents_text(contents)
+        instruction = self.system_instruction(config) or ""
+        if instruction == MARKDOWN_SPEC_INSTRUCTION:
+            return _fake_markdown_spec(prompt)
+        if instruction.startswith(WBS_INCREMENTAL_INSTRUCTION):
+            return json.dumps(_fake_wbs_incremental(prompt), ensure_ascii=False)
+        return json.dumps(_fake_wbs(prompt, self.random), ensure_ascii=False)
+    
+    def system_instruction(self, config: Optional[types.GenerateContentConfig]) -> Optional[str]:
+        """설정의 시스템 지시문 (컨텍스트 캐시 참조면 등록된 지시문)"""
+        if config is None:
+            return None
+        if config.cached_content:
+            return self.cached_instructions.get(config.cached_content)
+        return config.system_instruction if isinstance(config.system_instruction, str) else None
+    
+    def response(self, text: str, prompt_chars: int, cached_chars: int = 0) -> types.GenerateContentResponse:
+        """SDK 응답 객체 구성 (토큰 수는 약 2자당 1토큰으로 추정)"""
+        return types.GenerateContentResponse(
+            candidates=[types.Candidate(content=types.Content(role="model", parts=[types.Part(text=text)]))],
+            usage_metadata=types.GenerateContentResponseUsageMetadata(
+                prompt_token_count=prompt_chars // 2,
+                cached_content_token_count=cached_chars // 2 or None,
+                candidates_token_count=len(text) // 2,
+                total_token_count=(prompt_chars + len(text)) // 2
+            )
+        )
+    
+    def prompt_chars(self, contents: Any, config: Optional[types.GenerateContentConfig]) -> Dict[str, int]:
+        """입력 글자 수 (프롬프트 + 시스템 지시문, 캐시 적중분)"""
+        instruction = self.system_instruction(config) or ""
+        cached = len(instruction) if config is not None and config.cached_content else 0
+        return {"prompt_chars": len(_contents_text(contents)) + len(instruction), "cached_chars": cached}
+
+
+class _FakeAsyncClient:
+    """client.aio 대응"""
+    
+    def __init__(self, owner: FakeGeminiClient):
+        self.models = _FakeModels(owner)
+        self.caches = _FakeCaches(owner)
+        self.batches = _FakeBatches(owner)
+    
+    async def aclose(self) -> None:
+        """비동기 클라이언트 정리 (정리할 자원 없음)"""
+
+
+class _FakeModels:
+    """client.aio.models 대응"""
+    
+    def __init__(self, owner: FakeGeminiClient):
+        self.owner = owner
+    
+    async def get(self, model: str) -> types.Model:
+        return types.Model(name=f"models/{model}")
+    
+    async def generate_content(
+        self,
+        model: str,
+        contents: Any,
+        config: Optional[types.GenerateContentConfig] = None
+    ) -> types.GenerateContentResponse:
+        await asyncio.sleep(self.owner.sample_latency())
+        self.owner.maybe_fail()
+        text = self.owner.render(contents, config)
+        return self.owner.response(text, **self.owner.prompt_chars(contents, config))
+    
+    async def generate_content_stream(
+        self,
+        model: str,
+        contents: Any,
+        config: Optional[types.GenerateContentConfig] = None
+    ) -> AsyncIterator[types.GenerateContentResponse]:
+        self.owner.maybe_fail()
+        text = self.owner.render(contents, config)
+        latency = self.owner.sample_latency()
+        return self._stream(text, latency, self.owner.prompt_chars(contents, config))
+    
+    async def _stream(
+        self,
+        text: str,
+        latency: float,
+        chars: Dict[str, int]
+    ) -> AsyncIterator[types.GenerateContentResponse]:
+        """첫 조각은 지연 시간의 30% 후, 나머지 조각은 남은 시간에 고르게 분배"""
+        size = self.owner.stream_chunk_chars
+        pieces = [text[i:i + size] for i in range(0, len(text), size)] or [""]
+        await asyncio.sleep(latency * 0.3)
+        interval = latency * 0.7 / len(pieces)
+        for index, piece in enumerate(pieces):
+            if index:
+                await asyncio.sleep(interval)
+            chunk = types.GenerateContentResponse(
+                candidates=[types.Candidate(content=types.Content(role="model", parts=[types.Part(text=piece)]))]
+            )
+            if index == len(pieces) - 1:
+                chunk.usage_metadata = self.owner.response(text, **chars).usage_metadata
+            yield chunk
+
+
+class _FakeCaches:
+    """client.aio.caches 대응 (등록한 시스템 지시문을 이름으로 보관)"""
+    
+    def __init__(self, owner: FakeGeminiClient):
+        self.owner = owner
+    
+    async def create(self, model: str, config: types.CreateCachedContentConfig) -> types.CachedContent:
+        name = f"cachedContents/fake-{uuid.uuid4().hex[:12]}"
+        self.owner.cached_instructions[name] = config.system_instruction
+        return types.CachedContent(name=name, model=model)
+    
+    async def update(self, name: str, config: types.UpdateCachedContentConfig) -> types.CachedContent:
+        if name not in self.owner.cached_instructions:
+            raise errors.ClientError(404, {"error": {"code": 404, "status": "NOT_FOUND", "message": name}})
+        return types.CachedContent(name=name)
+    
+    async def delete(self, name: str) -> None:
+        self.owner.cached_instructions.pop(name, None)
+
+
+class _FakeBatches:
+    """client.aio.batches 대응 (제출 즉시 완료된 작업으로 처리)"""
+    
+    def __init__(self, owner: FakeGeminiClient):
+        self.owner = owner
+        self.jobs: Dict[str, types.BatchJob] = {}
+    
+    async def create(self, model: str, src: List[Dict[str, Any]], config: Any = None) -> types.BatchJob:
+        name = f"batches/fake-{uuid.uuid4().hex[:12]}"
+        responses = [
+            types.InlinedResponse(response=self.owner.response(
+                self.owner.render(item["contents"], item.get("config")),
+                **self.owner.prompt_chars(item["contents"], item.get("config"))
+            ))
+            for item in src
+        ]
+        self.jobs[name] = types.BatchJob(
+            name=name,
+            model=model,
+            state=types.JobState.JOB_STATE_SUCCEEDED,
+            dest=types.BatchJobDestination(inlined_responses=responses)
+        )
+        return types.BatchJob(name=name, model=model, state=types.JobState.JOB_STATE_PENDING)
+    
+    async def get(self, name: str) -> types.BatchJob:
+        if name not in self.jobs:
+            raise errors.ClientError(404, {"error": {"code": 404, "status": "NOT_FOUND", "message": name}})
+        return self.jobs[name]
+
+
+def create_fake_gemini_client() -> FakeGeminiClient:
+    """설정값 기반 가짜 Gemini 클라이언트 생성"""
+    return FakeGeminiClient(
+        latency_median_ms=settings.FAKE_GEMINI_LATENCY_MEDIAN_MS,
+        latency_p95_ms=settings.FAKE_GEMINI_LATENCY_P95_MS,
+        error_rate=settings.FAKE_GEMINI_ERROR_RATE,
+        rate_limit_rate=settings.FAKE_GEMINI_RATE_LIMIT_RATE,
+        stream_chunk_chars=settings.FAKE_GEMINI_STREAM_CHUNK_CHARS,
+        seed=settings.FAKE_GEMINI_SEED
+    )
+
+
+def _contents_text(contents: Any) -> str:
+    """SDK contents(문자열 또는 role/parts 목록)에서 텍스트 추출"""
+    if isinstance(contents, str):
+        return contents
+    texts = []
+    for content in contents or []:
+        parts = content.get("parts", []) if isinstance(content, dict) else (content.parts or [])
+        for part in parts:
+            text = part.get("text") if isinstance(part, dict) else part.text
+            if text:
+                texts.append(text)
+    return "\n".join(texts)
+
+
+def _fake_wbs(prompt: str, rng: random.Random) -> Dict[str, Any]:
+    """프롬프트의 프로젝트명/기간을 반영한 WBS (4단계 × 3작업)"""
+    name_match = re.search(r"프로젝트명\**:\s*(.+)", prompt)
+    days_match = re.search(r"기간\**:\s*(\d+)일", prompt)
+    project_name = name_match.group(1).strip() if name_match else "프로젝트"
+    total_days = int(days_match.group(1)) if days_match else 60
+    
+    phases = [
+        ("기획 및 요구사항 분석", "PM", ["요구사항 수집", "기능 명세 작성", "일정 및 리소스 계획"]),
+        ("설계", "기획자", ["아키텍처 설계", "UI/UX 설계", "데이터 모델 설계"]),
+        ("개발", "개발자", ["핵심 기능 구현", "API 연동", "관리 기능 구현"]),
+        ("테스트 및 배포", "QA", ["통합 테스트", "성능 테스트", "운영 배포"])
+    ]
+    start = date.today()
+    phase_days = max(4, total_days // len(phases))
+    structure = []
+    for phase_index, (phase_name, assignee, tasks) in enumerate(phases, start=1):
+        phase_start = start + timedelta(days=(phase_index - 1) * phase_days)
+        subtasks = []
+        task_start = phase_start
+        for task_index, task_name in enumerate(tasks, start=1):
+            duration = max(1, phase_days // len(tasks) + rng.randint(-1, 1))
+            task_end = min(task_start + timedelta(days=duration - 1), phase_start + timedelta(days=phase_days - 1))
+            subtasks.append({
+                "task_id": f"{phase_index}.{task_index}",
+                "parent_id": f"{phase_index}.0",
+                "name": task_name,
+                "assignee": assignee,
+                "start_date": task_start.isoformat(),
+                "end_date": task_end.isoformat(),
+                "duration_days": (task_end - task_start).days + 1,
+                "progress": 0,
+                "status": "할일",
+                "subtasks": []
+            })
+            task_start = task_end + timedelta(days=1)
+        structure.append({
+            "task_id": f"{phase_index}.0",
+            "parent_id": None,
+            "name": phase_name,
+            "assignee": assignee,
+            "start_date": phase_start.isoformat(),
+            "end_date": (phase_start + timedelta(days=phase_days - 1)).isoformat(),
+            "duration_days": phase_days,
+            "progress": 0,
+            "status": "할일",
+            "subtasks": subtasks
+        })
+    
+    return {
+        "project_name": project_name,
+        "total_tasks": sum(1 + len(phase["subtasks"]) for phase in structure),
+        "total_duration_days": phase_days * len(phases),
+        "wbs_structure": structure
+    }
+
+
+def _fake_wbs_incremental(prompt: str) -> Dict[str, Any]:
+    """
+    증분 재생성 응답: 현재 WBS 개요의 개발 단계(없으면 마지막 단계)에
+    수정/추가된 ### 섹션마다 "<기능> 구현" 작업을 더한 단계 하나
+    """
+    outline = re.findall(
+        r"^( *)- (\S+) (.+?) \| (.+?) \| (\d{4}-\d{2}-\d{2}) ~ (\d{4}-\d{2}-\d{2})$", prompt, flags=re.MULTILINE
+    )
+    phases = [row for row in outline if not row[0]]
+    if not phases:
+        return {"project_name": "프로젝트", "total_tasks": 0, "total_duration_days": 0, "wbs_structure": []}
+    phase = next((row for row in phases if "개발" in row[2]), phases[-1])
+    _, phase_id, phase_name, assignee, phase_start, phase_end = phase
+    
+    # 기존 하위 작업 유지 (바로 아래 단계만)
+    subtasks = [
+        {"task_id": row[1], "name": row[2], "assignee": row[3], "start_date": row[4], "end_date": row[5]}
+        for row in outline if row[0] == "  " and row[1].split(".")[0] == phase_id.split(".")[0]
+    ]
+    existing = {task["name"] for task in subtasks}
+    changed = re.findall(r"^\[[^\]]*\]\n### (.+)$", prompt, flags=re.MULTILINE)
+    for title in changed:
+        name = f"{normalize_title(title)} 구현"
+        if name not in existing:
+            existing.add(name)
+            subtasks.append({
+                "task_id": f"{phase_id}.new{len(subtasks)}",
+                "name": name,
+                "assignee": assignee,
+                "start_date": phase_start,
+                "end_date": phase_end
+            })
+    
+    for task in subtasks:
+        task.update(
+            parent_id=phase_id,
+            duration_days=(date.fromisoformat(task["end_date"]) - date.fromisoformat(task["start_date"])).days + 1,
+            progress=0,
+            status="할일",
+            subtasks=[]
+        )
+    return {
+        "project_name": re.search(r"프로젝트명: (.+)", prompt).group(1).strip(),
+        "total_tasks": 1 + len(subtasks),
+        "total_duration_days": (date.fromisoformat(phase_end) - date.fromisoformat(phase_start)).days + 1,
+        "wbs_structure": [{
+            "task_id": phase_id,
+            "parent_id": None,
+            "name": phase_name,
+            "assignee": assignee,
+            "start_date": phase_start,
+            "end_date": phase_end,
+            "duration_days": (date.fromisoformat(phase_end) - date.fromisoformat(phase_start)).days + 1,
+            "progress": 0,
+            "status": "할일",
+            "subtasks": subtasks
+        }]
+    }
+
+
+def _fake_markdown_spec(prompt: str) -> str:
+    """프롬프트의 입력 정보를 반영한 마크다운 명세서"""
+    fields = dict(re.findall(r"^- ([^:]+):\s*(.+)$", prompt, flags=re.MULTILINE))
+    project_name = fields.get("프로젝트명", "프로젝트")
+    features = [f.strip() for f in fields.get("주요 기능", "회원 관리, 대시보드, 알림").split(",")]
+    feature_sections = "\n\n".join(
+        f"### {feature}\n- {feature} 화면 및 API 제공\n- 권한별 접근 제어와 입력 검증" for feature in features
+    )
+    return f"""# 프로젝트 명세서: {project_name}
+
+## 📋 프로젝트 개요
+- **프로젝트명**: {project_name}
+- **프로젝트 주제**: {fields.get("프로젝트 주제", "-")}
+- **팀 구성**: {fields.get("팀 규모", "-")}
+- **기간**: {fields.get("기간", "-")}
+- **예산**: {fields.get("예산", "미정")}
+- **우선순위**: {fields.get("우선순위", "중간")}
+
+## 🎯 프로젝트 목적
+{fields.get("프로젝트 목적", f"{project_name}의 핵심 기능을 기한 내에 안정적으로 제공합니다.")}
+
+## 💼 주요 이해관계자
+- PM - 일정 및 범위 관리
+- 개발팀 - 기능 구현 및 배포
+
+## 📦 주요 산출물
+1. 요구사항 명세서 - 기능/비기능 요구사항 정리
+2. 서비스 배포본 - 운영 환경 배포
+
+## ⚠️ 예상 리스크 및 완화 방안
+- **리스크**: 일정 지연
+  - **완화 방안**: 주간 진척 점검과 범위 조정
+
+## ✨ 핵심 기능 및 요구사항
+{feature_sections}
+
+## 🔧 기술 요구사항
+- REST API 기반 백엔드
+- 반응형 프론트엔드
+
+## 📐 제약사항 및 가이드라인
+- {fields.get("제약사항", "기간 내 배포 가능한 범위로 제한")}
+
+## 📅 주요 마일스톤 (선택)
+- 1주차: 요구사항 확정
+- 마지막 주: 운영 배포
+"""
@@ -1,60 +1,468 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+import httpx
 from google import genai
-from google.genai import types
+from google.genai import errors, types
 from app.core.config import settings
-from typing import Dict, Any
+from app.core.metrics import (
+    WBS_REPAIR_ISSUES, WBS_REPAIRS, WBS_RETRIES_AVOIDED, record_request_model, record_tokens, track_inflight,
+    track_stage
+)
+from app.models.response import WBSGenerateResponse
+from app.services.context_cache import ContextCacheManager, create_context_cache
+from app.services.fake_gemini import create_fake_gemini_client
+from app.services.generation_stats import GenerationStats
+from app.services.model_router import ModelRouter, RouteDecision, create_model_router
+from app.services.prompt_templates import (
+    MARKDOWN_SPEC_INSTRUCTION,
+    wbs_from_markdown_system_instruction,
+    wbs_incremental_system_instruction,
+    wbs_system_instruction
+)
+from app.services.racing import RacePolicy, create_race_policy, first_valid
+from app.services.rate_limiter import (
+    QuotaRateLimiter,
+    RateLimitExceeded,
+    create_rate_limiter,
+    retry_after_from_error
+)
+from app.services.resilience import InvalidResponseError, ResiliencePolicy, create_resilience_policy
+from app.services.response_cache import ResponseCache, create_response_cache
+from app.services.single_flight import SingleFlight
+from app.utils.response_schema import build_gemini_response_schema
+from app.utils.scheduler import schedule_window_from_spec
+from app.utils.wbs_repair import repair_wbs
+from typing import AsyncIterator, Callable, Dict, Any, List, NamedTuple, Optional, Tuple
+
+
+# 구조화 출력 모드의 WBS 응답 스키마 (progress/status는 항상 기본값이므로 생성하지 않음)
+WBS_RESPONSE_SCHEMA = build_gemini_response_schema(
+    WBSGenerateResponse,
+    max_depth=3,
+    exclude_fields={"progress", "status"}
+)
+
+# 프로세스 전역 Gemini 동시 호출 제한 (모든 GeminiService 인스턴스가 공유)
+_upstream_semaphore = asyncio.Semaphore(settings.GEMINI_MAX_CONCURRENCY)
+# 프로세스 전역 동시 스트리밍 응답 제한 (클라이언트 전달이 끝날 때까지 유지)
+_stream_semaphore = asyncio.Semaphore(settings.GEMINI_MAX_STREAMS)
+# 스트림 읽기 작업이 끝났음을 알리는 표식
+_STREAM_END = object()
+
+# 현재 요청에서 마지막으로 받은 응답의 모델 (라우팅/경주 결과, 단계별 지표 라벨용)
+_response_model: ContextVar[Optional[str]] = ContextVar("response_model", default=None)
+# 마지막 응답이 응답 캐시에서 왔는지 (캐시 적중은 모델별 파싱 성공률에서 제외)
+_response_cached: ContextVar[bool] = ContextVar("response_cached", default=False)
+
+
+class _Admission(NamedTuple):
+    """전송 직전까지 통과한 호출 1회의 준비 결과"""
+    estimated_tokens: int
+    request_config: Optional[types.GenerateContentConfig]
+
+
+def create_gemini_client() -> genai.Client:
+    """
+    keep-alive 커넥션 풀이 설정된 Gemini 클라이언트 생성
+    
+    Returns:
+        프로세스 전체에서 공유할 genai.Client
+        
+    Note:
+        transport를 직접 지정하면 SDK가 httpx를 사용하므로 커넥션 풀 설정이 그대로 적용됩니다.
+        GEMINI_PROVIDER=fake면 같은 인터페이스의 로컬 가짜 클라이언트를 반환합니다 (부하 테스트용).
+    """
+    if settings.GEMINI_PROVIDER == "fake":
+        return create_fake_gemini_client()
+    
+    limits = httpx.Limits(
+        max_connections=settings.GEMINI_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.GEMINI_HTTP_MAX_KEEPALIVE,
+        keepalive_expiry=settings.GEMINI_HTTP_KEEPALIVE_EXPIRY
+    )
+    http_options = types.HttpOptions(
+        client_args={"transport": httpx.HTTPTransport(limits=limits)},
+        async_client_args={"transport": httpx.AsyncHTTPTransport(limits=limits)}
+    )
+    return genai.Client(api_key=settings.GEMINI_API_KEY, http_options=http_options)
 
 
 class GeminiService:
     """Google Gemini API 서비스"""
     
-    def __init__(self):
-        """Gemini API 초기화"""
-        self.client = genai.Client(api_key=settings.GEMINI_API_KEY)
+    def __init__(
+        self,
+        client: Optional[genai.Client] = None,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[QuotaRateLimiter] = None,
+        resilience: Optional[ResiliencePolicy] = None,
+        context_cache: Optional[ContextCacheManager] = None,
+        router: Optional[ModelRouter] = None,
+        race_policy: Optional[RacePolicy] = None
+    ):
+        """
+        Gemini API 초기화
+        
+        Args:
+            client: 공유 Gemini 클라이언트 (없으면 새로 생성)
+            cache: 응답 캐시 (없으면 설정에 따라 새로 생성)
+            rate_limiter: RPM/TPM 제한기 (없으면 설정에 따라 새로 생성)
+            resilience: 재시도/헤징 정책 (없으면 설정에 따라 새로 생성)
+            context_cache: 시스템 지시문 컨텍스트 캐시 (없으면 설정에 따라 새로 생성)
+            router: 입력 규모 기반 모델 라우터 (없으면 설정에 따라 새로 생성)
+            race_policy: 엔드포인트별 모델 경주 정책 (없으면 설정에 따라 새로 생성)
+        """
+        self.client = client or create_gemini_client()
         self.model_name = settings.GEMINI_MODEL
+        self.cache = cache or create_response_cache()
+        self.single_flight = SingleFlight()
+        self.rate_limiter = rate_limiter or create_rate_limiter()
+        self.resilience = resilience or create_resilience_policy()
+        self.structured_output = settings.GEMINI_STRUCTURED_OUTPUT
+        self.generation_stats = GenerationStats()
+        self.context_cache = context_cache or create_context_cache(self.client)
+        self.router = router or create_model_router()
+        self.race_policy = race_policy or create_race_policy()
+    
+    async def warmup(self) -> None:
+        """모델 메타데이터를 조회하여 TLS/HTTP 커넥션을 미리 열어둠 (라우팅 대상 모델 모두)"""
+        for model in self.router.models:
+            await self.client.aio.models.get(model=model)
+    
+    async def aclose(self) -> None:
+        """등록한 컨텍스트 캐시와 비동기/동기 클라이언트의 커넥션 풀 정리"""
+        await self.context_cache.aclose()
+        await self.client.aio.aclose()
+        self.client.close()
+    
+    async def get_stats(self) -> Dict[str, Any]:
+        """운영 지표 (캐시 등) 조회"""
+        return {
+            "cache": await self.cache.stats(),
+            "single_flight": self.single_flight.stats(),
+            "rate_limiter": self.rate_limiter.stats(),
+            "resilience": self.resilience.stats(),
+            "output_modes": self.generation_stats.snapshot(),
+            "context_cache": self.context_cache.stats(),
+            "model_routing": self.router.stats(),
+            "racing": self.race_policy.stats()
+        }
+    
+    @property
+    def response_model(self) -> str:
+        """현재 요청에서 마지막으로 응답한 모델 (라우팅/경주 결과, 호출 전이면 기본 모델)"""
+        return _response_model.get() or self.model_name
+    
+    @property
+    def output_mode(self) -> str:
+        """WBS JSON 출력 방식 (structured: 응답 스키마, prompt: 프롬프트 지시)"""
+        return "structured" if self.structured_output else "prompt"
+    
+    def record_parse_result(self, operation: str, success: bool) -> None:
+        """
+        WBS 응답 JSON 파싱 결과 기록 (출력 방식별 파싱 실패율 비교용)
+        
+        Args:
+            operation: 생성 종류 (wbs, wbs_from_markdown, wbs_incremental)
+            success: 파싱 성공 여부 (로컬 복구 없이 JSON으로 파싱되었는지)
+        """
+        self.generation_stats.record_parse(f"{operation}/{self.output_mode}", success)
+        model = _response_model.get()
+        if model is not None and not _response_cached.get():
+            self.router.record_parse(model, success)
+    
+    def record_repair(
+        self,
+        operation: str,
+        outcome: str,
+        issues: Optional[Dict[str, int]] = None,
+        retry_avoided: bool = False
+    ) -> None:
+        """
+        WBS 응답 검증/수정 결과 기록
+        
+        Args:
+            operation: 생성 종류 (wbs, wbs_from_markdown, wbs_incremental)
+            outcome: clean | repaired | retried | failed
+            issues: 로컬에서 수정한 문제 종류별 횟수
+            retry_avoided: 수정하지 않았다면 실패했을 응답인지
+        """
+        WBS_REPAIRS.labels(operation=operation, outcome=outcome).inc()
+        for issue, count in (issues or {}).items():
+            WBS_REPAIR_ISSUES.labels(operation=operation, issue=issue).inc(count)
+        if retry_avoided:
+            WBS_RETRIES_AVOIDED.labels(operation=operation).inc()
+        self.generation_stats.record_repair(f"{operation}/{self.output_mode}", outcome, retry_avoided)
     
-    async def generate_markdown_spec(self, project_data: Dict[str, Any]) -> str:
+    async def generate_markdown_spec(
+        self,
+        project_data: Dict[str, Any],
+        bypass_cache: bool = False
+    ) -> str:
         """
         프로젝트 정보를 마크다운 명세서로 변환
         
         Args:
             project_data: 프로젝트 정보 딕셔너리
+            bypass_cache: True면 캐시를 조회하지 않고 새로 생성
             
         Returns:
             마크다운 형식의 프로젝트 명세서
         """
-        prompt = self._build_markdown_prompt(project_data)
-        response = await self._generate_content(prompt)
+        model = self._route_project(project_data).model
+        with track_stage("prompt_build", model):
+            prompt = self._build_markdown_prompt(project_data)
+        response = await self._generate_content(
+            prompt,
+            bypass_cache=bypass_cache,
+            config=self._markdown_config(),
+            operation="markdown_spec",
+            model=model
+        )
         return response
     
-    async def generate_wbs_from_markdown(self, markdown_spec: str) -> str:
+    async def stream_markdown_spec(
+        self,
+        project_data: Dict[str, Any],
+        bypass_cache: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        프로젝트 정보를 마크다운 명세서로 변환 (스트리밍)
+        
+        Args:
+            project_data: 프로젝트 정보 딕셔너리
+            bypass_cache: True면 캐시를 조회하지 않고 새로 생성
+            
+        Yields:
+            {"event": "chunk", "text": ...} 형식의 조각 이벤트,
+            마지막에 토큰 사용량과 소요 시간을 담은 {"event": "done", ...} 이벤트
+        """
+        model = self._route_project(project_data).model
+        with track_stage("prompt_build", model):
+            prompt = self._build_markdown_prompt(project_data)
+        async for event in self._stream_content(
+            prompt,
+            bypass_cache=bypass_cache,
+            config=self._markdown_config(),
+            operation="markdown_spec",
+            model=model
+        ):
+            yield event
+    
+    async def generate_wbs_from_markdown(
+        self,
+        markdown_spec: str,
+        bypass_cache: bool = False
+    ) -> str:
         """
         마크다운 명세서를 기반으로 WBS 생성
         
         Args:
             markdown_spec: 마크다운 형식의 프로젝트 명세서
+            bypass_cache: True면 캐시를 조회하지 않고 새로 생성
             
         Returns:
             JSON 형식의 WBS 구조 문자열
         """
-        prompt = self._build_wbs_from_markdown_prompt(markdown_spec)
-        response = await self._generate_content(prompt)
+        model = self._route_spec(markdown_spec).model
+        with track_stage("prompt_build", model):
+            prompt = self._build_wbs_from_markdown_prompt(markdown_spec)
+        response = await self._generate_content(
+            prompt,
+            bypass_cache=bypass_cache,
+            config=self._wbs_config(wbs_from_markdown_system_instruction(self.structured_output)),
+            operation="wbs_from_markdown",
+            model=model,
+            accept=self._wbs_check()
+        )
         return response
     
-    async def generate_wbs_structure(self, project_data: Dict[str, Any]) -> str:
+    async def stream_wbs_from_markdown(
+        self,
+        markdown_spec: str,
+        bypass_cache: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        마크다운 명세서를 기반으로 WBS 생성 (스트리밍)
+        
+        Args:
+            markdown_spec: 마크다운 형식의 프로젝트 명세서
+            bypass_cache: True면 캐시를 조회하지 않고 새로 생성
+            
+        Yields:
+            JSON 텍스트 조각 이벤트와 마지막 완료 이벤트
+        """
+        model = self._route_spec(markdown_spec).model
+        with track_stage("prompt_build", model):
+            prompt = self._build_wbs_from_markdown_prompt(markdown_spec)
+        async for event in self._stream_content(
+            prompt,
+            bypass_cache=bypass_cache,
+            config=self._wbs_config(wbs_from_markdown_system_instruction(self.structured_output)),
+            operation="wbs_from_markdown",
+            model=model
+        ):
+            yield event
+    
+    async def generate_wbs_incremental(
+        self,
+        change_context: Dict[str, Any],
+        bypass_cache: bool = False
+    ) -> str:
+        """
+        명세서 변경분으로 영향받는 주요 단계만 다시 생성 (증분 재생성)
+        
+        Args:
+            change_context: 변경 정보
+                - context_sections: 변경되지 않은 전역 섹션 원문 (개요 등, 일정 기준)
+                - changed_sections / added_sections: 수정/추가된 섹션 원문
+                - removed_sections: 삭제된 섹션 제목 경로
+                - wbs_outline: 현재 WBS 개요 (task_id, 작업명, 담당자, 일정)
+            bypass_cache: True면 캐시를 조회하지 않고 새로 생성
+            
+        Returns:
+            다시 작성한 주요 단계만 담은 JSON 형식의 WBS 구조 문자열
+        """
+        model = self._route_incremental(change_context).model
+        with track_stage("prompt_build", model):
+            prompt = self._build_wbs_incremental_prompt(change_context)
+        response = await self._generate_content(
+            prompt,
+            bypass_cache=bypass_cache,
+            config=self._wbs_config(wbs_incremental_system_instruction(self.structured_output)),
+            operation="wbs_incremental",
+            model=model,
+            accept=self._wbs_check(allow_truncated=False, min_phases=0)
+        )
+        return response
+    
+    async def generate_wbs_structure(
+        self,
+        project_data: Dict[str, Any],
+        bypass_cache: bool = False
+    ) -> str:
         """
         프로젝트 정보를 기반으로 WBS 구조를 생성합니다.
         
         Args:
             project_data: 프로젝트 정보 딕셔너리
+            bypass_cache: True면 캐시를 조회하지 않고 새로 생성
             
         Returns:
             JSON 형식의 WBS 구조 문자열
         """
-        prompt = self._build_wbs_prompt(project_data)
+        model = self._route_project(project_data).model
+        with track_stage("prompt_build", model):
+            prompt = self._build_wbs_prompt(project_data)
         
-        response = await self._generate_content(prompt)
+        response = await self._generate_content(
+            prompt,
+            bypass_cache=bypass_cache,
+            config=self._wbs_config(wbs_system_instruction(self.structured_output)),
+            operation="wbs",
+            model=model,
+            accept=self._wbs_check()
+        )
         return response
     
+    async def submit_wbs_batch(self, project_data_list: List[Dict[str, Any]]) -> types.BatchJob:
+        """
+        여러 프로젝트의 WBS 생성을 Gemini 배치 예측 작업으로 제출
+        
+        Args:
+            project_data_list: 프로젝트 정보 딕셔너리 리스트
+            
+        Returns:
+            생성된 배치 작업 (name으로 결과 조회)
+        """
+        config = self._wbs_config(wbs_system_instruction(self.structured_output))
+        src = [
+            {
+                "contents": [{"role": "user", "parts": [{"text": self._build_wbs_prompt(data)}]}],
+                "config": config
+            }
+            for data in project_data_list
+        ]
+        try:
+            return await self.client.aio.batches.create(
+                model=self.model_name,
+                src=src,
+                config={"display_name": f"{settings.APP_NAME}-wbs-batch"}
+            )
+        except Exception as e:
+            raise Exception(f"Gemini 배치 작업 제출 실패: {str(e)}")
+    
+    async def get_batch_results(
+        self,
+        batch_name: str
+    ) -> Tuple[str, Optional[List[Tuple[Optional[str], Optional[str]]]]]:
+        """
+        배치 예측 작업 상태와 결과 조회
+        
+        Args:
+            batch_name: 배치 작업 이름
+            
+        Returns:
+            (상태, 완료 시 항목별 (응답 텍스트, 오류 메시지) 리스트 / 미완료 시 None)
+        """
+        try:
+            batch_job = await self.client.aio.batches.get(name=batch_name)
+        except Exception as e:
+            raise Exception(f"Gemini 배치 작업 조회 실패: {str(e)}")
+        
+        state = batch_job.state.value if batch_job.state else "JOB_STATE_UNSPECIFIED"
+        if not batch_job.dest or not batch_job.dest.inlined_responses:
+            return state, None
+        
+        results = []
+        for inlined in batch_job.dest.inlined_responses:
+            if inlined.error:
+                results.append((None, inlined.error.message or str(inlined.error)))
+            elif inlined.response is None or not inlined.response.text:
+                results.append((None, "Gemini가 이 항목에 응답을 반환하지 않았습니다."))
+            else:
+                results.append((inlined.response.text, None))
+        return state, results
+    
+    def _route_project(self, project_data: Dict[str, Any]) -> RouteDecision:
+        """프로젝트 정보(팀 규모, 기간)로 모델 선택"""
+        return self.router.route(team_size=project_data.get("team_size"), duration_days=project_data.get("total_days"))
+    
+    def _route_spec(self, markdown_spec: str) -> RouteDecision:
+        """명세서의 팀 구성/기간 항목과 길이로 모델 선택"""
+        window = schedule_window_from_spec(markdown_spec)
+        return self.router.route(window.team_size, window.total_days, len(markdown_spec))
+    
+    def _route_incremental(self, change_context: Dict[str, Any]) -> RouteDecision:
+        """변경 정보 분량(프롬프트에 들어갈 섹션 원문 + WBS 개요 길이)으로 모델 선택"""
+        return self.router.route(spec_chars=sum(len(str(value)) for value in change_context.values()))
+    
+    def _wbs_check(
+        self,
+        allow_truncated: bool = True,
+        min_phases: int = settings.WBS_REPAIR_MIN_PHASES
+    ) -> Callable[[str], None]:
+        """경주 승자 판정 함수 (로컬 수정 후 WBSGenerateResponse로 검증되지 않으면 ValueError)"""
+        def check(text: str) -> None:
+            WBSGenerateResponse(**repair_wbs(text, allow_truncated=allow_truncated, min_phases=min_phases).data)
+        return check
+    
+    def _wbs_config(self, system_instruction: str) -> types.GenerateContentConfig:
+        """WBS JSON 생성 설정 (구조화 출력 모드면 응답 스키마 + JSON MIME 타입)"""
+        if not self.structured_output:
+            return types.GenerateContentConfig(system_instruction=system_instruction)
+        return types.GenerateContentConfig(
+            system_instruction=system_instruction,
+            response_mime_type="application/json",
+            response_schema=WBS_RESPONSE_SCHEMA
+        )
+    
+    def _markdown_config(self) -> types.GenerateContentConfig:
+        """마크다운 명세서 생성 설정"""
+        return types.GenerateContentConfig(system_instruction=MARKDOWN_SPEC_INSTRUCTION)
+    
     def _build_wbs_prompt(self, data: Dict[str, Any]) -> str:
         """WBS 생성을 위한 프롬프트 구성"""
         
@@ -102,68 +510,12 @@ class GeminiService:
         if requirements_section:
             requirements_block = f"\n## 🎯 요구사항\n{requirements_section}\n"
         
-        prompt = f"""
-당신은 프로젝트 관리 전문가입니다. 다음 프로젝트 정보를 기반으로 상세하고 현실적인 WBS(Work Breakdown Structure)를 생성해주세요.
-
-## 📋 프로젝트 기본 정보
+        # 역할/지침/출력 형식은 시스템 지시문에 있으므로 프로젝트별 입력만 전달
+        prompt = f"""## 📋 프로젝트 기본 정보
 - 프로젝트명: {data['project_name']}
 - 프로젝트 주제: {data['project_type']}
 - 팀 규모: {data['team_size']}명
-{date_info}{additional_block}{requirements_block}
-
-## 📝 WBS 생성 지침
-1. 프로젝트를 3-5개의 주요 단계(Phase)로 분해
-2. 각 단계를 2-4개의 세부 작업(Task)으로 분해
-3. 각 작업에 적절한 담당자 역할 배정 (PM, 기획자, 개발자, 디자이너, QA 등)
-4. 작업 기간은 전체 프로젝트 기간 내에서 현실적으로 배분
-5. 작업 간 의존성을 고려하여 순차적으로 배치
-6. 예상 리스크를 고려한 여유 기간 포함
-7. 주요 산출물 완성 시점을 마일스톤으로 표시
-
-## 출력 형식
-반드시 다음 JSON 형식으로만 응답해주세요. 다른 설명은 포함하지 마세요.
-
-**중요**: 
-- progress는 항상 0
-- status는 항상 "할일"
-- parent_id는 상위 작업의 task_id (최상위는 null)
-- dependencies 필드는 사용하지 않음
-
-{{
-  "project_name": "프로젝트명",
-  "total_tasks": 총_작업_수,
-  "total_duration_days": 전체_기간,
-  "wbs_structure": [
-    {{
-      "task_id": "1.0",
-      "parent_id": null,
-      "name": "주요 단계명",
-      "assignee": "담당자",
-      "start_date": "YYYY-MM-DD",
-      "end_date": "YYYY-MM-DD",
-      "duration_days": 일수,
-      "progress": 0,
-      "status": "할일",
-      "subtasks": [
-        {{
-          "task_id": "1.1",
-          "parent_id": "1.0",
-          "name": "세부 작업명",
-          "assignee": "담당자",
-          "start_date": "YYYY-MM-DD",
-          "end_date": "YYYY-MM-DD",
-          "duration_days": 일수,
-          "progress": 0,
-          "status": "할일",
-          "subtasks": []
-        }}
-      ]
-    }}
-  ]
-}}
-
-JSON 형식만 출력하고, 마크다운 코드 블록(```)이나 다른 설명은 포함하지 마세요.
-"""
+{date_info}{additional_block}{requirements_block}"""
         return prompt
     
     def _build_markdown_prompt(self, data: Dict[str, Any]) -> str:
@@ -176,11 +528,7 @@ JSON 형식만 출력하고, 마크다운 코드 블록(```)이나 다른 설명
         else:
             date_info = f"- **예상 기간**: {data['total_days']}일\n"
         
-        prompt = f"""
-당신은 프로젝트 관리 전문가입니다. 다음 프로젝트 정보를 상세하고 체계적인 마크다운 명세서로 작성해주세요.
-사용자가 이 명세서를 수정하여 더 정확한 WBS를 생성할 수 있도록 편집하기 쉬운 형식으로 만들어주세요.
-
-## 입력 정보:
+        prompt = f"""## 입력 정보:
 - 프로젝트명: {data['project_name']}
 - 프로젝트 주제: {data['project_type']}
 - 팀 규모: {data['team_size']}명
@@ -194,137 +542,464 @@ JSON 형식만 출력하고, 마크다운 코드 블록(```)이나 다른 설명
 {f"- 주요 기능: {', '.join(data['key_features'])}" if data.get('key_features') else ""}
 {f"- 구체적 요구사항: {data['detailed_requirements']}" if data.get('detailed_requirements') else ""}
 {f"- 제약사항: {data['constraints']}" if data.get('constraints') else ""}
-
-## 출력 형식:
-다음 구조로 마크다운 명세서를 작성하세요. 사용자가 각 섹션을 쉽게 수정할 수 있도록 명확하게 구분하세요.
-
-```markdown
-# 프로젝트 명세서: [프로젝트명]
-
-## 📋 프로젝트 개요
-- **프로젝트명**: 
-- **프로젝트 주제**: 
-- **팀 구성**: 
-- **기간**: 
-- **예산**: 
-- **우선순위**: 
-
-## 🎯 프로젝트 목적
-[프로젝트의 목적과 배경을 상세히 설명]
-
-## 💼 주요 이해관계자
-- [이름/역할] - [책임사항]
-
-## 📦 주요 산출물
-1. [산출물 1] - [설명]
-2. [산출물 2] - [설명]
-
-## ⚠️ 예상 리스크 및 완화 방안
-- **리스크**: [리스크 설명]
-  - **완화 방안**: [대응 방안]
-
-## ✨ 핵심 기능 및 요구사항
-### [기능 1]
-- [상세 설명]
-- [기술 요구사항]
-
-## 🔧 기술 요구사항
-- [요구사항 1]
-- [요구사항 2]
-
-## 📐 제약사항 및 가이드라인
-- [제약사항 1]
-- [제약사항 2]
-
-## 📅 주요 마일스톤 (선택)
-- [날짜]: [마일스톤 설명]
-```
-
-마크다운 형식만 출력하고, 코드 블록 마커나 다른 설명은 포함하지 마세요.
 """
         return prompt
     
     def _build_wbs_from_markdown_prompt(self, markdown_spec: str) -> str:
         """마크다운 명세서로부터 WBS 생성 프롬프트"""
-        
-        prompt = f"""
-당신은 프로젝트 관리 전문가입니다. 다음 마크다운 형식의 프로젝트 명세서를 분석하여 상세한 WBS(Work Breakdown Structure)를 생성해주세요.
-
-명세서의 모든 내용을 꼼꼼히 읽고, 언급된 기능, 요구사항, 제약사항, 리스크를 모두 반영하여 현실적이고 실행 가능한 작업 분해 구조를 만들어주세요.
-
-## 프로젝트 명세서:
-
-{markdown_spec}
-
-## WBS 생성 지침:
-1. 명세서의 **핵심 기능**을 기준으로 주요 단계를 구성
-2. **기술 요구사항**을 고려하여 세부 작업 생성
-3. **제약사항**에 맞춰 작업 기간 배분
-4. **리스크 완화 방안**을 작업에 반영
-5. **마일스톤**이 있다면 중요 작업에 표시
-6. **팀 구성**을 고려하여 담당자 배정
-
-## 출력 형식:
-반드시 다음 JSON 형식으로만 응답해주세요.
-
-**중요 규칙**:
-- progress는 항상 0 (초기 생성 시)
-- status는 항상 "할일" (초기 생성 시)
-- parent_id는 상위 작업의 task_id (최상위 작업은 null)
-- dependencies 필드는 사용하지 않음
-
-{{
-  "project_name": "프로젝트명",
-  "total_tasks": 총_작업_수,
-  "total_duration_days": 전체_기간,
-  "wbs_structure": [
-    {{
-      "task_id": "1.0",
-      "parent_id": null,
-      "name": "주요 단계명",
-      "assignee": "담당자",
-      "start_date": "YYYY-MM-DD",
-      "end_date": "YYYY-MM-DD",
-      "duration_days": 일수,
-      "progress": 0,
-      "status": "할일",
-      "subtasks": [
-        {{
-          "task_id": "1.1",
-          "parent_id": "1.0",
-          "name": "세부 작업명",
-          "assignee": "담당자",
-          "start_date": "YYYY-MM-DD",
-          "end_date": "YYYY-MM-DD",
-          "duration_days": 일수,
-          "progress": 0,
-          "status": "할일",
-          "subtasks": []
-        }}
-      ]
-    }}
-  ]
-}}
-
-JSON 형식만 출력하고, 마크다운 코드 블록(```)이나 다른 설명은 포함하지 마세요.
-"""
-        return prompt
+        return f"## 프로젝트 명세서:\n\n{markdown_spec}\n"
+    
+    def _build_wbs_incremental_prompt(self, change_context: Dict[str, Any]) -> str:
+        """증분 재생성 프롬프트 (변경되지 않은 섹션 본문은 보내지 않음)"""
+        blocks = []
+        if change_context["context_sections"]:
+            blocks.append("## 프로젝트 정보 (변경 없음):\n\n" + "\n\n".join(change_context["context_sections"]))
+        for title, key in (("수정된 섹션", "changed_sections"), ("추가된 섹션", "added_sections")):
+            if change_context[key]:
+                blocks.append(f"## {title}:\n\n" + "\n\n".join(change_context[key]))
+        if change_context["removed_sections"]:
+            blocks.append("## 삭제된 섹션:\n" + "\n".join(f"- {key}" for key in change_context["removed_sections"]))
+        blocks.append(f"## 현재 WBS:\n{change_context['wbs_outline']}")
+        return "\n\n".join(blocks) + "\n"
     
-    async def _generate_content(self, prompt: str) -> str:
+    async def _generate_content(
+        self,
+        prompt: str,
+        bypass_cache: bool = False,
+        config: Optional[types.GenerateContentConfig] = None,
+        operation: str = "generate",
+        model: Optional[str] = None,
+        accept: Optional[Callable[[str], None]] = None
+    ) -> str:
         """
         Gemini API를 호출하여 컨텐츠 생성
         
+        응답 캐시를 먼저 조회하고, 캐시에 없으면 같은 지문(캐시 키)으로
+        진행 중인 호출이 있는지 확인하여 하나의 업스트림 호출 결과를 공유합니다.
+        현재 엔드포인트에 경주가 켜져 있고 accept가 있으면 두 모델에 동시에 호출합니다.
+        
         Args:
             prompt: 생성 프롬프트
+            bypass_cache: True면 캐시를 조회하지 않음 (결과는 다시 저장)
+            config: 생성 설정
+            operation: 생성 종류 (지표 집계용)
+            model: 라우터가 선택한 모델 (없으면 기본 모델)
+            accept: 경주 승자 판정 함수 (응답을 쓸 수 없으면 ValueError)
             
         Returns:
             생성된 텍스트
         """
+        model = model or self.model_name
+        config_dict = config.model_dump(mode="json", exclude_none=True) if config else None
+        cache_key = self.cache.make_key(prompt, model, config_dict)
+        
+        cached = await self.cache.get(cache_key, bypass=bypass_cache)
+        _set_response_model(model, cached is not None)
+        if cached is not None:
+            return cached
+        
+        if accept is not None and self.race_policy.enabled():
+            winner, text = await self.single_flight.do(
+                f"race:{cache_key}",
+                lambda: self._race_and_store(prompt, config, cache_key, operation, model, accept)
+            )
+            _set_response_model(winner, False)
+            return text
+        
+        return await self.single_flight.do(
+            cache_key,
+            lambda: self._call_and_store(prompt, config, cache_key, operation, model)
+        )
+    
+    async def _stream_content(
+        self,
+        prompt: str,
+        bypass_cache: bool = False,
+        config: Optional[types.GenerateContentConfig] = None,
+        operation: str = "generate",
+        model: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Gemini 스트리밍 생성 호출
+        
+        캐시에 있으면 전체 텍스트를 한 번에 내보내고,
+        없으면 SDK 스트리밍 결과를 조각 단위로 전달한 뒤 완성본을 캐시에 저장합니다.
+        
+        Note:
+            업스트림은 별도 작업(_read_stream)이 큐에 옮겨 담으므로 동시 호출 슬롯(GEMINI_MAX_CONCURRENCY)은
+            업스트림을 읽는 동안만 유지하고, 클라이언트가 느리게 읽어도 다른 호출을 막지 않습니다.
+            큐는 응답 1개 분량(최대 출력 토큰)까지만 쌓이며, 클라이언트 전달까지 포함한 동시 스트림 수는
+            GEMINI_MAX_STREAMS로 따로 제한합니다.
+        """
+        started_at = time.perf_counter()
+        model = model or self.model_name
+        config_dict = config.model_dump(mode="json", exclude_none=True) if config else None
+        cache_key = self.cache.make_key(prompt, model, config_dict)
+        
+        cached = await self.cache.get(cache_key, bypass=bypass_cache)
+        _set_response_model(model, cached is not None)
+        if cached is not None:
+            yield {"event": "chunk", "text": cached}
+            yield {
+                "event": "done",
+                "cached": True,
+                "model": model,
+                "usage": {},
+                "timing": {"first_chunk_ms": 0.0, "total_ms": _elapsed_ms(started_at)}
+            }
+            return
+        
+        chunks = []
+        first_chunk_ms = None
+        async with _stream_semaphore:
+            queue: "asyncio.Queue[Any]" = asyncio.Queue()
+            reader = asyncio.create_task(self._read_stream(prompt, config, model, queue))
+            try:
+                while True:
+                    text = await queue.get()
+                    if text is _STREAM_END:
+                        break
+                    if first_chunk_ms is None:
+                        first_chunk_ms = _elapsed_ms(started_at)
+                    chunks.append(text)
+                    yield {"event": "chunk", "text": text}
+                usage = await reader
+            except Exception as e:
+                if not isinstance(e, RateLimitExceeded):
+                    self.router.record_call(model, time.perf_counter() - started_at, False)
+                raise self._upstream_error(e)
+            finally:
+                # 클라이언트 연결이 끊긴 경우 업스트림 읽기도 중단
+                reader.cancel()
+        
+        self.router.record_call(model, time.perf_counter() - started_at, True)
+        self._record_call(operation, config, time.perf_counter() - started_at, usage, model)
+        await self.cache.set(cache_key, "".join(chunks))
+        yield {
+            "event": "done",
+            "cached": False,
+            "model": model,
+            "usage": _usage_to_dict(usage),
+            "timing": {"first_chunk_ms": first_chunk_ms, "total_ms": _elapsed_ms(started_at)}
+        }
+    
+    async def _read_stream(
+        self,
+        prompt: str,
+        config: Optional[types.GenerateContentConfig],
+        model: str,
+        queue: "asyncio.Queue[Any]"
+    ) -> Optional[types.GenerateContentResponseUsageMetadata]:
+        """
+        업스트림 스트림의 텍스트 조각을 큐에 전달 (끝나면 성공/실패와 관계없이 _STREAM_END 전달)
+        
+        Returns:
+            마지막 조각의 토큰 사용량
+            
+        Note:
+            첫 조각을 보내기 전의 실패는 재시도/헤징 정책과 같은 분류와 백오프로 다시 시도하고
+            (컨텍스트 캐시가 만료된 경우 핸들을 폐기하고 바로 재시도), 조각을 보낸 뒤의 실패는
+            이미 전달한 내용을 되돌릴 수 없으므로 그대로 발생시킵니다.
+        """
+        deadline = time.monotonic() + self.resilience.deadline_seconds
         try:
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=prompt
+            for attempt_number in range(self.resilience.max_attempts):
+                estimated_tokens = self._estimate_tokens(prompt, config)
+                await self.rate_limiter.acquire(estimated_tokens)
+                request_config = await self._with_context_cache(config, model)
+                usage = None
+                sent = False
+                try:
+                    async with _upstream_semaphore:
+                        with track_inflight(model), track_stage("upstream", model):
+                            stream = await self.client.aio.models.generate_content_stream(
+                                model=model,
+                                contents=prompt,
+                                config=request_config
+                            )
+                            async for chunk in stream:
+                                if chunk.usage_metadata is not None:
+                                    usage = chunk.usage_metadata
+                                if chunk.text:
+                                    sent = True
+                                    queue.put_nowait(chunk.text)
+                except Exception as e:
+                    if sent:
+                        raise
+                    if request_config is not config and _is_missing_cache_error(e):
+                        # 서버에서 캐시가 만료/삭제된 경우 핸들을 폐기하고 다시 시도 (다음 시도에서 재등록)
+                        self.context_cache.invalidate(model, config.system_instruction)
+                        if attempt_number < self.resilience.max_attempts - 1:
+                            continue
+                        raise
+                    await self.resilience.backoff(attempt_number, e, deadline)
+                    continue
+                
+                self.rate_limiter.record_usage(estimated_tokens, usage.total_token_count if usage else None)
+                return usage
+            
+            raise asyncio.TimeoutError("Gemini 호출 전체 제한 시간을 초과했습니다.")
+        finally:
+            queue.put_nowait(_STREAM_END)
+    
+    async def _call_and_store(
+        self,
+        prompt: str,
+        config: Optional[types.GenerateContentConfig],
+        cache_key: str,
+        operation: str,
+        model: str
+    ) -> str:
+        """업스트림 호출 후 결과를 캐시에 저장"""
+        text = await self._call_model(prompt, config, operation, model)
+        await self.cache.set(cache_key, text)
+        return text
+    
+    async def _race_and_store(
+        self,
+        prompt: str,
+        config: Optional[types.GenerateContentConfig],
+        cache_key: str,
+        operation: str,
+        model: str,
+        accept: Callable[[str], None]
+    ) -> Tuple[str, str]:
+        """
+        같은 프롬프트를 경주자 모델들에 동시에 호출하고 먼저 검증을 통과한 응답을 캐시에 저장
+        
+        Returns:
+            (응답 모델, 응답 텍스트)
+            
+        Note:
+            승자가 정해지면 나머지 호출은 취소합니다.
+            모든 응답이 검증에 실패하면 첫 번째로 도착한 응답을 그대로 반환해
+            호출자의 로컬 수정/재생성 단계에서 처리하게 합니다 (업스트림 오류만 있으면 예외 발생).
+        """
+        racers = self.race_policy.racers(model)
+        rejected: List[Tuple[str, str]] = []
+        started_at = time.perf_counter()
+        
+        async def run(racer_model: str) -> str:
+            text = await self._call_model(prompt, config, operation, racer_model)
+            try:
+                accept(text)
+            except ValueError:
+                self.router.record_parse(racer_model, False)
+                rejected.append((racer_model, text))
+                raise
+            return text
+        
+        try:
+            index, text = await first_valid([
+                lambda racer_model=racer_model: run(racer_model) for _, racer_model in racers
+            ])
+        except Exception:
+            self.race_policy.record_failure(model)
+            if not rejected:
+                raise
+            winner, text = rejected[0]
+        else:
+            racer, winner = racers[index]
+            self.race_policy.record_win(
+                racer, winner, time.perf_counter() - started_at, self.router.latency_quantile(model, 0.5)
+            )
+        await self.cache.set(cache_key, text)
+        return winner, text
+    
+    async def _call_model(
+        self,
+        prompt: str,
+        config: Optional[types.GenerateContentConfig] = None,
+        operation: str = "generate",
+        model: Optional[str] = None
+    ) -> str:
+        """
+        Gemini API 호출 (재시도/헤징 정책 적용)
+        
+        일시적인 오류는 전체 제한 시간 안에서 백오프 후 재시도하고,
+        최종 실패는 라우터가 처리할 수 있는 예외로 변환합니다.
+        재시도를 포함한 호출 결과는 모델 라우터의 SLO/오류 예산 판단에 기록합니다
+        (클라이언트 측 호출 한도 대기 초과는 모델 오류로 보지 않음).
+        """
+        model = model or self.model_name
+        started_at = time.perf_counter()
+        try:
+            text = await self.resilience.run(
+                lambda admission: self._attempt(prompt, config, operation, model, admission),
+                lambda: self._admit(prompt, config, model)
             )
-            return response.text
         except Exception as e:
-            raise Exception(f"Gemini API 호출 실패: {str(e)}")
+            if not isinstance(e, RateLimitExceeded):
+                self.router.record_call(model, time.perf_counter() - started_at, False)
+            raise self._upstream_error(e)
+        self.router.record_call(model, time.perf_counter() - started_at, True)
+        return text
+    
+    @asynccontextmanager
+    async def _admit(
+        self,
+        prompt: str,
+        config: Optional[types.GenerateContentConfig],
+        model: str
+    ) -> AsyncIterator[_Admission]:
+        """
+        호출 1회의 전송 준비 (재시도/헤징 정책의 시도 제한 시간과 지연 시간 기록 밖에서 대기)
+        
+        Note:
+            호출 빈도는 RPM/TPM 제한기로, 동시 호출 수는 GEMINI_MAX_CONCURRENCY로 제한되며
+            동시 호출 슬롯은 시도가 끝날 때까지 유지합니다.
+        """
+        estimated_tokens = self._estimate_tokens(prompt, config)
+        await self.rate_limiter.acquire(estimated_tokens)
+        request_config = await self._with_context_cache(config, model)
+        async with _upstream_semaphore:
+            yield _Admission(estimated_tokens, request_config)
+    
+    async def _attempt(
+        self,
+        prompt: str,
+        config: Optional[types.GenerateContentConfig],
+        operation: str,
+        model: str,
+        admission: _Admission
+    ) -> str:
+        """
+        Gemini API 호출 1회 (_admit 통과 후 실행, SDK 예외를 그대로 발생)
+        
+        Note:
+            이벤트 루프를 막지 않도록 SDK의 비동기 클라이언트(client.aio)를 사용하고,
+            비동기 클라이언트가 없으면 스레드 풀로 위임합니다.
+        """
+        request_config = admission.request_config
+        started_at = time.perf_counter()
+        with track_inflight(model), track_stage("upstream", model):
+            try:
+                response = await self._send(prompt, request_config, model)
+            except errors.APIError as e:
+                if request_config is config or not _is_missing_cache_error(e):
+                    raise
+                # 서버에서 캐시가 만료/삭제된 경우 핸들을 폐기하고 시스템 지시문을 직접 전송
+                self.context_cache.invalidate(model, config.system_instruction)
+                response = await self._send(prompt, config, model)
+        
+        usage = response.usage_metadata
+        self.rate_limiter.record_usage(admission.estimated_tokens, usage.total_token_count if usage else None)
+        self._record_call(operation, config, time.perf_counter() - started_at, usage, model)
+        if not response.text:
+            raise InvalidResponseError("Gemini가 빈 응답을 반환했습니다.")
+        return response.text
+    
+    async def _send(
+        self,
+        prompt: str,
+        config: Optional[types.GenerateContentConfig],
+        model: str
+    ) -> types.GenerateContentResponse:
+        """SDK 생성 호출 (비동기 클라이언트가 없으면 스레드 풀로 위임)"""
+        if hasattr(self.client, "aio"):
+            return await self.client.aio.models.generate_content(
+                model=model,
+                contents=prompt,
+                config=config
+            )
+        return await asyncio.to_thread(
+            self.client.models.generate_content,
+            model=model,
+            contents=prompt,
+            config=config
+        )
+    
+    async def _with_context_cache(
+        self,
+        config: Optional[types.GenerateContentConfig],
+        model: str
+    ) -> Optional[types.GenerateContentConfig]:
+        """
+        시스템 지시문을 컨텍스트 캐시 참조(cached_content)로 교체
+        
+        Returns:
+            캐시를 쓸 수 있으면 시스템 지시문 대신 캐시 이름을 담은 설정 사본,
+            없으면 원래 설정 (응답 캐시 키는 항상 원래 설정 기준)
+            
+        Note:
+            컨텍스트 캐시는 모델별로 등록되므로 라우팅된 모델마다 따로 관리됩니다.
+        """
+        if config is None or not isinstance(config.system_instruction, str):
+            return config
+        name = await self.context_cache.resolve(model, config.system_instruction)
+        if name is None:
+            return config
+        return config.model_copy(update={"cached_content": name, "system_instruction": None})
+    
+    def _estimate_tokens(self, prompt: str, config: Optional[types.GenerateContentConfig]) -> int:
+        """예상 토큰 수 (캐시된 시스템 지시문도 입력 토큰으로 집계됨)"""
+        system_instruction = config.system_instruction if config is not None else None
+        if isinstance(system_instruction, str):
+            prompt = system_instruction + prompt
+        return self.rate_limiter.estimate_tokens(prompt)
+    
+    def _record_call(
+        self,
+        operation: str,
+        config: Optional[types.GenerateContentConfig],
+        latency_seconds: float,
+        usage: Optional[types.GenerateContentResponseUsageMetadata],
+        model: str
+    ) -> None:
+        """업스트림 호출 1회의 지연 시간/토큰 사용량/예상 비용 기록 (운영 지표 + Prometheus)"""
+        self.generation_stats.record_call(self._stats_key(operation, config), latency_seconds, usage)
+        self.router.record_usage(model, usage)
+        if usage is not None:
+            record_tokens(
+                model,
+                usage.prompt_token_count,
+                usage.cached_content_token_count,
+                usage.candidates_token_count
+            )
+    
+    @staticmethod
+    def _stats_key(operation: str, config: Optional[types.GenerateContentConfig]) -> str:
+        """지표 키 (생성 종류/출력 방식)"""
+        mode = "structured" if config is not None and config.response_schema is not None else "prompt"
+        return f"{operation}/{mode}"
+    
+    def _upstream_error(self, error: Exception) -> Exception:
+        """업스트림 예외 변환 (429는 RateLimitExceeded, 나머지는 일반 호출 실패)"""
+        if isinstance(error, RateLimitExceeded):
+            return error
+        if isinstance(error, errors.APIError) and error.code == 429:
+            self.rate_limiter.record_upstream_rejection()
+            return RateLimitExceeded(
+                "Gemini API 호출 한도를 초과했습니다. 잠시 후 다시 시도해주세요.",
+                retry_after=retry_after_from_error(error.details, settings.RATE_LIMIT_DEFAULT_RETRY_AFTER)
+            )
+        return Exception(f"Gemini API 호출 실패: {str(error)}")
+
+
+def _set_response_model(model: str, cached: bool) -> None:
+    """현재 요청의 응답 모델 기록 (단계별/HTTP 지표 라벨, 모델별 파싱 성공률용)"""
+    _response_model.set(model)
+    _response_cached.set(cached)
+    record_request_model(model)
+
+
+def _is_missing_cache_error(error: Exception) -> bool:
+    """참조한 컨텍스트 캐시가 서버에 없을 때의 오류 (만료/삭제)"""
+    return isinstance(error, errors.APIError) and error.code in (403, 404)
+
+
+def _elapsed_ms(started_at: float) -> float:
+    """perf_counter 기준 경과 시간(ms)"""
+    return round((time.perf_counter() - started_at) * 1000, 1)
+
+
+def _usage_to_dict(usage: Optional[types.GenerateContentResponseUsageMetadata]) -> Dict[str, Any]:
+    """SDK 토큰 사용량 메타데이터를 응답용 딕셔너리로 변환"""
+    if usage is None:
+        return {}
+    return {
+        "prompt_tokens": usage.prompt_token_count,
+        "cached_tokens": usage.cached_content_token_count,
+        "output_tokens": usage.candidates_token_count,
+        "total_tokens": usage.total_token_count
+    }
@@ -0,0 +1,85 @@
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Optional
+from google.genai import types
+
+logger = logging.getLogger(__name__)
+
+
+class GenerationStats:
+    """
+    생성 방식별 품질/비용 지표
+    
+    키(예: "wbs/structured", "wbs/prompt")별로 호출 수, 평균 지연 시간,
+    평균 입력(컨텍스트 캐시 적중분 포함)/출력 토큰, JSON 파싱 실패율, 로컬 수정률/생략한 재생성 수를 집계하여 출력 모드를 비교할 수 있게 합니다.
+    """
+    
+    def __init__(self):
+        self._entries: Dict[str, Dict[str, float]] = defaultdict(lambda: {
+            "calls": 0,
+            "latency_seconds": 0.0,
+            "prompt_tokens": 0,
+            "cached_tokens": 0,
+            "output_tokens": 0,
+            "parse_success": 0,
+            "parse_failure": 0,
+            "validated": 0,
+            "repaired": 0,
+            "retries_avoided": 0,
+            "retried": 0
+        })
+    
+    def record_call(
+        self,
+        key: str,
+        latency_seconds: float,
+        usage: Optional[types.GenerateContentResponseUsageMetadata]
+    ) -> None:
+        """업스트림 호출 1회 기록"""
+        entry = self._entries[key]
+        entry["calls"] += 1
+        entry["latency_seconds"] += latency_seconds
+        if usage is not None:
+            entry["prompt_tokens"] += usage.prompt_token_count or 0
+            entry["cached_tokens"] += usage.cached_content_token_count or 0
+            entry["output_tokens"] += usage.candidates_token_count or 0
+            logger.debug(
+                f"Gemini 호출 ({key}): 입력 {usage.prompt_token_count} 토큰 "
+                f"(캐시 {usage.cached_content_token_count or 0}), 출력 {usage.candidates_token_count} 토큰"
+            )
+    
+    def record_parse(self, key: str, success: bool) -> None:
+        """응답 JSON 파싱 결과 기록"""
+        self._entries[key]["parse_success" if success else "parse_failure"] += 1
+    
+    def record_repair(self, key: str, outcome: str, retry_avoided: bool) -> None:
+        """응답 검증/수정 결과 기록 (outcome: clean | repaired | retried | failed)"""
+        entry = self._entries[key]
+        entry["validated"] += 1
+        if outcome == "repaired":
+            entry["repaired"] += 1
+        elif outcome in ("retried", "failed"):
+            entry["retried"] += 1
+        if retry_avoided:
+            entry["retries_avoided"] += 1
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """키별 평균/비율 지표"""
+        result = {}
+        for key, entry in self._entries.items():
+            calls = entry["calls"]
+            parsed = entry["parse_success"] + entry["parse_failure"]
+            validated = entry["validated"]
+            result[key] = {
+                "calls": calls,
+                "avg_latency_ms": round(entry["latency_seconds"] / calls * 1000, 1) if calls else None,
+                "avg_prompt_tokens": round(entry["prompt_tokens"] / calls, 1) if calls else None,
+                "avg_cached_tokens": round(entry["cached_tokens"] / calls, 1) if calls else None,
+                "avg_output_tokens": round(entry["output_tokens"] / calls, 1) if calls else None,
+                "parse_failures": entry["parse_failure"],
+                "parse_failure_rate": round(entry["parse_failure"] / parsed, 4) if parsed else None,
+                "repair_rate": round(entry["repaired"] / validated, 4) if validated else None,
+                "retries_avoided": entry["retries_avoided"],
+                "retries": entry["retried"]
+            }
+        return result
@@ -0,0 +1,321 @@
+import asyncio
+import json
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from app.core.config import settings
+from app.core.metrics import track_stage
+from app.core.sqlite_store import SQLiteStore
+from app.models.markdown import IncrementalInfo, IncrementalMode, WBSIncrementalResponse
+from app.models.response import WBSGenerateResponse, WBSTask
+from app.services.gemini_service import GeminiService
+from app.services.wbs_from_markdown import WBSFromMarkdownGenerator
+from app.services.wbs_validation import generate_valid_wbs
+from app.utils.spec_diff import SpecDiff, SpecSection, diff_sections, normalize_title, parse_sections
+from app.utils.wbs_repair import task_number
+
+
+class SpecRevisionStore(SQLiteStore):
+    """SQLite 기반 명세서 리비전 저장소 (문서별 마지막 명세서와 WBS)"""
+    
+    def __init__(self, path: str):
+        super().__init__(path, [
+            """
+            CREATE TABLE IF NOT EXISTS spec_revisions (
+                document_id TEXT PRIMARY KEY,
+                revision INTEGER NOT NULL,
+                markdown_spec TEXT NOT NULL,
+                wbs TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+            """
+        ])
+    
+    async def get(self, document_id: str) -> Optional[Dict[str, Any]]:
+        rows = await self._read(
+            "SELECT revision, markdown_spec, wbs FROM spec_revisions WHERE document_id = ?",
+            (document_id,)
+        )
+        if not rows:
+            return None
+        revision, markdown_spec, wbs = rows[0]
+        return {"revision": revision, "markdown_spec": markdown_spec, "wbs": json.loads(wbs)}
+    
+    async def save(self, document_id: str, revision: int, markdown_spec: str, wbs: WBSGenerateResponse) -> None:
+        await self._write(
+            "INSERT INTO spec_revisions (document_id, revision, markdown_spec, wbs, updated_at) "
+            "VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(document_id) DO UPDATE SET "
+            "revision = excluded.revision, markdown_spec = excluded.markdown_spec, "
+            "wbs = excluded.wbs, updated_at = excluded.updated_at",
+            (document_id, revision, markdown_spec, wbs.model_dump_json(), datetime.now(timezone.utc).isoformat())
+        )
+
+
+class IncrementalWBSGenerator(WBSFromMarkdownGenerator):
+    """
+    수정된 마크다운 명세서로 WBS 증분 재생성
+    
+    - 문서별 마지막 명세서와 WBS를 저장해 두고, 수정본과 ## / ### 섹션 단위로 비교
+    - 변경된 섹션과 현재 WBS 개요만 보내 영향받는 주요 단계만 다시 생성
+    - 다시 생성된 단계를 기존 WBS에 병합 (기존 단계/작업의 task_id 유지)
+    - 개요/제약사항/마일스톤처럼 전체 일정에 영향을 주는 섹션이 바뀌었거나
+      변경 분량이 INCREMENTAL_MAX_CHANGED_RATIO를 넘으면 전체 재생성
+    """
+    
+    def __init__(
+        self,
+        gemini_service: Optional[GeminiService] = None,
+        store: Optional[SpecRevisionStore] = None,
+        max_changed_ratio: Optional[float] = None
+    ):
+        super().__init__(gemini_service)
+        self.store = store or SpecRevisionStore(settings.INCREMENTAL_DB_PATH)
+        self.max_changed_ratio = (
+            settings.INCREMENTAL_MAX_CHANGED_RATIO if max_changed_ratio is None else max_changed_ratio
+        )
+        # 같은 문서의 동시 수정 요청은 순서대로 처리 (리비전 꼬임 방지), 문서 ID → [잠금, 대기 수]
+        self._document_locks: Dict[str, List[Any]] = {}
+    
+    async def regenerate_wbs(
+        self,
+        markdown_spec: str,
+        document_id: Optional[str] = None,
+        force_full: bool = False,
+        bypass_cache: bool = False
+    ) -> WBSIncrementalResponse:
+        """
+        수정된 명세서로 WBS 재생성 (가능하면 변경된 부분만)
+        
+        Args:
+            markdown_spec: 수정된 마크다운 명세서
+            document_id: 이전 응답의 문서 ID (없거나 저장되지 않은 ID면 전체 생성)
+            force_full: True면 항상 전체 재생성
+            bypass_cache: True면 응답 캐시를 사용하지 않음
+        
+        Returns:
+            병합된 WBS와 문서 리비전, 증분 처리 정보
+        """
+        document_id = document_id or uuid.uuid4().hex
+        entry = self._document_locks.setdefault(document_id, [asyncio.Lock(), 0])
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                return await self._regenerate(markdown_spec, document_id, force_full, bypass_cache)
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._document_locks[document_id]
+    
+    async def _regenerate(
+        self,
+        markdown_spec: str,
+        document_id: str,
+        force_full: bool,
+        bypass_cache: bool
+    ) -> WBSIncrementalResponse:
+        previous = await self.store.get(document_id)
+        revision = previous["revision"] + 1 if previous else 1
+        new_sections = parse_sections(markdown_spec)
+        
+        # 1. 처리 방식 결정
+        diff: Optional[SpecDiff] = None
+        if previous is None:
+            reason = "이전 명세서가 없어 전체 생성"
+        elif force_full:
+            reason = "force_full 요청"
+        else:
+            diff = diff_sections(parse_sections(previous["markdown_spec"]), new_sections)
+            reason = self._full_regeneration_reason(diff, new_sections)
+        
+        if diff is not None and not diff.has_changes:
+            return WBSIncrementalResponse(
+                **previous["wbs"],
+                document_id=document_id,
+                revision=previous["revision"],
+                incremental=IncrementalInfo(mode=IncrementalMode.UNCHANGED, reason="변경된 섹션 없음")
+            )
+        
+        # 2. 전체 생성 또는 변경된 단계만 재생성 후 병합
+        if diff is None or reason:
+            result = await self.generate_wbs(markdown_spec, bypass_cache=bypass_cache)
+            info = IncrementalInfo(
+                mode=IncrementalMode.FULL,
+                reason=reason,
+                changed_sections=diff.changed_keys if diff else []
+            )
+        else:
+            current = WBSGenerateResponse(**previous["wbs"])
+            patch = await self._generate_patch(current, diff, new_sections, bypass_cache)
+            with track_stage("merge", self.gemini_service.response_model):
+                result, regenerated, added, reused = merge_wbs_phases(current, patch)
+            # 병합으로 작업량이 바뀐 단계 뒤의 일정도 함께 조정 (시작일은 기존 WBS 유지)
+            if settings.LOCAL_SCHEDULING_ENABLED:
+                with track_stage("schedule", self.gemini_service.response_model):
+                    result = self._schedule(
+                        result,
+                        markdown_spec,
+                        default_start=min((phase.start_date for phase in current.wbs_structure), default=None)
+                    )
+            info = IncrementalInfo(
+                mode=IncrementalMode.INCREMENTAL,
+                reason=f"변경 섹션 {len(diff.changed_keys)}개에 영향받는 주요 단계만 재생성",
+                changed_sections=diff.changed_keys,
+                regenerated_phases=regenerated,
+                added_phases=added,
+                reused_task_ids=reused
+            )
+        
+        # 3. 다음 수정의 기준으로 저장
+        await self.store.save(document_id, revision, markdown_spec, result)
+        # 이미 검증된 WBS이므로 재검증 없이 응답 모델 구성
+        return WBSIncrementalResponse.model_construct(
+            **dict(result),
+            document_id=document_id,
+            revision=revision,
+            incremental=info
+        )
+    
+    def _full_regeneration_reason(self, diff: SpecDiff, new_sections: List[SpecSection]) -> str:
+        """전체 재생성이 필요한 이유 (증분 재생성 가능하면 빈 문자열)"""
+        if not diff.has_changes:
+            return ""
+        if diff.global_changed:
+            return "전체 일정에 영향을 주는 섹션(개요/제약사항/마일스톤 등) 변경"
+        total = sum(len(section.text) for section in new_sections) or 1
+        changed = sum(len(section.text) for section in (*diff.changed, *diff.added, *diff.removed))
+        if changed / total > self.max_changed_ratio:
+            return f"변경 분량이 명세서의 {changed / total:.0%}로 기준({self.max_changed_ratio:.0%}) 초과"
+        return ""
+    
+    async def _generate_patch(
+        self,
+        current: WBSGenerateResponse,
+        diff: SpecDiff,
+        new_sections: List[SpecSection],
+        bypass_cache: bool
+    ) -> List[WBSTask]:
+        """변경 섹션과 현재 WBS 개요로 영향받는 주요 단계만 생성"""
+        change_context = {
+            "context_sections": [
+                section.text for section in new_sections
+                if section.is_global and section not in diff.changed and section not in diff.added
+            ],
+            "changed_sections": [f"[{section.key}]\n{section.text}" for section in diff.changed],
+            "added_sections": [f"[{section.key}]\n{section.text}" for section in diff.added],
+            "removed_sections": [section.key for section in diff.removed],
+            "wbs_outline": wbs_outline(current)
+        }
+        # 패치는 일부 단계만 담으므로 잘린 응답은 복구하지 않고 재생성
+        wbs_data = await generate_valid_wbs(
+            self.gemini_service,
+            "wbs_incremental",
+            lambda bypass: self.gemini_service.generate_wbs_incremental(change_context, bypass_cache=bypass),
+            bypass_cache=bypass_cache,
+            allow_truncated=False,
+            min_phases=0
+        )
+        
+        with track_stage("validation", self.gemini_service.response_model):
+            return [WBSTask(**phase) for phase in wbs_data["wbs_structure"]]
+
+
+def wbs_outline(wbs: WBSGenerateResponse) -> str:
+    """프롬프트용 WBS 개요 (작업마다 한 줄: task_id 작업명 | 담당자 | 시작일 ~ 종료일)"""
+    lines = [f"프로젝트명: {wbs.project_name}", f"전체 기간: {wbs.total_duration_days}일"]
+    stack = [(task, 0) for task in reversed(wbs.wbs_structure)]
+    while stack:
+        task, depth = stack.pop()
+        lines.append(
+            f"{'  ' * depth}- {task.task_id} {task.name} | {task.assignee} | {task.start_date} ~ {task.end_date}"
+        )
+        stack.extend((subtask, depth + 1) for subtask in reversed(task.subtasks or []))
+    return "\n".join(lines)
+
+
+def merge_wbs_phases(
+    current: WBSGenerateResponse,
+    patch: List[WBSTask]
+) -> Tuple[WBSGenerateResponse, List[str], List[str], int]:
+    """
+    다시 생성된 주요 단계를 기존 WBS에 병합
+    
+    Args:
+        current: 기존 WBS
+        patch: 다시 생성된 주요 단계 목록
+    
+    Returns:
+        (병합된 WBS, 교체된 단계 task_id, 추가된 단계 task_id, 기존 task_id를 유지한 작업 수)
+    
+    Note:
+        다시 생성된 단계는 작업명이 같은 기존 단계만 교체합니다. task_id는 작업명이 같을 때만 같은 단계로 보며,
+        task_id만 같고 작업명이 다른 단계는 새 단계로 추가하고 다음 번호를 부여합니다 (다른 단계를 덮어쓰지 않도록).
+        하위 작업도 같은 부모 아래 작업명이 같으면 기존 task_id를 유지하고,
+        새 작업은 형제 중 가장 큰 번호 다음 번호를 받습니다 (AI가 준 task_id는 사용하지 않음).
+        patch에 없는 단계는 그대로 유지하므로 단계 삭제는 전체 재생성으로 처리해야 합니다.
+    """
+    phases = list(current.wbs_structure)
+    by_name = {normalize_title(phase.name): index for index, phase in enumerate(phases)}
+    next_phase = max((task_number(phase.task_id, first=True) for phase in phases), default=0) + 1
+    
+    regenerated: List[str] = []
+    added: List[str] = []
+    reused = 0
+    for new_phase in patch:
+        index = by_name.get(normalize_title(new_phase.name))
+        if index is not None and phases[index].task_id not in regenerated:
+            old_phase = phases[index]
+            merged, count = _renumber(new_phase, old_phase.task_id, None, old_phase)
+            phases[index] = merged
+            regenerated.append(old_phase.task_id)
+            reused += count
+        else:
+            merged, _ = _renumber(new_phase, f"{next_phase}.0", None, None)
+            phases.append(merged)
+            added.append(merged.task_id)
+            next_phase += 1
+    
+    all_tasks = _walk(phases)
+    start = min(task.start_date for task in all_tasks)
+    end = max(task.end_date for task in all_tasks)
+    merged_wbs = WBSGenerateResponse(
+        project_name=current.project_name,
+        total_tasks=len(all_tasks),
+        total_duration_days=(end - start).days + 1,
+        wbs_structure=phases
+    )
+    return merged_wbs, regenerated, added, reused
+
+
+def _renumber(task: WBSTask, task_id: str, parent_id: Optional[str], old: Optional[WBSTask]) -> Tuple[WBSTask, int]:
+    """task_id를 확정하고 하위 작업을 기존 작업과 작업명으로 대응시켜 번호 부여 (유지된 task_id 수 반환)"""
+    old_children = {normalize_title(child.name): child for child in (old.subtasks or [])} if old else {}
+    # 주요 단계 "1.0"의 하위는 "1.1", 그 외 "1.1"의 하위는 "1.1.1"
+    prefix = task_id[:-2] if parent_id is None and task_id.endswith(".0") else task_id
+    next_child = max((task_number(child.task_id) for child in old_children.values()), default=0) + 1
+    
+    reused = 1 if old is not None else 0
+    subtasks = []
+    for child in task.subtasks or []:
+        old_child = old_children.pop(normalize_title(child.name), None)
+        if old_child is not None:
+            child_id = old_child.task_id
+        else:
+            child_id = f"{prefix}.{next_child}"
+            next_child += 1
+        renumbered, count = _renumber(child, child_id, task_id, old_child)
+        subtasks.append(renumbered)
+        reused += count
+    
+    return task.model_copy(update={"task_id": task_id, "parent_id": parent_id, "subtasks": subtasks}), reused
+
+
+def _walk(phases: List[WBSTask]) -> List[WBSTask]:
+    """모든 작업 (전위 순회)"""
+    tasks = []
+    stack = list(reversed(phases))
+    while stack:
+        task = stack.pop()
+        tasks.append(task)
+        stack.extend(reversed(task.subtasks or []))
+    return tasks
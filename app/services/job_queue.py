@@ -0,0 +1,394 @@
+import asyncio
+import hashlib
+import json
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+import httpx
+from app.core.config import settings
+from app.core.metrics import JOB_QUEUE_DEPTH, JOBS_RUNNING, track_stage
+from app.core.sqlite_store import SQLiteStore
+from app.models.job import JobKind, JobStatus, JobResponse
+from app.models.markdown import WBSFromSpecRequest
+from app.models.request import WBSGenerateRequest
+from app.services.gemini_service import GeminiService
+from app.services.markdown_generator import MarkdownSpecGenerator
+from app.services.spring_push import SpringPushError, SpringPushSink, create_spring_push_sink
+from app.services.wbs_from_markdown import WBSFromMarkdownGenerator
+from app.services.wbs_generator import WBSGenerator
+from app.utils.wbs_converter import FlatTaskRow, flat_task_dicts, iter_flat_tasks
+from app.utils.webhook_url import allowed_hosts_from_setting, resolve_public_host
+
+logger = logging.getLogger(__name__)
+
+# 작업 종류별 요청 모델 (제출 시 payload 검증용)
+PAYLOAD_MODELS = {
+    JobKind.WBS: WBSGenerateRequest,
+    JobKind.SPEC: WBSGenerateRequest,
+    JobKind.WBS_FROM_SPEC: WBSFromSpecRequest,
+    JobKind.WBS_FROM_SPEC_FLAT: WBSFromSpecRequest,
+}
+
+
+class JobStore(SQLiteStore):
+    """SQLite 기반 작업 테이블 (재시작 후에도 작업 유지)"""
+    
+    _COLUMNS = "id, kind, status, payload, error, result, created_at, updated_at"
+    
+    def __init__(self, path: str):
+        super().__init__(path, [
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                status TEXT NOT NULL,
+                payload_hash TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                webhook_url TEXT,
+                error TEXT,
+                result TEXT,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+            """,
+            # 중복 제거된 제출자의 webhook (작업 완료 시 jobs.webhook_url과 함께 알림)
+            """
+            CREATE TABLE IF NOT EXISTS job_webhooks (
+                job_id TEXT NOT NULL,
+                webhook_url TEXT NOT NULL,
+                PRIMARY KEY (job_id, webhook_url)
+            )
+            """,
+            "CREATE INDEX IF NOT EXISTS idx_jobs_payload_hash ON jobs (payload_hash)",
+            "CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status)"
+        ])
+    
+    async def insert(self, job_id: str, kind: JobKind, payload_hash: str,
+                     payload: Dict[str, Any], webhook_url: Optional[str]) -> None:
+        now = _now()
+        await self._write(
+            "INSERT INTO jobs (id, kind, status, payload_hash, payload, webhook_url, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (job_id, kind.value, JobStatus.QUEUED.value, payload_hash,
+             json.dumps(payload, ensure_ascii=False), webhook_url, now, now)
+        )
+    
+    async def update_status(self, job_id: str, status: JobStatus,
+                            result: Any = None, error: Optional[str] = None) -> None:
+        await self._write(
+            "UPDATE jobs SET status = ?, result = ?, error = ?, updated_at = ? WHERE id = ?",
+            (status.value, json.dumps(result, ensure_ascii=False) if result is not None else None,
+             error, _now(), job_id)
+        )
+    
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        rows = await self._read(
+            f"SELECT {self._COLUMNS}, webhook_url FROM jobs WHERE id = ?", (job_id,)
+        )
+        return self._to_dict(rows[0]) if rows else None
+    
+    async def find_reusable(self, payload_hash: str, succeeded_after: str) -> Optional[Dict[str, Any]]:
+        """
+        같은 payload의 재사용 가능한 작업 조회
+        
+        Args:
+            payload_hash: 작업 종류 + 정규화된 payload 해시
+            succeeded_after: 이 시각(ISO 8601) 이후에 완료된 성공 작업만 재사용
+            
+        Note:
+            진행 중인 작업은 항상 재사용하고, 실패했거나 오래된 작업은 재제출을 허용합니다.
+        """
+        rows = await self._read(
+            f"SELECT {self._COLUMNS}, webhook_url FROM jobs WHERE payload_hash = ? "
+            "AND (status IN (?, ?) OR (status = ? AND updated_at >= ?)) "
+            "ORDER BY created_at DESC LIMIT 1",
+            (payload_hash, JobStatus.QUEUED.value, JobStatus.RUNNING.value,
+             JobStatus.SUCCEEDED.value, succeeded_after)
+        )
+        return self._to_dict(rows[0]) if rows else None
+    
+    async def add_webhook(self, job_id: str, webhook_url: str) -> None:
+        """중복 제거된 제출자의 webhook 추가"""
+        await self._write(
+            "INSERT OR IGNORE INTO job_webhooks (job_id, webhook_url) VALUES (?, ?)",
+            (job_id, webhook_url)
+        )
+    
+    async def webhooks(self, job_id: str) -> List[str]:
+        """작업 완료 시 알릴 webhook 목록 (최초 제출자 먼저, 중복 제외)"""
+        rows = await self._read(
+            "SELECT webhook_url FROM jobs WHERE id = ? AND webhook_url IS NOT NULL "
+            "UNION ALL SELECT webhook_url FROM job_webhooks WHERE job_id = ?",
+            (job_id, job_id)
+        )
+        return list(dict.fromkeys(row[0] for row in rows))
+    
+    async def list_unfinished(self) -> List[str]:
+        """재시작 시 다시 처리할 작업 ID (제출 순서)"""
+        rows = await self._read(
+            "SELECT id FROM jobs WHERE status IN (?, ?) ORDER BY created_at",
+            (JobStatus.QUEUED.value, JobStatus.RUNNING.value)
+        )
+        return [row[0] for row in rows]
+    
+    async def count_by_status(self) -> Dict[str, int]:
+        rows = await self._read(
+            "SELECT status, COUNT(*) FROM jobs GROUP BY status", ()
+        )
+        return {status.value: 0 for status in JobStatus} | dict(rows)
+    
+    @staticmethod
+    def _to_dict(row: Tuple) -> Dict[str, Any]:
+        job_id, kind, status, payload, error, result, created_at, updated_at, webhook_url = row
+        return {
+            "job_id": job_id,
+            "kind": kind,
+            "status": status,
+            "payload": json.loads(payload),
+            "error": error,
+            "result": json.loads(result) if result is not None else None,
+            "created_at": created_at,
+            "updated_at": updated_at,
+            "webhook_url": webhook_url
+        }
+
+
+class JobManager:
+    """
+    장시간 생성 작업용 비동기 작업 큐
+    
+    제출된 작업은 SQLite 작업 테이블에 기록되고 프로세스 내 워커 풀이 기존 생성 서비스로 처리합니다.
+    같은 payload의 작업은 해시로 중복 제거되어 게이트웨이 타임아웃 후 재시도해도 다시 생성하지 않습니다
+    (완료된 작업은 JOB_DEDUP_TTL_SECONDS 동안만 재사용, 중복 제거된 제출자의 webhook에도 알림).
+    스프링 push 전송이 설정되어 있으면 wbs_from_spec_flat 작업 결과를 스프링 서버로 바로 전송합니다.
+    """
+    
+    def __init__(self, gemini_service: GeminiService, store: Optional[JobStore] = None,
+                 push_sink: Optional[SpringPushSink] = None):
+        self.gemini_service = gemini_service
+        self.store = store or JobStore(settings.JOB_DB_PATH)
+        self.push_sink = push_sink
+        self._queue: "asyncio.Queue[str]" = asyncio.Queue()
+        self._workers: List[asyncio.Task] = []
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._running = 0
+        # 조회 ~ 등록과 완료 기록 ~ webhook 목록 조회를 직렬화 (동시 제출 중복 생성, 알림 누락 방지)
+        self._submit_lock = asyncio.Lock()
+        self._notify_tasks: Set[asyncio.Task] = set()
+        self.submitted = 0
+        self.deduplicated = 0
+    
+    async def start(self) -> None:
+        """워커 풀 시작 및 미완료 작업 재등록"""
+        self._http_client = httpx.AsyncClient(timeout=settings.JOB_WEBHOOK_TIMEOUT_SECONDS)
+        if self.push_sink is None:
+            self.push_sink = create_spring_push_sink()
+        for job_id in await self.store.list_unfinished():
+            self._enqueue(job_id)
+        self._workers = [
+            asyncio.create_task(self._worker()) for _ in range(settings.JOB_WORKERS)
+        ]
+    
+    async def stop(self) -> None:
+        """워커 풀 종료 (진행 중이던 작업은 다음 시작 시 다시 처리)"""
+        for worker in self._workers:
+            worker.cancel()
+        for task in self._notify_tasks:
+            task.cancel()
+        await asyncio.gather(*self._workers, *self._notify_tasks, return_exceptions=True)
+        self._workers = []
+        if self._http_client is not None:
+            await self._http_client.aclose()
+        if self.push_sink is not None:
+            await self.push_sink.aclose()
+        self.store.close()
+    
+    async def submit(self, kind: JobKind, payload: Dict[str, Any],
+                     webhook_url: Optional[str] = None) -> JobResponse:
+        """
+        작업 제출 (같은 payload의 진행 중 작업이나 TTL 안에 완료된 작업이 있으면 그 작업 반환)
+        
+        Args:
+            kind: 작업 종류
+            payload: 해당 생성 API의 요청 본문
+            webhook_url: 완료 시 결과를 POST할 URL (기존 작업을 반환하는 경우에도 알림)
+            
+        Returns:
+            작업 상태
+            
+        Raises:
+            ValueError: payload가 작업 종류의 요청 모델과 맞지 않을 때
+        """
+        request_model = PAYLOAD_MODELS[kind](**payload)
+        normalized_payload = request_model.model_dump(mode="json")
+        payload_hash = hashlib.sha256(
+            json.dumps([kind.value, normalized_payload], ensure_ascii=False, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        
+        succeeded_after = (
+            datetime.now(timezone.utc) - timedelta(seconds=settings.JOB_DEDUP_TTL_SECONDS)
+        ).isoformat()
+        
+        async with self._submit_lock:
+            existing = await self.store.find_reusable(payload_hash, succeeded_after)
+            if existing is not None:
+                self.deduplicated += 1
+                if webhook_url and webhook_url != existing["webhook_url"]:
+                    if existing["status"] == JobStatus.SUCCEEDED.value:
+                        # 이미 완료된 작업이면 새 제출자에게만 바로 알림
+                        self._notify_later(webhook_url, self._to_response(existing))
+                    else:
+                        await self.store.add_webhook(existing["job_id"], webhook_url)
+                return self._to_response(existing, deduplicated=True)
+            
+            job_id = uuid.uuid4().hex
+            await self.store.insert(job_id, kind, payload_hash, normalized_payload, webhook_url)
+        self._enqueue(job_id)
+        self.submitted += 1
+        return await self.get(job_id)
+    
+    async def get(self, job_id: str) -> Optional[JobResponse]:
+        """작업 상태 조회 (없으면 None)"""
+        job = await self.store.get(job_id)
+        return self._to_response(job) if job is not None else None
+    
+    async def stats(self) -> Dict[str, Any]:
+        """큐 깊이 등 작업 큐 지표"""
+        return {
+            "queue_depth": self._queue.qsize(),
+            "running": self._running,
+            "workers": len(self._workers),
+            "submitted": self.submitted,
+            "deduplicated": self.deduplicated,
+            "jobs_by_status": await self.store.count_by_status(),
+            "spring_push": self.push_sink.stats() if self.push_sink is not None else None
+        }
+    
+    def _enqueue(self, job_id: str) -> None:
+        """작업을 큐에 넣고 큐 깊이 게이지 갱신"""
+        self._queue.put_nowait(job_id)
+        JOB_QUEUE_DEPTH.set(self._queue.qsize())
+    
+    async def _worker(self) -> None:
+        """큐에서 작업을 꺼내 순서대로 처리 (큐 깊이/처리 중 게이지 갱신)"""
+        while True:
+            job_id = await self._queue.get()
+            JOB_QUEUE_DEPTH.set(self._queue.qsize())
+            JOBS_RUNNING.inc()
+            try:
+                await self._run_job(job_id)
+            except Exception as e:
+                logger.exception(f"작업 처리 중 예기치 않은 오류 ({job_id}): {str(e)}")
+            finally:
+                JOBS_RUNNING.dec()
+                self._queue.task_done()
+    
+    async def _run_job(self, job_id: str) -> None:
+        """작업 하나 실행 후 결과 기록 및 webhook 알림"""
+        job = await self.store.get(job_id)
+        if job is None or job["status"] in (JobStatus.SUCCEEDED.value, JobStatus.FAILED.value):
+            return
+        
+        await self.store.update_status(job_id, JobStatus.RUNNING)
+        self._running += 1
+        try:
+            result = await self._execute(job_id, JobKind(job["kind"]), job["payload"])
+            final_status, error = JobStatus.SUCCEEDED, None
+        except Exception as e:
+            result, final_status, error = None, JobStatus.FAILED, str(e)
+        finally:
+            self._running -= 1
+        
+        # 완료 기록과 webhook 목록 조회 사이에 중복 제출자가 끼어들지 않도록 제출과 같은 잠금 사용
+        async with self._submit_lock:
+            await self.store.update_status(job_id, final_status, result=result, error=error)
+            webhooks = await self.store.webhooks(job_id)
+        if webhooks:
+            response = await self.get(job_id)
+            for webhook_url in webhooks:
+                await self._notify(webhook_url, response)
+    
+    async def _execute(self, job_id: str, kind: JobKind, payload: Dict[str, Any]) -> Any:
+        """기존 생성 서비스로 작업 실행"""
+        if kind == JobKind.WBS:
+            result = await WBSGenerator(self.gemini_service).generate_wbs(WBSGenerateRequest(**payload))
+            return result.model_dump(mode="json")
+        
+        if kind == JobKind.SPEC:
+            request = WBSGenerateRequest(**payload)
+            markdown_spec = await MarkdownSpecGenerator(self.gemini_service).generate_spec(request)
+            return {"project_name": request.project_name, "markdown_spec": markdown_spec}
+        
+        request = WBSFromSpecRequest(**payload)
+        result = await WBSFromMarkdownGenerator(self.gemini_service).generate_wbs(request.markdown_spec)
+        if kind == JobKind.WBS_FROM_SPEC:
+            return result.model_dump(mode="json")
+        
+        with track_stage("flatten", self.gemini_service.response_model):
+            rows = list(iter_flat_tasks(result.wbs_structure))
+        summary = {
+            "project_name": result.project_name,
+            "total_tasks": result.total_tasks,
+            "total_duration_days": result.total_duration_days
+        }
+        flat_result = {**summary, "tasks": flat_task_dicts(rows)}
+        if self.push_sink is not None:
+            flat_result["push"] = await self._push(job_id, summary, rows)
+        return flat_result
+    
+    async def _push(self, job_id: str, summary: Dict[str, Any], rows: List[FlatTaskRow]) -> Dict[str, Any]:
+        """
+        스프링 서버로 Flat 작업 push (작업 ID를 push_id로 사용해 재실행 시에도 멱등 키 유지)
+        
+        전송 실패는 작업 실패로 처리하지 않고 결과의 push 항목에 기록하므로,
+        스프링은 /jobs/{job_id}/result로 결과를 직접 가져갈 수 있습니다.
+        """
+        try:
+            report = await self.push_sink.push(job_id, summary, rows)
+            return {"status": "delivered", **report}
+        except SpringPushError as e:
+            logger.warning(f"스프링 push 전송 실패 ({job_id}): {str(e)}")
+            return {"status": "failed", "push_id": job_id, "failed_batch": e.batch_index, "error": str(e)}
+    
+    def _notify_later(self, webhook_url: str, job: JobResponse) -> None:
+        """제출 응답을 막지 않도록 webhook을 백그라운드로 전송"""
+        task = asyncio.create_task(self._notify(webhook_url, job))
+        self._notify_tasks.add(task)
+        task.add_done_callback(self._notify_tasks.discard)
+    
+    async def _notify(self, webhook_url: str, job: JobResponse) -> None:
+        """
+        완료 webhook 전송 (실패해도 작업 결과에는 영향 없음)
+        
+        Note:
+            전송 직전 호스트가 내부 주소로 해석되는지 다시 확인하고, 리다이렉트는 따라가지 않습니다.
+        """
+        try:
+            await resolve_public_host(webhook_url, allowed_hosts_from_setting(settings.JOB_WEBHOOK_ALLOWED_HOSTS))
+            response = await self._http_client.post(
+                webhook_url,
+                content=job.model_dump_json(),
+                headers={"Content-Type": "application/json"}
+            )
+            response.raise_for_status()
+        except Exception as e:
+            logger.warning(f"작업 완료 webhook 전송 실패 ({job.job_id}): {str(e)}")
+    
+    @staticmethod
+    def _to_response(job: Dict[str, Any], deduplicated: bool = False) -> JobResponse:
+        return JobResponse(
+            job_id=job["job_id"],
+            kind=job["kind"],
+            status=job["status"],
+            deduplicated=deduplicated,
+            created_at=job["created_at"],
+            updated_at=job["updated_at"],
+            error=job["error"],
+            result=job["result"]
+        )
+
+
+def _now() -> str:
+    """UTC 현재 시각 (ISO 8601)"""
+    return datetime.now(timezone.utc).isoformat()
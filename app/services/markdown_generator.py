@@ -1,20 +1,25 @@
 from app.models.request import WBSGenerateRequest
 from app.services.gemini_service import GeminiService
-from typing import Dict, Any
+from typing import AsyncIterator, Dict, Any, Optional
 
 
 class MarkdownSpecGenerator:
     """마크다운 프로젝트 명세서 생성 서비스"""
     
-    def __init__(self):
-        self.gemini_service = GeminiService()
+    def __init__(self, gemini_service: Optional[GeminiService] = None):
+        self.gemini_service = gemini_service or GeminiService()
     
-    async def generate_spec(self, request: WBSGenerateRequest) -> str:
+    async def generate_spec(
+        self,
+        request: WBSGenerateRequest,
+        bypass_cache: bool = False
+    ) -> str:
         """
         프로젝트 정보를 마크다운 명세서로 변환
         
         Args:
             request: WBS 생성 요청
+            bypass_cache: True면 응답 캐시를 사용하지 않음
             
         Returns:
             마크다운 형식의 프로젝트 명세서
@@ -23,10 +28,33 @@ class MarkdownSpecGenerator:
         project_data = self._prepare_project_data(request)
         
         # 2. Gemini로 마크다운 생성
-        markdown_spec = await self.gemini_service.generate_markdown_spec(project_data)
+        markdown_spec = await self.gemini_service.generate_markdown_spec(
+            project_data, bypass_cache=bypass_cache
+        )
         
         return markdown_spec
     
+    async def stream_spec(
+        self,
+        request: WBSGenerateRequest,
+        bypass_cache: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        프로젝트 정보를 마크다운 명세서로 변환 (스트리밍)
+        
+        Args:
+            request: WBS 생성 요청
+            bypass_cache: True면 응답 캐시를 사용하지 않음
+            
+        Yields:
+            명세서 조각 이벤트와 마지막 완료 이벤트
+        """
+        project_data = self._prepare_project_data(request)
+        async for event in self.gemini_service.stream_markdown_spec(
+            project_data, bypass_cache=bypass_cache
+        ):
+            yield event
+    
     def _prepare_project_data(self, request: WBSGenerateRequest) -> Dict[str, Any]:
         """요청 데이터를 딕셔너리로 변환"""
         
@@ -0,0 +1,287 @@
+import time
+from collections import deque
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from google.genai import types
+from app.core.config import settings
+from app.core.metrics import GEMINI_COST, MODEL_ROUTES, current_endpoint
+from app.services.resilience import LatencyTracker
+
+FAST_TIER = "fast"
+LARGE_TIER = "large"
+
+
+class RouteDecision(NamedTuple):
+    """모델 선택 결과"""
+    model: str
+    tier: str  # fast | large
+    reason: str  # default: 라우팅 비활성화, size: 입력 규모, slo / error_budget: 다른 티어로 전환
+
+
+class ModelHealth:
+    """
+    모델별 최근 호출 상태 (SLO/오류 예산 판단) 및 누적 지표 (임계값 조정용)
+    
+    최근 window개 호출의 지연 시간 p95가 SLO를 넘거나 오류율이 예산을 넘으면
+    cooldown_seconds 동안 다른 티어로 전환하고, 이후 표본을 비운 상태로 다시 받습니다.
+    """
+    
+    def __init__(self, model: str, tier: str, window: int, input_price: float, output_price: float):
+        self.model = model
+        self.tier = tier
+        self.input_price = input_price
+        self.output_price = output_price
+        self.latency = LatencyTracker(window)
+        self.outcomes: "deque[bool]" = deque(maxlen=window)
+        self.tripped_reason = ""
+        self.tripped_until = 0.0
+        self.calls = 0
+        self.errors = 0
+        self.latency_seconds = 0.0
+        self.cost_usd = 0.0
+        self.parse_success = 0
+        self.parse_failure = 0
+        self.routed = 0
+        self.fallbacks_in = 0
+    
+    def record_call(self, latency_seconds: float, success: bool) -> None:
+        self.calls += 1
+        self.outcomes.append(success)
+        if success:
+            self.latency_seconds += latency_seconds
+            self.latency.record(latency_seconds)
+        else:
+            self.errors += 1
+    
+    def record_usage(self, usage: Optional[types.GenerateContentResponseUsageMetadata]) -> float:
+        """토큰 사용량으로 예상 비용 누적 (USD, 이번 호출 비용 반환)"""
+        if usage is None:
+            return 0.0
+        cost = (
+            (usage.prompt_token_count or 0) * self.input_price
+            + (usage.candidates_token_count or 0) * self.output_price
+        ) / 1_000_000
+        self.cost_usd += cost
+        return cost
+    
+    def error_rate(self) -> Optional[float]:
+        return self.outcomes.count(False) / len(self.outcomes) if self.outcomes else None
+    
+    def check(self, slo_seconds: float, error_budget: float, min_samples: int, cooldown_seconds: float) -> str:
+        """
+        SLO/오류 예산 초과 여부 (정상이면 빈 문자열, 초과면 slo | error_budget)
+        
+        Note:
+            초과를 처음 감지하면 cooldown_seconds 동안 같은 사유를 유지하고,
+            쿨다운이 끝나면 이전 표본을 버려 새 호출로 다시 판단합니다 (반개방).
+        """
+        now = time.monotonic()
+        if self.tripped_reason:
+            if now < self.tripped_until:
+                return self.tripped_reason
+            self.tripped_reason = ""
+            self.latency = LatencyTracker(self.outcomes.maxlen)
+            self.outcomes.clear()
+        
+        if len(self.outcomes) < min_samples:
+            return ""
+        if self.error_rate() > error_budget:
+            self.tripped_reason = "error_budget"
+        elif len(self.latency) >= min_samples and self.latency.quantile(0.95) > slo_seconds:
+            self.tripped_reason = "slo"
+        if self.tripped_reason:
+            self.tripped_until = now + cooldown_seconds
+        return self.tripped_reason
+    
+    def snapshot(self) -> Dict[str, Any]:
+        successes = self.calls - self.errors
+        parsed = self.parse_success + self.parse_failure
+        p50 = self.latency.quantile(0.5)
+        p95 = self.latency.quantile(0.95)
+        error_rate = self.error_rate()
+        return {
+            "model": self.model,
+            "routed": self.routed,
+            "fallbacks_in": self.fallbacks_in,
+            "calls": self.calls,
+            "errors": self.errors,
+            "window_error_rate": round(error_rate, 4) if error_rate is not None else None,
+            "window_latency_p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+            "window_latency_p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+            "avg_latency_ms": round(self.latency_seconds / successes * 1000, 1) if successes else None,
+            "cost_usd": round(self.cost_usd, 6),
+            "avg_cost_usd": round(self.cost_usd / self.calls, 6) if self.calls else None,
+            "parse_success_rate": round(self.parse_success / parsed, 4) if parsed else None,
+            "tripped": self.tripped_reason or None
+        }
+
+
+class ModelRouter:
+    """
+    입력 규모 기반 Gemini 모델 라우팅
+    
+    - 팀 규모, 기간, 명세서/프롬프트 길이가 모두 fast 기준 이하면 가벼운 모델(fast),
+      하나라도 넘으면 기본 모델(large)을 사용합니다.
+    - 선택한 티어가 지연 SLO 또는 오류 예산을 넘은 상태면 다른 티어로 전환합니다
+      (두 티어 모두 초과면 원래 티어 유지).
+    - 모델별 지연 시간, 예상 비용, 파싱 성공률을 기록해 기준값 조정에 사용합니다.
+    """
+    
+    def __init__(
+        self,
+        fast_model: str,
+        large_model: str,
+        enabled: bool = False,
+        fast_max_team_size: int = 5,
+        fast_max_duration_days: int = 30,
+        fast_max_spec_chars: int = 6000,
+        latency_slo_seconds: float = 20.0,
+        error_budget: float = 0.1,
+        window: int = 50,
+        min_samples: int = 10,
+        cooldown_seconds: float = 60.0,
+        prices: Optional[Dict[str, Tuple[float, float]]] = None
+    ):
+        """
+        Args:
+            fast_model: 작은 입력용 가벼운 모델
+            large_model: 큰 입력용 모델 (비활성화 시 항상 이 모델)
+            enabled: False면 항상 large_model 사용
+            fast_max_*: fast 티어로 보낼 입력 규모 상한
+            latency_slo_seconds: 최근 호출 p95 지연 시간 SLO
+            error_budget: 최근 호출 오류율 상한
+            window: SLO/오류율 판단에 쓰는 최근 호출 수
+            min_samples: 판단에 필요한 최소 호출 수
+            cooldown_seconds: 초과한 티어로 다시 보내기까지 대기 시간
+            prices: 티어별 (입력, 출력) 100만 토큰당 가격 (USD)
+        """
+        self.enabled = enabled
+        self.fast_max_team_size = fast_max_team_size
+        self.fast_max_duration_days = fast_max_duration_days
+        self.fast_max_spec_chars = fast_max_spec_chars
+        self.latency_slo_seconds = latency_slo_seconds
+        self.error_budget = error_budget
+        self.min_samples = min_samples
+        self.cooldown_seconds = cooldown_seconds
+        prices = prices or {}
+        self.tiers: Dict[str, ModelHealth] = {
+            tier: ModelHealth(model, tier, window, *prices.get(tier, (0.0, 0.0)))
+            for tier, model in ((FAST_TIER, fast_model), (LARGE_TIER, large_model))
+        }
+        self._by_model: Dict[str, ModelHealth] = {health.model: health for health in self.tiers.values()}
+    
+    @property
+    def models(self) -> List[str]:
+        """라우팅 대상 모델 목록 (비활성화 시 large 모델만)"""
+        if not self.enabled:
+            return [self.tiers[LARGE_TIER].model]
+        return list(self._by_model)
+    
+    def route(
+        self,
+        team_size: Optional[int] = None,
+        duration_days: Optional[int] = None,
+        spec_chars: Optional[int] = None
+    ) -> RouteDecision:
+        """
+        입력 규모로 모델 선택
+        
+        Args:
+            team_size: 참여 인원 (모르면 None)
+            duration_days: 프로젝트 기간(일) (모르면 None)
+            spec_chars: 명세서 또는 프롬프트 길이
+        
+        Returns:
+            선택한 모델과 티어, 선택 사유
+        """
+        if not self.enabled:
+            return RouteDecision(self.tiers[LARGE_TIER].model, LARGE_TIER, "default")
+        
+        small = all(
+            value is None or value <= limit
+            for value, limit in (
+                (team_size, self.fast_max_team_size),
+                (duration_days, self.fast_max_duration_days),
+                (spec_chars, self.fast_max_spec_chars)
+            )
+        )
+        tier = FAST_TIER if small else LARGE_TIER
+        other = LARGE_TIER if small else FAST_TIER
+        reason = self._check(tier)
+        if reason and not self._check(other):
+            tier = other
+            self.tiers[tier].fallbacks_in += 1
+        else:
+            reason = "size"
+        
+        health = self.tiers[tier]
+        health.routed += 1
+        MODEL_ROUTES.labels(tier=tier, model=health.model, reason=reason).inc()
+        return RouteDecision(health.model, tier, reason)
+    
+    def record_call(self, model: str, latency_seconds: float, success: bool) -> None:
+        """업스트림 호출 결과 기록 (재시도 포함 호출 1건 기준, SLO/오류 예산 판단용)"""
+        health = self._by_model.get(model)
+        if health is not None:
+            health.record_call(latency_seconds, success)
+    
+    def record_usage(self, model: str, usage: Optional[types.GenerateContentResponseUsageMetadata]) -> None:
+        """업스트림 시도 1회의 토큰 사용량으로 예상 비용 누적"""
+        health = self._by_model.get(model)
+        if health is None:
+            return
+        cost = health.record_usage(usage)
+        if cost:
+            GEMINI_COST.labels(endpoint=current_endpoint.get(), model=model).inc(cost)
+    
+    def record_parse(self, model: str, success: bool) -> None:
+        """모델 응답의 JSON 파싱 결과 기록"""
+        health = self._by_model.get(model)
+        if health is None:
+            return
+        if success:
+            health.parse_success += 1
+        else:
+            health.parse_failure += 1
+    
+    def latency_quantile(self, model: str, q: float) -> Optional[float]:
+        """모델의 최근 성공 호출 지연 시간 분위수 (기록이 없으면 None)"""
+        health = self._by_model.get(model)
+        return health.latency.quantile(q) if health is not None else None
+    
+    def stats(self) -> Dict[str, Any]:
+        """라우팅 기준값과 티어별 지표"""
+        return {
+            "enabled": self.enabled,
+            "fast_max_team_size": self.fast_max_team_size,
+            "fast_max_duration_days": self.fast_max_duration_days,
+            "fast_max_spec_chars": self.fast_max_spec_chars,
+            "latency_slo_ms": round(self.latency_slo_seconds * 1000, 1),
+            "error_budget": self.error_budget,
+            "tiers": {tier: health.snapshot() for tier, health in self.tiers.items()}
+        }
+    
+    def _check(self, tier: str) -> str:
+        return self.tiers[tier].check(
+            self.latency_slo_seconds, self.error_budget, self.min_samples, self.cooldown_seconds
+        )
+
+
+def create_model_router() -> ModelRouter:
+    """설정(MODEL_ROUTING_*, GEMINI_FAST_MODEL)에 따라 라우터 생성 (large 티어는 GEMINI_MODEL)"""
+    return ModelRouter(
+        fast_model=settings.GEMINI_FAST_MODEL,
+        large_model=settings.GEMINI_MODEL,
+        enabled=settings.MODEL_ROUTING_ENABLED,
+        fast_max_team_size=settings.MODEL_ROUTING_FAST_MAX_TEAM_SIZE,
+        fast_max_duration_days=settings.MODEL_ROUTING_FAST_MAX_DURATION_DAYS,
+        fast_max_spec_chars=settings.MODEL_ROUTING_FAST_MAX_SPEC_CHARS,
+        latency_slo_seconds=settings.MODEL_ROUTING_LATENCY_SLO_SECONDS,
+        error_budget=settings.MODEL_ROUTING_ERROR_BUDGET,
+        window=settings.MODEL_ROUTING_WINDOW,
+        min_samples=settings.MODEL_ROUTING_MIN_SAMPLES,
+        cooldown_seconds=settings.MODEL_ROUTING_COOLDOWN_SECONDS,
+        prices={
+            FAST_TIER: (settings.GEMINI_FAST_INPUT_USD_PER_M, settings.GEMINI_FAST_OUTPUT_USD_PER_M),
+            LARGE_TIER: (settings.GEMINI_INPUT_USD_PER_M, settings.GEMINI_OUTPUT_USD_PER_M)
+        }
+    )
@@ -0,0 +1,226 @@
+import asyncio
+import os
+import sys
+import sysconfig
+import threading
+import tracemalloc
+from collections import Counter
+from types import FrameType
+from typing import Any, Dict, List, Optional
+
+# 앱 소스 루트 (app 패키지의 상위 디렉터리) - 파일 경로를 모듈명으로 바꿀 때 사용
+_APP_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_SITE_PACKAGES = [p for p in {sysconfig.get_paths()["purelib"], sysconfig.get_paths()["platlib"]} if p]
+_STDLIB = sysconfig.get_paths()["stdlib"]
+
+
+class ProfilerBusyError(Exception):
+    """다른 프로파일링이 이미 진행 중"""
+
+
+class SamplingProfiler:
+    """
+    샘플링 CPU 프로파일러
+    
+    별도 스레드에서 일정 간격으로 sys._current_frames()를 읽어 모든 스레드의 호출 스택을 수집합니다.
+    대상 코드에 훅을 걸지 않으므로 실행 중인 서버에서도 부담이 작고,
+    결과는 collapsed stack(flamegraph.pl, speedscope 호환) 형식으로 집계합니다.
+    """
+    
+    def __init__(self, interval_seconds: float = 0.01):
+        """
+        Args:
+            interval_seconds: 샘플링 간격
+        """
+        self.interval_seconds = interval_seconds
+        self.stacks: "Counter[str]" = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="flowplan-profiler", daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+    
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        names = {}
+        while not self._stop.wait(self.interval_seconds):
+            threads = {t.ident: t.name for t in threading.enumerate()}
+            names.update(threads)
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                self.stacks[_collapse(names.get(thread_id, str(thread_id)), frame)] += 1
+            self.samples += 1
+
+
+class ProfilingService:
+    """
+    관리자용 온디맨드 프로파일링 (CPU 샘플링, tracemalloc 메모리 비교)
+    
+    한 번에 하나의 프로파일링만 실행하며, 요청이 없을 때는 아무 것도 수집하지 않습니다.
+    """
+    
+    def __init__(self):
+        self._lock = asyncio.Lock()
+    
+    async def profile_cpu(self, seconds: float, interval_seconds: float) -> SamplingProfiler:
+        """
+        seconds 동안 CPU 샘플링
+        
+        Returns:
+            수집을 마친 프로파일러 (stacks, samples)
+        
+        Raises:
+            ProfilerBusyError: 다른 프로파일링이 진행 중인 경우
+        """
+        async with self._exclusive():
+            profiler = SamplingProfiler(interval_seconds)
+            profiler.start()
+            try:
+                await asyncio.sleep(seconds)
+            finally:
+                await asyncio.to_thread(profiler.stop)
+            return profiler
+    
+    async def profile_memory(self, seconds: float, top: int) -> Dict[str, Any]:
+        """
+        seconds 간격으로 tracemalloc 스냅샷 두 개를 찍어 증가한 할당을 모듈/코드 위치별로 집계
+        
+        Args:
+            seconds: 스냅샷 간격
+            top: 반환할 상위 항목 수
+        
+        Raises:
+            ProfilerBusyError: 다른 프로파일링이 진행 중인 경우
+        """
+        async with self._exclusive():
+            started_here = not tracemalloc.is_tracing()
+            if started_here:
+                tracemalloc.start()
+            try:
+                before = _filtered_snapshot()
+                await asyncio.sleep(seconds)
+                after = _filtered_snapshot()
+            finally:
+                if started_here:
+                    tracemalloc.stop()
+        
+        by_line = after.compare_to(before, "lineno")
+        modules: Dict[str, Dict[str, int]] = {}
+        for stat in by_line:
+            module = module_name(stat.traceback[0].filename)
+            entry = modules.setdefault(module, {"size_diff": 0, "count_diff": 0, "size": 0})
+            entry["size_diff"] += stat.size_diff
+            entry["count_diff"] += stat.count_diff
+            entry["size"] += stat.size
+        
+        ranked_modules = sorted(modules.items(), key=lambda item: item[1]["size_diff"], reverse=True)
+        return {
+            "seconds": seconds,
+            "total_size_diff_kb": round(sum(stat.size_diff for stat in by_line) / 1024, 1),
+            "modules": [
+                {
+                    "module": module,
+                    "size_diff_kb": round(entry["size_diff"] / 1024, 1),
+                    "count_diff": entry["count_diff"],
+                    "size_kb": round(entry["size"] / 1024, 1)
+                }
+                for module, entry in ranked_modules[:top]
+            ],
+            "lines": [
+                {
+                    "location": f"{module_name(stat.traceback[0].filename)}:{stat.traceback[0].lineno}",
+                    "size_diff_kb": round(stat.size_diff / 1024, 1),
+                    "count_diff": stat.count_diff
+                }
+                for stat in by_line[:top]
+            ]
+        }
+    
+    def _exclusive(self) -> asyncio.Lock:
+        if self._lock.locked():
+            raise ProfilerBusyError("다른 프로파일링이 진행 중입니다. 완료 후 다시 시도해주세요.")
+        return self._lock
+
+
+def module_name(filename: str) -> str:
+    """
+    파일 경로를 모듈명으로 변환
+    
+    - 앱 코드: app.services.gemini_service
+    - 서드파티: 최상위 패키지명 (pydantic, google, httpx ...)
+    - 표준 라이브러리: stdlib.json
+    """
+    path = os.path.abspath(filename)
+    for root in _SITE_PACKAGES:
+        if path.startswith(root + os.sep):
+            return os.path.relpath(path, root).split(os.sep)[0].removesuffix(".py")
+    if path.startswith(_APP_ROOT + os.sep):
+        return os.path.relpath(path, _APP_ROOT).removesuffix(".py").replace(os.sep, ".")
+    if path.startswith(_STDLIB + os.sep):
+        return "stdlib." + os.path.relpath(path, _STDLIB).split(os.sep)[0].removesuffix(".py")
+    return filename
+
+
+def to_speedscope(stacks: "Counter[str]", interval_seconds: float, name: str = "flowplan") -> Dict[str, Any]:
+    """collapsed stack 집계를 speedscope sampled 프로파일 JSON으로 변환"""
+    frame_index: Dict[str, int] = {}
+    frames: List[Dict[str, str]] = []
+    samples: List[List[int]] = []
+    weights: List[float] = []
+    for stack, count in stacks.items():
+        indices = []
+        for frame in stack.split(";"):
+            if frame not in frame_index:
+                frame_index[frame] = len(frames)
+                frames.append({"name": frame})
+            indices.append(frame_index[frame])
+        samples.append(indices)
+        weights.append(count * interval_seconds)
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": {"frames": frames},
+        "profiles": [{
+            "type": "sampled",
+            "name": name,
+            "unit": "seconds",
+            "startValue": 0,
+            "endValue": sum(weights),
+            "samples": samples,
+            "weights": weights
+        }],
+        "exporter": "flowplan-profiler"
+    }
+
+
+def to_collapsed(stacks: "Counter[str]") -> str:
+    """collapsed stack 텍스트 (한 줄에 '스택 샘플수')"""
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+
+def _collapse(thread_name: str, frame: Optional[FrameType]) -> str:
+    """프레임 체인을 'thread;바깥;...;안쪽' 문자열로 변환"""
+    parts = []
+    while frame is not None:
+        code = frame.f_code
+        parts.append(f"{code.co_name} ({module_name(code.co_filename)})")
+        frame = frame.f_back
+    parts.append(thread_name)
+    return ";".join(reversed(parts))
+
+
+def _filtered_snapshot() -> tracemalloc.Snapshot:
+    """tracemalloc 자체와 import 시스템 할당을 제외한 스냅샷"""
+    return tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        tracemalloc.Filter(False, "<unknown>")
+    ))
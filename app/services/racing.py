@@ -0,0 +1,126 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+from app.core.config import settings
+from app.core.metrics import RACE_LATENCY_SAVED, RACE_WINS, current_endpoint
+
+T = TypeVar("T")
+
+PRIMARY_RACER = "primary"
+SECONDARY_RACER = "secondary"
+
+
+class RacePolicy:
+    """
+    지연 시간 민감 엔드포인트의 모델 경주 설정과 지표
+    
+    활성화된 엔드포인트의 WBS 생성은 같은 프롬프트를 두 모델(또는 같은 모델 2회)에 동시에 보내고
+    먼저 WBSGenerateResponse로 검증되는 응답을 사용합니다. 토큰을 더 쓰는 대신 꼬리 지연을 줄입니다.
+    """
+    
+    def __init__(self, endpoints: Iterable[str], secondary_model: str = ""):
+        """
+        Args:
+            endpoints: 경주를 사용할 라우트 경로 템플릿 (예: /api/v1/wbs/generate)
+            secondary_model: 두 번째 경주 모델 (비어 있으면 첫 번째와 같은 모델)
+        """
+        self.endpoints = {endpoint.strip() for endpoint in endpoints if endpoint.strip()}
+        self.secondary_model = secondary_model
+        self.races = 0
+        self.failures = 0
+        self.wins = {PRIMARY_RACER: 0, SECONDARY_RACER: 0}
+        self.latency_saved_seconds = 0.0
+    
+    def enabled(self) -> bool:
+        """현재 요청의 엔드포인트에서 경주를 사용하는지"""
+        return current_endpoint.get() in self.endpoints
+    
+    def racers(self, primary_model: str) -> List[Tuple[str, str]]:
+        """(경주자, 모델) 목록 (첫 번째는 라우터가 선택한 모델)"""
+        return [
+            (PRIMARY_RACER, primary_model),
+            (SECONDARY_RACER, self.secondary_model or primary_model)
+        ]
+    
+    def record_win(self, racer: str, model: str, latency_seconds: float, baseline_seconds: Optional[float]) -> None:
+        """
+        경주 결과 기록
+        
+        Args:
+            racer: 이긴 경주자 (primary | secondary)
+            model: 이긴 모델
+            latency_seconds: 경주 시작 ~ 승자 확정 시간
+            baseline_seconds: 첫 번째 모델 단독 호출의 최근 지연 중앙값 (없으면 절감 시간 0)
+        
+        Note:
+            진 쪽은 취소되어 실제 지연을 알 수 없으므로, 절감 시간은 첫 번째 모델의 최근 중앙값 대비 추정치입니다.
+            첫 번째 모델이 이기면 0으로 기록합니다.
+        """
+        self.races += 1
+        self.wins[racer] += 1
+        saved = 0.0
+        if racer != PRIMARY_RACER and baseline_seconds is not None:
+            saved = max(0.0, baseline_seconds - latency_seconds)
+        self.latency_saved_seconds += saved
+        endpoint = current_endpoint.get()
+        RACE_WINS.labels(endpoint=endpoint, racer=racer, model=model).inc()
+        RACE_LATENCY_SAVED.labels(endpoint=endpoint).observe(saved)
+    
+    def record_failure(self, primary_model: str) -> None:
+        """모든 경주자가 실패한 경우 (모델 라벨은 라우터가 선택한 첫 번째 모델)"""
+        self.races += 1
+        self.failures += 1
+        RACE_WINS.labels(endpoint=current_endpoint.get(), racer="none", model=primary_model).inc()
+    
+    def stats(self) -> Dict[str, Any]:
+        """경주 설정과 승률/절감 시간"""
+        decided = self.races - self.failures
+        return {
+            "endpoints": sorted(self.endpoints),
+            "secondary_model": self.secondary_model or None,
+            "races": self.races,
+            "failures": self.failures,
+            "wins": dict(self.wins),
+            "secondary_win_rate": round(self.wins[SECONDARY_RACER] / decided, 4) if decided else None,
+            "latency_saved_ms_total": round(self.latency_saved_seconds * 1000, 1),
+            "avg_latency_saved_ms": round(self.latency_saved_seconds / decided * 1000, 1) if decided else None
+        }
+
+
+async def first_valid(racers: List[Callable[[], Awaitable[T]]]) -> Tuple[int, T]:
+    """
+    모든 경주자를 동시에 실행하고 가장 먼저 성공한 결과 사용
+    
+    Args:
+        racers: 호출 + 검증을 수행하는 코루틴 팩토리 목록 (검증 실패는 예외로 알림)
+    
+    Returns:
+        (이긴 경주자 순번, 결과)
+    
+    Raises:
+        모든 경주자가 실패하면 마지막 오류
+    
+    Note:
+        승자가 정해지면 나머지는 취소합니다 (호출자가 취소되어도 모두 취소).
+    """
+    tasks = [asyncio.create_task(racer()) for racer in racers]
+    pending = set(tasks)
+    last_error: Optional[BaseException] = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=tasks.index):
+                if task.exception() is None:
+                    return tasks.index(task), task.result()
+                last_error = task.exception()
+        raise last_error
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def create_race_policy() -> RacePolicy:
+    """설정(GEMINI_RACE_*)에 따라 경주 정책 생성"""
+    return RacePolicy(
+        endpoints=settings.GEMINI_RACE_ENDPOINTS.split(","),
+        secondary_model=settings.GEMINI_RACE_SECONDARY_MODEL
+    )
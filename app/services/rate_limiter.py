@@ -0,0 +1,176 @@
+import asyncio
+import json
+import re
+import time
+from typing import Any, Dict, Optional
+from app.core.config import settings
+from app.core.metrics import (
+    RATE_LIMIT_DECISIONS, RATE_LIMIT_REQUESTS_AVAILABLE, RATE_LIMIT_TOKENS_AVAILABLE, RATE_LIMIT_WAIT
+)
+
+
+class RateLimitExceeded(Exception):
+    """Gemini 호출 한도 초과 (클라이언트 측 대기 한도 초과 또는 업스트림 429)"""
+    
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """일정 속도로 채워지는 토큰 버킷"""
+    
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._level = capacity
+        self._updated_at = time.monotonic()
+    
+    @property
+    def level(self) -> float:
+        """현재 남은 토큰 수"""
+        self._refill()
+        return self._level
+    
+    def wait_time(self, amount: float) -> float:
+        """amount만큼 소비하려면 기다려야 하는 시간(초), 바로 가능하면 0"""
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self._level >= amount:
+            return 0.0
+        return (amount - self._level) / self.refill_per_second
+    
+    def consume(self, amount: float) -> None:
+        """토큰 소비 (실사용량 보정으로 음수까지 내려갈 수 있음, 최대 -capacity)"""
+        self._refill()
+        self._level = max(self._level - amount, -self.capacity)
+    
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._level = min(self.capacity, self._level + (now - self._updated_at) * self.refill_per_second)
+        self._updated_at = now
+
+
+class QuotaRateLimiter:
+    """
+    Gemini 분당 요청 수(RPM)와 분당 토큰 수(TPM) 기반 클라이언트 측 제한기
+    
+    호출자는 도착 순서대로 대기하며, 최대 대기 시간(RATE_LIMIT_MAX_WAIT_SECONDS) 안에
+    처리할 수 없으면 RateLimitExceeded(retry_after 포함)를 발생시킵니다.
+    버킷 잔량은 Prometheus 게이지가 조회 시점에 직접 읽습니다 (마지막으로 생성한 제한기 기준).
+    """
+    
+    def __init__(self, rpm: int, tpm: int, max_wait_seconds: float, enabled: bool = True):
+        self.enabled = enabled
+        self.max_wait_seconds = max_wait_seconds
+        self.requests = TokenBucket(rpm, rpm / 60)
+        self.tokens = TokenBucket(tpm, tpm / 60)
+        self._lock = asyncio.Lock()
+        self.admitted = 0
+        self.rejected = 0
+        self.upstream_rejections = 0
+        self.waited_seconds = 0.0
+        RATE_LIMIT_REQUESTS_AVAILABLE.set_function(lambda: self.requests.level)
+        RATE_LIMIT_TOKENS_AVAILABLE.set_function(lambda: self.tokens.level)
+    
+    @staticmethod
+    def estimate_tokens(prompt: str) -> int:
+        """
+        호출 1회의 예상 토큰 수 (입력 + 예상 출력)
+        
+        한국어 위주 프롬프트 기준 약 2자당 1토큰으로 추정합니다.
+        """
+        return len(prompt) // 2 + settings.GEMINI_ESTIMATED_OUTPUT_TOKENS
+    
+    async def acquire(self, estimated_tokens: int) -> None:
+        """
+        요청 1건과 예상 토큰만큼 할당 (필요하면 대기)
+        
+        Args:
+            estimated_tokens: 예상 토큰 수
+            
+        Raises:
+            RateLimitExceeded: 최대 대기 시간 안에 할당할 수 없을 때
+        """
+        if not self.enabled:
+            return
+        
+        started_at = time.monotonic()
+        deadline = started_at + self.max_wait_seconds
+        
+        # 먼저 온 호출자가 먼저 할당받도록 잠금 안에서 대기
+        try:
+            await asyncio.wait_for(self._lock.acquire(), timeout=self.max_wait_seconds)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            RATE_LIMIT_DECISIONS.labels(outcome="rejected").inc()
+            raise RateLimitExceeded(
+                "Gemini 호출 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요.",
+                retry_after=self.max_wait_seconds
+            )
+        
+        try:
+            while True:
+                wait = max(self.requests.wait_time(1), self.tokens.wait_time(estimated_tokens))
+                if wait == 0:
+                    self.requests.consume(1)
+                    self.tokens.consume(estimated_tokens)
+                    waited = time.monotonic() - started_at
+                    self.admitted += 1
+                    self.waited_seconds += waited
+                    RATE_LIMIT_DECISIONS.labels(outcome="admitted").inc()
+                    RATE_LIMIT_WAIT.observe(waited)
+                    return
+                
+                if time.monotonic() + wait > deadline:
+                    self.rejected += 1
+                    RATE_LIMIT_DECISIONS.labels(outcome="rejected").inc()
+                    raise RateLimitExceeded(
+                        "Gemini 호출 한도(RPM/TPM)를 초과했습니다. 잠시 후 다시 시도해주세요.",
+                        retry_after=wait
+                    )
+                await asyncio.sleep(wait)
+        finally:
+            self._lock.release()
+    
+    def record_usage(self, estimated_tokens: int, actual_tokens: Optional[int]) -> None:
+        """실제 사용 토큰으로 TPM 버킷 보정"""
+        if self.enabled and actual_tokens is not None:
+            self.tokens.consume(actual_tokens - estimated_tokens)
+    
+    def record_upstream_rejection(self) -> None:
+        """업스트림 429 발생 시 남은 요청 할당량을 비워 후속 호출을 늦춤"""
+        self.upstream_rejections += 1
+        RATE_LIMIT_DECISIONS.labels(outcome="upstream_rejected").inc()
+        if self.enabled:
+            self.requests.consume(self.requests.level)
+    
+    def stats(self) -> Dict[str, Any]:
+        """현재 버킷 잔량 등 지표"""
+        return {
+            "enabled": self.enabled,
+            "requests_available": round(self.requests.level, 2),
+            "requests_capacity": self.requests.capacity,
+            "tokens_available": round(self.tokens.level),
+            "tokens_capacity": self.tokens.capacity,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "upstream_rejections": self.upstream_rejections,
+            "waited_seconds_total": round(self.waited_seconds, 3)
+        }
+
+
+def retry_after_from_error(details: Any, default: float) -> float:
+    """업스트림 429 응답의 RetryInfo(retryDelay: "13s")에서 재시도 대기 시간 추출"""
+    match = re.search(r'"retryDelay":\s*"(\d+(?:\.\d+)?)s"', json.dumps(details, default=str))
+    return float(match.group(1)) if match else default
+
+
+def create_rate_limiter() -> QuotaRateLimiter:
+    """설정(RATE_LIMIT_*, GEMINI_RPM/TPM)에 따라 제한기 생성"""
+    return QuotaRateLimiter(
+        rpm=settings.GEMINI_RPM,
+        tpm=settings.GEMINI_TPM,
+        max_wait_seconds=settings.RATE_LIMIT_MAX_WAIT_SECONDS,
+        enabled=settings.RATE_LIMIT_ENABLED
+    )
@@ -0,0 +1,256 @@
+import asyncio
+import random
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncContextManager, AsyncIterator, Awaitable, Callable, Dict, List, Optional, TypeVar
+import httpx
+from google.genai import errors
+from app.core.config import settings
+
+T = TypeVar("T")
+
+# 재시도 가능한 업스트림 HTTP 상태 코드 (429는 호출 한도 초과로 즉시 반환)
+RETRYABLE_STATUS_CODES = {408, 500, 502, 503, 504}
+
+
+class InvalidResponseError(Exception):
+    """업스트림이 성공 응답을 보냈지만 내용이 비어 있는 등 사용할 수 없는 경우 (재시도 대상)"""
+
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    재시도 가능 여부 분류
+    
+    일시적인 오류(서버 오류, 타임아웃, 네트워크 오류)만 재시도하고,
+    요청 오류(400/403/404 등)와 호출 한도 초과(429)는 즉시 실패로 처리합니다.
+    """
+    if isinstance(error, errors.APIError):
+        return error.code in RETRYABLE_STATUS_CODES
+    return isinstance(error, (InvalidResponseError, asyncio.TimeoutError, httpx.TransportError))
+
+
+class LatencyTracker:
+    """최근 성공 호출 지연 시간 기록 (헤징 기준 분위수 계산용)"""
+    
+    def __init__(self, window: int = 200):
+        self._samples: "deque[float]" = deque(maxlen=window)
+    
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+    
+    def __len__(self) -> int:
+        return len(self._samples)
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """q 분위수 (표본이 없으면 None)"""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class ResiliencePolicy:
+    """
+    업스트림 호출 복원력 정책
+    
+    - 재시도 가능 오류만 지수 백오프 + full jitter로 재시도
+    - 전체 제한 시간(deadline) 안에서만 시도
+    - 헤징: 시도가 최근 p95 지연 시간을 넘기면 두 번째 요청을 보내고 먼저 성공한 결과 사용
+    
+    호출 한도/동시 호출 대기 같은 입장(admit) 단계는 시도마다 먼저 통과한 뒤에 시도 제한 시간,
+    지연 시간 기록, 헤징 타이머를 시작합니다 (대기 시간이 p95와 시도 제한 시간을 잡아먹지 않도록).
+    """
+    
+    def __init__(
+        self,
+        max_attempts: int,
+        base_delay: float,
+        max_delay: float,
+        deadline_seconds: float,
+        attempt_timeout: float,
+        hedge_enabled: bool = False,
+        hedge_quantile: float = 0.95,
+        hedge_min_samples: int = 20
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline_seconds = deadline_seconds
+        self.attempt_timeout = attempt_timeout
+        self.hedge_enabled = hedge_enabled
+        self.hedge_quantile = hedge_quantile
+        self.hedge_min_samples = hedge_min_samples
+        self.latency = LatencyTracker()
+        self.retries = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.deadline_exceeded = 0
+    
+    async def run(
+        self,
+        attempt: Callable[[Any], Awaitable[T]],
+        admit: Optional[Callable[[], AsyncContextManager[Any]]] = None
+    ) -> T:
+        """
+        정책에 따라 attempt 실행
+        
+        Args:
+            attempt: 입장 값을 받아 업스트림 호출 1회를 수행하는 코루틴 팩토리 (SDK 예외를 그대로 발생)
+            admit: 시도(헤징 요청 포함)마다 전송 직전까지 대기하는 비동기 컨텍스트 팩토리
+                (호출 한도 할당, 동시 호출 슬롯 등, 시도가 끝날 때까지 유지, 없으면 None 전달)
+            
+        Returns:
+            첫 번째 성공 결과
+            
+        Raises:
+            재시도 불가 오류, 마지막 재시도 오류, 또는 전체 제한 시간 초과 시 asyncio.TimeoutError
+        """
+        deadline = time.monotonic() + self.deadline_seconds
+        admit = admit or _no_admission
+        
+        for attempt_number in range(self.max_attempts):
+            try:
+                return await self._run_attempt(attempt, admit, deadline)
+            except Exception as e:
+                await self.backoff(attempt_number, e, deadline)
+        
+        raise asyncio.TimeoutError("Gemini 호출 전체 제한 시간을 초과했습니다.")
+    
+    async def backoff(self, attempt_number: int, error: Exception, deadline: float) -> None:
+        """
+        실패한 시도 뒤 다음 시도까지 대기 (run 밖에서 직접 시도하는 스트리밍 호출도 사용)
+        
+        Args:
+            attempt_number: 실패한 시도 번호 (0부터)
+            error: 실패한 시도의 오류
+            deadline: 전체 제한 시각 (time.monotonic 기준)
+            
+        Raises:
+            재시도 불가 오류나 마지막 시도의 오류는 그대로, 대기가 전체 제한 시간을 넘으면 asyncio.TimeoutError
+        """
+        if not is_retryable(error) or attempt_number >= self.max_attempts - 1:
+            raise error
+        
+        # full jitter: 0 ~ min(max_delay, base * 2^n) 사이 임의 대기
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt_number))
+        if time.monotonic() + delay >= deadline:
+            self.deadline_exceeded += 1
+            raise asyncio.TimeoutError("Gemini 호출 전체 제한 시간을 초과했습니다.") from error
+        
+        self.retries += 1
+        await asyncio.sleep(delay)
+    
+    def hedge_delay(self) -> Optional[float]:
+        """헤징 요청을 보낼 기준 시간 (비활성화되었거나 표본이 부족하면 None)"""
+        if not self.hedge_enabled or len(self.latency) < self.hedge_min_samples:
+            return None
+        return self.latency.quantile(self.hedge_quantile)
+    
+    def stats(self) -> Dict[str, Any]:
+        """재시도/헤징 지표"""
+        p50 = self.latency.quantile(0.5)
+        p95 = self.latency.quantile(0.95)
+        return {
+            "retries": self.retries,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "deadline_exceeded": self.deadline_exceeded,
+            "latency_p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+            "latency_p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+            "hedge_delay_ms": round(self.hedge_delay() * 1000, 1) if self.hedge_delay() is not None else None
+        }
+    
+    async def _run_attempt(
+        self,
+        attempt: Callable[[Any], Awaitable[T]],
+        admit: Callable[[], AsyncContextManager[Any]],
+        deadline: float
+    ) -> T:
+        """
+        시도 1회 (헤징 조건을 만족하면 두 번째 요청까지 경쟁)
+        
+        Note:
+            시도 제한 시간과 헤징 타이머는 입장을 통과한 뒤(전송 직전)부터 계산합니다.
+            헤징 요청도 따로 입장하므로 호출 한도와 동시 호출 상한을 넘지 않습니다.
+        """
+        async with admit() as admission:
+            timeout = min(deadline - time.monotonic(), self.attempt_timeout)
+            if timeout <= 0:
+                self.deadline_exceeded += 1
+                raise asyncio.TimeoutError("Gemini 호출 전체 제한 시간을 초과했습니다.")
+            
+            hedge_delay = self.hedge_delay()
+            if hedge_delay is None or hedge_delay >= timeout:
+                return await asyncio.wait_for(self._timed(attempt, admission), timeout=timeout)
+            
+            started_at = time.monotonic()
+            tasks = [asyncio.create_task(self._timed(attempt, admission))]
+            try:
+                done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+                if not done:
+                    self.hedges += 1
+                    tasks.append(asyncio.create_task(self._admitted(attempt, admit)))
+                return await self._first_success(tasks, started_at + timeout)
+            finally:
+                # 늦게 도착하는 쪽은 취소
+                for task in tasks:
+                    task.cancel()
+    
+    async def _first_success(self, tasks: List["asyncio.Task[T]"], deadline: float) -> T:
+        """가장 먼저 성공한 결과 반환 (모두 실패하면 마지막 오류)"""
+        pending = set(tasks)
+        last_error: Optional[BaseException] = None
+        
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise asyncio.TimeoutError("Gemini 호출 시도 제한 시간을 초과했습니다.")
+            
+            done, pending = await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    if task is not tasks[0]:
+                        self.hedge_wins += 1
+                    return task.result()
+                last_error = task.exception()
+        
+        raise last_error
+    
+    async def _admitted(
+        self,
+        attempt: Callable[[Any], Awaitable[T]],
+        admit: Callable[[], AsyncContextManager[Any]]
+    ) -> T:
+        """헤징 요청 (입장 대기 후 시도)"""
+        async with admit() as admission:
+            return await self._timed(attempt, admission)
+    
+    async def _timed(self, attempt: Callable[[Any], Awaitable[T]], admission: Any) -> T:
+        """성공한 시도의 지연 시간 기록 (입장 이후 전송 ~ 응답 구간)"""
+        started_at = time.monotonic()
+        result = await attempt(admission)
+        self.latency.record(time.monotonic() - started_at)
+        return result
+
+
+@asynccontextmanager
+async def _no_admission() -> AsyncIterator[None]:
+    """입장 단계가 없는 경우"""
+    yield
+
+
+def create_resilience_policy() -> ResiliencePolicy:
+    """설정(GEMINI_RETRY_*, GEMINI_HEDGE_*)에 따라 정책 생성"""
+    return ResiliencePolicy(
+        max_attempts=settings.GEMINI_MAX_ATTEMPTS,
+        base_delay=settings.GEMINI_RETRY_BASE_DELAY,
+        max_delay=settings.GEMINI_RETRY_MAX_DELAY,
+        deadline_seconds=settings.GEMINI_DEADLINE_SECONDS,
+        attempt_timeout=settings.GEMINI_ATTEMPT_TIMEOUT_SECONDS,
+        hedge_enabled=settings.GEMINI_HEDGE_ENABLED,
+        hedge_quantile=settings.GEMINI_HEDGE_QUANTILE,
+        hedge_min_samples=settings.GEMINI_HEDGE_MIN_SAMPLES
+    )
@@ -0,0 +1,208 @@
+import hashlib
+import json
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+from app.core.config import settings
+from app.core.sqlite_store import SQLiteStore
+
+
+class CacheBackend(ABC):
+    """응답 캐시 저장소 인터페이스 (LRU + TTL)"""
+    
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """키에 해당하는 값 조회 (없거나 만료되면 None)"""
+    
+    @abstractmethod
+    async def set(self, key: str, value: str) -> None:
+        """값 저장 (용량 초과 시 가장 오래 사용되지 않은 항목 제거)"""
+    
+    @abstractmethod
+    async def clear(self) -> None:
+        """전체 항목 삭제"""
+    
+    @abstractmethod
+    async def size(self) -> int:
+        """저장된 항목 수"""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """프로세스 메모리 기반 LRU + TTL 캐시"""
+    
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+    
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        created_at, value = entry
+        if self.ttl_seconds and time.time() - created_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return value
+    
+    async def set(self, key: str, value: str) -> None:
+        self._entries[key] = (time.time(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    async def clear(self) -> None:
+        self._entries.clear()
+    
+    async def size(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheBackend(SQLiteStore, CacheBackend):
+    """SQLite 파일 기반 LRU + TTL 캐시 (프로세스 재시작 후에도 유지)"""
+    
+    def __init__(self, path: str, max_entries: int, ttl_seconds: int):
+        super().__init__(path, [
+            """
+            CREATE TABLE IF NOT EXISTS response_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """,
+            "CREATE INDEX IF NOT EXISTS idx_response_cache_accessed ON response_cache (accessed_at)"
+        ])
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+    
+    async def get(self, key: str) -> Optional[str]:
+        return await self._transaction(lambda conn: self._get(conn, key, time.time()))
+    
+    async def set(self, key: str, value: str) -> None:
+        await self._transaction(lambda conn: self._set(conn, key, value, time.time()))
+    
+    async def clear(self) -> None:
+        await self._write("DELETE FROM response_cache")
+    
+    async def size(self) -> int:
+        rows = await self._read("SELECT COUNT(*) FROM response_cache")
+        return rows[0][0]
+    
+    def _get(self, conn: sqlite3.Connection, key: str, now: float) -> Optional[str]:
+        row = conn.execute("SELECT value, created_at FROM response_cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        
+        value, created_at = row
+        if self.ttl_seconds and now - created_at > self.ttl_seconds:
+            conn.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+            return None
+        
+        conn.execute("UPDATE response_cache SET accessed_at = ? WHERE key = ?", (now, key))
+        return value
+    
+    def _set(self, conn: sqlite3.Connection, key: str, value: str, now: float) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO response_cache (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+            (key, value, now, now)
+        )
+        # 용량 초과분은 가장 오래 조회되지 않은 항목부터 제거
+        conn.execute(
+            """
+            DELETE FROM response_cache WHERE key IN (
+                SELECT key FROM response_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.max_entries,)
+        )
+
+
+class ResponseCache:
+    """Gemini 응답 캐시 (정규화된 프롬프트 + 모델 + 생성 설정 해시 기반)"""
+    
+    def __init__(self, backend: CacheBackend, enabled: bool = True):
+        self.backend = backend
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+    
+    @staticmethod
+    def make_key(prompt: str, model: str, config: Optional[Dict[str, Any]] = None) -> str:
+        """
+        캐시 키 생성
+        
+        Args:
+            prompt: 프롬프트 원문
+            model: 모델명
+            config: 생성 설정 (JSON 직렬화 가능한 딕셔너리)
+            
+        Returns:
+            SHA-256 해시 문자열
+        """
+        # 줄바꿈/줄 끝 공백 차이는 같은 프롬프트로 취급
+        lines = prompt.replace("\r\n", "\n").strip().split("\n")
+        normalized_prompt = "\n".join(line.rstrip() for line in lines)
+        
+        payload = json.dumps(
+            {"prompt": normalized_prompt, "model": model, "config": config or {}},
+            ensure_ascii=False,
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    async def get(self, key: str, bypass: bool = False) -> Optional[str]:
+        """캐시 조회 (bypass=True면 조회하지 않고 새로 생성하도록 None 반환)"""
+        if not self.enabled:
+            return None
+        if bypass:
+            self.bypasses += 1
+            return None
+        
+        value = await self.backend.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+    
+    async def set(self, key: str, value: str) -> None:
+        """캐시 저장"""
+        if self.enabled and value:
+            await self.backend.set(key, value)
+    
+    async def stats(self) -> Dict[str, Any]:
+        """캐시 크기 산정용 통계"""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "backend": type(self.backend).__name__,
+            "entries": await self.backend.size(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypasses": self.bypasses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+
+def create_response_cache() -> ResponseCache:
+    """설정(CACHE_*)에 따라 응답 캐시 생성"""
+    if settings.CACHE_BACKEND == "sqlite":
+        backend = SQLiteCacheBackend(
+            settings.CACHE_SQLITE_PATH,
+            settings.CACHE_MAX_ENTRIES,
+            settings.CACHE_TTL_SECONDS
+        )
+    elif settings.CACHE_BACKEND == "memory":
+        backend = MemoryCacheBackend(settings.CACHE_MAX_ENTRIES, settings.CACHE_TTL_SECONDS)
+    else:
+        raise ValueError(f"지원하지 않는 캐시 백엔드: {settings.CACHE_BACKEND}")
+    
+    return ResponseCache(backend, enabled=settings.CACHE_ENABLED)
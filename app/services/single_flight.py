@@ -0,0 +1,76 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    """진행 중인 공유 호출"""
+    
+    def __init__(self, task: "asyncio.Task[Any]"):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    동일 키의 동시 요청을 하나의 업스트림 호출로 합치는 single-flight 그룹
+    
+    공유 호출은 별도 Task로 실행되므로 한 대기자가 취소(클라이언트 연결 끊김 등)되어도
+    다른 대기자의 호출은 계속 진행됩니다. 마지막 대기자까지 취소되면 공유 호출도 취소합니다.
+    """
+    
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}
+        self.leaders = 0
+        self.coalesced = 0
+    
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        키에 해당하는 호출이 진행 중이면 그 결과를 기다리고, 없으면 새로 시작
+        
+        Args:
+            key: 요청 지문 (프롬프트 해시 등)
+            fn: 업스트림 호출 코루틴 팩토리
+            
+        Returns:
+            공유 호출 결과
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = _Call(asyncio.create_task(fn()))
+            self._calls[key] = call
+            call.task.add_done_callback(lambda task: self._finish(key, call))
+            self.leaders += 1
+        else:
+            self.coalesced += 1
+        
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            # 이 대기자만 빠지는 경우 공유 호출은 유지, 남은 대기자가 없으면 함께 취소
+            # (취소가 끝나기 전에 들어온 요청이 취소될 호출을 기다리지 않도록 바로 목록에서 제거)
+            if call.waiters == 1 and not call.task.done():
+                call.task.cancel()
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            raise
+        finally:
+            call.waiters -= 1
+    
+    def _finish(self, key: str, call: _Call) -> None:
+        """완료된 호출 정리"""
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        # 모든 대기자가 떠난 뒤 실패한 경우 "exception was never retrieved" 경고 방지
+        if not call.task.cancelled():
+            call.task.exception()
+    
+    def stats(self) -> Dict[str, Any]:
+        """합쳐진 요청 수 등 통계"""
+        return {
+            "in_flight": len(self._calls),
+            "leaders": self.leaders,
+            "coalesced": self.coalesced
+        }
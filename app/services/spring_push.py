@@ -0,0 +1,204 @@
+import asyncio
+import logging
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Sequence
+import httpx
+from pydantic_core import to_json
+from app.core.config import settings
+from app.utils.wbs_converter import FlatTaskRow, flat_task_dicts
+
+logger = logging.getLogger(__name__)
+
+# 재시도 가능한 스프링 응답 상태 코드 (그 외 4xx는 요청 자체의 문제로 즉시 실패)
+RETRYABLE_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+
+
+class SpringPushError(Exception):
+    """스프링 서버로 작업 배치 전송 실패 (재시도 소진 또는 재시도 불가 응답)"""
+    
+    def __init__(self, message: str, batch_index: int):
+        """
+        Args:
+            message: 오류 메시지
+            batch_index: 실패한 배치 번호 (그 앞의 배치는 모두 전송 완료)
+        """
+        super().__init__(message)
+        self.batch_index = batch_index
+
+
+class SpringPushSink:
+    """
+    생성된 Flat 작업을 스프링 서버로 배치 전송 (push)
+    
+    - 프로세스 전체에서 keep-alive 커넥션 풀을 가진 httpx 클라이언트 하나를 공유
+    - 작업을 전위 순회 순서 그대로 batch_size개씩 나누고 배치를 순서대로 하나씩 전송하므로
+      스프링은 받은 순서대로 저장하면 부모가 항상 자식보다 먼저 저장됨
+    - 배치마다 Idempotency-Key(push_id:배치 번호)를 붙여, 재시도나 작업 재실행으로
+      같은 배치가 다시 도착해도 스프링이 중복 저장을 건너뛸 수 있음
+    - 일시적 오류(네트워크, 408/429/5xx)만 지수 백오프 + full jitter로 재시도 (Retry-After 우선)
+    """
+    
+    def __init__(
+        self,
+        url: str,
+        batch_size: int,
+        max_attempts: int,
+        base_delay: float,
+        max_delay: float,
+        auth_token: str = "",
+        client: Optional[httpx.AsyncClient] = None
+    ):
+        """
+        Args:
+            url: 배치를 POST할 스프링 엔드포인트
+            batch_size: 배치당 작업 수
+            max_attempts: 배치당 최대 시도 횟수 (재시도 포함)
+            base_delay: 백오프 기준 대기(초), 시도마다 2배
+            max_delay: 백오프 최대 대기(초)
+            auth_token: 설정 시 Authorization: Bearer 헤더로 전송
+            client: 공유 HTTP 클라이언트 (없으면 설정에 따라 생성)
+        """
+        self.url = url
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._headers = {"Content-Type": "application/json"}
+        if auth_token:
+            self._headers["Authorization"] = f"Bearer {auth_token}"
+        self._client = client or httpx.AsyncClient(
+            timeout=settings.SPRING_PUSH_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=settings.SPRING_PUSH_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.SPRING_PUSH_MAX_CONNECTIONS,
+                keepalive_expiry=settings.SPRING_PUSH_KEEPALIVE_EXPIRY
+            )
+        )
+        self.pushes = 0
+        self.failed_pushes = 0
+        self.batches_sent = 0
+        self.tasks_sent = 0
+        self.retries = 0
+    
+    async def push(self, push_id: str, summary: Dict[str, Any], rows: Sequence[FlatTaskRow]) -> Dict[str, Any]:
+        """
+        Flat 작업을 배치로 나눠 순서대로 전송
+        
+        Args:
+            push_id: 전송 식별자 (작업 ID 등, 재실행해도 같아야 멱등 키가 유지됨)
+            summary: project_name, total_tasks, total_duration_days
+            rows: iter_flat_tasks 순서의 작업 행
+        
+        Returns:
+            {"push_id", "batches", "tasks", "retries", "elapsed_ms"}
+        
+        Raises:
+            SpringPushError: 배치 전송에 실패한 경우 (이후 배치는 전송하지 않음)
+        """
+        started_at = time.perf_counter()
+        batch_count = max(1, -(-len(rows) // self.batch_size))
+        retries = 0
+        
+        for batch_index in range(batch_count):
+            batch = rows[batch_index * self.batch_size:(batch_index + 1) * self.batch_size]
+            body = to_json({
+                "push_id": push_id,
+                "batch_index": batch_index,
+                "batch_count": batch_count,
+                **summary,
+                "tasks": flat_task_dicts(batch)
+            })
+            try:
+                retries += await self._send(batch_index, f"{push_id}:{batch_index}", body)
+            except SpringPushError:
+                self.failed_pushes += 1
+                raise
+            self.batches_sent += 1
+            self.tasks_sent += len(batch)
+        
+        self.pushes += 1
+        return {
+            "push_id": push_id,
+            "batches": batch_count,
+            "tasks": len(rows),
+            "retries": retries,
+            "elapsed_ms": round((time.perf_counter() - started_at) * 1000, 1)
+        }
+    
+    async def aclose(self) -> None:
+        await self._client.aclose()
+    
+    def stats(self) -> Dict[str, Any]:
+        """전송 지표"""
+        return {
+            "url": self.url,
+            "pushes": self.pushes,
+            "failed_pushes": self.failed_pushes,
+            "batches_sent": self.batches_sent,
+            "tasks_sent": self.tasks_sent,
+            "retries": self.retries
+        }
+    
+    async def _send(self, batch_index: int, idempotency_key: str, body: bytes) -> int:
+        """배치 1개 전송 (재시도 포함), 재시도 횟수 반환"""
+        headers = {**self._headers, "Idempotency-Key": idempotency_key}
+        
+        for attempt_number in range(self.max_attempts):
+            retry_after: Optional[float] = None
+            try:
+                response = await self._client.post(self.url, content=body, headers=headers)
+                if response.is_success:
+                    return attempt_number
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    raise SpringPushError(
+                        f"스프링 서버가 배치를 거부했습니다. (HTTP {response.status_code}: {response.text[:200]})",
+                        batch_index
+                    )
+                error = f"HTTP {response.status_code}"
+                retry_after = _retry_after_seconds(response.headers.get("Retry-After"))
+            except httpx.TransportError as e:
+                error = f"{type(e).__name__}: {str(e)}"
+            
+            if attempt_number == self.max_attempts - 1:
+                raise SpringPushError(
+                    f"스프링 서버 배치 전송 재시도를 모두 소진했습니다. ({idempotency_key}, {error})",
+                    batch_index
+                )
+            
+            # full jitter: 0 ~ min(max_delay, base * 2^n) 사이 임의 대기 (Retry-After가 있으면 우선)
+            delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt_number))
+            if retry_after is not None:
+                delay = min(retry_after, self.max_delay)
+            logger.warning(f"스프링 배치 전송 재시도 ({idempotency_key}, {error}, {delay:.2f}초 후)")
+            self.retries += 1
+            await asyncio.sleep(delay)
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 초로 변환 (해석할 수 없으면 None)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def create_spring_push_sink() -> Optional[SpringPushSink]:
+    """설정(SPRING_PUSH_*)에 따라 전송기 생성 (비활성화 또는 URL 미설정 시 None)"""
+    if not settings.SPRING_PUSH_ENABLED or not settings.SPRING_PUSH_URL:
+        return None
+    return SpringPushSink(
+        url=settings.SPRING_PUSH_URL,
+        batch_size=settings.SPRING_PUSH_BATCH_SIZE,
+        max_attempts=settings.SPRING_PUSH_MAX_ATTEMPTS,
+        base_delay=settings.SPRING_PUSH_RETRY_BASE_DELAY,
+        max_delay=settings.SPRING_PUSH_RETRY_MAX_DELAY,
+        auth_token=settings.SPRING_PUSH_AUTH_TOKEN
+    )
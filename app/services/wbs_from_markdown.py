@@ -1,59 +1,151 @@
-import json
-import re
-from typing import Dict, Any
-from app.models.response import WBSGenerateResponse
+from datetime import date
+from typing import AsyncIterator, Dict, Any, List, Optional
+from app.core.config import settings
+from app.core.metrics import track_stage
+from app.models.response import WBSGenerateResponse, WBSTask
 from app.services.gemini_service import GeminiService
+from app.services.wbs_validation import generate_valid_wbs
+from app.utils.scheduler import assignee_roles, schedule_response, schedule_window_from_spec
+from app.utils.wbs_converter import flatten_wbs_for_spring, iter_flat_tasks
+from app.utils.wbs_repair import WBSTreeRepairer, repair_wbs
+from app.utils.wbs_stream_parser import WBSStreamParser
 
 
 class WBSFromMarkdownGenerator:
     """마크다운 명세서로부터 WBS 생성 서비스"""
     
-    def __init__(self):
-        self.gemini_service = GeminiService()
+    def __init__(self, gemini_service: Optional[GeminiService] = None):
+        self.gemini_service = gemini_service or GeminiService()
     
-    async def generate_wbs(self, markdown_spec: str) -> WBSGenerateResponse:
+    async def generate_wbs(
+        self,
+        markdown_spec: str,
+        bypass_cache: bool = False
+    ) -> WBSGenerateResponse:
         """
         마크다운 명세서로부터 WBS 생성
         
         Args:
             markdown_spec: 마크다운 형식의 프로젝트 명세서
+            bypass_cache: True면 응답 캐시를 사용하지 않음
             
         Returns:
             생성된 WBS 응답
         """
-        # 1. Gemini API를 통해 WBS 구조 생성
-        wbs_json_str = await self.gemini_service.generate_wbs_from_markdown(markdown_spec)
-        
-        # 2. JSON 파싱 및 검증
-        wbs_data = self._parse_and_validate_wbs(wbs_json_str)
+        # 1~2. Gemini API를 통해 WBS 구조 생성 후 로컬 검증/수정 (복구 불가 시에만 재생성)
+        wbs_data = await generate_valid_wbs(
+            self.gemini_service,
+            "wbs_from_markdown",
+            lambda bypass: self.gemini_service.generate_wbs_from_markdown(markdown_spec, bypass_cache=bypass),
+            bypass_cache=bypass_cache,
+            min_phases=settings.WBS_REPAIR_MIN_PHASES
+        )
         
         # 3. Pydantic 모델로 변환
-        response = WBSGenerateResponse(**wbs_data)
+        model = self.gemini_service.response_model
+        with track_stage("validation", model):
+            response = WBSGenerateResponse(**wbs_data)
+        
+        # 4. 날짜를 명세서의 기간/팀 구성에 맞춰 로컬에서 다시 배정
+        if settings.LOCAL_SCHEDULING_ENABLED:
+            with track_stage("schedule", model):
+                response = self._schedule(response, markdown_spec)
         
         return response
     
-    def _parse_and_validate_wbs(self, json_str: str) -> Dict[str, Any]:
+    async def stream_flat_tasks(
+        self,
+        markdown_spec: str,
+        bypass_cache: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
         """
-        Gemini 응답을 파싱하고 검증
+        마크다운 명세서로부터 WBS를 생성하면서 Flat 작업을 즉시 전달
         
         Args:
-            json_str: Gemini가 생성한 JSON 문자열
-            
-        Returns:
-            파싱된 딕셔너리
-        """
-        try:
-            # 마크다운 코드 블록 제거
-            json_str = re.sub(r'^```(?:json)?\s*\n', '', json_str, flags=re.MULTILINE)
-            json_str = re.sub(r'\n```\s*$', '', json_str, flags=re.MULTILINE)
-            json_str = json_str.strip()
-            
-            # JSON 파싱
-            wbs_data = json.loads(json_str)
+            markdown_spec: 마크다운 형식의 프로젝트 명세서
+            bypass_cache: True면 응답 캐시를 사용하지 않음
             
-            return wbs_data
+        Yields:
+            {"type": "task", "data": flat_task} 행 (flatten_wbs_for_spring 순서와 동일),
+            로컬 일정 계산 시 {"type": "schedule", "data": [...]} 행, 마지막에 {"type": "summary", "data": {...}} 행
             
-        except json.JSONDecodeError as e:
-            raise ValueError(f"WBS JSON 파싱 실패: {str(e)}\n응답: {json_str[:500]}")
-        except Exception as e:
-            raise ValueError(f"WBS 데이터 검증 실패: {str(e)}")
+        Note:
+            일정은 전체 작업량을 알아야 기간에 맞출 수 있으므로, 로컬 일정 계산을 사용하면 task 행의 날짜는
+            모델이 정한 잠정 값입니다. 생성이 끝나면 /flat과 같은 날짜를 schedule 행으로 한 번에 보냅니다.
+        """
+        parser = WBSStreamParser()
+        repairer = WBSTreeRepairer()
+        phases: List[WBSTask] = []
+        
+        async for event in self.gemini_service.stream_wbs_from_markdown(
+            markdown_spec, bypass_cache=bypass_cache
+        ):
+            if event["event"] == "chunk":
+                # 1. 완성된 주요 단계(하위 작업 포함)를 수정한 뒤 바로 Flat 구조로 변환
+                for task_data in parser.feed(event["text"]):
+                    task_data = repairer.repair_phase(task_data)
+                    if task_data is None:
+                        continue
+                    task = WBSTask(**task_data)
+                    phases.append(task)
+                    for flat_task in flatten_wbs_for_spring([task]):
+                        yield {"type": "task", "data": flat_task}
+            else:
+                # 2. 전체 응답으로 최종 검증 및 요약 정보 생성
+                model = self.gemini_service.response_model
+                with track_stage("json_parse", model):
+                    wbs_data = repair_wbs(parser.text, min_phases=settings.WBS_REPAIR_MIN_PHASES).data
+                with track_stage("validation", model):
+                    response = WBSGenerateResponse(**wbs_data)
+                
+                # 3. 이미 보낸 작업의 날짜를 /flat과 같은 방식으로 다시 배정해 확정 날짜 전달
+                if settings.LOCAL_SCHEDULING_ENABLED and phases:
+                    with track_stage("schedule", model):
+                        scheduled = self._schedule(
+                            response.model_copy(update={"wbs_structure": phases}), markdown_spec
+                        )
+                    response = response.model_copy(update={"total_duration_days": scheduled.total_duration_days})
+                    yield {
+                        "type": "schedule",
+                        "data": [
+                            {
+                                "task_id": row.task_id,
+                                "start_date": row.start_date,
+                                "end_date": row.end_date,
+                                "duration_days": row.duration_days
+                            }
+                            for row in iter_flat_tasks(scheduled.wbs_structure)
+                        ]
+                    }
+                
+                yield {
+                    "type": "summary",
+                    "data": {
+                        "project_name": response.project_name,
+                        "total_tasks": response.total_tasks,
+                        "total_duration_days": response.total_duration_days,
+                        "usage": event["usage"],
+                        "timing": event["timing"]
+                    }
+                }
+    
+    def _schedule(
+        self,
+        response: WBSGenerateResponse,
+        markdown_spec: str,
+        default_start: Optional[date] = None
+    ) -> WBSGenerateResponse:
+        """
+        명세서의 기간/팀 구성으로 일정 계산
+        
+        Note:
+            명세서에 없는 값은 시작일 default_start(없으면 오늘), 기간은 모델이 정한 전체 기간,
+            인원은 담당자 역할 수로 대신합니다.
+        """
+        window = schedule_window_from_spec(markdown_spec)
+        return schedule_response(
+            response,
+            window.start_date or default_start or date.today(),
+            window.total_days or max(response.total_duration_days, 1),
+            window.team_size or max(len(assignee_roles(response.wbs_structure)), 1)
+        )
@@ -1,24 +1,87 @@
+import asyncio
 import json
-import re
-from datetime import datetime, timedelta
-from typing import Dict, Any
+from datetime import date, datetime, timedelta, timezone
+from typing import AsyncIterator, Dict, Any, List, Optional
+from app.core.config import settings
+from app.core.metrics import track_stage
+from app.core.sqlite_store import SQLiteStore
+from app.models.batch import WBSBatchItemResult, WBSBatchJobResponse
 from app.models.request import WBSGenerateRequest
 from app.models.response import WBSGenerateResponse, WBSTask
 from app.services.gemini_service import GeminiService
+from app.services.wbs_validation import generate_valid_wbs
+from app.utils.scheduler import schedule_response
+from app.utils.wbs_repair import repair_wbs
+
+
+class OfflineBatchStore(SQLiteStore):
+    """SQLite 기반 오프라인 배치 요청 저장소 (결과 조회 시 항목별 일정 계산용)"""
+    
+    def __init__(self, path: str):
+        super().__init__(path, [
+            """
+            CREATE TABLE IF NOT EXISTS offline_batches (
+                batch_name TEXT PRIMARY KEY,
+                requests TEXT NOT NULL,
+                submitted_on TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            )
+            """
+        ])
+    
+    async def get(self, batch_name: str) -> Optional[Dict[str, Any]]:
+        rows = await self._read(
+            "SELECT requests, submitted_on FROM offline_batches WHERE batch_name = ?",
+            (batch_name,)
+        )
+        if not rows:
+            return None
+        requests, submitted_on = rows[0]
+        return {
+            "requests": [WBSGenerateRequest(**item) for item in json.loads(requests)],
+            "submitted_on": date.fromisoformat(submitted_on)
+        }
+    
+    async def save(self, batch_name: str, requests: List[WBSGenerateRequest], submitted_on: date) -> None:
+        await self._write(
+            "INSERT OR REPLACE INTO offline_batches (batch_name, requests, submitted_on, created_at) "
+            "VALUES (?, ?, ?, ?)",
+            (
+                batch_name,
+                json.dumps([request.model_dump(mode="json") for request in requests], ensure_ascii=False),
+                submitted_on.isoformat(),
+                datetime.now(timezone.utc).isoformat()
+            )
+        )
 
 
 class WBSGenerator:
     """WBS 생성 서비스"""
     
-    def __init__(self):
-        self.gemini_service = GeminiService()
+    def __init__(
+        self,
+        gemini_service: Optional[GeminiService] = None,
+        batch_store: Optional[OfflineBatchStore] = None
+    ):
+        """
+        Args:
+            gemini_service: Gemini 서비스 (없으면 새로 생성)
+            batch_store: 오프라인 배치 요청 저장소 (없으면 배치 결과의 일정을 다시 계산하지 않음)
+        """
+        self.gemini_service = gemini_service or GeminiService()
+        self.batch_store = batch_store
     
-    async def generate_wbs(self, request: WBSGenerateRequest) -> WBSGenerateResponse:
+    async def generate_wbs(
+        self,
+        request: WBSGenerateRequest,
+        bypass_cache: bool = False
+    ) -> WBSGenerateResponse:
         """
         WBS 생성 메인 로직
         
         Args:
             request: WBS 생성 요청
+            bypass_cache: True면 응답 캐시를 사용하지 않음
             
         Returns:
             생성된 WBS 응답
@@ -26,17 +89,148 @@ class WBSGenerator:
         # 1. 요청 데이터를 Gemini용 형식으로 변환
         project_data = self._prepare_project_data(request)
         
-        # 2. Gemini API를 통해 WBS 구조 생성
-        wbs_json_str = await self.gemini_service.generate_wbs_structure(project_data)
+        # 2. Gemini API를 통해 WBS 구조 생성 후 로컬 검증/수정 (복구 불가 시에만 재생성)
+        wbs_data = await generate_valid_wbs(
+            self.gemini_service,
+            "wbs",
+            lambda bypass: self.gemini_service.generate_wbs_structure(project_data, bypass_cache=bypass),
+            bypass_cache=bypass_cache,
+            min_phases=settings.WBS_REPAIR_MIN_PHASES
+        )
         
-        # 3. JSON 파싱 및 검증
-        wbs_data = self._parse_and_validate_wbs(wbs_json_str)
+        # 3. Pydantic 모델로 변환
+        model = self.gemini_service.response_model
+        with track_stage("validation", model):
+            response = WBSGenerateResponse(**wbs_data)
         
-        # 4. Pydantic 모델로 변환
-        response = WBSGenerateResponse(**wbs_data)
+        # 4. 날짜를 요청 기간/인원에 맞춰 로컬에서 다시 배정
+        if settings.LOCAL_SCHEDULING_ENABLED:
+            with track_stage("schedule", model):
+                response = self._schedule(response, request)
         
         return response
     
+    async def generate_batch(
+        self,
+        requests: List[WBSGenerateRequest],
+        bypass_cache: bool = False
+    ) -> AsyncIterator[WBSBatchItemResult]:
+        """
+        여러 프로젝트의 WBS를 병렬 생성하고 완료 순서대로 반환
+        
+        Args:
+            requests: WBS 생성 요청 리스트
+            bypass_cache: True면 응답 캐시를 사용하지 않음
+            
+        Yields:
+            항목별 결과 (한 항목의 실패가 전체 배치를 중단시키지 않음)
+            
+        Note:
+            동시 생성 수는 BATCH_MAX_PARALLEL로 제한됩니다.
+        """
+        semaphore = asyncio.Semaphore(settings.BATCH_MAX_PARALLEL)
+        
+        async def run_item(index: int, request: WBSGenerateRequest) -> WBSBatchItemResult:
+            async with semaphore:
+                try:
+                    result = await self.generate_wbs(request, bypass_cache=bypass_cache)
+                    return WBSBatchItemResult(index=index, project_name=request.project_name, result=result)
+                except Exception as e:
+                    return WBSBatchItemResult(index=index, project_name=request.project_name, error=str(e))
+        
+        tasks = [asyncio.create_task(run_item(i, request)) for i, request in enumerate(requests)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # 클라이언트 연결이 끊기면 남은 항목 취소
+            for task in tasks:
+                task.cancel()
+    
+    async def submit_offline_batch(self, requests: List[WBSGenerateRequest]) -> WBSBatchJobResponse:
+        """
+        여러 프로젝트의 WBS 생성을 Gemini 배치 예측 작업으로 제출 (저비용, 고지연)
+        
+        Args:
+            requests: WBS 생성 요청 리스트
+            
+        Returns:
+            배치 작업 정보 (batch_name으로 결과 조회)
+            
+        Note:
+            결과를 조회할 때 항목별 기간/인원으로 일정을 다시 계산할 수 있도록
+            요청과 제출일(시작일이 없는 요청의 기준일)을 batch_store에 저장합니다.
+        """
+        project_data_list = [self._prepare_project_data(request) for request in requests]
+        batch_job = await self.gemini_service.submit_wbs_batch(project_data_list)
+        if self.batch_store is not None:
+            await self.batch_store.save(batch_job.name, requests, date.today())
+        
+        return WBSBatchJobResponse(
+            batch_name=batch_job.name,
+            state=batch_job.state.value if batch_job.state else "JOB_STATE_UNSPECIFIED",
+            total_items=len(requests)
+        )
+    
+    async def get_offline_batch(self, batch_name: str) -> WBSBatchJobResponse:
+        """
+        배치 예측 작업 상태 조회 (완료 시 항목별 WBS 포함)
+        
+        Args:
+            batch_name: 배치 작업 이름
+            
+        Returns:
+            배치 작업 상태 및 결과
+            
+        Note:
+            제출 시 저장한 요청이 있으면 온라인 생성과 같이 항목별 기간/인원으로 날짜를 다시 배정합니다
+            (시작일이 없는 요청은 제출일 기준). 저장된 요청이 없으면 모델이 준 날짜를 그대로 반환합니다.
+        """
+        state, raw_results = await self.gemini_service.get_batch_results(batch_name)
+        if raw_results is None:
+            return WBSBatchJobResponse(batch_name=batch_name, state=state, total_items=0)
+        
+        saved = await self.batch_store.get(batch_name) if self.batch_store is not None else None
+        requests = saved["requests"] if saved is not None else []
+        
+        results = []
+        for index, (json_str, error) in enumerate(raw_results):
+            request = requests[index] if index < len(requests) else None
+            if error is None:
+                try:
+                    wbs_data = repair_wbs(json_str or "", min_phases=settings.WBS_REPAIR_MIN_PHASES).data
+                    result = WBSGenerateResponse(**wbs_data)
+                    if settings.LOCAL_SCHEDULING_ENABLED and request is not None:
+                        result = self._schedule(result, request, saved["submitted_on"])
+                    results.append(WBSBatchItemResult(index=index, project_name=result.project_name, result=result))
+                    continue
+                except Exception as e:
+                    error = str(e)
+            project_name = request.project_name if request is not None else ""
+            results.append(WBSBatchItemResult(index=index, project_name=project_name, error=error))
+        
+        return WBSBatchJobResponse(
+            batch_name=batch_name,
+            state=state,
+            total_items=len(results),
+            results=results
+        )
+    
+    def _schedule(
+        self,
+        response: WBSGenerateResponse,
+        request: WBSGenerateRequest,
+        default_start: Optional[date] = None
+    ) -> WBSGenerateResponse:
+        """요청의 시작일(없으면 default_start, 그것도 없으면 오늘)/기간/참여 인원으로 일정 계산"""
+        if request.project_duration:
+            start_date = request.project_duration.start_date
+            total_days = (request.project_duration.end_date - start_date).days + 1
+        else:
+            start_date = default_start or date.today()
+            total_days = request.expected_duration_days
+        return schedule_response(response, start_date, total_days, request.team_size)
+    
     def _prepare_project_data(self, request: WBSGenerateRequest) -> Dict[str, Any]:
         """요청 데이터를 Gemini API용 형식으로 변환"""
         
@@ -74,29 +268,3 @@ class WBSGenerator:
             "detailed_requirements": request.detailed_requirements,
             "constraints": request.constraints
         }
-    
-    def _parse_and_validate_wbs(self, json_str: str) -> Dict[str, Any]:
-        """
-        Gemini 응답을 파싱하고 검증
-        
-        Args:
-            json_str: Gemini가 생성한 JSON 문자열
-            
-        Returns:
-            파싱된 딕셔너리
-        """
-        try:
-            # 마크다운 코드 블록 제거 (```json ... ``` 또는 ``` ... ```)
-            json_str = re.sub(r'^```(?:json)?\s*\n', '', json_str, flags=re.MULTILINE)
-            json_str = re.sub(r'\n```\s*$', '', json_str, flags=re.MULTILINE)
-            json_str = json_str.strip()
-            
-            # JSON 파싱
-            wbs_data = json.loads(json_str)
-            
-            return wbs_data
-            
-        except json.JSONDecodeError as e:
-            raise ValueError(f"WBS JSON 파싱 실패: {str(e)}\n응답: {json_str[:500]}")
-        except Exception as e:
-            raise ValueError(f"WBS 데이터 검증 실패: {str(e)}")
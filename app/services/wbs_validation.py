@@ -0,0 +1,73 @@
+import logging
+from typing import Any, Awaitable, Callable, Dict
+from app.core.metrics import track_stage
+from app.services.gemini_service import GeminiService
+from app.utils.wbs_repair import RepairReport, WBSRepairError, repair_wbs
+
+logger = logging.getLogger(__name__)
+
+
+async def generate_valid_wbs(
+    gemini_service: GeminiService,
+    operation: str,
+    generate: Callable[[bool], Awaitable[str]],
+    bypass_cache: bool = False,
+    allow_truncated: bool = True,
+    min_phases: int = 1
+) -> Dict[str, Any]:
+    """
+    WBS 생성 후 로컬 검증/수정, 복구할 수 없을 때만 한 번 재생성
+    
+    Args:
+        gemini_service: 지표 기록용 Gemini 서비스
+        operation: 생성 종류 (wbs, wbs_from_markdown, wbs_incremental)
+        generate: bypass_cache를 받아 응답 원문을 반환하는 생성 함수
+        bypass_cache: True면 첫 생성도 응답 캐시를 사용하지 않음
+        allow_truncated: False면 잘린 응답은 복구하지 않고 재생성
+        min_phases: 잘린 응답에서 살려야 하는 최소 주요 단계 수
+    
+    Returns:
+        WBSGenerateResponse로 바로 검증 가능한 딕셔너리
+    
+    Raises:
+        WBSRepairError: 재생성한 응답도 복구할 수 없는 경우 (ValueError 하위 클래스)
+    
+    Note:
+        재생성은 캐시를 우회하므로 캐시에 남은 잘못된 응답도 새 응답으로 덮어씁니다.
+    """
+    text = await generate(bypass_cache)
+    try:
+        report = _repair(gemini_service, operation, text, allow_truncated, min_phases)
+    except WBSRepairError as e:
+        logger.warning(f"WBS 응답을 로컬에서 복구할 수 없어 재생성합니다. ({operation}: {str(e)[:200]})")
+        text = await generate(True)
+        try:
+            report = _repair(gemini_service, operation, text, allow_truncated, min_phases)
+        except WBSRepairError:
+            gemini_service.record_repair(operation, "failed")
+            raise
+        gemini_service.record_repair(operation, "retried", report.issues)
+        return report.data
+    
+    gemini_service.record_repair(
+        operation, "repaired" if report.repaired else "clean", report.issues, report.retry_avoided
+    )
+    return report.data
+
+
+def _repair(
+    gemini_service: GeminiService,
+    operation: str,
+    text: str,
+    allow_truncated: bool,
+    min_phases: int
+) -> RepairReport:
+    """응답 1개 검증/수정 (파싱 결과는 출력 방식별 파싱 실패율에 기록)"""
+    try:
+        with track_stage("json_parse", gemini_service.response_model):
+            report = repair_wbs(text, allow_truncated=allow_truncated, min_phases=min_phases)
+    except WBSRepairError:
+        gemini_service.record_parse_result(operation, False)
+        raise
+    gemini_service.record_parse_result(operation, report.parsed_cleanly)
+    return report
@@ -0,0 +1,156 @@
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+from app.utils.wbs_converter import FLAT_TASK_FIELDS, FlatTaskRow, flat_task_dicts
+
+try:
+    import msgpack
+except ImportError:  # msgpack 미설치 시 JSON 계열 형식만 제공
+    msgpack = None
+
+
+class FlatEncoding(str, Enum):
+    """Flat 작업 응답 형식 (Accept 헤더의 미디어 타입)"""
+    JSON = "application/json"                                  # 작업마다 객체 (기본)
+    COLUMNAR_JSON = "application/vnd.flowplan.columnar+json"   # 필드별 배열, 상수 열은 한 번만
+    MSGPACK = "application/msgpack"                            # JSON과 같은 구조의 MessagePack
+    COLUMNAR_MSGPACK = "application/vnd.flowplan.columnar+msgpack"
+    
+    @property
+    def columnar(self) -> bool:
+        return self in (FlatEncoding.COLUMNAR_JSON, FlatEncoding.COLUMNAR_MSGPACK)
+    
+    @property
+    def binary(self) -> bool:
+        return self in (FlatEncoding.MSGPACK, FlatEncoding.COLUMNAR_MSGPACK)
+
+
+# 같은 q 값이면 앞쪽 형식을 우선 (와일드카드는 기본 JSON)
+_PREFERENCE = list(FlatEncoding)
+_ALIASES = {"application/x-msgpack": FlatEncoding.MSGPACK}
+
+
+def available_encodings() -> List[FlatEncoding]:
+    """현재 환경에서 제공 가능한 형식 (msgpack 미설치 시 JSON 계열만)"""
+    if msgpack is None:
+        return [encoding for encoding in _PREFERENCE if not encoding.binary]
+    return list(_PREFERENCE)
+
+
+def negotiate_flat_encoding(accept: Optional[str]) -> Optional[FlatEncoding]:
+    """
+    Accept 헤더로 Flat 응답 형식 결정
+    
+    Args:
+        accept: Accept 헤더 값 (없으면 JSON)
+    
+    Returns:
+        가장 높은 q 값의 제공 가능한 형식, 제공 가능한 형식이 없으면 None (406)
+    
+    Note:
+        q 값이 같으면 구체적인 미디어 타입이 와일드카드보다 우선하고,
+        와일드카드(*/*, application/*)는 기본 JSON으로 응답합니다.
+    """
+    if not accept:
+        return FlatEncoding.JSON
+    
+    available = available_encodings()
+    best: Optional[Tuple[float, int, int]] = None
+    chosen: Optional[FlatEncoding] = None
+    for media_range, quality in _parse_accept(accept):
+        if quality <= 0:
+            continue
+        if media_range in ("*/*", "application/*"):
+            encoding, specificity = FlatEncoding.JSON, 0
+        else:
+            encoding = _ALIASES.get(media_range)
+            if encoding is None:
+                try:
+                    encoding = FlatEncoding(media_range)
+                except ValueError:
+                    continue
+            specificity = 1
+        if encoding not in available:
+            continue
+        rank = (quality, specificity, -_PREFERENCE.index(encoding))
+        if best is None or rank > best:
+            best, chosen = rank, encoding
+    return chosen
+
+
+def to_columnar(rows: Sequence[FlatTaskRow]) -> Dict[str, Any]:
+    """
+    Flat 작업 행을 열 기반 구조로 변환
+    
+    Args:
+        rows: iter_flat_tasks가 만든 행 (부모 → 자식 순서)
+    
+    Returns:
+        {"count": 행 수, "fields": 필드 순서, "columns": {필드: 값 배열}, "constants": {필드: 값}}
+    
+    Note:
+        모든 행에서 값이 같은 열(progress=0, status="할일" 등)은 constants에 한 번만 담습니다.
+        i번째 작업은 fields 순서대로 columns[field][i] 또는 constants[field]를 읽어 복원합니다.
+    """
+    count = len(rows)
+    columns: Dict[str, List[Any]] = {}
+    constants: Dict[str, Any] = {}
+    values_by_field = zip(*rows) if count else ([] for _ in FLAT_TASK_FIELDS)
+    for field, values in zip(FLAT_TASK_FIELDS, values_by_field):
+        if count > 1 and values.count(values[0]) == count:
+            constants[field] = values[0]
+        else:
+            columns[field] = list(values)
+    return {
+        "count": count,
+        "fields": list(FLAT_TASK_FIELDS),
+        "columns": columns,
+        "constants": constants
+    }
+
+
+def rows_from_dicts(tasks: Iterable[Mapping[str, Any]]) -> List[FlatTaskRow]:
+    """flatten_wbs_for_spring 형식 딕셔너리(작업 큐에 저장된 결과 등)를 행으로 변환"""
+    return [FlatTaskRow(*(task[field] for field in FLAT_TASK_FIELDS)) for task in tasks]
+
+
+def encode_flat_body(
+    summary: Dict[str, Any],
+    rows: Sequence[FlatTaskRow],
+    encoding: FlatEncoding
+) -> Dict[str, Any]:
+    """
+    요약 필드(project_name 등)와 작업 행으로 응답 본문 구성
+    
+    Returns:
+        columnar 형식이면 {**summary, "layout": "columnar", "tasks": to_columnar(...)},
+        그 외에는 {**summary, "tasks": [작업 딕셔너리...]} (기존 /flat 응답과 동일)
+    """
+    if encoding.columnar:
+        return {**summary, "layout": "columnar", "tasks": to_columnar(rows)}
+    return {**summary, "tasks": flat_task_dicts(rows)}
+
+
+def pack_msgpack(content: Any) -> bytes:
+    """MessagePack 직렬화 (문자열은 str, 바이너리는 bin 타입)"""
+    if msgpack is None:
+        raise RuntimeError("msgpack 패키지가 설치되어 있지 않습니다.")
+    return msgpack.packb(content, use_bin_type=True)
+
+
+def _parse_accept(accept: str) -> List[Tuple[str, float]]:
+    """Accept 헤더를 (미디어 타입, q) 목록으로 파싱 (잘못된 q는 0으로 취급)"""
+    parsed = []
+    for part in accept.split(","):
+        media_range, *params = [token.strip() for token in part.split(";")]
+        if not media_range:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        parsed.append((media_range.lower(), quality))
+    return parsed
@@ -0,0 +1,105 @@
+from typing import Any, Dict, Optional, Set, Type
+from pydantic import BaseModel
+
+# Gemini 응답 스키마(OpenAPI 부분집합)에서 STRING에 허용되는 format
+_SUPPORTED_STRING_FORMATS = {"enum", "date-time"}
+
+
+def build_gemini_response_schema(
+    model: Type[BaseModel],
+    max_depth: int = 3,
+    exclude_fields: Optional[Set[str]] = None
+) -> Dict[str, Any]:
+    """
+    Pydantic 모델로부터 Gemini 구조화 출력용 응답 스키마 생성
+    
+    Args:
+        model: 응답 모델 (예: WBSGenerateResponse)
+        max_depth: 중첩 모델 최대 깊이 (순환 참조 WBSTask.subtasks를 이 깊이에서 끊음)
+        exclude_fields: 스키마에서 제외할 필드명 (기본값으로 채워지는 필드 등)
+        
+    Returns:
+        GenerateContentConfig.response_schema에 전달할 딕셔너리
+        
+    Note:
+        Gemini 응답 스키마는 $ref를 지원하지 않으므로 참조를 인라인으로 펼치고,
+        Optional 필드는 nullable로, 속성 순서는 모델 필드 순서(property_ordering)로 고정합니다.
+    """
+    json_schema = model.model_json_schema()
+    definitions = json_schema.pop("$defs", {})
+    return _convert(json_schema, definitions, max_depth, exclude_fields or set())
+
+
+def _convert(
+    node: Dict[str, Any],
+    definitions: Dict[str, Any],
+    depth: int,
+    exclude_fields: Set[str]
+) -> Optional[Dict[str, Any]]:
+    """JSON Schema 노드를 Gemini 스키마로 변환 (최대 깊이를 넘으면 None)"""
+    if "$ref" in node:
+        resolved = dict(definitions[node["$ref"].split("/")[-1]])
+        # 열거형 참조는 순환하지 않으므로 깊이에 포함하지 않음
+        if "enum" not in resolved:
+            if depth <= 0:
+                return None
+            depth -= 1
+        if "description" in node:
+            resolved["description"] = node["description"]
+        return _convert(resolved, definitions, depth, exclude_fields)
+    
+    if "allOf" in node and len(node["allOf"]) == 1:
+        merged = {**node["allOf"][0], **{k: v for k, v in node.items() if k != "allOf"}}
+        return _convert(merged, definitions, depth, exclude_fields)
+    
+    if "anyOf" in node:
+        variants = [variant for variant in node["anyOf"] if variant.get("type") != "null"]
+        converted = _convert({**variants[0], **_annotations(node)}, definitions, depth, exclude_fields)
+        if converted is not None and len(variants) < len(node["anyOf"]):
+            converted["nullable"] = True
+        return converted
+    
+    schema: Dict[str, Any] = {}
+    if "description" in node:
+        schema["description"] = node["description"]
+    
+    if "enum" in node:
+        schema.update({"type": "STRING", "enum": [str(value) for value in node["enum"]]})
+        return schema
+    
+    node_type = node.get("type", "object")
+    if node_type == "object":
+        properties = {}
+        for name, child in node.get("properties", {}).items():
+            if name in exclude_fields:
+                continue
+            converted = _convert(child, definitions, depth, exclude_fields)
+            if converted is not None:
+                properties[name] = converted
+        schema.update({
+            "type": "OBJECT",
+            "properties": properties,
+            "required": [name for name in node.get("required", []) if name in properties],
+            "property_ordering": list(properties)
+        })
+    elif node_type == "array":
+        items = _convert(node.get("items", {}), definitions, depth, exclude_fields)
+        if items is None:
+            return None
+        schema.update({"type": "ARRAY", "items": items})
+    else:
+        schema["type"] = node_type.upper()
+        if node_type == "string" and node.get("format") in _SUPPORTED_STRING_FORMATS:
+            schema["format"] = node["format"]
+        elif node_type == "string" and node.get("format") == "date":
+            schema["description"] = f"{schema.get('description', '')} (YYYY-MM-DD)".strip()
+        for key in ("minimum", "maximum"):
+            if key in node:
+                schema[key] = node[key]
+    
+    return schema
+
+
+def _annotations(node: Dict[str, Any]) -> Dict[str, Any]:
+    """anyOf 바깥에 붙은 설명 등 부가 정보"""
+    return {key: value for key, value in node.items() if key in ("description",)}
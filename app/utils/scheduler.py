@@ -0,0 +1,247 @@
+import heapq
+import re
+from datetime import date, timedelta
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+from app.models.response import WBSGenerateResponse, WBSTask
+
+# 비율 보정 반복 횟수 (대부분 2~3회 안에 기간에 맞춰짐)
+_MAX_FIT_ITERATIONS = 12
+
+_SPEC_DATE_RANGE = re.compile(r"(\d{4}-\d{2}-\d{2})\s*~\s*(\d{4}-\d{2}-\d{2})")
+_SPEC_PERIOD_LINE = re.compile(r"^.*기간\**\s*:(.*)$", re.MULTILINE)
+_SPEC_TEAM_LINE = re.compile(r"^.*(?:팀 구성|팀 규모|참여 인원)\**\s*:(.*)$", re.MULTILINE)
+
+
+class Schedule(NamedTuple):
+    """일정 계산 결과"""
+    wbs_structure: List[WBSTask]  # 날짜/기간이 채워진 WBS (원본은 변경하지 않음)
+    total_duration_days: int  # 첫 작업 시작일 ~ 마지막 작업 종료일 (일)
+    fits_window: bool  # 인원 제약 안에서 요청 기간에 맞췄는지 (False면 기간 초과)
+
+
+class ScheduleWindow(NamedTuple):
+    """명세서에서 읽은 일정 조건 (없는 값은 None)"""
+    start_date: Optional[date]
+    total_days: Optional[int]
+    team_size: Optional[int]
+
+
+def schedule_wbs(
+    wbs_structure: List[WBSTask],
+    start_date: date,
+    total_days: int,
+    team_size: int
+) -> Schedule:
+    """
+    작업 트리에 날짜를 결정적으로 배정 (forward pass + 인원 기반 자원 평준화)
+    
+    Args:
+        wbs_structure: 주요 단계 목록 (하위 작업 포함)
+        start_date: 프로젝트 시작일
+        total_days: 프로젝트 기간(일)
+        team_size: 동시에 진행할 수 있는 작업 수 (참여 인원)
+    
+    Returns:
+        날짜가 배정된 WBS와 전체 기간
+    
+    Note:
+        - 말단 작업의 duration_days는 상대 작업량(가중치)으로만 사용하고, 날짜는 모델 출력과 무관하게 계산합니다.
+        - 주요 단계는 순서대로 진행합니다 (이전 단계의 모든 작업이 끝난 뒤 시작).
+        - 같은 상위 작업의 말단 작업은 순서대로 진행하고(이전 형제 작업이 끝난 뒤 시작),
+          서로 다른 상위 작업의 하위 작업 묶음(하위 트리)만 독립적으로 보고 최대 team_size개까지 병행합니다.
+        - 전체 기간이 total_days에 맞도록 작업량 비율을 조정합니다 (압축/확장).
+          모든 작업을 1일로 줄여도 기간을 넘으면 인원 제약을 지키고 기간을 넘긴 일정을 반환합니다.
+        - 상위 작업의 날짜는 하위 작업 범위로 채웁니다.
+    """
+    if total_days < 1 or team_size < 1:
+        raise ValueError("일정 계산에는 1일 이상의 기간과 1명 이상의 인원이 필요합니다.")
+    
+    phases = _chains_by_phase(wbs_structure)
+    if not any(phases):
+        return Schedule(list(wbs_structure), 0, True)
+    
+    # 1. 작업량 비율을 조정하며 기간 안에 가장 길게 들어가는 배치 탐색
+    scale = 1.0
+    best: Optional[Tuple[List[int], List[int], int]] = None
+    for _ in range(_MAX_FIT_ITERATIONS):
+        starts, durations, makespan = _level(phases, team_size, scale)
+        if makespan <= total_days and (best is None or makespan > best[2]):
+            best = (starts, durations, makespan)
+        if makespan == total_days:
+            break
+        scale *= total_days / makespan
+    if best is None:
+        best = _level(phases, team_size, 0.0)
+    starts, durations, makespan = best
+    
+    # 2. 말단 작업 날짜 → 상위 작업 범위 순으로 트리 재구성
+    leaf_dates: Dict[int, Tuple[date, date, int]] = {}
+    leaves = [task for chains in phases for chain in chains for task in chain]
+    for task, offset, duration in zip(leaves, starts, durations):
+        task_start = start_date + timedelta(days=offset)
+        leaf_dates[id(task)] = (task_start, task_start + timedelta(days=duration - 1), duration)
+    
+    scheduled = [_apply_dates(task, leaf_dates) for task in wbs_structure]
+    return Schedule(scheduled, makespan, makespan <= total_days)
+
+
+def schedule_response(
+    response: WBSGenerateResponse,
+    start_date: date,
+    total_days: int,
+    team_size: int
+) -> WBSGenerateResponse:
+    """WBS 응답의 날짜를 schedule_wbs로 다시 계산 (이미 검증된 작업이므로 재검증 없이 구성)"""
+    schedule = schedule_wbs(response.wbs_structure, start_date, total_days, team_size)
+    return WBSGenerateResponse.model_construct(
+        project_name=response.project_name,
+        total_tasks=response.total_tasks,
+        total_duration_days=schedule.total_duration_days,
+        wbs_structure=schedule.wbs_structure
+    )
+
+
+def schedule_window_from_spec(markdown_spec: str) -> ScheduleWindow:
+    """
+    마크다운 명세서의 기간/팀 구성 항목에서 일정 조건 추출
+    
+    Note:
+        "- **기간**: 2024-01-01 ~ 2024-01-14 (14일)", "- **기간**: 30일",
+        "- **팀 구성**: 5명 (PM 1, 개발자 3, 디자이너 1)" 형식을 인식합니다.
+    """
+    start_date, total_days, team_size = None, None, None
+    
+    period = _SPEC_PERIOD_LINE.search(markdown_spec)
+    if period:
+        text = period.group(1)
+        date_range = _SPEC_DATE_RANGE.search(text)
+        days = re.search(r"(\d+)\s*일", text)
+        if date_range:
+            try:
+                start_date, end_date = (date.fromisoformat(value) for value in date_range.groups())
+                total_days = (end_date - start_date).days + 1 if end_date >= start_date else None
+            except ValueError:
+                start_date = None
+        if total_days is None and days:
+            total_days = int(days.group(1))
+    
+    team = _SPEC_TEAM_LINE.search(markdown_spec)
+    if team:
+        people = re.search(r"(\d+)\s*명", team.group(1))
+        if people:
+            team_size = int(people.group(1))
+    
+    return ScheduleWindow(start_date, total_days or None, team_size or None)
+
+
+def assignee_roles(wbs_structure: List[WBSTask]) -> Set[str]:
+    """모든 작업의 담당자 역할 (인원 정보가 없을 때 동시 진행 가능한 작업 수로 사용)"""
+    roles = set()
+    stack = list(wbs_structure)
+    while stack:
+        task = stack.pop()
+        roles.add(task.assignee)
+        stack.extend(task.subtasks or [])
+    return roles
+
+
+def _chains_by_phase(wbs_structure: List[WBSTask]) -> List[List[List[WBSTask]]]:
+    """
+    주요 단계별 순차 진행 묶음 (상위 작업마다 말단 하위 작업을 순서대로 묶음)
+    
+    Note:
+        묶음은 첫 말단 작업의 전위 순회 순서로 정렬되며, 하위 작업이 없는 단계는 단계 자신만 담은 묶음입니다.
+    """
+    phases = []
+    for phase in wbs_structure:
+        # 상위 작업별 말단 하위 작업 (삽입 순서 = 첫 말단 작업의 전위 순회 순서)
+        chains: Dict[int, List[WBSTask]] = {}
+        stack = [(phase, id(phase))]
+        while stack:
+            task, parent_key = stack.pop()
+            if task.subtasks:
+                stack.extend((child, id(task)) for child in reversed(task.subtasks))
+            else:
+                chains.setdefault(parent_key, []).append(task)
+        phases.append(list(chains.values()))
+    return phases
+
+
+def _level(phases: List[List[List[WBSTask]]], team_size: int, scale: float) -> Tuple[List[int], List[int], int]:
+    """
+    작업량 비율 scale로 기간을 정하고, 묶음 안은 순서대로, 묶음끼리는 인원 수만큼 병행 배치
+    
+    Returns:
+        (말단 작업별 시작 오프셋, 기간, 전체 기간) - 오프셋/기간은 단계 → 묶음 → 작업 순서
+    """
+    sizes = [len(chain) for chains in phases for chain in chains]
+    starts: List[int] = [0] * sum(sizes)
+    durations: List[int] = [0] * sum(sizes)
+    phase_start = 0
+    first_index = 0
+    for chains in phases:
+        if not chains:
+            continue
+        # 묶음별 첫 작업의 전체 순번, 다음 작업 위치
+        offsets = []
+        for chain in chains:
+            offsets.append(first_index)
+            first_index += len(chain)
+        # 가장 먼저 비는 인원에게 그때 시작할 수 있는 묶음 중 앞선 묶음의 다음 작업을 배정
+        # (시작할 수 있는 묶음이 없으면 가장 먼저 준비되는 묶음을 기다림)
+        ready_at = [phase_start] * len(chains)
+        positions = [0] * len(chains)
+        active = list(range(len(chains)))
+        free_at = [phase_start] * min(team_size, len(chains))
+        phase_end = phase_start
+        while active:
+            worker_free = heapq.heappop(free_at)
+            index = next(
+                (index for index in active if ready_at[index] <= worker_free),
+                min(active, key=lambda index: (ready_at[index], index))
+            )
+            task = chains[index][positions[index]]
+            duration = max(1, round(max(task.duration_days, 1) * scale))
+            task_start = max(worker_free, ready_at[index])
+            task_end = task_start + duration
+            heapq.heappush(free_at, task_end)
+            starts[offsets[index] + positions[index]] = task_start
+            durations[offsets[index] + positions[index]] = duration
+            phase_end = max(phase_end, task_end)
+            ready_at[index] = task_end
+            positions[index] += 1
+            if positions[index] == len(chains[index]):
+                active.remove(index)
+        phase_start = phase_end
+    return starts, durations, phase_start
+
+
+def _apply_dates(root: WBSTask, leaf_dates: Dict[int, Tuple[date, date, int]]) -> WBSTask:
+    """말단 날짜로 트리를 후위 순회하며 새 작업 생성 (상위 작업은 하위 작업의 범위)"""
+    built: Dict[int, WBSTask] = {}
+    stack: List[Tuple[WBSTask, bool]] = [(root, False)]
+    while stack:
+        task, children_done = stack.pop()
+        if task.subtasks and not children_done:
+            stack.append((task, True))
+            stack.extend((child, False) for child in task.subtasks)
+            continue
+        
+        if task.subtasks:
+            children = [built.pop(id(child)) for child in task.subtasks]
+            task_start = min(child.start_date for child in children)
+            task_end = max(child.end_date for child in children)
+            built[id(task)] = task.model_copy(update={
+                "start_date": task_start,
+                "end_date": task_end,
+                "duration_days": (task_end - task_start).days + 1,
+                "subtasks": children
+            })
+        else:
+            task_start, task_end, duration = leaf_dates[id(task)]
+            built[id(task)] = task.model_copy(update={
+                "start_date": task_start,
+                "end_date": task_end,
+                "duration_days": duration
+            })
+    return built[id(root)]
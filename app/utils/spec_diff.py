@@ -0,0 +1,140 @@
+import hashlib
+import re
+from typing import Dict, List, NamedTuple
+
+# ## / ### 제목 (# 제목은 머리말에 포함, #### 이하는 본문으로 취급)
+_HEADING = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+_FENCE = re.compile(r"^\s*(```|~~~)")
+
+PREAMBLE_KEY = "머리말"
+
+# 변경되면 전체 일정(기간, 팀 구성, 제약, 마일스톤)에 영향을 주는 ## 섹션 제목 키워드
+GLOBAL_SECTION_KEYWORDS = ("개요", "제약", "마일스톤", "일정")
+
+
+class SpecSection(NamedTuple):
+    """마크다운 명세서의 ## / ### 섹션"""
+    key: str  # 정규화된 제목 경로 (예: "핵심 기능 및 요구사항 > 회원 관리")
+    level: int  # 0: 머리말, 2: ##, 3: ###
+    text: str  # 제목 줄 포함 원문 (하위 ### 섹션 제외)
+    digest: str  # 공백 차이를 무시한 본문 해시
+    is_global: bool  # 머리말 또는 GLOBAL_SECTION_KEYWORDS 섹션(과 그 하위)
+
+
+class SpecDiff(NamedTuple):
+    """두 명세서의 섹션 단위 차이"""
+    added: List[SpecSection]
+    removed: List[SpecSection]  # 이전 명세서의 섹션
+    changed: List[SpecSection]  # 수정된 명세서의 섹션
+    unchanged: List[SpecSection]
+    
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+    
+    @property
+    def global_changed(self) -> bool:
+        """전체 일정에 영향을 주는 섹션이 바뀌었는지"""
+        return any(section.is_global for section in (*self.added, *self.removed, *self.changed))
+    
+    @property
+    def changed_keys(self) -> List[str]:
+        return [section.key for section in (*self.changed, *self.added, *self.removed)]
+
+
+def parse_sections(markdown_spec: str) -> List[SpecSection]:
+    """
+    마크다운 명세서를 ## / ### 제목 기준 섹션으로 분할
+    
+    Args:
+        markdown_spec: 마크다운 명세서
+    
+    Returns:
+        문서 순서의 섹션 목록 (첫 ## 앞의 내용은 머리말 섹션)
+    
+    Note:
+        코드 블록 안의 # 줄은 제목으로 취급하지 않고,
+        같은 제목 경로가 반복되면 " (2)"처럼 순번을 붙여 구분합니다.
+    """
+    sections: List[SpecSection] = []
+    seen: Dict[str, int] = {}
+    key, level, is_global = PREAMBLE_KEY, 0, True
+    parent_key, parent_global = "", False
+    lines: List[str] = []
+    in_fence = False
+    
+    def close() -> None:
+        if level == 0 and not "".join(lines).strip():
+            return
+        count = seen.get(key, 0) + 1
+        seen[key] = count
+        unique_key = key if count == 1 else f"{key} ({count})"
+        body = lines[1:] if level else lines
+        sections.append(SpecSection(unique_key, level, "\n".join(lines).strip("\n"), _digest(body), is_global))
+    
+    for line in markdown_spec.splitlines():
+        if _FENCE.match(line):
+            in_fence = not in_fence
+        match = None if in_fence else _HEADING.match(line)
+        heading_level = len(match.group(1)) if match else 0
+        if heading_level in (2, 3):
+            close()
+            title = normalize_title(match.group(2))
+            if heading_level == 2 or not parent_key:
+                parent_key = title
+                parent_global = any(keyword in title for keyword in GLOBAL_SECTION_KEYWORDS)
+                key, level, is_global = title, heading_level, parent_global
+            else:
+                key, level, is_global = f"{parent_key} > {title}", 3, parent_global
+            lines = [line]
+        else:
+            lines.append(line)
+    close()
+    return sections
+
+
+def diff_sections(old_sections: List[SpecSection], new_sections: List[SpecSection]) -> SpecDiff:
+    """
+    섹션 제목 경로 기준으로 두 명세서 비교
+    
+    Note:
+        제목만 바뀌고 본문이 같은 섹션(삭제 + 추가의 본문 해시가 같은 경우)은 변경 없음으로 취급합니다.
+    """
+    old_by_key = {section.key: section for section in old_sections}
+    new_keys = {section.key for section in new_sections}
+    
+    added, changed, unchanged = [], [], []
+    for section in new_sections:
+        previous = old_by_key.get(section.key)
+        if previous is None:
+            added.append(section)
+        elif previous.digest != section.digest:
+            changed.append(section)
+        else:
+            unchanged.append(section)
+    removed = [section for section in old_sections if section.key not in new_keys]
+    
+    # 제목만 바뀐 섹션 (본문이 빈 섹션은 비교하지 않음)
+    removed_digests = {section.digest: section for section in removed if section.digest != _EMPTY_DIGEST}
+    for section in list(added):
+        previous = removed_digests.pop(section.digest, None)
+        if previous is not None and previous.is_global == section.is_global:
+            added.remove(section)
+            removed.remove(previous)
+            unchanged.append(section)
+    
+    return SpecDiff(added, removed, changed, unchanged)
+
+
+def normalize_title(title: str) -> str:
+    """제목의 이모지/기호/굵게 표시를 제거하고 공백 정리"""
+    return " ".join(re.sub(r"[^\w\s]", " ", title).split())
+
+
+def _digest(lines: List[str]) -> str:
+    """줄 끝 공백과 빈 줄 차이를 무시한 본문 해시"""
+    normalized = "\n".join(line.rstrip() for line in lines if line.strip())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+_EMPTY_DIGEST = _digest([])
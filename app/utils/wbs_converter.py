@@ -1,7 +1,73 @@
-from typing import List, Dict, Any
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 from app.models.response import WBSTask
 
 
+class FlatTaskRow(NamedTuple):
+    """Flat 작업 한 행 (flatten_wbs_for_spring 딕셔너리와 같은 필드/순서)"""
+    task_id: str  # UI 표시용 (1.0, 1.1, 1.2...)
+    parent_task_id: Optional[str]  # 부모의 task_id (1.1의 부모는 1.0)
+    name: str
+    assignee: str
+    start_date: str
+    end_date: str
+    duration_days: int
+    progress: int  # 항상 0
+    status: str  # 항상 "할일"
+
+
+FLAT_TASK_FIELDS = FlatTaskRow._fields
+
+
+def iter_flat_tasks(wbs_structure: Iterable[WBSTask]) -> Iterator[FlatTaskRow]:
+    """
+    계층 구조의 WBS를 전위 순회하며 Flat 행을 하나씩 생성
+    
+    Args:
+        wbs_structure: 계층 구조의 WBS 작업 리스트
+        
+    Yields:
+        부모가 항상 자식보다 먼저 나오는 순서의 FlatTaskRow
+        
+    Note:
+        - 재귀 대신 명시적 스택을 사용하므로 계층 깊이에 제한이 없습니다.
+        - 제너레이터이므로 전체 결과를 메모리에 쌓지 않고 바로 스트리밍할 수 있습니다.
+        - 같은 날짜 문자열은 한 번만 변환합니다 (대부분의 작업이 날짜를 공유).
+    """
+    # NamedTuple 생성자(파이썬 레벨 __new__)를 거치지 않고 튜플을 바로 생성
+    new_row = tuple.__new__
+    iso_dates: Dict[date, str] = {}
+    stack: List[Tuple[WBSTask, Optional[str]]] = [(task, None) for task in reversed(list(wbs_structure))]
+    
+    while stack:
+        task, parent_task_id = stack.pop()
+        start_date = iso_dates.get(task.start_date)
+        if start_date is None:
+            start_date = iso_dates[task.start_date] = task.start_date.isoformat()
+        end_date = iso_dates.get(task.end_date)
+        if end_date is None:
+            end_date = iso_dates[task.end_date] = task.end_date.isoformat()
+        
+        yield new_row(FlatTaskRow, (
+            task.task_id,
+            parent_task_id,
+            task.name,
+            task.assignee,
+            start_date,
+            end_date,
+            task.duration_days,
+            task.progress,
+            task.status.value
+        ))
+        
+        # 하위 작업은 역순으로 쌓아 원래 순서대로 꺼냄
+        subtasks = task.subtasks
+        if subtasks:
+            task_id = task.task_id
+            for child in reversed(subtasks):
+                stack.append((child, task_id))
+
+
 def flatten_wbs_for_spring(wbs_structure: List[WBSTask]) -> List[Dict[str, Any]]:
     """
     계층 구조의 WBS를 flat 구조로 변환 (스프링 서버 DB 저장용)
@@ -16,32 +82,28 @@ def flatten_wbs_for_spring(wbs_structure: List[WBSTask]) -> List[Dict[str, Any]]
         - task_id는 계층 구조 표시용 (UI에서 사용)
         - parent_task_id는 부모 작업의 task_id (스프링에서 매핑 필요)
         - 스프링에서 저장 순서대로 저장하면 parent_id를 올바르게 설정 가능
+        - 계층 깊이 제한 없음 (iter_flat_tasks 사용)
     """
-    flat_tasks = []
-    
-    def flatten_recursive(tasks: List[WBSTask], parent_task_id: str = None):
-        """재귀적으로 작업을 flat하게 만듦"""
-        for task in tasks:
-            # 현재 작업 추가
-            flat_task = {
-                "task_id": task.task_id,  # UI 표시용 (1.0, 1.1, 1.2...)
-                "parent_task_id": parent_task_id,  # 부모의 task_id (1.1의 부모는 1.0)
-                "name": task.name,
-                "assignee": task.assignee,
-                "start_date": task.start_date.isoformat(),
-                "end_date": task.end_date.isoformat(),
-                "duration_days": task.duration_days,
-                "progress": task.progress,  # 항상 0
-                "status": task.status.value  # 항상 "할일"
-            }
-            flat_tasks.append(flat_task)
-            
-            # 하위 작업 재귀 처리
-            if task.subtasks:
-                flatten_recursive(task.subtasks, task.task_id)
-    
-    flatten_recursive(wbs_structure)
-    return flat_tasks
+    return flat_task_dicts(iter_flat_tasks(wbs_structure))
+
+
+def flat_task_dicts(rows: Iterable[FlatTaskRow]) -> List[Dict[str, Any]]:
+    """FlatTaskRow를 flatten_wbs_for_spring 형식의 딕셔너리로 변환"""
+    return [
+        {
+            "task_id": task_id,
+            "parent_task_id": parent_task_id,
+            "name": name,
+            "assignee": assignee,
+            "start_date": start_date,
+            "end_date": end_date,
+            "duration_days": duration_days,
+            "progress": progress,
+            "status": status
+        }
+        for task_id, parent_task_id, name, assignee, start_date, end_date, duration_days, progress, status
+        in rows
+    ]
 
 
 # 사용 예시
@@ -0,0 +1,355 @@
+import json
+import re
+from collections import Counter
+from datetime import date, timedelta
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+from app.models.response import TaskStatus
+
+# 응답을 그대로 쓰면 요청이 실패했을 문제 (로컬 수정 = 재생성 1회 절약)
+FATAL_ISSUES = frozenset({
+    "truncated", "syntax", "dropped_task", "missing_field", "invalid_value", "duplicate_task_id"
+})
+
+_CODE_FENCE_START = re.compile(r"^```(?:json)?\s*\n", re.MULTILINE)
+_CODE_FENCE_END = re.compile(r"\n```\s*$", re.MULTILINE)
+_STATUS_VALUES = {status.value for status in TaskStatus}
+
+
+class WBSRepairError(ValueError):
+    """로컬에서 복구할 수 없는 WBS 응답 (재생성 필요)"""
+
+
+class RepairReport(NamedTuple):
+    """WBS 응답 검증/수정 결과"""
+    data: Dict[str, Any]  # WBSGenerateResponse로 바로 검증 가능한 딕셔너리
+    issues: Dict[str, int]  # 수정한 문제 종류별 횟수 (비어 있으면 수정 없음)
+    
+    @property
+    def repaired(self) -> bool:
+        return bool(self.issues)
+    
+    @property
+    def retry_avoided(self) -> bool:
+        """수정하지 않았다면 요청이 실패했을 응답인지"""
+        return any(issue in FATAL_ISSUES for issue in self.issues)
+    
+    @property
+    def parsed_cleanly(self) -> bool:
+        """원문이 JSON으로 바로 파싱되었는지"""
+        return "truncated" not in self.issues and "syntax" not in self.issues
+
+
+def repair_wbs(text: str, allow_truncated: bool = True, min_phases: int = 1) -> RepairReport:
+    """
+    Gemini WBS 응답을 파싱하고 트리 불변식을 검사해 결정적으로 수정
+    
+    Args:
+        text: Gemini 응답 원문 (코드 블록/앞뒤 설명 포함 가능)
+        allow_truncated: False면 잘린 응답은 복구하지 않고 실패 처리
+        min_phases: 잘린 응답에서 살려야 하는 최소 주요 단계 수 (미만이면 실패)
+    
+    Returns:
+        수정된 WBS 딕셔너리와 수정 내역
+    
+    Raises:
+        WBSRepairError: JSON을 복구할 수 없거나, 살릴 작업이 없는 경우
+    
+    Note:
+        - 잘린 JSON은 마지막으로 완성된 객체/배열까지 남기고 닫아 완성된 작업만 살립니다.
+        - 필수 필드나 날짜가 없는 작업은 하위 작업과 함께 제외합니다.
+        - parent_id는 실제 부모의 task_id, duration_days는 시작일~종료일 일수로 맞추고,
+          상위 작업 기간은 하위 작업을 모두 포함하도록 넓힙니다.
+        - total_tasks / total_duration_days는 수정된 트리에서 다시 계산합니다.
+    """
+    issues: Counter = Counter()
+    data = parse_wbs_json(text, issues)
+    if "truncated" in issues and not allow_truncated:
+        raise WBSRepairError("WBS 응답이 중간에 잘렸습니다.")
+    
+    if not isinstance(data, dict) or not isinstance(data.get("wbs_structure"), list):
+        raise WBSRepairError("WBS 응답에 wbs_structure 배열이 없습니다.")
+    project_name = data.get("project_name")
+    if not isinstance(project_name, str) or not project_name.strip():
+        raise WBSRepairError("WBS 응답에 project_name이 없습니다.")
+    
+    repairer = WBSTreeRepairer(issues)
+    phases = [
+        phase for phase in (repairer.repair_phase(item) for item in data["wbs_structure"])
+        if phase is not None
+    ]
+    if (not phases and data["wbs_structure"]) or ("truncated" in issues and len(phases) < min_phases):
+        raise WBSRepairError(f"WBS 응답에서 살릴 수 있는 주요 단계가 부족합니다. ({len(phases)}개)")
+    
+    total_tasks = repairer.task_count
+    if data.get("total_tasks") != total_tasks:
+        issues["total_tasks"] += 1
+    total_duration_days = 0
+    if phases:
+        start = min(date.fromisoformat(phase["start_date"]) for phase in phases)
+        end = max(date.fromisoformat(phase["end_date"]) for phase in phases)
+        total_duration_days = (end - start).days + 1
+    if data.get("total_duration_days") != total_duration_days:
+        issues["total_duration_days"] += 1
+    
+    return RepairReport(
+        {
+            "project_name": project_name,
+            "total_tasks": total_tasks,
+            "total_duration_days": total_duration_days,
+            "wbs_structure": phases
+        },
+        dict(issues)
+    )
+
+
+def parse_wbs_json(text: str, issues: Counter) -> Any:
+    """
+    응답 원문에서 루트 JSON 값 파싱 (코드 블록/뒤따르는 설명 무시, 잘린 JSON은 닫아서 파싱)
+    
+    Raises:
+        WBSRepairError: 복구해도 JSON으로 파싱할 수 없는 경우
+    """
+    text = _CODE_FENCE_END.sub("", _CODE_FENCE_START.sub("", text)).strip()
+    start = text.find("{")
+    if start < 0:
+        raise WBSRepairError(f"WBS 응답에 JSON 객체가 없습니다. 응답: {text[:200]}")
+    
+    try:
+        value, _ = json.JSONDecoder().raw_decode(text, start)
+        return value
+    except json.JSONDecodeError:
+        pass
+    
+    closed, truncated = close_truncated_json(text[start:])
+    try:
+        value = json.loads(closed)
+    except json.JSONDecodeError as e:
+        raise WBSRepairError(f"WBS JSON 파싱 실패: {str(e)}\n응답: {text[:500]}")
+    issues["truncated" if truncated else "syntax"] += 1
+    return value
+
+
+def close_truncated_json(text: str) -> Tuple[str, bool]:
+    """
+    잘린 JSON을 마지막으로 완성된 값까지 자르고 열린 괄호를 닫음 (배열/객체 끝의 쉼표도 제거)
+    
+    Returns:
+        (수정된 JSON 문자열, 잘린 응답이었는지)
+    """
+    out: List[str] = []
+    stack: List[str] = []
+    in_string = False
+    escape = False
+    # 잘라도 올바른 JSON이 되는 지점 (출력 길이, 그때 열려 있던 괄호)
+    checkpoint: Optional[Tuple[int, str]] = None
+    
+    for char in text:
+        if in_string:
+            out.append(char)
+            if escape:
+                escape = False
+            elif char == "\\":
+                escape = True
+            elif char == '"':
+                in_string = False
+            continue
+        
+        if char == '"':
+            in_string = True
+        elif char in "{[":
+            stack.append("}" if char == "{" else "]")
+            out.append(char)
+            checkpoint = (len(out), "".join(stack))
+            continue
+        elif char in "}]":
+            if not stack:
+                break
+            _drop_trailing_comma(out)
+            stack.pop()
+            out.append(char)
+            checkpoint = (len(out), "".join(stack))
+            if not stack:
+                return "".join(out), False
+            continue
+        out.append(char)
+    
+    if checkpoint is None:
+        return "".join(out), False
+    length, open_stack = checkpoint
+    out = out[:length]
+    _drop_trailing_comma(out)
+    return "".join(out) + open_stack[::-1], True
+
+
+class WBSTreeRepairer:
+    """
+    주요 단계 단위 작업 트리 검사/수정 (스트리밍으로 단계가 하나씩 도착해도 사용 가능)
+    
+    task_id 중복 검사를 위해 지금까지 본 task_id와 작업 수를 유지합니다.
+    """
+    
+    def __init__(self, issues: Optional[Counter] = None):
+        self.issues: Counter = issues if issues is not None else Counter()
+        self.task_count = 0
+        self._seen_ids: Set[str] = set()
+    
+    def repair_phase(self, phase: Any) -> Optional[Dict[str, Any]]:
+        """주요 단계 하나(하위 작업 포함) 수정, 살릴 수 없으면 None"""
+        if not isinstance(phase, dict):
+            self.issues["dropped_task"] += 1
+            return None
+        task_id = self._unique_id(_task_id(phase), lambda n: f"{n}.0")
+        if task_id is None:
+            self.issues["dropped_task"] += 1
+            return None
+        return self._repair(phase, task_id, None, None)
+    
+    def _repair(
+        self,
+        task: Dict[str, Any],
+        task_id: str,
+        parent_id: Optional[str],
+        parent_assignee: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        """작업 하나 수정 (task_id는 호출자가 중복 없이 확정)"""
+        name = task.get("name")
+        if not isinstance(name, str) or not name.strip():
+            self.issues["dropped_task"] += 1
+            return None
+        assignee = task.get("assignee")
+        if not isinstance(assignee, str) or not assignee.strip():
+            self.issues["missing_field"] += 1
+            assignee = parent_assignee or "미정"
+        
+        # 1. 하위 작업 (task_id 중복 제거 후 재귀)
+        raw_children = task.get("subtasks")
+        if raw_children is None:
+            raw_children = []
+        elif not isinstance(raw_children, list):
+            self.issues["invalid_value"] += 1
+            raw_children = []
+        # 주요 단계 "1.0"의 하위는 "1.1", 그 외 "1.1"의 하위는 "1.1.1"
+        prefix = task_id[:-2] if parent_id is None and task_id.endswith(".0") else task_id
+        children = []
+        for child in raw_children:
+            if not isinstance(child, dict):
+                self.issues["dropped_task"] += 1
+                continue
+            child_id = self._unique_id(_task_id(child), lambda n: f"{prefix}.{n}")
+            if child_id is None:
+                self.issues["dropped_task"] += 1
+                continue
+            repaired = self._repair(child, child_id, task_id, assignee)
+            if repaired is not None:
+                children.append(repaired)
+        
+        # 2. 날짜/기간
+        start, end = _parse_date(task.get("start_date")), _parse_date(task.get("end_date"))
+        duration = task.get("duration_days")
+        duration = duration if isinstance(duration, int) and not isinstance(duration, bool) and duration > 0 else None
+        if children:
+            children_start = min(date.fromisoformat(child["start_date"]) for child in children)
+            children_end = max(date.fromisoformat(child["end_date"]) for child in children)
+            if start is None or end is None or start > children_start or end < children_end:
+                self.issues["parent_range"] += 1
+                start = min(start, children_start) if start else children_start
+                end = max(end, children_end) if end else children_end
+        else:
+            if start is None and end is None:
+                self.issues["dropped_task"] += 1
+                return None
+            if start is None or end is None:
+                if duration is None:
+                    self.issues["dropped_task"] += 1
+                    return None
+                self.issues["missing_field"] += 1
+                start = start or end - timedelta(days=duration - 1)
+                end = end or start + timedelta(days=duration - 1)
+            if end < start:
+                self.issues["date_order"] += 1
+                end = start + timedelta(days=(duration or 1) - 1)
+        expected_duration = (end - start).days + 1
+        if duration != expected_duration:
+            self.issues["duration"] += 1
+        
+        # 3. 계층/상태 필드
+        if task.get("parent_id") != parent_id:
+            self.issues["parent_id"] += 1
+        progress = task.get("progress", 0)
+        if not isinstance(progress, int) or isinstance(progress, bool) or not 0 <= progress <= 100:
+            self.issues["invalid_value"] += 1
+            progress = 0
+        status = task.get("status", TaskStatus.TODO.value)
+        if status not in _STATUS_VALUES:
+            self.issues["invalid_value"] += 1
+            status = TaskStatus.TODO.value
+        
+        self.task_count += 1
+        return {
+            "task_id": task_id,
+            "parent_id": parent_id,
+            "name": name,
+            "assignee": assignee,
+            "start_date": start.isoformat(),
+            "end_date": end.isoformat(),
+            "duration_days": expected_duration,
+            "progress": progress,
+            "status": status,
+            "subtasks": children
+        }
+    
+    def _unique_id(self, task_id: Optional[str], make_id) -> Optional[str]:
+        """
+        중복 없는 task_id 확정 (없으면 None, 중복이면 같은 부모 아래 다음 번호)
+        
+        Args:
+            task_id: 응답의 task_id
+            make_id: 번호 → task_id 생성 함수
+        """
+        if task_id is None:
+            return None
+        if task_id in self._seen_ids:
+            self.issues["duplicate_task_id"] += 1
+            number = task_number(task_id) + 1
+            while make_id(number) in self._seen_ids:
+                number += 1
+            task_id = make_id(number)
+        self._seen_ids.add(task_id)
+        return task_id
+
+
+def _task_id(task: Dict[str, Any]) -> Optional[str]:
+    """task_id를 문자열로 (숫자면 변환, 없으면 None)"""
+    task_id = task.get("task_id")
+    if isinstance(task_id, (int, float)) and not isinstance(task_id, bool):
+        return str(task_id)
+    if isinstance(task_id, str) and task_id.strip():
+        return task_id.strip()
+    return None
+
+
+def _parse_date(value: Any) -> Optional[date]:
+    """YYYY-MM-DD (뒤에 시간이 붙어도 허용) → date, 해석할 수 없으면 None"""
+    if not isinstance(value, str):
+        return None
+    try:
+        return date.fromisoformat(value.strip()[:10])
+    except ValueError:
+        return None
+
+
+def task_number(task_id: str, first: bool = False) -> int:
+    """task_id의 마지막(first면 첫) 번호 (숫자가 아니면 0)"""
+    parts = task_id.split(".")
+    try:
+        return int(parts[0] if first else parts[-1])
+    except ValueError:
+        return 0
+
+
+def _drop_trailing_comma(out: List[str]) -> None:
+    """출력 끝의 공백과 쉼표 하나 제거 (닫는 괄호 앞에 남은 쉼표)"""
+    while out and out[-1] in " \t\r\n":
+        out.pop()
+    if out and out[-1] == ",":
+        out.pop()
@@ -0,0 +1,98 @@
+import json
+from typing import List, Dict, Any, Optional
+
+
+class WBSStreamParser:
+    """
+    스트리밍으로 도착하는 Gemini WBS JSON을 점진적으로 파싱
+    
+    전체 응답을 기다리지 않고, `wbs_structure` 배열의 최상위 작업 객체가
+    닫히는 즉시(하위 작업 포함) 딕셔너리로 반환합니다.
+    
+    Note:
+        - 루트 객체 앞뒤의 마크다운 코드 블록(```json)이나 설명 문장은 무시
+        - 문자열 내부의 괄호/이스케이프는 구조로 취급하지 않음
+        - 전체 텍스트는 `text`로 접근 가능 (최종 검증용)
+    """
+    
+    TARGET_KEY = "wbs_structure"
+    
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start: Optional[int] = None
+        self._last_key: Optional[str] = None
+        self._array_depth: Optional[int] = None
+        self._element_start: Optional[int] = None
+        self._root_closed = False
+    
+    @property
+    def text(self) -> str:
+        """지금까지 수신한 전체 텍스트"""
+        return self._buffer
+    
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """
+        텍스트 조각을 추가하고 새로 완성된 최상위 작업 반환
+        
+        Args:
+            chunk: 스트리밍 응답 조각
+            
+        Returns:
+            이번 조각으로 완성된 wbs_structure 작업 리스트 (순서 유지)
+        """
+        self._buffer += chunk
+        completed = []
+        buffer = self._buffer
+        
+        for i in range(self._pos, len(buffer)):
+            if self._root_closed:
+                break
+            char = buffer[i]
+            
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    # 루트 객체의 키 후보 기록 (값 문자열이어도 다음 키에서 덮어씀)
+                    if self._depth == 1:
+                        self._last_key = buffer[self._string_start + 1:i]
+                continue
+            
+            if char == '"':
+                if self._depth > 0:
+                    self._in_string = True
+                    self._string_start = i
+            elif char in "{[":
+                if (
+                    char == "["
+                    and self._depth == 1
+                    and self._array_depth is None
+                    and self._last_key == self.TARGET_KEY
+                ):
+                    self._array_depth = self._depth + 1
+                elif char == "{" and self._array_depth is not None and self._depth == self._array_depth:
+                    self._element_start = i
+                self._depth += 1
+            elif char in "}]" and self._depth > 0:
+                self._depth -= 1
+                if (
+                    char == "}"
+                    and self._element_start is not None
+                    and self._depth == self._array_depth
+                ):
+                    completed.append(json.loads(buffer[self._element_start:i + 1]))
+                    self._element_start = None
+                elif char == "]" and self._array_depth is not None and self._depth == self._array_depth - 1:
+                    self._array_depth = -1  # 배열 종료 (이후 재진입 방지)
+                if self._depth == 0:
+                    self._root_closed = True
+        
+        self._pos = len(buffer)
+        return completed
@@ -0,0 +1,72 @@
+import asyncio
+import ipaddress
+import socket
+from typing import Iterable, Set
+from urllib.parse import urlsplit
+
+
+def allowed_hosts_from_setting(value: str) -> Set[str]:
+    """쉼표 구분 허용 호스트 설정값을 소문자 집합으로 변환"""
+    return {host.strip().lower() for host in value.split(",") if host.strip()}
+
+
+def check_webhook_url(url: str, allowed_hosts: Iterable[str] = ()) -> None:
+    """
+    서버가 POST할 webhook URL 검사 (SSRF 방지)
+    
+    Args:
+        url: http/https URL
+        allowed_hosts: 허용 호스트 목록 (비어 있지 않으면 이 호스트만 허용, 내부 주소도 허용)
+    
+    Raises:
+        ValueError: 허용 목록에 없거나, 허용 목록이 없을 때 localhost/사설/루프백/링크 로컬 등 공인이 아닌 IP인 경우
+    
+    Note:
+        도메인 이름이 내부 주소로 해석되는지는 전송 직전 resolve_public_host로 다시 확인합니다.
+    """
+    host = (urlsplit(url).hostname or "").lower()
+    if not host:
+        raise ValueError("webhook URL에 호스트가 없습니다.")
+    allowed = {allowed_host.lower() for allowed_host in allowed_hosts}
+    if allowed:
+        if host not in allowed:
+            raise ValueError(f"허용되지 않은 webhook 호스트입니다: {host}")
+        return
+    if host == "localhost" or host.endswith((".localhost", ".local", ".internal")):
+        raise ValueError(f"내부 주소로는 webhook을 보낼 수 없습니다: {host}")
+    try:
+        address = ipaddress.ip_address(host.strip("[]"))
+    except ValueError:
+        return
+    if not _is_public(address):
+        raise ValueError(f"내부 주소로는 webhook을 보낼 수 없습니다: {host}")
+
+
+async def resolve_public_host(url: str, allowed_hosts: Iterable[str] = ()) -> None:
+    """
+    webhook 호스트의 DNS 해석 결과가 모두 공인 주소인지 확인 (허용 목록 호스트는 확인하지 않음)
+    
+    Raises:
+        ValueError: 내부 주소로 해석되거나 해석할 수 없는 경우
+    """
+    check_webhook_url(url, allowed_hosts)
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    if host in {allowed_host.lower() for allowed_host in allowed_hosts}:
+        return
+    try:
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            host, parts.port or (443 if parts.scheme == "https" else 80), type=socket.SOCK_STREAM
+        )
+    except OSError as e:
+        raise ValueError(f"webhook 호스트를 해석할 수 없습니다: {host} ({str(e)})")
+    for info in infos:
+        if not _is_public(ipaddress.ip_address(info[4][0].split("%")[0])):
+            raise ValueError(f"webhook 호스트가 내부 주소로 해석됩니다: {host}")
+
+
+def _is_public(address: ipaddress._BaseAddress) -> bool:
+    """공인 주소 여부 (IPv4 매핑 IPv6 주소는 IPv4 기준)"""
+    if isinstance(address, ipaddress.IPv6Address) and address.ipv4_mapped is not None:
+        address = address.ipv4_mapped
+    return address.is_global and not address.is_multicast
@@ -0,0 +1,120 @@
+"""
+Gemini 클라이언트 재사용 오버헤드 벤치마크
+
+요청마다 genai.Client를 새로 만들고 첫 호출 후 닫는 방식(기존 구조)과
+lifespan에서 만든 keep-alive 풀 클라이언트 하나를 재사용하는 방식(create_gemini_client)의
+요청당 시간(클라이언트 생성 + 호출)을 로컬 가짜 generateContent 서버로 비교합니다.
+
+가짜 서버는 평문 HTTP이므로 클라이언트 생성 + TCP 연결 비용만 측정됩니다.
+실제 Gemini 엔드포인트에서는 새 클라이언트마다 TLS 핸드셰이크(수십 ms)가 더해집니다.
+
+사용법:
+    python scripts/bench_client_pool.py
+    python scripts/bench_client_pool.py --requests 500 --port 8765
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from typing import Awaitable, Callable, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.environ.setdefault("GEMINI_API_KEY", "bench")
+
+import httpx
+import uvicorn
+from google import genai
+from google.genai import types
+
+from app.core.config import settings
+
+RESPONSE_BODY = json.dumps({
+    "candidates": [{"content": {"role": "model", "parts": [{"text": "ok"}]}}],
+    "usageMetadata": {"promptTokenCount": 1, "candidatesTokenCount": 1, "totalTokenCount": 2}
+}).encode()
+
+
+async def fake_generate_content(scope, receive, send) -> None:
+    """모든 요청에 고정 generateContent 응답 (지연 없음)"""
+    if scope["type"] != "http":
+        return
+    while (await receive()).get("more_body"):
+        pass
+    await send({
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [(b"content-type", b"application/json")]
+    })
+    await send({"type": "http.response.body", "body": RESPONSE_BODY})
+
+
+def start_server(port: int) -> uvicorn.Server:
+    server = uvicorn.Server(uvicorn.Config(fake_generate_content, port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return server
+
+
+def pooled_client(base_url: str) -> genai.Client:
+    """create_gemini_client와 같은 커넥션 풀 설정 (base_url만 가짜 서버로)"""
+    limits = httpx.Limits(
+        max_connections=settings.GEMINI_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.GEMINI_HTTP_MAX_KEEPALIVE,
+        keepalive_expiry=settings.GEMINI_HTTP_KEEPALIVE_EXPIRY
+    )
+    return genai.Client(api_key="bench", http_options=types.HttpOptions(
+        base_url=base_url,
+        client_args={"transport": httpx.HTTPTransport(limits=limits)},
+        async_client_args={"transport": httpx.AsyncHTTPTransport(limits=limits)}
+    ))
+
+
+async def measure(call: Callable[[], Awaitable[None]], requests: int) -> List[float]:
+    """요청 requests회의 소요 시간(ms) 목록"""
+    timings = []
+    for _ in range(requests):
+        started_at = time.perf_counter()
+        await call()
+        timings.append((time.perf_counter() - started_at) * 1000)
+    return timings
+
+
+async def main(requests: int, port: int) -> None:
+    base_url = f"http://127.0.0.1:{port}"
+    server = start_server(port)
+
+    async def fresh() -> None:
+        client = genai.Client(api_key="bench", http_options=types.HttpOptions(base_url=base_url))
+        await client.aio.models.generate_content(model=settings.GEMINI_MODEL, contents="ping")
+        await client.aio.aclose()
+        client.close()
+
+    shared = pooled_client(base_url)
+
+    async def pooled() -> None:
+        await shared.aio.models.generate_content(model=settings.GEMINI_MODEL, contents="ping")
+
+    await pooled()
+    await fresh()
+    print(f"{'client':>8}{'p50 ms':>10}{'p95 ms':>10}{'mean ms':>10}")
+    for name, call in (("fresh", fresh), ("pooled", pooled)):
+        timings = await measure(call, requests)
+        p95 = statistics.quantiles(timings, n=20)[-1]
+        print(f"{name:>8}{statistics.median(timings):>10.2f}{p95:>10.2f}{statistics.mean(timings):>10.2f}")
+
+    await shared.aio.aclose()
+    shared.close()
+    server.should_exit = True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gemini 클라이언트 재사용 벤치마크")
+    parser.add_argument("--requests", type=int, default=200, help="방식별 요청 수")
+    parser.add_argument("--port", type=int, default=8765, help="가짜 generateContent 서버 포트")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.port))
@@ -0,0 +1,123 @@
+"""
+응답 압축 벤치마크
+
+엔드포인트별 대표 응답 본문을 gzip/brotli 수준별로 압축해
+압축률(절감 바이트)과 압축 CPU 시간을 비교합니다.
+NDJSON 스트림은 CompressionMiddleware와 같이 행마다 flush한 경우를 측정합니다.
+
+사용법:
+    python scripts/bench_compression.py
+    python scripts/bench_compression.py --sizes 50,500,5000 --repeat 20
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import zlib
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.environ.setdefault("GEMINI_API_KEY", "bench")
+
+from bench_serialization import build_response
+from app.api.responses import PydanticJSONResponse
+from app.models.markdown import MarkdownSpecResponse
+from app.services.fake_gemini import _fake_markdown_spec
+from app.utils.flat_encoding import FlatEncoding, encode_flat_body
+from app.utils.wbs_converter import iter_flat_tasks
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+Compressor = Callable[[List[bytes]], bytes]
+
+
+def gzip_codec(level: int) -> Compressor:
+    def compress(chunks: List[bytes]) -> bytes:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+        if len(chunks) == 1:
+            return compressor.compress(chunks[0]) + compressor.flush()
+        return b"".join(
+            compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH) for chunk in chunks
+        ) + compressor.flush()
+    return compress
+
+
+def brotli_codec(quality: int) -> Compressor:
+    def compress(chunks: List[bytes]) -> bytes:
+        compressor = brotli.Compressor(quality=quality)
+        if len(chunks) == 1:
+            return compressor.process(chunks[0]) + compressor.finish()
+        return b"".join(compressor.process(chunk) + compressor.flush() for chunk in chunks) + compressor.finish()
+    return compress
+
+
+def build_payloads(sizes: List[int]) -> Dict[str, List[bytes]]:
+    """엔드포인트별 응답 본문 (스트림은 행 단위 조각 목록)"""
+    payloads: Dict[str, List[bytes]] = {}
+    for size in sizes:
+        response = build_response(size)
+        rows = list(iter_flat_tasks(response.wbs_structure))
+        summary = {
+            "project_name": response.project_name,
+            "total_tasks": response.total_tasks,
+            "total_duration_days": response.total_duration_days
+        }
+        payloads[f"/generate ({size})"] = [PydanticJSONResponse(response).body]
+        payloads[f"/flat json ({size})"] = [
+            PydanticJSONResponse(encode_flat_body(summary, rows, FlatEncoding.JSON)).body
+        ]
+        payloads[f"/flat columnar ({size})"] = [
+            PydanticJSONResponse(encode_flat_body(summary, rows, FlatEncoding.COLUMNAR_JSON)).body
+        ]
+        payloads[f"/flat/stream ({size})"] = [
+            (json.dumps({"type": "task", "data": task}, ensure_ascii=False) + "\n").encode("utf-8")
+            for task in encode_flat_body(summary, rows, FlatEncoding.JSON)["tasks"]
+        ]
+
+    features = ", ".join(f"기능 {index}" for index in range(1, 31))
+    markdown = _fake_markdown_spec(f"- 프로젝트명: 벤치마크\n- 주요 기능: {features}\n")
+    payloads["/generate-spec"] = [
+        PydanticJSONResponse(MarkdownSpecResponse(project_name="벤치마크", markdown_spec=markdown)).body
+    ]
+    return payloads
+
+
+def measure(compress: Compressor, chunks: List[bytes], repeat: int) -> Tuple[int, float]:
+    """(압축 크기, 최소 압축 시간 ms)"""
+    best = float("inf")
+    size = 0
+    for _ in range(repeat):
+        started_at = time.process_time()
+        size = len(compress(chunks))
+        best = min(best, time.process_time() - started_at)
+    return size, best * 1000
+
+
+def main(sizes: List[int], repeat: int) -> None:
+    codecs: Dict[str, Compressor] = {f"gzip-{level}": gzip_codec(level) for level in (1, 5, 6, 9)}
+    if brotli is not None:
+        codecs.update({f"br-{quality}": brotli_codec(quality) for quality in (1, 4, 5, 11)})
+
+    print(f"{'endpoint':<24}{'codec':<9}{'bytes':>10}{'saved':>10}{'ratio':>8}{'cpu ms':>9}{'MB/s':>8}")
+    for endpoint, chunks in build_payloads(sizes).items():
+        original = sum(len(chunk) for chunk in chunks)
+        print(f"{endpoint:<24}{'identity':<9}{original:>10}")
+        for name, compress in codecs.items():
+            size, cpu_ms = measure(compress, chunks, repeat)
+            throughput = original / 1024 / 1024 / (cpu_ms / 1000) if cpu_ms else float("inf")
+            print(
+                f"{'':<24}{name:<9}{size:>10}{original - size:>10}"
+                f"{size / original:>8.3f}{cpu_ms:>9.2f}{throughput:>8.0f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="응답 압축 벤치마크")
+    parser.add_argument("--sizes", default="50,500,5000", help="작업 수 (쉼표 구분)")
+    parser.add_argument("--repeat", type=int, default=10, help="반복 횟수 (최솟값 보고)")
+    args = parser.parse_args()
+    main([int(s) for s in args.sizes.split(",")], args.repeat)
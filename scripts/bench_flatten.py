@@ -0,0 +1,132 @@
+"""
+WBS Flat 변환 벤치마크
+
+기존 재귀 구현과 명시적 스택 기반 iter_flat_tasks / flatten_wbs_for_spring을
+노드 100,000개 트리(넓은 트리, 깊은 체인)에서 비교합니다.
+
+사용법:
+    python scripts/bench_flatten.py
+    python scripts/bench_flatten.py --nodes 100000 --repeat 5
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.environ.setdefault("GEMINI_API_KEY", "bench")
+
+from app.models.response import TaskStatus, WBSTask
+from app.utils.wbs_converter import flatten_wbs_for_spring, iter_flat_tasks
+
+
+def recursive_flatten(wbs_structure: List[WBSTask]) -> List[Dict[str, Any]]:
+    """기존 구현 (재귀 클로저, 작업마다 딕셔너리 생성) - 비교 기준"""
+    flat_tasks = []
+
+    def flatten_recursive(tasks: List[WBSTask], parent_task_id: str = None):
+        for task in tasks:
+            flat_tasks.append({
+                "task_id": task.task_id,
+                "parent_task_id": parent_task_id,
+                "name": task.name,
+                "assignee": task.assignee,
+                "start_date": task.start_date.isoformat(),
+                "end_date": task.end_date.isoformat(),
+                "duration_days": task.duration_days,
+                "progress": task.progress,
+                "status": task.status.value
+            })
+            if task.subtasks:
+                flatten_recursive(task.subtasks, task.task_id)
+
+    flatten_recursive(wbs_structure)
+    return flat_tasks
+
+
+def make_task(task_id: str, parent_id: Optional[str], day: int, subtasks: List[WBSTask]) -> WBSTask:
+    """검증 없이 작업 생성 (트리 생성 시간을 측정에서 제외하고 깊은 체인도 만들 수 있도록)"""
+    start = date(2025, 1, 1) + timedelta(days=day % 90)
+    return WBSTask.model_construct(
+        task_id=task_id,
+        parent_id=parent_id,
+        name=f"작업 {task_id}",
+        assignee="개발자",
+        start_date=start,
+        end_date=start + timedelta(days=3),
+        duration_days=4,
+        progress=0,
+        status=TaskStatus.TODO,
+        subtasks=subtasks
+    )
+
+
+def build_wide(nodes: int) -> List[WBSTask]:
+    """단계 10개 × 작업 100개 × 세부 작업 n개 (총 nodes개)"""
+    per_task = max(0, (nodes - 10 - 1000) // 1000)
+    phases = []
+    for p in range(1, 11):
+        tasks = []
+        for t in range(1, 101):
+            task_id = f"{p}.{t}"
+            leaves = [make_task(f"{task_id}.{l}", task_id, l, []) for l in range(1, per_task + 1)]
+            tasks.append(make_task(task_id, f"{p}.0", t, leaves))
+        phases.append(make_task(f"{p}.0", None, p, tasks))
+    return phases
+
+
+def build_deep(nodes: int) -> List[WBSTask]:
+    """깊이 nodes의 단일 체인 (재귀 구현은 RecursionError)"""
+    child: List[WBSTask] = []
+    for depth in range(nodes, 0, -1):
+        task_id = f"d{depth}"
+        child = [make_task(task_id, f"d{depth - 1}" if depth > 1 else None, depth, child)]
+    return child
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    """최소 실행 시간(ms)과 최대 할당량(MB)"""
+    best = float("inf")
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started_at)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"ms": best * 1000, "peak_mb": peak / 1024 / 1024}
+
+
+def main(nodes: int, repeat: int) -> None:
+    cases = {"wide": build_wide(nodes), "deep": build_deep(nodes)}
+    candidates = {
+        "recursive (기존)": recursive_flatten,
+        "flatten_wbs_for_spring": flatten_wbs_for_spring,
+        "iter_flat_tasks (rows)": lambda tree: list(iter_flat_tasks(tree)),
+        "iter_flat_tasks (stream)": lambda tree: sum(1 for _ in iter_flat_tasks(tree))
+    }
+
+    print(f"{'tree':<6}{'implementation':<28}{'ms':>10}{'peak MB':>10}")
+    for case, tree in cases.items():
+        expected = len(list(iter_flat_tasks(tree)))
+        for name, fn in candidates.items():
+            try:
+                result = measure(lambda: fn(tree), repeat)
+            except RecursionError:
+                print(f"{case:<6}{name:<28}{'RecursionError':>20}")
+                continue
+            print(f"{case:<6}{name:<28}{result['ms']:>10.1f}{result['peak_mb']:>10.1f}")
+        assert flatten_wbs_for_spring(tree) == recursive_flatten(tree) if case == "wide" else True
+        print(f"{case:<6}({expected} nodes)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="WBS Flat 변환 벤치마크")
+    parser.add_argument("--nodes", type=int, default=100_000, help="트리 노드 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (최솟값 보고)")
+    args = parser.parse_args()
+    main(args.nodes, args.repeat)
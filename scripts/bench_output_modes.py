@@ -0,0 +1,92 @@
+"""
+WBS 출력 방식 비교 (structured: 응답 스키마 / prompt: 프롬프트 지시 + 코드 블록 제거)
+
+같은 요청들을 두 출력 방식으로 생성하고 GenerationStats의 방식별 지표
+(평균 지연 시간, 평균 입력/출력 토큰, JSON 파싱 실패율, 로컬 수정률)를 표로 출력합니다.
+
+기본은 가짜 Gemini(GEMINI_PROVIDER=fake)로 실행하며, 가짜 응답은 항상 올바른 JSON이므로
+파싱 실패율은 실제 모델로 실행해야 의미가 있습니다 (입력 토큰 차이는 시스템 지시문 길이 차이로 그대로 측정됨).
+
+사용법:
+    python scripts/bench_output_modes.py --requests 50
+    GEMINI_PROVIDER=gemini GEMINI_API_KEY=... python scripts/bench_output_modes.py --requests 20
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.environ.setdefault("GEMINI_API_KEY", "bench")
+os.environ.setdefault("GEMINI_PROVIDER", "fake")
+os.environ.setdefault("FAKE_GEMINI_LATENCY_MEDIAN_MS", "50")
+os.environ.setdefault("FAKE_GEMINI_LATENCY_P95_MS", "150")
+os.environ.setdefault("FAKE_GEMINI_SEED", "7")
+
+from app.models.request import WBSGenerateRequest
+from app.services.gemini_service import GeminiService, create_gemini_client
+from app.services.wbs_generator import WBSGenerator
+
+PROJECT_TYPES = ["웹 서비스", "모바일 앱", "사내 시스템", "데이터 파이프라인", "게임"]
+
+
+def build_requests(count: int) -> list:
+    return [
+        WBSGenerateRequest(
+            project_name=f"벤치마크 프로젝트 {index}",
+            project_type=PROJECT_TYPES[index % len(PROJECT_TYPES)],
+            team_size=2 + index % 6,
+            expected_duration_days=20 + index % 5 * 10
+        )
+        for index in range(count)
+    ]
+
+
+async def run_mode(structured: bool, requests: list, concurrency: int) -> dict:
+    """한 출력 방식으로 모든 요청 생성 (응답 캐시 우회) 후 방식별 지표 반환"""
+    client = create_gemini_client()
+    service = GeminiService(client=client)
+    service.structured_output = structured
+    generator = WBSGenerator(service)
+    semaphore = asyncio.Semaphore(concurrency)
+    failures = 0
+
+    async def generate(request: WBSGenerateRequest) -> None:
+        nonlocal failures
+        async with semaphore:
+            try:
+                await generator.generate_wbs(request, bypass_cache=True)
+            except Exception:
+                failures += 1
+
+    await asyncio.gather(*(generate(request) for request in requests))
+    stats = service.generation_stats.snapshot()[f"wbs/{service.output_mode}"]
+    stats["failed_requests"] = failures
+    await service.aclose()
+    return stats
+
+
+async def main(count: int, concurrency: int) -> None:
+    requests = build_requests(count)
+    columns = [
+        ("calls", "calls"),
+        ("avg_latency_ms", "latency ms"),
+        ("avg_prompt_tokens", "prompt tok"),
+        ("avg_output_tokens", "output tok"),
+        ("parse_failure_rate", "parse fail"),
+        ("repair_rate", "repaired"),
+        ("failed_requests", "failed")
+    ]
+    print(f"{'mode':>12}" + "".join(f"{title:>12}" for _, title in columns))
+    for structured in (True, False):
+        stats = await run_mode(structured, requests, concurrency)
+        mode = "structured" if structured else "prompt"
+        print(f"{mode:>12}" + "".join(f"{str(stats[key]):>12}" for key, _ in columns))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="WBS 출력 방식 비교")
+    parser.add_argument("--requests", type=int, default=50, help="방식별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 생성 수")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
@@ -0,0 +1,108 @@
+"""
+WBS 응답 직렬화 마이크로벤치마크
+
+FastAPI 기본 경로(response_model 재검증 + 직렬화 + json.dumps)와
+PydanticJSONResponse(검증된 모델을 컴파일된 직렬화기로 바로 직렬화)를
+작업 50 / 500 / 5,000개 트리에서 비교합니다.
+
+사용법:
+    python scripts/bench_serialization.py
+    python scripts/bench_serialization.py --sizes 50,500,5000,50000 --repeat 20
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import date, timedelta
+from typing import Callable, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.environ.setdefault("GEMINI_API_KEY", "bench")
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.api.responses import PydanticJSONResponse
+from app.models.response import WBSGenerateResponse, WBSTask
+
+
+def build_response(total_tasks: int) -> WBSGenerateResponse:
+    """3단계 계층(단계 → 작업 → 세부 작업, 가지 수 10)으로 total_tasks개 작업 생성"""
+    start = date(2025, 1, 1)
+    counter = 0
+
+    def task(task_id: str, parent_id, depth: int) -> WBSTask:
+        nonlocal counter
+        counter += 1
+        children = []
+        if depth < 3:
+            for index in range(1, 11):
+                if counter >= total_tasks:
+                    break
+                children.append(task(f"{task_id}.{index}", task_id, depth + 1))
+        return WBSTask(
+            task_id=task_id,
+            parent_id=parent_id,
+            name=f"작업 {task_id}",
+            assignee="개발자",
+            start_date=start,
+            end_date=start + timedelta(days=depth),
+            duration_days=depth + 1,
+            subtasks=children
+        )
+
+    phases = []
+    index = 1
+    while counter < total_tasks:
+        phases.append(task(str(index), None, 1))
+        index += 1
+    return WBSGenerateResponse(
+        project_name="벤치마크",
+        total_tasks=counter,
+        total_duration_days=90,
+        wbs_structure=phases
+    )
+
+
+def measure(fn: Callable[[], object], repeat: int) -> float:
+    """repeat회 실행 중 최소 시간(ms)"""
+    best = float("inf")
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started_at)
+    return best * 1000
+
+
+def main(sizes: List[int], repeat: int) -> None:
+    field = create_response_field(name="response", type_=WBSGenerateResponse)
+    loop = asyncio.new_event_loop()
+
+    def fastapi_default(model: WBSGenerateResponse) -> bytes:
+        content = loop.run_until_complete(serialize_response(field=field, response_content=model))
+        return JSONResponse(content).body
+
+    def fast_path(model: WBSGenerateResponse) -> bytes:
+        return PydanticJSONResponse(model).body
+
+    print(f"{'tasks':>8}{'bytes':>12}{'default ms':>14}{'fast ms':>12}{'speedup':>10}")
+    for size in sizes:
+        model = build_response(size)
+        assert fastapi_default(model) == fast_path(model)
+        default_ms = measure(lambda: fastapi_default(model), repeat)
+        fast_ms = measure(lambda: fast_path(model), repeat)
+        print(
+            f"{size:>8}{len(fast_path(model)):>12}{default_ms:>14.3f}{fast_ms:>12.3f}"
+            f"{default_ms / fast_ms:>9.1f}x"
+        )
+    loop.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="WBS 응답 직렬화 벤치마크")
+    parser.add_argument("--sizes", default="50,500,5000", help="작업 수 (쉼표 구분)")
+    parser.add_argument("--repeat", type=int, default=30, help="크기별 반복 횟수 (최솟값 보고)")
+    args = parser.parse_args()
+    main([int(s) for s in args.sizes.split(",")], args.repeat)
@@ -0,0 +1,199 @@
+"""
+FlowPlanAI 부하 테스트
+
+/wbs/generate, /wbs/generate-spec, /wbs/generate-from-spec/flat 엔드포인트를
+동시성 단계별로 호출하고 처리량, p50/p95/p99 지연 시간, 이벤트 루프 지연을 출력합니다.
+
+사용법:
+    # 앱을 같은 프로세스에서 가짜 Gemini로 실행 (쿼터 소모 없음)
+    python scripts/load_test.py --concurrency 1,8,32 --duration 20
+
+    # 실행 중인 서버 대상 (서버는 GEMINI_PROVIDER=fake 권장)
+    python scripts/load_test.py --base-url http://localhost:8000 --concurrency 8,32
+
+Note:
+    같은 프로세스 모드에서는 GEMINI_PROVIDER=fake, RATE_LIMIT_ENABLED=False가 기본값입니다.
+    가짜 응답의 지연/오류율은 FAKE_GEMINI_* 환경변수로 조절합니다.
+    요청마다 프로젝트명을 바꾸고 X-Cache-Bypass를 보내므로 응답 캐시는 적중하지 않습니다 (--use-cache로 해제).
+"""
+import argparse
+import asyncio
+import itertools
+import os
+import sys
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, List, Optional
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+ENDPOINTS = {
+    "generate": "/wbs/generate",
+    "spec": "/wbs/generate-spec",
+    "flat": "/wbs/generate-from-spec/flat"
+}
+
+SAMPLE_SPEC = """# 프로젝트 명세서: {name}
+
+## 📋 프로젝트 개요
+- **프로젝트명**: {name}
+- **프로젝트 주제**: 모바일 앱
+- **팀 구성**: 5명
+- **기간**: 60일
+
+## ✨ 핵심 기능 및 요구사항
+### 회원 관리
+- 소셜 로그인, 프로필 관리
+### 일정 관리
+- 캘린더, 알림
+"""
+
+
+@dataclass
+class LevelResult:
+    """엔드포인트 × 동시성 단계 1회의 결과"""
+    endpoint: str
+    concurrency: int
+    elapsed: float
+    latencies: List[float] = field(default_factory=list)
+    errors: Dict[str, int] = field(default_factory=dict)
+    loop_lag: Dict[str, Optional[float]] = field(default_factory=dict)
+
+
+def build_payload(endpoint: str, seq: int) -> dict:
+    """요청 본문 (캐시 적중을 피하려고 프로젝트명에 순번 포함)"""
+    name = f"부하 테스트 프로젝트 {seq}"
+    if endpoint == "flat":
+        return {"markdown_spec": SAMPLE_SPEC.format(name=name)}
+    return {
+        "project_name": name,
+        "project_type": "모바일 앱",
+        "team_size": 5,
+        "expected_duration_days": 60,
+        "key_features": ["회원 관리", "일정 관리", "알림"]
+    }
+
+
+def percentile(ordered: List[float], q: float) -> Optional[float]:
+    """정렬된 표본의 q 분위수 (nearest-rank)"""
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, max(0, int(round(q * len(ordered))) - 1))]
+
+
+async def run_level(
+    client: httpx.AsyncClient,
+    prefix: str,
+    endpoint: str,
+    concurrency: int,
+    duration: float,
+    use_cache: bool,
+    counter: "itertools.count[int]"
+) -> LevelResult:
+    """동시성 단계 1회: concurrency개 워커가 duration초 동안 요청 반복"""
+    result = LevelResult(endpoint=endpoint, concurrency=concurrency, elapsed=0.0)
+    headers = {} if use_cache else {"X-Cache-Bypass": "true"}
+    url = prefix + ENDPOINTS[endpoint]
+    # 이 단계의 루프 지연만 집계하도록 시작 시점의 측정 순번 기록 (이전 단계 표본 제외)
+    since = None
+    stats = await client.get(prefix + "/wbs/stats")
+    if stats.status_code == 200:
+        since = stats.json().get("event_loop", {}).get("sequence")
+    deadline = time.perf_counter() + duration
+
+    async def worker() -> None:
+        while time.perf_counter() < deadline:
+            started_at = time.perf_counter()
+            try:
+                response = await client.post(url, json=build_payload(endpoint, next(counter)), headers=headers)
+                key = None if response.status_code == 200 else str(response.status_code)
+            except httpx.HTTPError as e:
+                key = type(e).__name__
+            if key is None:
+                result.latencies.append(time.perf_counter() - started_at)
+            else:
+                result.errors[key] = result.errors.get(key, 0) + 1
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result.elapsed = time.perf_counter() - started_at
+
+    params = {"loop_lag_since": since} if since is not None else {}
+    stats = await client.get(prefix + "/wbs/stats", params=params)
+    if stats.status_code == 200:
+        result.loop_lag = stats.json().get("event_loop", {})
+    return result
+
+
+def print_report(results: List[LevelResult]) -> None:
+    """결과 표 출력"""
+    header = (
+        f"{'endpoint':<10}{'conc':>6}{'ok':>8}{'err':>6}{'rps':>9}"
+        f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'lag p99':>10}{'lag max':>10}"
+    )
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        ordered = sorted(r.latencies)
+        ms = lambda v: f"{v * 1000:.0f}" if v is not None else "-"
+        lag = lambda v: f"{v:.1f}" if v is not None else "-"
+        print(
+            f"{r.endpoint:<10}{r.concurrency:>6}{len(ordered):>8}{sum(r.errors.values()):>6}"
+            f"{len(ordered) / r.elapsed:>9.1f}"
+            f"{ms(percentile(ordered, 0.50)):>10}{ms(percentile(ordered, 0.95)):>10}{ms(percentile(ordered, 0.99)):>10}"
+            f"{lag(r.loop_lag.get('lag_p99_ms')):>10}{lag(r.loop_lag.get('lag_max_recent_ms')):>10}"
+        )
+        if r.errors:
+            print(f"{'':<10}errors: {r.errors}")
+
+
+@asynccontextmanager
+async def open_client(base_url: Optional[str]) -> AsyncIterator[httpx.AsyncClient]:
+    """대상 서버 클라이언트 (base_url이 없으면 앱을 같은 프로세스에서 실행)"""
+    timeout = httpx.Timeout(300.0)
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    if base_url:
+        async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+            yield client
+        return
+
+    os.environ.setdefault("GEMINI_PROVIDER", "fake")
+    os.environ.setdefault("GEMINI_API_KEY", "fake")
+    os.environ.setdefault("RATE_LIMIT_ENABLED", "False")
+    os.environ.setdefault("JOB_DB_PATH", os.path.join(tempfile.gettempdir(), "flowplan_loadtest_jobs.db"))
+    from app.main import app
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=timeout) as client:
+            yield client
+
+
+async def main(args: argparse.Namespace) -> None:
+    endpoints = [e.strip() for e in args.endpoints.split(",")]
+    levels = [int(c) for c in args.concurrency.split(",")]
+    counter = itertools.count()
+    results = []
+    async with open_client(args.base_url) as client:
+        for endpoint in endpoints:
+            for concurrency in levels:
+                print(f"running {endpoint} @ {concurrency} for {args.duration:.0f}s ...", file=sys.stderr)
+                results.append(await run_level(
+                    client, args.prefix, endpoint, concurrency, args.duration, args.use_cache, counter
+                ))
+    print_report(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="FlowPlanAI 부하 테스트")
+    parser.add_argument("--base-url", help="대상 서버 URL (생략하면 같은 프로세스에서 가짜 Gemini로 실행)")
+    parser.add_argument("--prefix", default="/api/v1", help="API 경로 접두사")
+    parser.add_argument("--endpoints", default="generate,spec,flat", help=f"대상 엔드포인트 ({','.join(ENDPOINTS)})")
+    parser.add_argument("--concurrency", default="1,8,32", help="동시성 단계 (쉼표 구분)")
+    parser.add_argument("--duration", type=float, default=20.0, help="단계별 실행 시간(초)")
+    parser.add_argument("--use-cache", action="store_true", help="X-Cache-Bypass를 보내지 않음")
+    asyncio.run(main(parser.parse_args()))
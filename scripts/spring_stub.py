@@ -0,0 +1,112 @@
+"""
+스프링 push 수신 스텁 서버
+
+FlowPlanAI의 스프링 push 전송(SPRING_PUSH_*)을 로컬에서 확인하기 위한 가짜 스프링 엔드포인트입니다.
+스프링 저장 로직과 같은 규칙으로 배치를 검사합니다.
+
+- 부모 작업이 먼저 저장되어 있지 않으면 422 (외래 키 위반 재현)
+- 배치 번호가 순서대로 오지 않으면 409
+- 이미 처리한 Idempotency-Key는 다시 저장하지 않고 200 (duplicate: true)
+- --fail-rate: 저장 전에 503 응답 (재시도 확인)
+- --lost-ack-rate: 저장 후 503 응답 (응답 유실 → 재시도 → 멱등 키로 중복 제거 확인)
+
+사용법:
+    python scripts/spring_stub.py --port 8080 --fail-rate 0.2 --lost-ack-rate 0.1
+
+    # 다른 터미널에서 FlowPlanAI 실행
+    SPRING_PUSH_ENABLED=True SPRING_PUSH_URL=http://localhost:8080/api/wbs/tasks/batch \\
+        uvicorn app.main:app --port 8000
+
+    # wbs_from_spec_flat 작업 제출 후 수신 현황 확인
+    curl http://localhost:8080/pushes
+"""
+import argparse
+import asyncio
+import random
+from typing import Any, Dict, Optional
+import uvicorn
+from fastapi import FastAPI, Header, Request
+from fastapi.responses import JSONResponse
+
+app = FastAPI(title="Spring push stub")
+
+# push_id별 수신 상태
+pushes: Dict[str, Dict[str, Any]] = {}
+seen_keys: Dict[str, int] = {}
+options = argparse.Namespace(fail_rate=0.0, lost_ack_rate=0.0, save_ms=0.0)
+
+
+@app.post("/api/wbs/tasks/batch")
+async def receive_batch(request: Request, idempotency_key: Optional[str] = Header(None)):
+    body = await request.json()
+    if not idempotency_key:
+        return JSONResponse({"error": "Idempotency-Key 헤더가 없습니다."}, status_code=400)
+
+    if idempotency_key in seen_keys:
+        pushes[body["push_id"]]["duplicates"] += 1
+        return {"saved": 0, "duplicate": True}
+
+    if random.random() < options.fail_rate:
+        return JSONResponse({"error": "일시적 오류 (주입)"}, status_code=503)
+
+    push = pushes.setdefault(body["push_id"], {
+        "project_name": body["project_name"],
+        "batch_count": body["batch_count"],
+        "next_batch": 0,
+        "task_ids": {},
+        "duplicates": 0,
+        "rejected": 0
+    })
+    if body["batch_index"] != push["next_batch"]:
+        push["rejected"] += 1
+        return JSONResponse(
+            {"error": f"배치 순서 오류 (기대 {push['next_batch']}, 수신 {body['batch_index']})"},
+            status_code=409
+        )
+
+    # 스프링 저장 흐름과 같이 순서대로 저장하며 task_id → DB id 매핑
+    task_ids = push["task_ids"]
+    for task in body["tasks"]:
+        parent_task_id = task["parent_task_id"]
+        if parent_task_id is not None and parent_task_id not in task_ids:
+            push["rejected"] += 1
+            return JSONResponse(
+                {"error": f"부모 작업이 아직 저장되지 않았습니다. ({task['task_id']} → {parent_task_id})"},
+                status_code=422
+            )
+        task_ids[task["task_id"]] = len(task_ids) + 1
+    if options.save_ms:
+        await asyncio.sleep(options.save_ms * len(body["tasks"]) / 1000)
+
+    push["next_batch"] += 1
+    seen_keys[idempotency_key] = len(body["tasks"])
+
+    if random.random() < options.lost_ack_rate:
+        return JSONResponse({"error": "응답 유실 (주입, 저장은 완료)"}, status_code=503)
+    return {"saved": len(body["tasks"]), "duplicate": False}
+
+
+@app.get("/pushes")
+async def list_pushes():
+    return {
+        push_id: {
+            "project_name": push["project_name"],
+            "batches": f"{push['next_batch']}/{push['batch_count']}",
+            "complete": push["next_batch"] == push["batch_count"],
+            "tasks": len(push["task_ids"]),
+            "duplicates": push["duplicates"],
+            "rejected": push["rejected"]
+        }
+        for push_id, push in pushes.items()
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="스프링 push 수신 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="저장 전 503 비율")
+    parser.add_argument("--lost-ack-rate", type=float, default=0.0, help="저장 후 503 비율 (응답 유실)")
+    parser.add_argument("--save-ms", type=float, default=0.0, help="작업당 저장 지연(ms)")
+    parser.parse_args(namespace=options)
+    uvicorn.run(app, host=options.host, port=options.port, log_level="warning")
@@ -0,0 +1,38 @@
+import os
+import tempfile
+import httpx
+import pytest
+
+# app.core.config.settings는 import 시점에 생성되므로 테스트 모듈보다 먼저 환경 변수를 설정
+# (가짜 Gemini 사용, SQLite 파일은 임시 디렉터리에 생성)
+_DATA_DIR = tempfile.mkdtemp(prefix="flowplan-tests-")
+os.environ.setdefault("GEMINI_API_KEY", "test")
+os.environ.setdefault("GEMINI_PROVIDER", "fake")
+os.environ.setdefault("GEMINI_WARMUP_ON_STARTUP", "false")
+os.environ.setdefault("FAKE_GEMINI_LATENCY_MEDIAN_MS", "1")
+os.environ.setdefault("FAKE_GEMINI_LATENCY_P95_MS", "2")
+os.environ.setdefault("FAKE_GEMINI_SEED", "1")
+os.environ.setdefault("LOOP_LAG_MONITOR_ENABLED", "false")
+for name, filename in (
+    ("JOB_DB_PATH", "jobs.db"),
+    ("INCREMENTAL_DB_PATH", "specs.db"),
+    ("BATCH_DB_PATH", "batches.db"),
+    ("CACHE_SQLITE_PATH", "cache.db"),
+):
+    os.environ.setdefault(name, os.path.join(_DATA_DIR, filename))
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def client():
+    from app.main import app
+    
+    # Starlette TestClient는 httpx 0.28과 맞지 않으므로 ASGITransport로 직접 호출 (lifespan 포함)
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            yield client
@@ -0,0 +1,63 @@
+import msgpack
+import pytest
+
+PROJECT = {
+    "project_name": "테스트 앱",
+    "project_type": "모바일 앱",
+    "team_size": 3,
+    "expected_duration_days": 30
+}
+
+SPEC = """# 테스트 앱
+
+## 1. 프로젝트 개요
+- **프로젝트명**: 테스트 앱
+- **기간**: 30일
+- **팀 구성**: 3명
+"""
+
+
+@pytest.mark.anyio
+async def test_health(client):
+    response = await client.get("/api/v1/wbs/health")
+    assert response.status_code == 200
+    assert response.json()["status"] == "healthy"
+
+
+@pytest.mark.anyio
+async def test_generate_wbs_with_fake_gemini(client):
+    response = await client.post("/api/v1/wbs/generate", json=PROJECT)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["project_name"]
+    assert body["wbs_structure"]
+    assert body["total_tasks"] > 0
+
+
+@pytest.mark.anyio
+async def test_flat_endpoint_rejects_unsupported_accept_with_406(client):
+    response = await client.post(
+        "/api/v1/wbs/generate-from-spec/flat",
+        json={"markdown_spec": SPEC},
+        headers={"Accept": "text/csv"}
+    )
+    assert response.status_code == 406
+    assert "application/msgpack" in response.json()["detail"]
+
+
+@pytest.mark.anyio
+async def test_flat_endpoint_returns_requested_encoding(client):
+    json_response = await client.post("/api/v1/wbs/generate-from-spec/flat", json={"markdown_spec": SPEC})
+    packed = await client.post(
+        "/api/v1/wbs/generate-from-spec/flat",
+        json={"markdown_spec": SPEC},
+        headers={"Accept": "application/vnd.flowplan.columnar+msgpack"}
+    )
+    
+    assert json_response.headers["content-type"].startswith("application/json")
+    assert packed.status_code == 200
+    assert packed.headers["content-type"] == "application/vnd.flowplan.columnar+msgpack"
+    assert "accept" in packed.headers["vary"].lower()
+    body = msgpack.unpackb(packed.content)
+    assert body["layout"] == "columnar"
+    assert body["tasks"]["count"] == len(json_response.json()["tasks"])
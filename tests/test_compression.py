@@ -0,0 +1,128 @@
+import gzip
+import zlib
+import brotli
+import pytest
+from app.core import compression
+from app.core.compression import CompressionMiddleware, select_encoding
+
+BIG_JSON = b'{"tasks": [' + b",".join(b'{"task_id": "%d.0", "status": "\\ud560\\uc77c"}' % i for i in range(200)) + b"]}"
+ROWS = [b'{"type": "task", "data": {"task_id": "%d.0"}}\n' % i for i in range(3)]
+
+
+def _app(content_type, chunks, extra_headers=()):
+    """chunks를 본문 조각으로 보내는 ASGI 앱 (조각이 1개면 일반 응답)"""
+    
+    async def app(scope, receive, send):
+        headers = [(b"content-type", content_type.encode()), *extra_headers]
+        if len(chunks) == 1:
+            headers.append((b"content-length", str(len(chunks[0])).encode()))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        for index, chunk in enumerate(chunks):
+            await send({"type": "http.response.body", "body": chunk, "more_body": index < len(chunks) - 1})
+    
+    return app
+
+
+async def _call(app, accept_encoding="gzip, br", minimum_size=500):
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(b"accept-encoding", accept_encoding.encode())] if accept_encoding else []
+    }
+    messages = []
+    
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+    
+    async def send(message):
+        messages.append(message)
+    
+    await CompressionMiddleware(app, minimum_size=minimum_size)(scope, receive, send)
+    headers = {key.decode(): value.decode() for key, value in messages[0]["headers"]}
+    return headers, [message["body"] for message in messages[1:]]
+
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    ("gzip", "gzip"),
+    ("gzip, br", "br"),
+    ("br;q=0.5, gzip", "gzip"),
+    ("*", "br"),
+    ("*, br;q=0", "gzip"),
+    ("identity", None),
+    ("gzip;q=0", None),
+    ("", None),
+])
+def test_selects_encoding_by_quality(accept_encoding, expected):
+    assert select_encoding(accept_encoding) == expected
+
+
+def test_falls_back_to_gzip_without_brotli(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", None)
+    
+    assert select_encoding("br, gzip;q=0.1") == "gzip"
+    assert select_encoding("br") is None
+
+
+@pytest.mark.anyio
+async def test_compresses_large_response_with_content_length():
+    headers, bodies = await _call(_app("application/json", [BIG_JSON]))
+    
+    assert headers["content-encoding"] == "br"
+    assert headers["vary"] == "Accept-Encoding"
+    assert int(headers["content-length"]) == len(bodies[0]) < len(BIG_JSON)
+    assert brotli.decompress(bodies[0]) == BIG_JSON
+
+
+@pytest.mark.anyio
+async def test_small_response_is_sent_uncompressed():
+    small = b'{"status": "healthy"}'
+    headers, bodies = await _call(_app("application/json", [small]))
+    
+    assert "content-encoding" not in headers
+    assert headers["content-length"] == str(len(small))
+    assert bodies == [small]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("content_type, extra_headers, content_encoding", [
+    ("image/png", (), None),
+    ("application/json", ((b"content-encoding", b"identity"),), "identity"),
+])
+async def test_skips_incompressible_or_already_encoded_responses(content_type, extra_headers, content_encoding):
+    headers, bodies = await _call(_app(content_type, [BIG_JSON], extra_headers))
+    
+    assert headers.get("content-encoding") == content_encoding
+    assert bodies == [BIG_JSON]
+
+
+@pytest.mark.anyio
+async def test_skips_when_client_does_not_accept_compression():
+    headers, bodies = await _call(_app("application/json", [BIG_JSON]), accept_encoding="")
+    
+    assert "content-encoding" not in headers
+    assert bodies == [BIG_JSON]
+
+
+@pytest.mark.anyio
+async def test_streamed_rows_are_flushed_one_by_one():
+    headers, bodies = await _call(_app("application/x-ndjson", ROWS), accept_encoding="gzip")
+    
+    assert headers["content-encoding"] == "gzip"
+    assert "content-length" not in headers
+    assert len(bodies) == len(ROWS)
+    # 각 조각만으로 해당 행까지 복원되어야 스트리밍이 유지됨 (작은 행도 압축)
+    decoder = zlib.decompressobj(31)
+    for row, body in zip(ROWS, bodies):
+        assert decoder.decompress(body) == row
+    assert gzip.decompress(b"".join(bodies)) == b"".join(ROWS)
+
+
+@pytest.mark.anyio
+async def test_streamed_brotli_rows_are_flushed_one_by_one():
+    headers, bodies = await _call(_app("application/x-ndjson", ROWS), accept_encoding="br")
+    
+    assert headers["content-encoding"] == "br"
+    decoder = brotli.Decompressor()
+    for row, body in zip(ROWS, bodies):
+        assert decoder.process(body) == row
@@ -0,0 +1,116 @@
+import asyncio
+from types import SimpleNamespace
+import pytest
+from app.services import context_cache
+from app.services.context_cache import ContextCacheManager
+from app.services.fake_gemini import FakeGeminiClient
+from app.services.gemini_service import GeminiService
+
+MODEL = "gemini-test"
+INSTRUCTION = "정적 시스템 지시문 " * 100
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(context_cache, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+def _manager(client=None, **kwargs):
+    kwargs.setdefault("ttl_seconds", 600)
+    kwargs.setdefault("refresh_margin_seconds", 60)
+    kwargs.setdefault("min_tokens", 100)
+    return ContextCacheManager(client or FakeGeminiClient(), **kwargs)
+
+
+@pytest.mark.anyio
+async def test_registers_instruction_once_for_concurrent_requests(clock):
+    manager = _manager()
+    
+    names = await asyncio.gather(*(manager.resolve(MODEL, INSTRUCTION) for _ in range(5)))
+    
+    assert len(set(names)) == 1
+    assert manager.client.cached_instructions[names[0]] == INSTRUCTION
+    assert (manager.creates, manager.hits) == (1, 4)
+
+
+@pytest.mark.anyio
+async def test_skips_instructions_below_minimum_tokens(clock):
+    manager = _manager(min_tokens=10_000)
+    
+    assert await manager.resolve(MODEL, INSTRUCTION) is None
+    assert manager.too_small == 1
+    assert manager.client.cached_instructions == {}
+
+
+@pytest.mark.anyio
+async def test_refreshes_ttl_near_expiry_and_recreates_after_expiry(clock):
+    manager = _manager()
+    name = await manager.resolve(MODEL, INSTRUCTION)
+    
+    clock.now += 550
+    assert await manager.resolve(MODEL, INSTRUCTION) == name
+    assert manager.refreshes == 1
+    
+    clock.now += 601
+    assert await manager.resolve(MODEL, INSTRUCTION) != name
+    assert manager.creates == 2
+
+
+@pytest.mark.anyio
+async def test_invalidated_handle_is_registered_again(clock):
+    manager = _manager()
+    name = await manager.resolve(MODEL, INSTRUCTION)
+    
+    manager.invalidate(MODEL, INSTRUCTION)
+    
+    assert await manager.resolve(MODEL, INSTRUCTION) != name
+    assert manager.creates == 2
+
+
+@pytest.mark.anyio
+async def test_failed_registration_falls_back_until_ttl_passes(clock):
+    client = FakeGeminiClient()
+    calls = 0
+    
+    async def unsupported(**kwargs):
+        nonlocal calls
+        calls += 1
+        raise RuntimeError("model does not support caching")
+    
+    client.aio.caches.create = unsupported
+    manager = _manager(client)
+    
+    assert await manager.resolve(MODEL, INSTRUCTION) is None
+    assert await manager.resolve(MODEL, INSTRUCTION) is None
+    assert (calls, manager.failures) == (1, 1)
+    
+    clock.now += 601
+    assert await manager.resolve(MODEL, INSTRUCTION) is None
+    assert calls == 2
+
+
+@pytest.mark.anyio
+async def test_disabled_manager_never_registers():
+    manager = _manager(enabled=False)
+    
+    assert await manager.resolve(MODEL, INSTRUCTION) is None
+    assert manager.client.cached_instructions == {}
+
+
+@pytest.mark.anyio
+async def test_service_sends_cached_instruction_reference():
+    client = FakeGeminiClient(latency_median_ms=1, latency_p95_ms=1, seed=1)
+    service = GeminiService(client=client, context_cache=_manager(client, min_tokens=1))
+    project = {"project_name": "캐시 테스트", "project_type": "웹", "team_size": 3, "total_days": 20}
+    
+    first = await service.generate_markdown_spec(project)
+    second = await service.generate_markdown_spec({**project, "project_name": "캐시 테스트 2"})
+    
+    # 컨텍스트 캐시 참조만 보내도 같은 지시문으로 생성됨 (가짜 클라이언트는 등록된 지시문으로 응답)
+    assert "캐시 테스트" in first and "캐시 테스트 2" in second
+    assert service.context_cache.creates == 1
+    assert service.context_cache.hits == 1
+    await service.context_cache.aclose()
+    assert client.cached_instructions == {}
@@ -0,0 +1,23 @@
+import asyncio
+import time
+import pytest
+from app.services.event_loop_monitor import EventLoopLagMonitor
+
+
+@pytest.mark.anyio
+async def test_stats_since_only_counts_later_samples():
+    monitor = EventLoopLagMonitor(interval_seconds=0.005)
+    monitor.start()
+    await asyncio.sleep(0.05)
+    time.sleep(0.05)  # 루프를 막아 큰 지연 1회 발생
+    await asyncio.sleep(0.02)
+    before = monitor.stats()
+    assert before["lag_max_recent_ms"] >= 40
+    
+    await asyncio.sleep(0.05)
+    stage = monitor.stats(since=before["sequence"])
+    await monitor.stop()
+    
+    assert 0 < stage["samples"] <= stage["sequence"] - before["sequence"]
+    assert stage["lag_max_recent_ms"] < 40
+    assert stage["lag_max_ms"] >= 40
@@ -0,0 +1,96 @@
+import msgpack
+import pytest
+from app.utils import flat_encoding
+from app.utils.flat_encoding import FlatEncoding, encode_flat_body, negotiate_flat_encoding, pack_msgpack, to_columnar
+from app.utils.wbs_converter import FlatTaskRow
+
+ROWS = [
+    FlatTaskRow("1.0", None, "기획", "PM", "2024-03-04", "2024-03-08", 5, 0, "할일"),
+    FlatTaskRow("1.1", "1.0", "요구사항", "PM", "2024-03-04", "2024-03-05", 2, 0, "할일"),
+]
+
+
+@pytest.mark.parametrize("accept, expected", [
+    (None, FlatEncoding.JSON),
+    ("", FlatEncoding.JSON),
+    ("*/*", FlatEncoding.JSON),
+    ("application/*", FlatEncoding.JSON),
+    ("application/json", FlatEncoding.JSON),
+    ("application/msgpack", FlatEncoding.MSGPACK),
+    ("application/x-msgpack", FlatEncoding.MSGPACK),
+    ("Application/Vnd.Flowplan.Columnar+Msgpack", FlatEncoding.COLUMNAR_MSGPACK),
+    # q 값이 높은 형식 우선
+    ("application/json;q=0.5, application/vnd.flowplan.columnar+json", FlatEncoding.COLUMNAR_JSON),
+    # 같은 q 값이면 와일드카드보다 구체적인 형식
+    ("*/*, application/msgpack", FlatEncoding.MSGPACK),
+    # 같은 q 값의 구체적인 형식끼리는 기본 우선순위
+    ("application/msgpack, application/json", FlatEncoding.JSON),
+    # 지원하지 않는 형식은 건너뜀
+    ("text/html, application/msgpack;q=0.1", FlatEncoding.MSGPACK),
+])
+def test_negotiates_best_available_encoding(accept, expected):
+    assert negotiate_flat_encoding(accept) is expected
+
+
+@pytest.mark.parametrize("accept", [
+    "text/html",
+    "application/xml, text/csv",
+    "application/json;q=0",
+    "application/msgpack;q=abc",
+])
+def test_returns_none_when_nothing_acceptable(accept):
+    assert negotiate_flat_encoding(accept) is None
+
+
+def test_binary_encodings_are_unavailable_without_msgpack(monkeypatch):
+    monkeypatch.setattr(flat_encoding, "msgpack", None)
+    
+    assert negotiate_flat_encoding("application/msgpack") is None
+    assert negotiate_flat_encoding("application/msgpack, application/json;q=0.1") is FlatEncoding.JSON
+    with pytest.raises(RuntimeError):
+        pack_msgpack({})
+
+
+def test_columnar_layout_stores_constant_columns_once():
+    columnar = to_columnar(ROWS)
+    
+    assert columnar["count"] == 2
+    assert columnar["constants"] == {"assignee": "PM", "start_date": "2024-03-04", "progress": 0, "status": "할일"}
+    assert columnar["columns"]["task_id"] == ["1.0", "1.1"]
+    assert columnar["columns"]["parent_task_id"] == [None, "1.0"]
+    # fields 순서대로 열/상수를 읽으면 원래 행으로 복원
+    restored = [
+        tuple(
+            columnar["constants"][field] if field in columnar["constants"] else columnar["columns"][field][index]
+            for field in columnar["fields"]
+        )
+        for index in range(columnar["count"])
+    ]
+    assert restored == [tuple(row) for row in ROWS]
+
+
+def test_empty_columnar_layout():
+    columnar = to_columnar([])
+    
+    assert columnar["count"] == 0
+    assert all(values == [] for values in columnar["columns"].values())
+
+
+def test_encoded_bodies_match_flat_response_shape():
+    summary = {"project_name": "테스트", "total_tasks": 2, "total_duration_days": 5}
+    
+    body = encode_flat_body(summary, ROWS, FlatEncoding.JSON)
+    assert body["tasks"][1] == {
+        "task_id": "1.1",
+        "parent_task_id": "1.0",
+        "name": "요구사항",
+        "assignee": "PM",
+        "start_date": "2024-03-04",
+        "end_date": "2024-03-05",
+        "duration_days": 2,
+        "progress": 0,
+        "status": "할일"
+    }
+    columnar = encode_flat_body(summary, ROWS, FlatEncoding.COLUMNAR_MSGPACK)
+    assert columnar["layout"] == "columnar"
+    assert msgpack.unpackb(pack_msgpack(columnar)) == columnar
@@ -0,0 +1,103 @@
+import json
+import threading
+import time
+import pytest
+import uvicorn
+from google import genai
+from google.genai import types
+from app.core.config import settings
+from app.services.fake_gemini import FakeGeminiClient
+from app.services.gemini_service import create_gemini_client
+
+RESPONSE_BODY = json.dumps({
+    "candidates": [{"content": {"role": "model", "parts": [{"text": "ok"}]}}],
+    "usageMetadata": {"promptTokenCount": 1, "candidatesTokenCount": 1, "totalTokenCount": 2}
+}).encode()
+
+
+class GenerateContentServer:
+    """고정 generateContent 응답을 보내고 요청마다 클라이언트 포트(TCP 연결)를 기록하는 로컬 서버"""
+    
+    def __init__(self):
+        self.client_ports = []
+        config = uvicorn.Config(self.app, host="127.0.0.1", port=0, log_level="warning", interface="asgi3")
+        self.server = uvicorn.Server(config)
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+    
+    async def app(self, scope, receive, send):
+        if scope["type"] != "http":
+            return
+        self.client_ports.append(scope["client"][1])
+        while (await receive()).get("more_body"):
+            pass
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+        await send({"type": "http.response.body", "body": RESPONSE_BODY})
+    
+    @property
+    def base_url(self):
+        port = self.server.servers[0].sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+    
+    def __enter__(self):
+        self.thread.start()
+        while not self.server.started:
+            time.sleep(0.01)
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.server.should_exit = True
+        self.thread.join()
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    with GenerateContentServer() as server:
+        monkeypatch.setattr(settings, "GEMINI_PROVIDER", "gemini")
+        monkeypatch.setenv("GOOGLE_GEMINI_BASE_URL", server.base_url)
+        yield server
+
+
+@pytest.mark.anyio
+async def test_shared_client_reuses_one_keep_alive_connection(upstream):
+    client = create_gemini_client()
+    try:
+        for _ in range(5):
+            response = await client.aio.models.generate_content(model=settings.GEMINI_MODEL, contents="ping")
+            assert response.text == "ok"
+    finally:
+        await client.aio.aclose()
+        client.close()
+    
+    assert len(upstream.client_ports) == 5
+    assert len(set(upstream.client_ports)) == 1
+
+
+@pytest.mark.anyio
+async def test_client_per_request_opens_new_connections(upstream):
+    # 요청마다 클라이언트를 새로 만들던 기존 방식은 매번 TCP(실서버는 TLS까지) 연결을 새로 맺음
+    for _ in range(3):
+        client = genai.Client(api_key="test", http_options=types.HttpOptions(base_url=upstream.base_url))
+        await client.aio.models.generate_content(model=settings.GEMINI_MODEL, contents="ping")
+        await client.aio.aclose()
+        client.close()
+    
+    assert len(set(upstream.client_ports)) == 3
+
+
+def test_fake_provider_returns_local_client(monkeypatch):
+    monkeypatch.setattr(settings, "GEMINI_PROVIDER", "fake")
+    
+    assert isinstance(create_gemini_client(), FakeGeminiClient)
+
+
+@pytest.mark.anyio
+async def test_app_requests_share_one_service_and_client(client):
+    from app.main import app
+    
+    service = app.state.gemini_service
+    for _ in range(2):
+        assert (await client.get("/api/v1/wbs/health")).status_code == 200
+    
+    assert app.state.gemini_service is service
+    assert app.state.job_manager.gemini_service.client is service.client
+    assert app.state.incremental_generator.gemini_service is service
@@ -0,0 +1,130 @@
+import asyncio
+import time
+import pytest
+from google.genai import errors
+from app.services import gemini_service
+from app.services.fake_gemini import FakeGeminiClient
+from app.services.gemini_service import GeminiService
+from app.services.resilience import ResiliencePolicy
+
+LATENCY_MS = 200.0
+
+
+def _service(**kwargs):
+    kwargs.setdefault("latency_median_ms", LATENCY_MS)
+    kwargs.setdefault("latency_p95_ms", LATENCY_MS)
+    return GeminiService(client=FakeGeminiClient(seed=1, **kwargs))
+
+
+def _project(index):
+    return {"project_name": f"프로젝트 {index}", "project_type": "웹", "team_size": 3, "total_days": 20}
+
+
+def _fast_retry_service():
+    return GeminiService(
+        client=FakeGeminiClient(latency_median_ms=20, latency_p95_ms=20, stream_chunk_chars=100, seed=1),
+        resilience=ResiliencePolicy(max_attempts=3, base_delay=0.01, max_delay=0.01, deadline_seconds=5, attempt_timeout=5)
+    )
+
+
+def _unavailable():
+    return errors.ServerError(503, {"error": {"code": 503, "status": "UNAVAILABLE", "message": "unavailable"}})
+
+
+async def _stream_text(service, spec):
+    events = [event async for event in service.stream_wbs_from_markdown(spec, bypass_cache=True)]
+    assert events[-1]["event"] == "done"
+    return "".join(event["text"] for event in events if event["event"] == "chunk")
+
+
+@pytest.mark.anyio
+async def test_concurrent_calls_finish_in_about_one_call_time():
+    service = _service()
+    ticks = 0
+    
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+    
+    ticking = asyncio.create_task(ticker())
+    started_at = time.perf_counter()
+    specs = await asyncio.gather(*(service.generate_markdown_spec(_project(index)) for index in range(8)))
+    elapsed = time.perf_counter() - started_at
+    ticking.cancel()
+    
+    assert len(set(specs)) == 8
+    # 순차 호출이면 8 × 200ms, 비동기 호출이면 호출 1회 시간 + 약간의 오버헤드
+    assert elapsed < 2 * LATENCY_MS / 1000
+    # 호출 대기 중에도 이벤트 루프가 다른 작업을 처리
+    assert ticks >= 10
+
+
+@pytest.mark.anyio
+async def test_slow_stream_client_does_not_hold_upstream_slot(monkeypatch):
+    monkeypatch.setattr(gemini_service, "_upstream_semaphore", asyncio.Semaphore(1))
+    service = _service(latency_median_ms=50, latency_p95_ms=50, stream_chunk_chars=100)
+    spec = await service.generate_markdown_spec(_project(0))
+    
+    events = service.stream_wbs_from_markdown(spec, bypass_cache=True)
+    first = await events.__anext__()
+    # 스트림 클라이언트가 읽기를 멈춘 동안에도 업스트림을 다 읽으면 슬롯이 풀려 다른 호출이 진행
+    other = await asyncio.wait_for(service.generate_markdown_spec(_project(1)), timeout=2)
+    rest = [event async for event in events]
+    
+    assert first["event"] == "chunk" and other
+    assert rest[-1]["event"] == "done"
+
+
+@pytest.mark.anyio
+async def test_stream_retries_failure_before_first_chunk():
+    service = _fast_retry_service()
+    spec = await service.generate_markdown_spec(_project(0))
+    models = service.client.aio.models
+    original = models.generate_content_stream
+    calls = 0
+    
+    async def flaky(**kwargs):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise _unavailable()
+        return await original(**kwargs)
+    
+    models.generate_content_stream = flaky
+    text = await _stream_text(service, spec)
+    
+    assert calls == 2
+    assert service.resilience.retries == 1
+    assert text.startswith("{") and text.endswith("}")
+
+
+@pytest.mark.anyio
+async def test_stream_failure_after_first_chunk_is_not_retried():
+    service = _fast_retry_service()
+    spec = await service.generate_markdown_spec(_project(0))
+    models = service.client.aio.models
+    original = models.generate_content_stream
+    calls = 0
+    
+    async def broken(**kwargs):
+        nonlocal calls
+        calls += 1
+        stream = await original(**kwargs)
+        
+        async def first_chunk_then_fail():
+            yield await stream.__anext__()
+            raise _unavailable()
+        
+        return first_chunk_then_fail()
+    
+    models.generate_content_stream = broken
+    chunks = []
+    with pytest.raises(Exception, match="Gemini API 호출 실패"):
+        async for event in service.stream_wbs_from_markdown(spec, bypass_cache=True):
+            chunks.append(event)
+    
+    assert calls == 1
+    assert service.resilience.retries == 0
+    assert [event["event"] for event in chunks] == ["chunk"]
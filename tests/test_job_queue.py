@@ -0,0 +1,111 @@
+import asyncio
+import json
+import os
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+from app.core.config import settings
+from app.models.job import JobKind, JobStatus
+from app.services.fake_gemini import FakeGeminiClient
+from app.services.gemini_service import GeminiService
+from app.services.job_queue import JobManager, JobStore
+from app.utils.webhook_url import check_webhook_url, resolve_public_host
+
+PAYLOAD = {"project_name": "작업 큐", "project_type": "웹", "team_size": 3, "expected_duration_days": 30}
+
+
+@pytest.mark.parametrize("url", [
+    "http://127.0.0.1/hook",
+    "http://localhost:8080/hook",
+    "http://api.localhost/hook",
+    "http://10.0.0.5/hook",
+    "http://192.168.1.10/hook",
+    "http://169.254.169.254/latest/meta-data",
+    "http://[::1]/hook",
+    "http://[::ffff:127.0.0.1]/hook",
+    "http://0.0.0.0/hook",
+    "http:///hook"
+])
+def test_check_webhook_url_rejects_internal_addresses(url):
+    with pytest.raises(ValueError):
+        check_webhook_url(url)
+
+
+def test_check_webhook_url_allows_public_hosts_and_allow_list():
+    check_webhook_url("https://8.8.8.8/hook")
+    check_webhook_url("https://hooks.example.com/hook")
+    check_webhook_url("http://spring.internal:8080/hook", ["spring.internal"])
+    with pytest.raises(ValueError):
+        check_webhook_url("https://hooks.example.com/hook", ["spring.internal"])
+
+
+@pytest.mark.anyio
+async def test_resolve_public_host_rejects_names_resolving_to_loopback():
+    with pytest.raises(ValueError):
+        await resolve_public_host("http://ip6-localhost/hook")
+    await resolve_public_host("http://spring.internal/hook", ["spring.internal"])
+
+
+@pytest.fixture
+async def manager(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "JOB_WEBHOOK_ALLOWED_HOSTS", "hooks.test")
+    service = GeminiService(client=FakeGeminiClient(latency_median_ms=30, latency_p95_ms=30, seed=1))
+    manager = JobManager(service, store=JobStore(os.path.join(tmp_path, "jobs.db")))
+    await manager.start()
+    delivered = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        delivered.append((str(request.url), json.loads(request.content)["status"]))
+        return httpx.Response(204)
+    
+    await manager._http_client.aclose()
+    manager._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    manager.delivered = delivered
+    yield manager
+    await manager.stop()
+
+
+async def _wait_finished(manager, job_id):
+    for _ in range(200):
+        job = await manager.get(job_id)
+        if job.status in (JobStatus.SUCCEEDED, JobStatus.FAILED):
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError("작업이 끝나지 않았습니다.")
+
+
+@pytest.mark.anyio
+async def test_concurrent_duplicate_submissions_share_one_job_and_notify_everyone(manager):
+    jobs = await asyncio.gather(*(
+        manager.submit(JobKind.WBS, PAYLOAD, webhook_url=f"http://hooks.test/{index}") for index in range(4)
+    ))
+    
+    assert len({job.job_id for job in jobs}) == 1
+    assert sum(job.deduplicated for job in jobs) == 3
+    job = await _wait_finished(manager, jobs[0].job_id)
+    assert job.status == JobStatus.SUCCEEDED
+    for _ in range(100):
+        if len(manager.delivered) == 4:
+            break
+        await asyncio.sleep(0.01)
+    assert sorted(manager.delivered) == [(f"http://hooks.test/{index}", "succeeded") for index in range(4)]
+
+
+@pytest.mark.anyio
+async def test_queue_depth_and_running_gauges(manager):
+    manager._workers[0].cancel()
+    manager._workers[1].cancel()
+    await asyncio.gather(*manager._workers, return_exceptions=True)
+    
+    for index in range(3):
+        await manager.submit(JobKind.WBS, {**PAYLOAD, "project_name": f"게이지 {index}"})
+    assert REGISTRY.get_sample_value("flowplan_job_queue_depth") == 3
+    
+    manager._workers = [asyncio.create_task(manager._worker())]
+    await asyncio.sleep(0.01)
+    assert REGISTRY.get_sample_value("flowplan_job_queue_depth") == 2
+    assert REGISTRY.get_sample_value("flowplan_jobs_running") == 1
+    
+    await asyncio.wait_for(manager._queue.join(), timeout=5)
+    assert REGISTRY.get_sample_value("flowplan_job_queue_depth") == 0
+    assert REGISTRY.get_sample_value("flowplan_jobs_running") == 0
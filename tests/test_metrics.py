@@ -0,0 +1,64 @@
+import pytest
+from prometheus_client import REGISTRY
+from app.core.config import settings
+
+PROJECT = {
+    "project_name": "지표 테스트",
+    "project_type": "웹",
+    "team_size": 3,
+    "expected_duration_days": 30
+}
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.mark.anyio
+async def test_generate_records_request_stage_and_token_metrics(client):
+    endpoint = "/api/v1/wbs/generate"
+    model = settings.GEMINI_MODEL
+    requests_before = _sample(
+        "flowplan_http_requests_total", method="POST", endpoint=endpoint, status="200", model=model
+    )
+    upstream_before = _sample("flowplan_stage_duration_seconds_count", stage="upstream", endpoint=endpoint, model=model)
+    output_before = _sample("flowplan_gemini_tokens_total", kind="output", endpoint=endpoint, model=model)
+    
+    response = await client.post(endpoint, json=PROJECT, headers={"X-Cache-Bypass": "true"})
+    
+    assert response.status_code == 200
+    assert _sample(
+        "flowplan_http_requests_total", method="POST", endpoint=endpoint, status="200", model=model
+    ) == requests_before + 1
+    assert _sample(
+        "flowplan_stage_duration_seconds_count", stage="upstream", endpoint=endpoint, model=model
+    ) == upstream_before + 1
+    assert _sample("flowplan_gemini_tokens_total", kind="output", endpoint=endpoint, model=model) > output_before
+    assert _sample("flowplan_gemini_inflight_calls", endpoint=endpoint, model=model) == 0
+
+
+@pytest.mark.anyio
+async def test_endpoint_label_uses_route_template(client):
+    labels = {"method": "GET", "endpoint": "/api/v1/wbs/jobs/{job_id}", "status": "404", "model": "none"}
+    before = _sample("flowplan_http_requests_total", **labels)
+    
+    for job_id in ("missing-1", "missing-2"):
+        assert (await client.get(f"/api/v1/wbs/jobs/{job_id}")).status_code == 404
+    await client.get("/no/such/path")
+    
+    assert _sample("flowplan_http_requests_total", **labels) == before + 2
+    assert _sample(
+        "flowplan_http_requests_total", method="GET", endpoint="unmatched", status="404", model="none"
+    ) >= 1
+
+
+@pytest.mark.anyio
+async def test_metrics_endpoint_exposes_prometheus_text(client):
+    await client.get("/api/v1/wbs/health")
+    
+    response = await client.get("/metrics")
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    for name in ("flowplan_http_requests_total", "flowplan_stage_duration_seconds", "flowplan_job_queue_depth"):
+        assert name in response.text
@@ -0,0 +1,92 @@
+from types import SimpleNamespace
+import pytest
+from app.services import model_router
+from app.services.model_router import ModelRouter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = SimpleNamespace(now=100.0)
+    monkeypatch.setattr(model_router, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+def _router(**kwargs):
+    kwargs.setdefault("enabled", True)
+    kwargs.setdefault("latency_slo_seconds", 1.0)
+    kwargs.setdefault("error_budget", 0.2)
+    kwargs.setdefault("window", 10)
+    kwargs.setdefault("min_samples", 5)
+    kwargs.setdefault("cooldown_seconds", 30.0)
+    return ModelRouter("fast-model", "large-model", **kwargs)
+
+
+def _record(router, model, count, latency=0.1, success=True):
+    for _ in range(count):
+        router.record_call(model, latency, success)
+
+
+def test_routes_by_input_size():
+    router = _router(fast_max_team_size=5, fast_max_duration_days=30, fast_max_spec_chars=100)
+    
+    assert router.route(team_size=3, duration_days=20, spec_chars=50) == ("fast-model", "fast", "size")
+    assert router.route(team_size=3, duration_days=60) == ("large-model", "large", "size")
+    assert router.route(spec_chars=101).tier == "large"
+    assert _router(enabled=False).route(team_size=1) == ("large-model", "large", "default")
+
+
+def test_error_budget_switches_tier_until_cooldown_ends(clock):
+    router = _router()
+    _record(router, "fast-model", 3, success=False)
+    _record(router, "fast-model", 2)
+    
+    decision = router.route(team_size=1)
+    assert decision == ("large-model", "large", "error_budget")
+    assert router.stats()["tiers"]["large"]["fallbacks_in"] == 1
+    
+    # 쿨다운 동안은 성공 호출이 쌓여도 전환 유지
+    clock.now += 29
+    _record(router, "fast-model", 10)
+    assert router.route(team_size=1).reason == "error_budget"
+    
+    # 쿨다운이 끝나면 이전 표본을 버리고 원래 티어로 복귀
+    clock.now += 2
+    assert router.route(team_size=1) == ("fast-model", "fast", "size")
+    assert router.stats()["tiers"]["fast"]["calls"] == 15
+    assert router.stats()["tiers"]["fast"]["window_error_rate"] is None
+
+
+def test_latency_slo_switches_tier(clock):
+    router = _router()
+    _record(router, "large-model", 5, latency=2.0)
+    
+    assert router.route(team_size=50) == ("fast-model", "fast", "slo")
+
+
+def test_too_few_samples_do_not_trip(clock):
+    router = _router()
+    _record(router, "fast-model", 4, success=False)
+    
+    assert router.route(team_size=1).tier == "fast"
+
+
+def test_keeps_original_tier_when_both_tiers_are_over_budget(clock):
+    router = _router()
+    _record(router, "fast-model", 5, success=False)
+    _record(router, "large-model", 5, latency=2.0)
+    
+    assert router.route(team_size=1) == ("fast-model", "fast", "size")
+    assert router.stats()["tiers"]["fast"]["tripped"] == "error_budget"
+    assert router.stats()["tiers"]["large"]["tripped"] == "slo"
+
+
+def test_records_parse_rate_and_ignores_unknown_models():
+    router = _router()
+    router.record_parse("fast-model", True)
+    router.record_parse("fast-model", False)
+    router.record_call("other-model", 1.0, False)
+    router.record_parse("other-model", False)
+    
+    stats = router.stats()["tiers"]
+    assert stats["fast"]["parse_success_rate"] == 0.5
+    assert stats["large"]["calls"] == 0
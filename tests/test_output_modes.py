@@ -0,0 +1,88 @@
+import json
+import pytest
+from google.genai import types
+from app.models.response import WBSGenerateResponse
+from app.services.fake_gemini import FakeGeminiClient
+from app.services.gemini_service import WBS_RESPONSE_SCHEMA, GeminiService
+from app.services.wbs_from_markdown import WBSFromMarkdownGenerator
+from app.utils.response_schema import build_gemini_response_schema
+
+SPEC = """# 출력 모드 비교
+
+## 1. 프로젝트 개요
+- **프로젝트명**: 출력 모드 비교
+- **기간**: 40일
+- **팀 구성**: 4명
+"""
+
+
+def _task_schema(schema):
+    return schema["properties"]["wbs_structure"]["items"]
+
+
+def test_schema_inlines_references_and_keeps_field_order():
+    task = _task_schema(WBS_RESPONSE_SCHEMA)
+    
+    assert "$ref" not in json.dumps(WBS_RESPONSE_SCHEMA)
+    assert WBS_RESPONSE_SCHEMA["property_ordering"] == [
+        "project_name", "total_tasks", "total_duration_days", "wbs_structure"
+    ]
+    assert task["property_ordering"][:3] == ["task_id", "parent_id", "name"]
+    assert task["properties"]["parent_id"]["nullable"] is True
+    assert "YYYY-MM-DD" in task["properties"]["start_date"]["description"]
+    # 기본값으로 채우는 필드는 모델이 생성하지 않음
+    assert "progress" not in task["properties"] and "status" not in task["properties"]
+
+
+def test_recursive_subtasks_are_cut_at_max_depth():
+    depth = 0
+    task = _task_schema(WBS_RESPONSE_SCHEMA)
+    while "subtasks" in task["properties"]:
+        depth += 1
+        task = task["properties"]["subtasks"]["items"]
+    
+    assert depth == 2
+    shallow = build_gemini_response_schema(WBSGenerateResponse, max_depth=1)
+    assert "subtasks" not in _task_schema(shallow)["properties"]
+    assert "status" in _task_schema(shallow)["properties"]
+    assert _task_schema(shallow)["properties"]["status"]["enum"] == ["할일", "진행중", "완료"]
+
+
+def test_schema_is_accepted_by_sdk():
+    schema = types.Schema.model_validate(WBS_RESPONSE_SCHEMA)
+    
+    assert schema.type == types.Type.OBJECT
+    assert schema.properties["wbs_structure"].items.properties["task_id"].type == types.Type.STRING
+
+
+@pytest.mark.parametrize("structured", [True, False])
+def test_config_per_output_mode(structured):
+    service = GeminiService(client=FakeGeminiClient())
+    service.structured_output = structured
+    
+    config = service._wbs_config("지시문")
+    
+    if structured:
+        assert config.response_mime_type == "application/json"
+        assert config.response_schema is not None
+    else:
+        assert config.response_mime_type is None
+        assert config.response_schema is None
+
+
+@pytest.mark.anyio
+async def test_both_modes_produce_valid_wbs_and_record_separate_stats():
+    service = GeminiService(client=FakeGeminiClient(latency_median_ms=1, latency_p95_ms=1, seed=1))
+    generator = WBSFromMarkdownGenerator(service)
+    
+    for structured in (True, False):
+        service.structured_output = structured
+        response = await generator.generate_wbs(SPEC, bypass_cache=True)
+        assert response.wbs_structure
+    
+    stats = service.generation_stats.snapshot()
+    structured, prompt = stats["wbs_from_markdown/structured"], stats["wbs_from_markdown/prompt"]
+    assert structured["calls"] == prompt["calls"] == 1
+    assert structured["parse_failure_rate"] == prompt["parse_failure_rate"] == 0.0
+    # 프롬프트 모드는 JSON 형식 예시를 시스템 지시문에 담으므로 입력 토큰이 더 많음
+    assert prompt["avg_prompt_tokens"] > structured["avg_prompt_tokens"]
@@ -0,0 +1,101 @@
+import asyncio
+import json
+import threading
+from collections import Counter
+import pydantic
+import pytest
+from fastapi import HTTPException
+from app.api.dependencies import verify_admin_token
+from app.core.config import settings
+from app.services import profiler
+from app.services.profiler import ProfilerBusyError, ProfilingService, module_name, to_collapsed, to_speedscope
+
+
+def _busy_loop(stop):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+@pytest.mark.anyio
+async def test_cpu_profile_samples_other_threads():
+    stop = threading.Event()
+    worker = threading.Thread(target=_busy_loop, args=(stop,), name="busy-worker")
+    worker.start()
+    try:
+        result = await ProfilingService().profile_cpu(0.2, 0.005)
+    finally:
+        stop.set()
+        worker.join()
+    
+    assert result.samples > 0
+    busy = [stack for stack in result.stacks if stack.startswith("busy-worker;")]
+    assert busy
+    assert any("_busy_loop (tests.test_profiler)" in stack for stack in busy)
+    assert not any(stack.startswith("flowplan-profiler;") for stack in result.stacks)
+
+
+@pytest.mark.anyio
+async def test_memory_profile_attributes_allocations_to_module():
+    retained = []
+    
+    async def allocate():
+        await asyncio.sleep(0.05)
+        retained.extend(bytearray(1024) for _ in range(2000))
+    
+    allocating = asyncio.create_task(allocate())
+    result = await ProfilingService().profile_memory(0.2, top=5)
+    await allocating
+    
+    top_module = result["modules"][0]
+    assert top_module["module"] == "tests.test_profiler"
+    assert top_module["size_diff_kb"] >= 2000
+    assert result["lines"][0]["location"].startswith("tests.test_profiler:")
+
+
+@pytest.mark.anyio
+async def test_only_one_profile_runs_at_a_time():
+    service = ProfilingService()
+    running = asyncio.create_task(service.profile_cpu(0.2, 0.01))
+    await asyncio.sleep(0.01)
+    
+    with pytest.raises(ProfilerBusyError):
+        await service.profile_memory(0.1, top=5)
+    await running
+
+
+def test_module_names_group_by_package():
+    assert module_name(profiler.__file__) == "app.services.profiler"
+    assert module_name(json.__file__) == "stdlib.json"
+    assert module_name(pydantic.__file__) == "pydantic"
+
+
+def test_collapsed_and_speedscope_output():
+    stacks = Counter({"main;handler (app.api);dump (stdlib.json)": 3, "main;handler (app.api)": 1})
+    
+    assert to_collapsed(stacks).splitlines() == [
+        "main;handler (app.api);dump (stdlib.json) 3",
+        "main;handler (app.api) 1"
+    ]
+    speedscope = to_speedscope(stacks, 0.01)
+    frames = [frame["name"] for frame in speedscope["shared"]["frames"]]
+    assert frames == ["main", "handler (app.api)", "dump (stdlib.json)"]
+    profile = speedscope["profiles"][0]
+    assert profile["samples"] == [[0, 1, 2], [0, 1]]
+    assert profile["weights"] == [0.03, 0.01]
+
+
+@pytest.mark.parametrize("configured, sent, allowed", [
+    ("", "", False),
+    ("", "anything", False),
+    ("secret", "wrong", False),
+    ("secret", "secret", True),
+])
+def test_admin_token_is_required(monkeypatch, configured, sent, allowed):
+    monkeypatch.setattr(settings, "PROFILING_ADMIN_TOKEN", configured)
+    
+    if allowed:
+        verify_admin_token(sent)
+    else:
+        with pytest.raises(HTTPException) as raised:
+            verify_admin_token(sent)
+        assert raised.value.status_code == 403
@@ -0,0 +1,95 @@
+import asyncio
+import pytest
+from app.core.metrics import current_endpoint
+from app.services.racing import RacePolicy, first_valid
+
+
+class Racer:
+    """delay 후 결과를 내거나 오류를 발생시키는 경주자 (취소 여부 기록)"""
+    
+    def __init__(self, delay, result=None, error=None):
+        self.delay = delay
+        self.result = result
+        self.error = error
+        self.cancelled = False
+    
+    async def __call__(self):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+@pytest.mark.anyio
+async def test_fastest_valid_response_wins_and_loser_is_cancelled():
+    slow, fast = Racer(1, "slow"), Racer(0.01, "fast")
+    
+    assert await first_valid([slow, fast]) == (1, "fast")
+    await asyncio.sleep(0)
+    assert slow.cancelled
+    assert not fast.cancelled
+
+
+@pytest.mark.anyio
+async def test_invalid_fast_response_loses_to_valid_slow_response():
+    invalid = Racer(0.001, error=ValueError("검증 실패"))
+    valid = Racer(0.02, "valid")
+    
+    assert await first_valid([invalid, valid]) == (1, "valid")
+
+
+@pytest.mark.anyio
+async def test_all_failures_raise_last_error():
+    first = Racer(0.001, error=ValueError("first"))
+    second = Racer(0.01, error=RuntimeError("second"))
+    
+    with pytest.raises(RuntimeError, match="second"):
+        await first_valid([first, second])
+
+
+@pytest.mark.anyio
+async def test_cancelling_caller_cancels_every_racer():
+    racers = [Racer(1, "a"), Racer(1, "b")]
+    race = asyncio.create_task(first_valid(racers))
+    await asyncio.sleep(0.01)
+    
+    race.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await race
+    await asyncio.sleep(0)
+    assert all(racer.cancelled for racer in racers)
+
+
+def test_policy_applies_only_to_configured_endpoints():
+    policy = RacePolicy(["/api/v1/wbs/generate", " "], secondary_model="fast-model")
+    
+    token = current_endpoint.set("/api/v1/wbs/generate")
+    try:
+        assert policy.enabled()
+    finally:
+        current_endpoint.reset(token)
+    token = current_endpoint.set("/api/v1/wbs/generate-from-spec")
+    try:
+        assert not policy.enabled()
+    finally:
+        current_endpoint.reset(token)
+    assert policy.racers("main-model") == [("primary", "main-model"), ("secondary", "fast-model")]
+    assert RacePolicy([]).racers("main-model")[1] == ("secondary", "main-model")
+
+
+def test_policy_records_wins_and_estimated_savings():
+    policy = RacePolicy(["/race"])
+    policy.record_win("secondary", "model", latency_seconds=0.3, baseline_seconds=1.0)
+    policy.record_win("primary", "model", latency_seconds=0.2, baseline_seconds=1.0)
+    policy.record_failure("model")
+    
+    stats = policy.stats()
+    assert stats["races"] == 3
+    assert stats["failures"] == 1
+    assert stats["wins"] == {"primary": 1, "secondary": 1}
+    assert stats["secondary_win_rate"] == 0.5
+    assert stats["latency_saved_ms_total"] == 700.0
@@ -0,0 +1,71 @@
+import asyncio
+import pytest
+from prometheus_client import REGISTRY
+from app.services.rate_limiter import QuotaRateLimiter, RateLimitExceeded, retry_after_from_error
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels)
+
+
+@pytest.mark.anyio
+async def test_acquire_waits_for_refill_within_deadline():
+    limiter = QuotaRateLimiter(rpm=600, tpm=1_000_000, max_wait_seconds=1.0)
+    limiter.requests.consume(limiter.requests.level)  # 10 req/s 속도로 다시 채워짐
+    
+    loop = asyncio.get_running_loop()
+    started_at = loop.time()
+    await limiter.acquire(10)
+    
+    assert 0.05 <= loop.time() - started_at < 0.5
+    assert limiter.admitted == 1
+
+
+@pytest.mark.anyio
+async def test_acquire_rejects_with_retry_after_when_wait_exceeds_deadline():
+    limiter = QuotaRateLimiter(rpm=60, tpm=6_000, max_wait_seconds=0.5)
+    rejected_before = _sample("flowplan_rate_limit_decisions_total", outcome="rejected") or 0
+    
+    await limiter.acquire(6_000)
+    with pytest.raises(RateLimitExceeded) as exc_info:
+        await limiter.acquire(3_000)  # 100 tokens/s → 약 30초 필요
+    
+    assert exc_info.value.retry_after == pytest.approx(30, rel=0.05)
+    assert (limiter.admitted, limiter.rejected) == (1, 1)
+    assert _sample("flowplan_rate_limit_decisions_total", outcome="rejected") == rejected_before + 1
+
+
+@pytest.mark.anyio
+async def test_queued_callers_are_admitted_in_arrival_order():
+    limiter = QuotaRateLimiter(rpm=1200, tpm=1_000_000, max_wait_seconds=1.0)
+    limiter.requests.consume(limiter.requests.level)  # 20 req/s
+    admitted = []
+    
+    async def acquire(index):
+        await limiter.acquire(1)
+        admitted.append(index)
+    
+    await asyncio.gather(*(acquire(index) for index in range(4)))
+    assert admitted == [0, 1, 2, 3]
+
+
+def test_bucket_levels_are_exported_as_gauges():
+    limiter = QuotaRateLimiter(rpm=60, tpm=10_000, max_wait_seconds=1.0)
+    limiter.tokens.consume(4_000)
+    limiter.record_usage(estimated_tokens=4_000, actual_tokens=5_000)
+    
+    assert _sample("flowplan_rate_limit_tokens_available") == pytest.approx(5_000, abs=5)
+    limiter.record_upstream_rejection()
+    assert _sample("flowplan_rate_limit_requests_available") == pytest.approx(0, abs=0.1)
+
+
+def test_disabled_limiter_never_waits():
+    limiter = QuotaRateLimiter(rpm=1, tpm=1, max_wait_seconds=0.0, enabled=False)
+    asyncio.run(limiter.acquire(1_000_000))
+    assert limiter.admitted == 0
+
+
+def test_retry_after_from_error_details():
+    details = {"error": {"details": [{"retryDelay": "13s"}]}}
+    assert retry_after_from_error(details, 30.0) == 13.0
+    assert retry_after_from_error({}, 30.0) == 30.0
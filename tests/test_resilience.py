@@ -0,0 +1,155 @@
+import asyncio
+from contextlib import asynccontextmanager
+import httpx
+import pytest
+from google.genai import errors
+from app.services import resilience
+from app.services.resilience import InvalidResponseError, ResiliencePolicy, is_retryable
+
+
+def _api_error(code):
+    return errors.APIError(code, {"error": {"code": code, "message": "error", "status": "ERROR"}})
+
+
+def _policy(**kwargs):
+    kwargs.setdefault("max_attempts", 3)
+    kwargs.setdefault("base_delay", 0.001)
+    kwargs.setdefault("max_delay", 0.001)
+    kwargs.setdefault("deadline_seconds", 5)
+    kwargs.setdefault("attempt_timeout", 5)
+    return ResiliencePolicy(**kwargs)
+
+
+class Attempts:
+    """정해진 순서로 오류/결과를 돌려주는 시도 함수"""
+    
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+    
+    async def __call__(self, admission):
+        outcome = self.outcomes[min(self.calls, len(self.outcomes) - 1)]
+        self.calls += 1
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+@pytest.mark.parametrize("error, retryable", [
+    (_api_error(500), True),
+    (_api_error(503), True),
+    (_api_error(408), True),
+    (_api_error(400), False),
+    (_api_error(404), False),
+    (_api_error(429), False),
+    (InvalidResponseError("empty"), True),
+    (asyncio.TimeoutError(), True),
+    (httpx.ConnectError("refused"), True),
+    (ValueError("bad"), False),
+])
+def test_retry_classification(error, retryable):
+    assert is_retryable(error) is retryable
+
+
+@pytest.mark.anyio
+async def test_retries_transient_errors_until_success():
+    policy = _policy()
+    attempt = Attempts(_api_error(503), InvalidResponseError("empty"), "ok")
+    
+    assert await policy.run(attempt) == "ok"
+    assert attempt.calls == 3
+    assert policy.retries == 2
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("code", [400, 429])
+async def test_does_not_retry_request_errors_or_quota(code):
+    policy = _policy()
+    attempt = Attempts(_api_error(code), "ok")
+    
+    with pytest.raises(errors.APIError):
+        await policy.run(attempt)
+    assert attempt.calls == 1
+    assert policy.retries == 0
+
+
+@pytest.mark.anyio
+async def test_raises_last_error_after_max_attempts():
+    policy = _policy(max_attempts=2)
+    attempt = Attempts(_api_error(503))
+    
+    with pytest.raises(errors.APIError) as raised:
+        await policy.run(attempt)
+    assert raised.value.code == 503
+    assert attempt.calls == 2
+
+
+@pytest.mark.anyio
+async def test_stops_when_backoff_would_pass_deadline(monkeypatch):
+    # full jitter의 최댓값으로 대기
+    monkeypatch.setattr(resilience.random, "uniform", lambda low, high: high)
+    policy = _policy(base_delay=10, max_delay=10, deadline_seconds=1)
+    attempt = Attempts(_api_error(503), "ok")
+    
+    with pytest.raises(asyncio.TimeoutError):
+        await policy.run(attempt)
+    assert attempt.calls == 1
+    assert policy.deadline_exceeded == 1
+
+
+@pytest.mark.anyio
+async def test_attempt_timeout_is_retried():
+    policy = _policy(attempt_timeout=0.05)
+    calls = 0
+    
+    async def slow_then_fast(admission):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(1)
+        return "ok"
+    
+    assert await policy.run(slow_then_fast) == "ok"
+    assert calls == 2
+
+
+@pytest.mark.anyio
+async def test_hedge_wins_and_cancels_slow_primary():
+    policy = _policy(hedge_enabled=True, hedge_min_samples=1)
+    policy.latency.record(0.02)
+    admitted = []
+    started = []
+    cancelled = []
+    
+    @asynccontextmanager
+    async def admit():
+        admitted.append(len(admitted))
+        yield len(admitted) - 1
+    
+    async def attempt(admission):
+        started.append(admission)
+        try:
+            # 첫 요청은 느리고 헤징 요청은 바로 응답
+            await asyncio.sleep(1 if admission == 0 else 0)
+        except asyncio.CancelledError:
+            cancelled.append(admission)
+            raise
+        return f"response-{admission}"
+    
+    assert await policy.run(attempt, admit) == "response-1"
+    await asyncio.sleep(0)
+    
+    assert started == [0, 1]
+    assert cancelled == [0]
+    assert (policy.hedges, policy.hedge_wins) == (1, 1)
+
+
+@pytest.mark.anyio
+async def test_no_hedge_before_enough_samples():
+    policy = _policy(hedge_enabled=True, hedge_min_samples=5)
+    policy.latency.record(0.001)
+    attempt = Attempts("ok")
+    
+    assert policy.hedge_delay() is None
+    assert await policy.run(attempt) == "ok"
+    assert policy.hedges == 0
@@ -0,0 +1,107 @@
+from types import SimpleNamespace
+import pytest
+from app.services import response_cache
+from app.services.response_cache import MemoryCacheBackend, ResponseCache, SQLiteCacheBackend
+
+
+class Clock:
+    """호출할 때마다 1초씩 흐르는 시계 (같은 시각으로 LRU 순서가 겹치지 않도록)"""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        self.now += 1
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(response_cache, "time", SimpleNamespace(time=clock))
+    return clock
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_backend(request, tmp_path):
+    backends = []
+    
+    def make(max_entries=2, ttl_seconds=0):
+        if request.param == "memory":
+            backend = MemoryCacheBackend(max_entries, ttl_seconds)
+        else:
+            backend = SQLiteCacheBackend(str(tmp_path / f"cache-{len(backends)}.db"), max_entries, ttl_seconds)
+            backends.append(backend)
+        return backend
+    
+    yield make
+    for backend in backends:
+        backend.close()
+
+
+@pytest.mark.anyio
+async def test_evicts_least_recently_used_entry(make_backend, clock):
+    backend = make_backend(max_entries=2)
+    await backend.set("a", "A")
+    await backend.set("b", "B")
+    # a를 조회해 최근 사용으로 만들면 다음 저장 시 b가 제거됨
+    assert await backend.get("a") == "A"
+    await backend.set("c", "C")
+    
+    assert await backend.get("b") is None
+    assert await backend.get("a") == "A"
+    assert await backend.get("c") == "C"
+    assert await backend.size() == 2
+
+
+@pytest.mark.anyio
+async def test_expires_entries_after_ttl(make_backend, clock):
+    backend = make_backend(max_entries=10, ttl_seconds=60)
+    await backend.set("a", "A")
+    assert await backend.get("a") == "A"
+    
+    clock.now += 60
+    assert await backend.get("a") is None
+    assert await backend.size() == 0
+
+
+@pytest.mark.anyio
+async def test_overwrite_keeps_one_entry(make_backend, clock):
+    backend = make_backend(max_entries=2)
+    await backend.set("a", "A")
+    await backend.set("a", "A2")
+    
+    assert await backend.get("a") == "A2"
+    assert await backend.size() == 1
+    await backend.clear()
+    assert await backend.size() == 0
+
+
+@pytest.mark.anyio
+async def test_bypass_skips_lookup_but_still_stores(make_backend, clock):
+    cache = ResponseCache(make_backend(max_entries=10))
+    await cache.set("key", "value")
+    
+    assert await cache.get("key", bypass=True) is None
+    assert await cache.get("key") == "value"
+    assert await cache.get("missing") is None
+    stats = await cache.stats()
+    assert (stats["hits"], stats["misses"], stats["bypasses"]) == (1, 1, 1)
+    assert stats["hit_ratio"] == 0.5
+
+
+@pytest.mark.anyio
+async def test_disabled_cache_never_stores(make_backend, clock):
+    cache = ResponseCache(make_backend(), enabled=False)
+    await cache.set("key", "value")
+    
+    assert await cache.get("key") is None
+    assert (await cache.stats())["entries"] == 0
+
+
+def test_key_ignores_line_ending_differences_but_not_model_or_config():
+    key = ResponseCache.make_key("첫 줄\n둘째 줄", "model-a", {"temperature": 0.2})
+    
+    assert ResponseCache.make_key("첫 줄  \r\n둘째 줄\n", "model-a", {"temperature": 0.2}) == key
+    assert ResponseCache.make_key("첫 줄\n둘째 줄", "model-b", {"temperature": 0.2}) != key
+    assert ResponseCache.make_key("첫 줄\n둘째 줄", "model-a", {"temperature": 0.7}) != key
@@ -0,0 +1,67 @@
+import json
+from datetime import date
+import msgpack
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from app.api.responses import MsgpackResponse, PydanticJSONResponse
+from app.models.response import WBSGenerateResponse, WBSTask
+
+
+def _response():
+    child = WBSTask(
+        task_id="1.1",
+        parent_id="1.0",
+        name="요구사항 \"수집\"",
+        assignee="PM",
+        start_date=date(2024, 3, 4),
+        end_date=date(2024, 3, 5),
+        duration_days=2
+    )
+    phase = WBSTask(
+        task_id="1.0",
+        name="기획",
+        assignee="PM",
+        start_date=date(2024, 3, 4),
+        end_date=date(2024, 3, 8),
+        duration_days=5,
+        subtasks=[child]
+    )
+    return WBSGenerateResponse(project_name="쇼핑몰", total_tasks=2, total_duration_days=5, wbs_structure=[phase])
+
+
+def test_model_body_matches_default_fastapi_serialization():
+    model = _response()
+    
+    fast = PydanticJSONResponse(model).body
+    default = JSONResponse(jsonable_encoder(model)).body
+    
+    assert fast == default
+    assert "쇼핑몰".encode() in fast
+    assert json.loads(fast)["wbs_structure"][0]["subtasks"][0]["status"] == "할일"
+
+
+def test_constructed_model_is_serialized_without_revalidation():
+    model = _response()
+    # 일정 계산처럼 model_construct로 만든 응답도 같은 바이트로 직렬화
+    constructed = WBSGenerateResponse.model_construct(**dict(model))
+    
+    assert PydanticJSONResponse(constructed).body == PydanticJSONResponse(model).body
+
+
+def test_plain_content_and_custom_media_type():
+    response = PydanticJSONResponse(
+        {"tasks": [{"start_date": date(2024, 3, 4)}]},
+        media_type="application/vnd.flowplan.columnar+json"
+    )
+    
+    assert response.body == b'{"tasks":[{"start_date":"2024-03-04"}]}'
+    assert response.headers["content-type"] == "application/vnd.flowplan.columnar+json"
+
+
+def test_msgpack_response_round_trip():
+    content = {"project_name": "쇼핑몰", "tasks": [{"task_id": "1.0", "parent_task_id": None}]}
+    
+    response = MsgpackResponse(content)
+    
+    assert response.headers["content-type"] == "application/msgpack"
+    assert msgpack.unpackb(response.body) == content
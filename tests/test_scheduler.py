@@ -0,0 +1,109 @@
+from datetime import date, timedelta
+import pytest
+from app.models.response import WBSGenerateResponse, WBSTask
+from app.utils.scheduler import schedule_response, schedule_wbs, schedule_window_from_spec
+
+START = date(2024, 3, 4)
+
+
+def _task(task_id, duration=1, subtasks=None):
+    return WBSTask(
+        task_id=task_id,
+        parent_id=task_id.rsplit(".", 1)[0] if task_id.count(".") > 1 else None,
+        name=task_id,
+        assignee="개발자",
+        start_date=date(2000, 1, 1),
+        end_date=date(2000, 1, 1),
+        duration_days=duration,
+        subtasks=subtasks or []
+    )
+
+
+def _offsets(task):
+    return (task.start_date - START).days, (task.end_date - START).days
+
+
+def _by_id(structure):
+    tasks = {}
+    stack = list(structure)
+    while stack:
+        task = stack.pop()
+        tasks[task.task_id] = task
+        stack.extend(task.subtasks or [])
+    return tasks
+
+
+def test_phases_run_in_order_and_sibling_leaves_in_sequence():
+    structure = [
+        _task("1.0", subtasks=[_task("1.1", 2), _task("1.2", 3)]),
+        _task("2.0", subtasks=[_task("2.1", 5)])
+    ]
+    schedule = schedule_wbs(structure, START, 10, team_size=4)
+    tasks = _by_id(schedule.wbs_structure)
+    assert _offsets(tasks["1.1"]) == (0, 1)
+    assert _offsets(tasks["1.2"]) == (2, 4)
+    assert _offsets(tasks["1.0"]) == (0, 4)
+    assert _offsets(tasks["2.1"]) == (5, 9)
+    assert (schedule.total_duration_days, schedule.fits_window) == (10, True)
+
+
+def test_subtrees_are_leveled_by_team_size():
+    def structure():
+        return [_task("1.0", subtasks=[
+            _task("1.1", subtasks=[_task("1.1.1", 2), _task("1.1.2", 2)]),
+            _task("1.2", subtasks=[_task("1.2.1", 4)])
+        ])]
+    
+    parallel = _by_id(schedule_wbs(structure(), START, 4, team_size=2).wbs_structure)
+    assert _offsets(parallel["1.1.1"]) == (0, 1)
+    assert _offsets(parallel["1.1.2"]) == (2, 3)
+    assert _offsets(parallel["1.2.1"]) == (0, 3)
+    
+    # 인원 1명이면 하위 트리도 전위 순회 순서로 하나씩 진행
+    single = _by_id(schedule_wbs(structure(), START, 8, team_size=1).wbs_structure)
+    assert [_offsets(single[task_id]) for task_id in ("1.1.1", "1.1.2", "1.2.1")] == [(0, 1), (2, 3), (4, 7)]
+
+
+def test_durations_are_scaled_to_window():
+    structure = [_task("1.0", subtasks=[_task("1.1", 1), _task("1.2", 3)])]
+    schedule = schedule_wbs(structure, START, 40, team_size=1)
+    tasks = _by_id(schedule.wbs_structure)
+    assert schedule.fits_window
+    assert 36 <= schedule.total_duration_days <= 40
+    assert tasks["1.2"].duration_days == pytest.approx(3 * tasks["1.1"].duration_days, abs=1)
+
+
+def test_overfull_window_reports_overflow():
+    structure = [_task("1.0", subtasks=[_task(f"1.{index}", 5) for index in range(1, 6)])]
+    schedule = schedule_wbs(structure, START, 3, team_size=3)
+    assert not schedule.fits_window
+    assert schedule.total_duration_days == 5
+
+
+def test_leaf_phase_is_scheduled_alone():
+    schedule = schedule_wbs([_task("1.0", 3), _task("2.0", 1)], START, 4, team_size=2)
+    assert [_offsets(phase) for phase in schedule.wbs_structure] == [(0, 2), (3, 3)]
+
+
+def test_invalid_window_is_rejected():
+    with pytest.raises(ValueError):
+        schedule_wbs([_task("1.0")], START, 0, team_size=1)
+
+
+def test_schedule_response_updates_total_duration():
+    response = WBSGenerateResponse(
+        project_name="테스트",
+        total_tasks=2,
+        total_duration_days=99,
+        wbs_structure=[_task("1.0", subtasks=[_task("1.1", 2)])]
+    )
+    scheduled = schedule_response(response, START, 6, team_size=1)
+    assert scheduled.total_duration_days == 6
+    assert scheduled.wbs_structure[0].end_date == START + timedelta(days=5)
+
+
+def test_schedule_window_from_spec():
+    window = schedule_window_from_spec("- **기간**: 2024-01-01 ~ 2024-01-14 (14일)\n- **팀 구성**: 5명 (PM 1, 개발자 4)")
+    assert (window.start_date, window.total_days, window.team_size) == (date(2024, 1, 1), 14, 5)
+    window = schedule_window_from_spec("- 기간: 30일\n")
+    assert (window.start_date, window.total_days, window.team_size) == (None, 30, None)
@@ -0,0 +1,111 @@
+import asyncio
+import pytest
+from app.services.single_flight import SingleFlight
+
+
+class Upstream:
+    """호출 수를 세고 release 전까지 응답하지 않는 업스트림"""
+    
+    def __init__(self):
+        self.calls = 0
+        self.cancelled = 0
+        self.release = asyncio.Event()
+    
+    async def __call__(self):
+        self.calls += 1
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return f"result-{self.calls}"
+
+
+async def _settle():
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.anyio
+async def test_concurrent_callers_share_one_call():
+    group = SingleFlight()
+    upstream = Upstream()
+    waiters = [asyncio.create_task(group.do("key", upstream)) for _ in range(5)]
+    await _settle()
+    upstream.release.set()
+    
+    assert await asyncio.gather(*waiters) == ["result-1"] * 5
+    assert upstream.calls == 1
+    assert group.stats() == {"in_flight": 0, "leaders": 1, "coalesced": 4}
+
+
+@pytest.mark.anyio
+async def test_one_cancelled_waiter_does_not_cancel_shared_call():
+    group = SingleFlight()
+    upstream = Upstream()
+    leader = asyncio.create_task(group.do("key", upstream))
+    follower = asyncio.create_task(group.do("key", upstream))
+    await _settle()
+    
+    leader.cancel()
+    await _settle()
+    upstream.release.set()
+    
+    assert await follower == "result-1"
+    assert leader.cancelled()
+    assert upstream.cancelled == 0
+
+
+@pytest.mark.anyio
+async def test_last_waiter_cancelling_cancels_shared_call():
+    group = SingleFlight()
+    upstream = Upstream()
+    waiters = [asyncio.create_task(group.do("key", upstream)) for _ in range(2)]
+    await _settle()
+    
+    for waiter in waiters:
+        waiter.cancel()
+    await asyncio.gather(*waiters, return_exceptions=True)
+    await _settle()
+    
+    assert upstream.cancelled == 1
+    assert group.stats()["in_flight"] == 0
+
+
+@pytest.mark.anyio
+async def test_caller_after_last_waiter_cancelled_starts_new_call():
+    group = SingleFlight()
+    upstream = Upstream()
+    first = asyncio.create_task(group.do("key", upstream))
+    await _settle()
+    
+    first.cancel()
+    # 취소된 공유 호출이 정리되기 전에 들어온 요청도 새 호출을 시작
+    second = asyncio.create_task(group.do("key", upstream))
+    await _settle()
+    upstream.release.set()
+    
+    assert await second == "result-2"
+    assert upstream.calls == 2
+
+
+@pytest.mark.anyio
+async def test_failure_is_shared_and_next_call_retries():
+    group = SingleFlight()
+    calls = 0
+    
+    async def failing():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        raise ValueError("upstream failed")
+    
+    results = await asyncio.gather(
+        *(group.do("key", failing) for _ in range(3)), return_exceptions=True
+    )
+    assert calls == 1
+    assert all(isinstance(result, ValueError) for result in results)
+    
+    with pytest.raises(ValueError):
+        await group.do("key", failing)
+    assert calls == 2
@@ -0,0 +1,120 @@
+from datetime import date
+from app.models.response import WBSGenerateResponse, WBSTask
+from app.services.incremental_wbs import merge_wbs_phases
+from app.utils.spec_diff import PREAMBLE_KEY, diff_sections, normalize_title, parse_sections
+
+SPEC = """# 📋 쇼핑몰 명세서
+
+## 📌 프로젝트 개요
+- **기간**: 30일
+
+## ⚙️ 핵심 기능 및 요구사항
+
+### 회원 관리
+- 회원 가입
+
+### 결제
+- 카드 결제
+
+```
+## 코드 블록 안의 제목은 무시
+```
+"""
+
+
+def _task(task_id, parent_id, name, subtasks=None):
+    day = date(2024, 1, 1)
+    return WBSTask(
+        task_id=task_id,
+        parent_id=parent_id,
+        name=name,
+        assignee="개발자",
+        start_date=day,
+        end_date=day,
+        duration_days=1,
+        subtasks=subtasks or []
+    )
+
+
+def _current():
+    return WBSGenerateResponse(
+        project_name="쇼핑몰",
+        total_tasks=4,
+        total_duration_days=1,
+        wbs_structure=[
+            _task("1.0", None, "기획", [_task("1.1", "1.0", "요구사항 분석")]),
+            _task("2.0", None, "개발", [_task("2.1", "2.0", "API 개발")])
+        ]
+    )
+
+
+def test_parse_sections_builds_title_paths():
+    sections = parse_sections(SPEC)
+    assert [section.key for section in sections] == [
+        PREAMBLE_KEY,
+        "프로젝트 개요",
+        "핵심 기능 및 요구사항",
+        "핵심 기능 및 요구사항 > 회원 관리",
+        "핵심 기능 및 요구사항 > 결제"
+    ]
+    assert [section.is_global for section in sections] == [True, True, False, False, False]
+    assert "코드 블록 안의 제목은 무시" in sections[-1].text
+
+
+def test_repeated_titles_get_sequence_numbers():
+    sections = parse_sections("## 기능\n### 로그인\n- a\n### 로그인\n- b\n")
+    assert [section.key for section in sections] == ["기능", "기능 > 로그인", "기능 > 로그인 (2)"]
+
+
+def test_normalize_title_strips_emoji_and_markup():
+    assert normalize_title("⚙️ **핵심 기능**  및 요구사항") == "핵심 기능 및 요구사항"
+
+
+def test_diff_detects_changed_added_removed_sections():
+    new_spec = SPEC.replace("- 카드 결제", "- 카드 결제\n- 정기 결제").replace("### 회원 관리\n- 회원 가입\n", "")
+    new_spec = new_spec.replace("### 결제", "### 쿠폰\n- 쿠폰 발급\n\n### 결제")
+    diff = diff_sections(parse_sections(SPEC), parse_sections(new_spec))
+    assert [section.key for section in diff.changed] == ["핵심 기능 및 요구사항 > 결제"]
+    assert [section.key for section in diff.added] == ["핵심 기능 및 요구사항 > 쿠폰"]
+    assert [section.key for section in diff.removed] == ["핵심 기능 및 요구사항 > 회원 관리"]
+    assert diff.has_changes
+    assert not diff.global_changed
+
+
+def test_diff_ignores_whitespace_and_renamed_titles():
+    new_spec = SPEC.replace("- 카드 결제", "- 카드 결제   \n\n").replace("### 회원 관리", "### 회원")
+    diff = diff_sections(parse_sections(SPEC), parse_sections(new_spec))
+    assert not diff.has_changes
+
+
+def test_diff_flags_global_section_changes():
+    diff = diff_sections(parse_sections(SPEC), parse_sections(SPEC.replace("30일", "45일")))
+    assert [section.key for section in diff.changed] == ["프로젝트 개요"]
+    assert diff.global_changed
+
+
+def test_merge_replaces_phase_with_same_name_and_keeps_task_ids():
+    patch = [_task("7.0", None, "개발", [_task("7.1", "7.0", "API 개발"), _task("7.2", "7.0", "결제 연동")])]
+    merged, regenerated, added, reused = merge_wbs_phases(_current(), patch)
+    assert (regenerated, added, reused) == (["2.0"], [], 2)
+    phase = merged.wbs_structure[1]
+    assert [(task.task_id, task.parent_id, task.name) for task in phase.subtasks] == [
+        ("2.1", "2.0", "API 개발"),
+        ("2.2", "2.0", "결제 연동")
+    ]
+    assert merged.total_tasks == 5
+
+
+def test_merge_treats_id_collision_with_different_name_as_addition():
+    patch = [_task("2.0", None, "쿠폰", [_task("2.1", "2.0", "쿠폰 발급")])]
+    merged, regenerated, added, _ = merge_wbs_phases(_current(), patch)
+    assert (regenerated, added) == ([], ["3.0"])
+    assert [phase.name for phase in merged.wbs_structure] == ["기획", "개발", "쿠폰"]
+    assert merged.wbs_structure[1].subtasks[0].name == "API 개발"
+    assert [(task.task_id, task.parent_id) for task in merged.wbs_structure[2].subtasks] == [("3.1", "3.0")]
+
+
+def test_merge_adds_second_patch_phase_with_same_name():
+    patch = [_task("2.0", None, "개발"), _task("2.0", None, "개발")]
+    _, regenerated, added, _ = merge_wbs_phases(_current(), patch)
+    assert (regenerated, added) == (["2.0"], ["3.0"])
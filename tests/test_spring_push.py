@@ -0,0 +1,123 @@
+import json
+import httpx
+import pytest
+from app.services.spring_push import SpringPushError, SpringPushSink
+from app.utils.wbs_converter import FlatTaskRow
+
+URL = "http://spring.test/api/wbs/tasks"
+SUMMARY = {"project_name": "테스트", "total_tasks": 5, "total_duration_days": 10}
+ROWS = [
+    FlatTaskRow(f"{index}.0", None, f"작업 {index}", "PM", "2024-03-04", "2024-03-05", 2, 0, "할일")
+    for index in range(1, 6)
+]
+
+
+class Spring:
+    """받은 요청을 기록하고 배치마다 정해진 응답을 돌려주는 가짜 스프링 서버"""
+    
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+        self.stored = {}
+    
+    def __call__(self, request):
+        self.requests.append(request)
+        response = self.responses.pop(0) if self.responses else httpx.Response(200)
+        if isinstance(response, Exception):
+            raise response
+        if response.is_success:
+            # 멱등 키가 같은 배치는 한 번만 저장
+            self.stored.setdefault(request.headers["Idempotency-Key"], json.loads(request.content))
+        return response
+
+
+def _sink(spring, **kwargs):
+    kwargs.setdefault("batch_size", 2)
+    kwargs.setdefault("max_attempts", 3)
+    kwargs.setdefault("base_delay", 0.001)
+    kwargs.setdefault("max_delay", 0.01)
+    return SpringPushSink(URL, client=httpx.AsyncClient(transport=httpx.MockTransport(spring)), **kwargs)
+
+
+@pytest.mark.anyio
+async def test_pushes_batches_in_order_with_idempotency_keys():
+    spring = Spring()
+    sink = _sink(spring, auth_token="secret")
+    
+    result = await sink.push("job-1", SUMMARY, ROWS)
+    
+    assert result["batches"] == 3 and result["tasks"] == 5 and result["retries"] == 0
+    assert [request.headers["Idempotency-Key"] for request in spring.requests] == ["job-1:0", "job-1:1", "job-1:2"]
+    assert all(request.headers["Authorization"] == "Bearer secret" for request in spring.requests)
+    bodies = [json.loads(request.content) for request in spring.requests]
+    assert [task["task_id"] for body in bodies for task in body["tasks"]] == [row.task_id for row in ROWS]
+    assert bodies[0]["batch_count"] == 3
+    assert bodies[0]["project_name"] == "테스트"
+
+
+@pytest.mark.anyio
+async def test_retries_transient_failures_with_same_idempotency_key():
+    spring = Spring(
+        httpx.Response(503),
+        httpx.ConnectError("refused"),
+        httpx.Response(200),
+        httpx.Response(429, headers={"Retry-After": "0"})
+    )
+    sink = _sink(spring)
+    
+    result = await sink.push("job-1", SUMMARY, ROWS)
+    
+    keys = [request.headers["Idempotency-Key"] for request in spring.requests]
+    assert keys == ["job-1:0", "job-1:0", "job-1:0", "job-1:1", "job-1:1", "job-1:2"]
+    assert result["retries"] == 3
+    assert sink.stats()["retries"] == 3
+    assert len(spring.stored) == 3
+
+
+@pytest.mark.anyio
+async def test_rerunning_push_reuses_keys_so_spring_can_deduplicate():
+    spring = Spring()
+    sink = _sink(spring)
+    
+    await sink.push("job-1", SUMMARY, ROWS)
+    await sink.push("job-1", SUMMARY, ROWS)
+    
+    assert len(spring.requests) == 6
+    assert sorted(spring.stored) == ["job-1:0", "job-1:1", "job-1:2"]
+
+
+@pytest.mark.anyio
+async def test_non_retryable_response_stops_remaining_batches():
+    spring = Spring(httpx.Response(200), httpx.Response(400, text="잘못된 작업"))
+    sink = _sink(spring)
+    
+    with pytest.raises(SpringPushError) as raised:
+        await sink.push("job-1", SUMMARY, ROWS)
+    
+    assert raised.value.batch_index == 1
+    assert "HTTP 400" in str(raised.value)
+    assert len(spring.requests) == 2
+    assert sink.stats()["failed_pushes"] == 1
+
+
+@pytest.mark.anyio
+async def test_gives_up_after_max_attempts():
+    spring = Spring(*[httpx.Response(502)] * 3)
+    sink = _sink(spring)
+    
+    with pytest.raises(SpringPushError) as raised:
+        await sink.push("job-1", SUMMARY, ROWS)
+    
+    assert raised.value.batch_index == 0
+    assert len(spring.requests) == 3
+
+
+@pytest.mark.anyio
+async def test_empty_push_sends_one_summary_batch():
+    spring = Spring()
+    sink = _sink(spring)
+    
+    result = await sink.push("job-1", SUMMARY, [])
+    
+    assert result["batches"] == 1
+    assert json.loads(spring.requests[0].content)["tasks"] == []
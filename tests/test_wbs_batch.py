@@ -0,0 +1,53 @@
+import pytest
+from google.genai import types
+from app.models.request import WBSGenerateRequest
+from app.services.fake_gemini import FakeGeminiClient
+from app.services.gemini_service import GeminiService
+from app.services.wbs_generator import WBSGenerator
+
+
+def _request(index):
+    return WBSGenerateRequest(
+        project_name=f"배치 프로젝트 {index}",
+        project_type="웹",
+        team_size=3,
+        expected_duration_days=30
+    )
+
+
+@pytest.fixture
+def client():
+    return FakeGeminiClient(latency_median_ms=1, latency_p95_ms=1, seed=1)
+
+
+@pytest.mark.anyio
+async def test_offline_batch_reports_missing_item_response_as_item_error(client):
+    generator = WBSGenerator(GeminiService(client=client))
+    submitted = await generator.submit_offline_batch([_request(index) for index in range(3)])
+    job = client.aio.batches.jobs[submitted.batch_name]
+    job.dest.inlined_responses[1] = types.InlinedResponse()
+    
+    batch = await generator.get_offline_batch(submitted.batch_name)
+    
+    assert batch.total_items == 3
+    assert [item.error is None for item in batch.results] == [True, False, True]
+    assert batch.results[0].result.wbs_structure
+
+
+@pytest.mark.anyio
+async def test_online_batch_item_failure_does_not_fail_batch(client):
+    service = GeminiService(client=client)
+    generator = WBSGenerator(service)
+    original = service.generate_wbs_structure
+    
+    async def generate(project_data, bypass_cache=False):
+        if project_data["project_name"].endswith("1"):
+            raise RuntimeError("업스트림 오류")
+        return await original(project_data, bypass_cache=bypass_cache)
+    
+    service.generate_wbs_structure = generate
+    items = [item async for item in generator.generate_batch([_request(index) for index in range(3)])]
+    
+    by_index = {item.index: item for item in sorted(items, key=lambda item: item.index)}
+    assert by_index[1].error == "업스트림 오류"
+    assert by_index[0].result is not None and by_index[2].result is not None
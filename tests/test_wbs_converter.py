@@ -0,0 +1,64 @@
+from datetime import date
+from app.models.response import WBSTask
+from app.utils.wbs_converter import FLAT_TASK_FIELDS, flatten_wbs_for_spring, iter_flat_tasks
+
+
+def _task(task_id, parent_id=None, subtasks=None):
+    return WBSTask(
+        task_id=task_id,
+        parent_id=parent_id,
+        name=f"작업 {task_id}",
+        assignee="PM",
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 1, 3),
+        duration_days=3,
+        subtasks=subtasks or []
+    )
+
+
+STRUCTURE = [
+    _task("1.0", subtasks=[_task("1.1", "1.0", [_task("1.1.1", "1.1")]), _task("1.2", "1.0")]),
+    _task("2.0")
+]
+
+
+def test_flat_rows_are_preorder_with_parent_ids():
+    rows = list(iter_flat_tasks(STRUCTURE))
+    assert [(row.task_id, row.parent_task_id) for row in rows] == [
+        ("1.0", None),
+        ("1.1", "1.0"),
+        ("1.1.1", "1.1"),
+        ("1.2", "1.0"),
+        ("2.0", None)
+    ]
+
+
+def test_flatten_wbs_for_spring_format():
+    tasks = flatten_wbs_for_spring(STRUCTURE)
+    assert len(tasks) == 5
+    assert tuple(tasks[0]) == FLAT_TASK_FIELDS
+    assert tasks[2] == {
+        "task_id": "1.1.1",
+        "parent_task_id": "1.1",
+        "name": "작업 1.1.1",
+        "assignee": "PM",
+        "start_date": "2024-01-01",
+        "end_date": "2024-01-03",
+        "duration_days": 3,
+        "progress": 0,
+        "status": "할일"
+    }
+
+
+def test_deep_tree_does_not_recurse():
+    root = _task("1.0")
+    node = root
+    for depth in range(2000):
+        child = _task(f"1.{depth}", node.task_id)
+        node.subtasks = [child]
+        node = child
+    assert len(list(iter_flat_tasks([root]))) == 2001
+
+
+def test_empty_structure():
+    assert flatten_wbs_for_spring([]) == []
@@ -0,0 +1,55 @@
+import pytest
+from app.core.config import settings
+from app.services.fake_gemini import FakeGeminiClient
+from app.services.gemini_service import GeminiService
+from app.services.wbs_from_markdown import WBSFromMarkdownGenerator
+from app.utils.wbs_converter import flatten_wbs_for_spring
+
+SPEC = """# 쇼핑몰 구축
+
+## 1. 프로젝트 개요
+- **프로젝트명**: 쇼핑몰 구축
+- **기간**: 2024-03-04 ~ 2024-04-12 (40일)
+- **팀 구성**: 3명 (PM 1, 개발자 2)
+"""
+
+
+@pytest.fixture
+def generator(monkeypatch):
+    monkeypatch.setattr(settings, "LOCAL_SCHEDULING_ENABLED", True)
+    service = GeminiService(client=FakeGeminiClient(latency_median_ms=1, latency_p95_ms=1, stream_chunk_chars=50, seed=1))
+    return WBSFromMarkdownGenerator(service)
+
+
+async def _collect(generator):
+    return [row async for row in generator.stream_flat_tasks(SPEC, bypass_cache=True)]
+
+
+@pytest.mark.anyio
+async def test_stream_ends_with_schedule_matching_flat_endpoint(generator):
+    rows = await _collect(generator)
+    # 스트림 응답이 캐시에 저장되므로 /flat 경로도 같은 모델 응답을 사용
+    expected = flatten_wbs_for_spring((await generator.generate_wbs(SPEC)).wbs_structure)
+    
+    assert [row["type"] for row in rows[-2:]] == ["schedule", "summary"]
+    tasks = [row["data"] for row in rows if row["type"] == "task"]
+    schedule = rows[-2]["data"]
+    assert [task["task_id"] for task in tasks] == [item["task_id"] for item in schedule]
+    assert schedule == [
+        {key: task[key] for key in ("task_id", "start_date", "end_date", "duration_days")}
+        for task in expected
+    ]
+    assert schedule[0]["start_date"] == "2024-03-04"
+    assert max(item["end_date"] for item in schedule) <= "2024-04-12"
+    summary = rows[-1]["data"]
+    assert summary["total_tasks"] == len(tasks)
+    assert summary["total_duration_days"] == (await generator.generate_wbs(SPEC)).total_duration_days
+
+
+@pytest.mark.anyio
+async def test_stream_without_local_scheduling_has_no_schedule_row(generator, monkeypatch):
+    monkeypatch.setattr(settings, "LOCAL_SCHEDULING_ENABLED", False)
+    rows = await _collect(generator)
+    
+    assert "schedule" not in {row["type"] for row in rows}
+    assert rows[-1]["type"] == "summary"
@@ -0,0 +1,148 @@
+import json
+import pytest
+from app.models.response import WBSGenerateResponse
+from app.utils.wbs_repair import WBSRepairError, close_truncated_json, repair_wbs
+
+
+def _task(task_id, parent_id, start, end, subtasks=None, **fields):
+    task = {
+        "task_id": task_id,
+        "parent_id": parent_id,
+        "name": f"작업 {task_id}",
+        "assignee": "개발자",
+        "start_date": start,
+        "end_date": end,
+        "duration_days": (int(end[-2:]) - int(start[-2:])) + 1,
+        "progress": 0,
+        "status": "할일",
+        "subtasks": subtasks or []
+    }
+    task.update(fields)
+    return task
+
+
+def _wbs(phases, **fields):
+    data = {"project_name": "테스트", "total_tasks": 0, "total_duration_days": 0, "wbs_structure": phases}
+    data.update(fields)
+    return data
+
+
+def _phase(number, start, end, children):
+    return _task(f"{number}.0", None, start, end, [
+        _task(f"{number}.{index}", f"{number}.0", child_start, child_end)
+        for index, (child_start, child_end) in enumerate(children, start=1)
+    ])
+
+
+def test_clean_response_only_recomputes_totals():
+    text = json.dumps(_wbs(
+        [_phase(1, "2024-01-01", "2024-01-05", [("2024-01-01", "2024-01-02"), ("2024-01-03", "2024-01-05")])],
+        total_tasks=3,
+        total_duration_days=5
+    ))
+    report = repair_wbs(text)
+    assert report.issues == {}
+    assert report.parsed_cleanly
+    WBSGenerateResponse(**report.data)
+
+
+def test_code_fence_and_trailing_text_are_ignored():
+    body = json.dumps(_wbs([_phase(1, "2024-01-01", "2024-01-02", [("2024-01-01", "2024-01-02")])]))
+    report = repair_wbs(f"다음은 WBS입니다.\n```json\n{body}\n```\n")
+    assert report.data["total_tasks"] == 2
+
+
+def test_truncated_response_keeps_completed_phases():
+    phases = [
+        _phase(number, f"2024-01-{number:02d}", f"2024-01-{number:02d}", [(f"2024-01-{number:02d}",) * 2])
+        for number in (1, 2, 3)
+    ]
+    text = json.dumps(_wbs(phases))
+    cut = text.index('"task_id": "3.1"')
+    report = repair_wbs(text[:cut], min_phases=2)
+    assert report.issues["truncated"] == 1
+    assert report.retry_avoided
+    assert not report.parsed_cleanly
+    assert [phase["task_id"] for phase in report.data["wbs_structure"]][:2] == ["1.0", "2.0"]
+    assert report.data["total_tasks"] == sum(1 + len(phase["subtasks"]) for phase in report.data["wbs_structure"])
+    WBSGenerateResponse(**report.data)
+
+
+def test_truncated_response_below_min_phases_fails():
+    text = json.dumps(_wbs([_phase(1, "2024-01-01", "2024-01-02", [("2024-01-01", "2024-01-02")])] * 2))
+    with pytest.raises(WBSRepairError):
+        repair_wbs(text[:text.index('"task_id": "1.1"')], min_phases=2)
+
+
+def test_truncated_response_rejected_when_not_allowed():
+    text = json.dumps(_wbs([_phase(1, "2024-01-01", "2024-01-02", [("2024-01-01", "2024-01-02")])]))
+    with pytest.raises(WBSRepairError):
+        repair_wbs(text[:-10], allow_truncated=False)
+
+
+def test_close_truncated_json_closes_open_containers():
+    closed, truncated = close_truncated_json('{"a": [1, 2, {"b": "c"}, {"d": ')
+    assert truncated
+    # 값이 없는 마지막 키는 버리고 열린 객체/배열만 닫음 (빈 작업은 트리 수정 단계에서 제외)
+    assert json.loads(closed) == {"a": [1, 2, {"b": "c"}, {}]}
+
+
+def test_duplicate_task_ids_are_renumbered():
+    phase = _phase(1, "2024-01-01", "2024-01-03", [("2024-01-01", "2024-01-01"), ("2024-01-02", "2024-01-03")])
+    phase["subtasks"][1]["task_id"] = "1.1"
+    duplicate_phase = _phase(1, "2024-01-04", "2024-01-04", [("2024-01-04", "2024-01-04")])
+    report = repair_wbs(json.dumps(_wbs([phase, duplicate_phase])))
+    assert report.issues["duplicate_task_id"] >= 2
+    ids = [phase["task_id"] for phase in report.data["wbs_structure"]]
+    assert ids == ["1.0", "2.0"]
+    assert [child["task_id"] for child in report.data["wbs_structure"][0]["subtasks"]] == ["1.1", "1.2"]
+    all_ids = [
+        task["task_id"]
+        for phase in report.data["wbs_structure"]
+        for task in [phase, *phase["subtasks"]]
+    ]
+    assert len(all_ids) == len(set(all_ids))
+
+
+def test_wrong_parent_id_is_set_to_actual_parent():
+    phase = _phase(1, "2024-01-01", "2024-01-02", [("2024-01-01", "2024-01-02")])
+    phase["parent_id"] = "0.0"
+    phase["subtasks"][0]["parent_id"] = "9.0"
+    report = repair_wbs(json.dumps(_wbs([phase])))
+    assert report.issues["parent_id"] == 2
+    repaired = report.data["wbs_structure"][0]
+    assert repaired["parent_id"] is None
+    assert repaired["subtasks"][0]["parent_id"] == "1.0"
+
+
+def test_child_dates_outside_parent_widen_parent_range():
+    phase = _phase(1, "2024-01-03", "2024-01-04", [("2024-01-01", "2024-01-02"), ("2024-01-04", "2024-01-09")])
+    report = repair_wbs(json.dumps(_wbs([phase])))
+    assert report.issues["parent_range"] == 1
+    repaired = report.data["wbs_structure"][0]
+    assert (repaired["start_date"], repaired["end_date"]) == ("2024-01-01", "2024-01-09")
+    assert repaired["duration_days"] == 9
+    assert report.data["total_duration_days"] == 9
+
+
+def test_end_before_start_and_wrong_duration_are_fixed():
+    phase = _phase(1, "2024-01-01", "2024-01-05", [("2024-01-01", "2024-01-02")])
+    child = phase["subtasks"][0]
+    child.update(end_date="2023-12-30", duration_days=3)
+    report = repair_wbs(json.dumps(_wbs([phase])))
+    assert report.issues["date_order"] == 1
+    repaired = report.data["wbs_structure"][0]["subtasks"][0]
+    assert (repaired["start_date"], repaired["end_date"], repaired["duration_days"]) == ("2024-01-01", "2024-01-03", 3)
+
+
+def test_task_without_dates_is_dropped():
+    phase = _phase(1, "2024-01-01", "2024-01-02", [("2024-01-01", "2024-01-02"), ("2024-01-02", "2024-01-02")])
+    del phase["subtasks"][1]["start_date"], phase["subtasks"][1]["end_date"]
+    report = repair_wbs(json.dumps(_wbs([phase])))
+    assert report.issues["dropped_task"] == 1
+    assert report.data["total_tasks"] == 2
+
+
+def test_missing_project_name_is_not_repairable():
+    with pytest.raises(WBSRepairError):
+        repair_wbs(json.dumps(_wbs([], project_name="")))
@@ -0,0 +1,73 @@
+import json
+import pytest
+from app.utils.wbs_stream_parser import WBSStreamParser
+
+
+def _phase(index):
+    return {
+        "task_id": f"{index}.0",
+        "name": f'단계 {index} {{"중괄호"}} [대괄호] \\ 역슬래시',
+        "subtasks": [
+            {"task_id": f"{index}.1", "name": "하위 }] 작업", "subtasks": []},
+            {"task_id": f"{index}.2", "name": "하위 \"따옴표\" 작업", "subtasks": []}
+        ]
+    }
+
+
+PHASES = [_phase(index) for index in range(1, 4)]
+RESPONSE = json.dumps(
+    {"project_name": "테스트 {프로젝트}", "wbs_structure": PHASES, "total_tasks": 9},
+    ensure_ascii=False,
+    indent=2
+)
+
+
+def _feed_in_chunks(text, size):
+    parser = WBSStreamParser()
+    completed = []
+    for start in range(0, len(text), size):
+        completed.extend(parser.feed(text[start:start + size]))
+    return parser, completed
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, len(RESPONSE)])
+def test_split_chunks_yield_each_phase_once_in_order(size):
+    parser, completed = _feed_in_chunks(RESPONSE, size)
+    
+    assert completed == PHASES
+    assert parser.text == RESPONSE
+
+
+def test_phase_is_returned_as_soon_as_it_closes():
+    parser = WBSStreamParser()
+    first_end = RESPONSE.index('"2.0"')
+    
+    assert parser.feed(RESPONSE[:first_end]) == PHASES[:1]
+    assert parser.feed(RESPONSE[first_end:]) == PHASES[1:]
+
+
+def test_ignores_code_fence_and_trailing_text():
+    text = "```json\n" + RESPONSE + "\n```\n설명: {\"wbs_structure\": [{\"task_id\": \"9.0\"}]}"
+    
+    _, completed = _feed_in_chunks(text, 5)
+    
+    assert completed == PHASES
+
+
+def test_ignores_nested_arrays_named_wbs_structure():
+    text = json.dumps({
+        "meta": {"wbs_structure": [{"task_id": "x"}]},
+        "wbs_structure": PHASES[:1]
+    }, ensure_ascii=False)
+    
+    _, completed = _feed_in_chunks(text, 4)
+    
+    assert completed == PHASES[:1]
+
+
+def test_truncated_response_returns_only_closed_phases():
+    cut = RESPONSE.index('"3.1"')
+    
+    _, completed = _feed_in_chunks(RESPONSE[:cut], 11)
+    
+    assert completed == PHASES[:2]